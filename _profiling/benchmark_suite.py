@@ -0,0 +1,398 @@
+# Copyright (c) 2019-2020, RTE (https://www.rte-france.com)
+# See AUTHORS.txt
+# This Source Code Form is subject to the terms of the Mozilla Public License, version 2.0.
+# If a copy of the Mozilla Public License, version 2.0 was not distributed with this file,
+# you can obtain one at http://mozilla.org/MPL/2.0/.
+# SPDX-License-Identifier: MPL-2.0
+# This file is part of Grid2Op, Grid2Op a testbed platform to model sequential decision making in power systems.
+
+"""
+This file runs a set of benchmarks of the main operations of grid2op, on a few environments, and saves the results
+(along with some information about the machine and the versions of the packages used) in a json file.
+
+The benchmarks are:
+
+  - "step": number of `env.step` per second (agent doing nothing, the environment is reset when the episode is over)
+  - "reset": duration of `env.reset`
+  - "simulate": number of `obs.simulate` per second
+  - "chronics_load": duration of the loading of the data of a chronics
+  - "action_enumeration": duration of the enumeration of all the unitary topological actions
+  - "to_vect" / "from_vect": duration of the conversion of an observation to / from a vector
+  - "runner_sequential" / "runner_parallel": number of episodes per second played by the runner with one process, and
+    with `--nb_process` processes
+  - "episode_write": time spent to save an episode on the hard drive with the runner (duration of
+    `EpisodeData.to_disk`)
+  - "episode_read": duration of `EpisodeData.from_disk`
+
+Each benchmark is performed `--repeat` times and the median of the results is kept. The seeds of the environments are
+set so that the same steps are performed in each run.
+
+The results can be compared to those of a previous run (``--baseline``), for example made on the same machine before
+a modification. The benchmarks that are worse than the baseline by more than `--tolerance` (relative) are reported as
+regressions, and the script then exits with code 1:
+
+.. code-block:: bash
+
+    python benchmark_suite.py --output baseline.json
+    # modify grid2op
+    python benchmark_suite.py --output new.json --baseline baseline.json
+"""
+
+import json
+import multiprocessing
+import os
+import platform
+import queue as queue_module
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import traceback
+import warnings
+import numpy as np
+
+import grid2op
+from grid2op import make
+from grid2op.Agent import DoNothingAgent
+from grid2op.Episode import EpisodeData
+from grid2op.Runner import Runner
+
+ENV_NAMES = ["rte_case5_example", "rte_case14_realistic", "rte_case118_example"]
+NB_STEP = 200
+NB_SIMULATE = 100
+NB_RESET = 10
+NB_VECT = 1000
+NB_EPISODE = 4
+MAX_ITER = 20
+NB_PROCESS = 2
+NB_REPEAT = 3
+TOLERANCE = 0.1
+SEED = 0
+QUEUE_POLL = 1.  # seconds between two checks that the process running the benchmarks is alive
+
+
+def _metric(value, unit, higher_is_better):
+    return {"value": float(value), "unit": unit, "higher_is_better": higher_is_better}
+
+
+def bench_step(env, nb_step):
+    env.seed(SEED)
+    env.reset()
+    act = env.action_space()
+    beg_ = time.perf_counter()
+    for _ in range(nb_step):
+        obs, reward, done, info = env.step(act)
+        if done:
+            env.reset()
+    total = time.perf_counter() - beg_
+    return {"step": _metric(nb_step / total, "it/s", True)}
+
+
+def bench_reset(env, nb_reset):
+    env.seed(SEED)
+    times = np.zeros(nb_reset)
+    for i in range(nb_reset):
+        beg_ = time.perf_counter()
+        env.reset()
+        times[i] = time.perf_counter() - beg_
+    return {"reset": _metric(np.median(times), "s", False)}
+
+
+def bench_simulate(env, nb_simulate):
+    env.seed(SEED)
+    obs = env.reset()
+    act = env.action_space()
+    beg_ = time.perf_counter()
+    for _ in range(nb_simulate):
+        obs.simulate(act)
+    total = time.perf_counter() - beg_
+    return {"simulate": _metric(nb_simulate / total, "it/s", True)}
+
+
+def bench_chronics_load(env, nb_load):
+    chronics_handler = env.chronics_handler
+    backend = env.backend
+    times = np.zeros(nb_load)
+    for i in range(nb_load):
+        beg_ = time.perf_counter()
+        chronics_handler.next_chronics()
+        chronics_handler.initialize(backend.name_load, backend.name_gen, backend.name_line, backend.name_sub,
+                                    names_chronics_to_backend=env.names_chronics_to_backend)
+        times[i] = time.perf_counter() - beg_
+    return {"chronics_load": _metric(np.median(times), "s", False)}
+
+
+def bench_action_enumeration(env):
+    beg_ = time.perf_counter()
+    all_actions = env.action_space.get_all_unitary_topologies_set(env.action_space)
+    total = time.perf_counter() - beg_
+    return {"action_enumeration": _metric(total, "s", False),
+            # not a performance: not compared with the baseline
+            "nb_unitary_topologies": _metric(len(all_actions), "", None)}
+
+
+def bench_vect(env, nb_vect):
+    env.seed(SEED)
+    obs = env.reset()
+    vect = obs.to_vect()
+    time_to = 0.
+    time_from = 0.
+    for _ in range(nb_vect):
+        beg_ = time.perf_counter()
+        new_obs = env.observation_space.from_vect(vect)
+        time_from += time.perf_counter() - beg_
+        # the vector of a new observation is not computed yet
+        beg_ = time.perf_counter()
+        vect = new_obs.to_vect()
+        time_to += time.perf_counter() - beg_
+    return {"to_vect": _metric(time_to / nb_vect, "s", False),
+            "from_vect": _metric(time_from / nb_vect, "s", False)}
+
+
+def bench_runner(env, nb_episode, max_iter, nb_process):
+    res = {}
+    runner = Runner(**env.get_params_for_runner(), agentClass=DoNothingAgent)
+    beg_ = time.perf_counter()
+    runner.run(nb_episode=nb_episode, max_iter=max_iter, env_seeds=[SEED + i for i in range(nb_episode)])
+    time_seq = time.perf_counter() - beg_
+    res["runner_sequential"] = _metric(nb_episode / time_seq, "episode/s", True)
+
+    beg_ = time.perf_counter()
+    runner.run(nb_episode=nb_episode, max_iter=max_iter, nb_process=nb_process,
+               env_seeds=[SEED + i for i in range(nb_episode)])
+    time_par = time.perf_counter() - beg_
+    res["runner_parallel"] = _metric(nb_episode / time_par, "episode/s", True)
+
+    path_save = tempfile.mkdtemp()
+    try:
+        # time spent in EpisodeData.to_disk only: the difference with a run without `path_save` is hidden by noise
+        times_write = []
+        to_disk = EpisodeData.to_disk
+
+        def timed_to_disk(episode):
+            beg_ = time.perf_counter()
+            to_disk(episode)
+            times_write.append(time.perf_counter() - beg_)
+
+        EpisodeData.to_disk = timed_to_disk
+        try:
+            runner_res = runner.run(nb_episode=nb_episode, max_iter=max_iter, path_save=path_save,
+                                    env_seeds=[SEED + i for i in range(nb_episode)])
+        finally:
+            EpisodeData.to_disk = to_disk
+        res["episode_write"] = _metric(np.median(times_write), "s", False)
+
+        times = np.zeros(len(runner_res))
+        for i, (_, name_chron, *_) in enumerate(runner_res):
+            beg_ = time.perf_counter()
+            EpisodeData.from_disk(path_save, name_chron)
+            times[i] = time.perf_counter() - beg_
+        res["episode_read"] = _metric(np.median(times), "s", False)
+    finally:
+        shutil.rmtree(path_save, ignore_errors=True)
+    return res
+
+
+def run_benchmarks(name, args, test_env=True):
+    with warnings.catch_warnings():
+        warnings.filterwarnings("ignore")
+        env = make(name, test=test_env)
+        try:
+            res = {}
+            res.update(bench_step(env, args.nb_step))
+            res.update(bench_reset(env, args.nb_reset))
+            res.update(bench_simulate(env, args.nb_simulate))
+            res.update(bench_chronics_load(env, args.nb_reset))
+            res.update(bench_action_enumeration(env))
+            res.update(bench_vect(env, args.nb_vect))
+            res.update(bench_runner(env, args.nb_episode, args.max_iter, args.nb_process))
+        finally:
+            env.close()
+    return res
+
+
+class BenchmarkError(Exception):
+    """the benchmarks of an environment could not be performed"""
+    pass
+
+
+def _run_benchmarks_worker(queue, name, args, test_env):
+    try:
+        res = run_benchmarks(name, args, test_env=test_env)
+    except BaseException:
+        queue.put((False, traceback.format_exc()))
+    else:
+        queue.put((True, res))
+
+
+def run_benchmarks_in_process(name, args, test_env=True):
+    """
+    The benchmarks of each environment are performed in a new process: the classes created for the grid of an
+    environment (see `GridObjects.init_grid`) and loaded again by `EpisodeData.from_disk` would otherwise be mixed up
+    with the ones of the environments benchmarked before.
+
+    This process is forked from the main one, in which no environment is created.
+    """
+    if "fork" not in multiprocessing.get_all_start_methods():
+        return run_benchmarks(name, args, test_env=test_env)
+    ctx = multiprocessing.get_context("fork")
+    queue = ctx.Queue()
+    process = ctx.Process(target=_run_benchmarks_worker, args=(queue, name, args, test_env))
+    process.start()
+    try:
+        while True:
+            try:
+                is_ok, res = queue.get(timeout=QUEUE_POLL)
+                break
+            except queue_module.Empty:
+                if process.is_alive():
+                    continue
+                # the process may have sent its results just before exiting
+                try:
+                    is_ok, res = queue.get(timeout=QUEUE_POLL)
+                    break
+                except queue_module.Empty:
+                    raise BenchmarkError("The process running the benchmarks of \"{}\" stopped without sending "
+                                         "any result (exit code {})".format(name, process.exitcode))
+    finally:
+        process.join(timeout=QUEUE_POLL)
+        if process.is_alive():
+            process.terminate()
+            process.join()
+    if not is_ok:
+        raise BenchmarkError("The benchmarks of \"{}\" failed:\n{}".format(name, res))
+    return res
+
+
+def median_results(all_res):
+    """median of the value of each metric over the repetitions"""
+    res = {}
+    for key, metric in all_res[0].items():
+        res[key] = dict(metric)
+        res[key]["value"] = float(np.median([el[key]["value"] for el in all_res]))
+    return res
+
+
+def _package_version(name):
+    try:
+        module = __import__(name)
+        return str(module.__version__)
+    except (ImportError, AttributeError):
+        return None
+
+
+def machine_info():
+    try:
+        commit = subprocess.check_output(["git", "rev-parse", "HEAD"],
+                                         cwd=os.path.dirname(os.path.abspath(__file__)),
+                                         stderr=subprocess.DEVNULL).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {"platform": platform.platform(),
+            "processor": platform.processor(),
+            "machine": platform.machine(),
+            "cpu_count": os.cpu_count(),
+            "python": sys.version.split()[0],
+            "grid2op": grid2op.__version__,
+            "grid2op_commit": commit,
+            "numpy": _package_version("numpy"),
+            "scipy": _package_version("scipy"),
+            "pandas": _package_version("pandas"),
+            "pandapower": _package_version("pandapower"),
+            "date": time.strftime("%Y-%m-%d %H:%M:%S")}
+
+
+def compare(results, baseline, tolerance):
+    """
+    Compare the results with the baseline. Returns the list of the regressions: (env name, metric, baseline value,
+    new value)
+    """
+    regressions = []
+    for name, metrics in results["envs"].items():
+        if name not in baseline["envs"]:
+            continue
+        print("Environment \"{}\" (compared with the baseline)".format(name))
+        for key, metric in metrics.items():
+            if key not in baseline["envs"][name] or metric["higher_is_better"] is None:
+                continue
+            ref = baseline["envs"][name][key]["value"]
+            new = metric["value"]
+            if metric["higher_is_better"]:
+                is_regression = new < (1. - tolerance) * ref
+            else:
+                is_regression = new > (1. + tolerance) * ref
+            ratio = new / ref if ref else float("nan")
+            print("\t{:<25} {:>12.6g} -> {:>12.6g} {:<10} (x{:.2f}){}".format(key, ref, new, metric["unit"], ratio,
+                                                                               " REGRESSION" if is_regression else ""))
+            if is_regression:
+                regressions.append((name, key, ref, new))
+    return regressions
+
+
+def main(args):
+    results = {"machine": machine_info(),
+               "config": {k: v for k, v in vars(args).items() if k not in ("output", "baseline")},
+               "envs": {}}
+    for name in args.names:
+        try:
+            all_res = [run_benchmarks_in_process(name, args, test_env=not args.no_test) for _ in range(args.repeat)]
+        except BenchmarkError as exc_:
+            print("ERROR: {}".format(exc_), file=sys.stderr)
+            return 2
+        results["envs"][name] = median_results(all_res)
+        print("Environment \"{}\"".format(name))
+        for key, metric in results["envs"][name].items():
+            print("\t{:<25} {:>12.6g} {}".format(key, metric["value"], metric["unit"]))
+
+    with open(args.output, "w") as f:
+        json.dump(obj=results, fp=f, indent=4, sort_keys=True)
+    print("Results saved in \"{}\"".format(args.output))
+
+    if args.baseline is not None:
+        with open(args.baseline, "r") as f:
+            baseline = json.load(fp=f)
+        if baseline["machine"]["platform"] != results["machine"]["platform"] or \
+                baseline["machine"]["cpu_count"] != results["machine"]["cpu_count"]:
+            print("WARNING: the baseline has not been computed on the same machine")
+        regressions = compare(results, baseline, args.tolerance)
+        if regressions:
+            print("{} regression(s) found (tolerance {:.0f}%)".format(len(regressions), 100. * args.tolerance))
+            return 1
+        print("No regression found (tolerance {:.0f}%)".format(100. * args.tolerance))
+    return 0
+
+
+if __name__ == "__main__":
+    import argparse
+    from utils_benchmark import str2bool
+    parser = argparse.ArgumentParser(description='Benchmark the main operations of grid2op and track the regressions')
+    parser.add_argument('--names', default=ENV_NAMES, type=str, nargs="+",
+                        help='Environment names to be used for the benchmark.')
+    parser.add_argument('--output', default="benchmark_results.json", type=str,
+                        help='Path of the json file where the results are saved.')
+    parser.add_argument('--baseline', default=None, type=str,
+                        help='Path of the json file of a previous run to compare the results with.')
+    parser.add_argument('--tolerance', type=float, default=TOLERANCE,
+                        help='Relative degradation above which a benchmark is reported as a regression.')
+    parser.add_argument('--repeat', type=int, default=NB_REPEAT,
+                        help='Number of times each benchmark is performed (the median is kept).')
+    parser.add_argument('--nb_step', type=int, default=NB_STEP,
+                        help='Number of steps performed to assess the step throughput.')
+    parser.add_argument('--nb_simulate', type=int, default=NB_SIMULATE,
+                        help='Number of calls to obs.simulate performed to assess its throughput.')
+    parser.add_argument('--nb_reset', type=int, default=NB_RESET,
+                        help='Number of resets (and of chronics loaded) performed to assess their duration.')
+    parser.add_argument('--nb_vect', type=int, default=NB_VECT,
+                        help='Number of conversions of an observation to / from a vector.')
+    parser.add_argument('--nb_episode', type=int, default=NB_EPISODE,
+                        help='Number of episodes played by the runner.')
+    parser.add_argument('--max_iter', type=int, default=MAX_ITER,
+                        help='Maximum number of steps of each episode played by the runner.')
+    parser.add_argument('--nb_process', type=int, default=NB_PROCESS,
+                        help='Number of processes used by the runner in parallel.')
+    parser.add_argument("--no_test", type=str2bool, nargs='?',
+                        const=True, default=False,
+                        help="Do not use a test environment for the profiling (default to False: meaning you use a test env)")
+    args = parser.parse_args()
+    sys.exit(main(args))
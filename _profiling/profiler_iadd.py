@@ -0,0 +1,91 @@
+# Copyright (c) 2019-2020, RTE (https://www.rte-france.com)
+# See AUTHORS.txt
+# This Source Code Form is subject to the terms of the Mozilla Public License, version 2.0.
+# If a copy of the Mozilla Public License, version 2.0 was not distributed with this file,
+# you can obtain one at http://mozilla.org/MPL/2.0/.
+# SPDX-License-Identifier: MPL-2.0
+# This file is part of Grid2Op, Grid2Op a testbed platform to model sequential decision making in power systems.
+
+"""
+This file should be used to assess the cost of combining the actions at each step of an environment: the agent action,
+the environment modification and the voltage control action are added to one another (:func:`BaseAction.__iadd__`)
+and to the backend action (:func:`_BackendAction.__iadd__`).
+
+No powerflow is computed here, only the combination of the actions is timed (as it is done in
+:func:`grid2op.Environment.BaseEnv.step`).
+"""
+
+import time
+import warnings
+import numpy as np
+
+from grid2op import make
+from grid2op.Action import CompleteAction
+
+ENV_NAME = "rte_case14_realistic"
+NB_ITER = 10000
+
+
+def get_actions(env):
+    """build a set of typical actions: do nothing, a line disconnection, a topology change and a redispatching"""
+    res = [env.action_space(),
+           env.action_space({"set_line_status": [(0, -1)]}),
+           env.action_space({"change_bus": {"substations_id": [(1, [True, False, True, False, False, True])]}}),
+           env.action_space({"redispatch": [(0, 1.)]})
+           ]
+    return res
+
+
+def time_iadd(env, actions, nb_iter):
+    bk_act = env._backend_action
+    env_act = env.helper_action_env({"injection": {"load_p": np.zeros(env.n_load),
+                                                   "prod_p": np.zeros(env.n_gen)}})
+    volt_act = env.helper_action_env({"injection": {"prod_v": np.ones(env.n_gen)}})
+    nb_act = len(actions)
+
+    tmp = env.helper_action_env()
+    time_act = 0.
+    time_bk = 0.
+    for i in range(nb_iter):
+        act = actions[i % nb_act]
+        tmp.reset()
+
+        beg_ = time.perf_counter()
+        tmp += env_act
+        tmp += act
+        time_act += time.perf_counter() - beg_
+
+        beg_ = time.perf_counter()
+        bk_act += act
+        bk_act += env_act
+        bk_act += volt_act
+        time_bk += time.perf_counter() - beg_
+        bk_act.reset()
+    return time_act, time_bk
+
+
+def main(name, nb_iter, test_env=True):
+    with warnings.catch_warnings():
+        warnings.filterwarnings("ignore")
+        env = make(name, test=test_env, action_class=CompleteAction)
+    actions = get_actions(env)
+    time_act, time_bk = time_iadd(env, actions, nb_iter)
+    print("Environment \"{}\" ({} iterations)".format(name, nb_iter))
+    print("\tTime BaseAction.__iadd__ (x2): {:.2f}us per step".format(1e6 * time_act / nb_iter))
+    print("\tTime _BackendAction.__iadd__ (x3): {:.2f}us per step".format(1e6 * time_bk / nb_iter))
+    env.close()
+
+
+if __name__ == "__main__":
+    import argparse
+    from utils_benchmark import str2bool
+    parser = argparse.ArgumentParser(description='Benchmark the combination of actions performed at each step')
+    parser.add_argument('--name', default=ENV_NAME, type=str,
+                        help='Environment name to be used for the benchmark.')
+    parser.add_argument('--number', type=int, default=NB_ITER,
+                        help='Number of iterations for which the benchamark will be run.')
+    parser.add_argument("--no_test", type=str2bool, nargs='?',
+                        const=True, default=False,
+                        help="Do not use a test environment for the profiling (default to False: meaning you use a test env)")
+    args = parser.parse_args()
+    main(str(args.name), int(args.number), test_env=not args.no_test)
@@ -0,0 +1,67 @@
+# Copyright (c) 2019-2020, RTE (https://www.rte-france.com)
+# See AUTHORS.txt
+# This Source Code Form is subject to the terms of the Mozilla Public License, version 2.0.
+# If a copy of the Mozilla Public License, version 2.0 was not distributed with this file,
+# you can obtain one at http://mozilla.org/MPL/2.0/.
+# SPDX-License-Identifier: MPL-2.0
+# This file is part of Grid2Op, Grid2Op a testbed platform to model sequential decision making in power systems.
+
+"""
+This file should be used to assess the throughput of the :class:`grid2op.Runner.Runner`, in number of episodes per
+second, when the episodes are played in parallel (:func:`grid2op.Runner.Runner.run` with `nb_process` > 1).
+
+The episodes are short (`max_iter` steps) so that the time spent to build and reset the environments in each process
+is not negligible compared to the time spent to play the episodes.
+"""
+
+import time
+import warnings
+
+from grid2op import make
+from grid2op.Agent import DoNothingAgent
+from grid2op.Runner import Runner
+
+ENV_NAME = "rte_case14_realistic"
+NB_EPISODE = 64
+NB_PROCESS = 8
+MAX_ITER = 10
+
+
+def main(name, nb_episode, nb_process, max_iter, test_env=True, longest_first=False):
+    with warnings.catch_warnings():
+        warnings.filterwarnings("ignore")
+        env = make(name, test=test_env)
+        runner = Runner(**env.get_params_for_runner(), agentClass=DoNothingAgent)
+        beg_ = time.perf_counter()
+        res = runner.run(nb_episode=nb_episode, nb_process=nb_process, max_iter=max_iter,
+                         longest_first=longest_first)
+        total_time = time.perf_counter() - beg_
+    env.close()
+    nb_step = sum(nb_time_step for *_, nb_time_step, _ in res)
+    print("Environment \"{}\" ({} episodes of at most {} steps, {} processes)"
+          "".format(name, nb_episode, max_iter, nb_process))
+    print("\tTotal time: {:.2f}s ({} steps played)".format(total_time, nb_step))
+    print("\tThroughput: {:.2f} episodes per second".format(nb_episode / total_time))
+
+
+if __name__ == "__main__":
+    import argparse
+    from utils_benchmark import str2bool
+    parser = argparse.ArgumentParser(description='Benchmark the number of episodes per second played by the runner')
+    parser.add_argument('--name', default=ENV_NAME, type=str,
+                        help='Environment name to be used for the benchmark.')
+    parser.add_argument('--nb_episode', type=int, default=NB_EPISODE,
+                        help='Number of episodes played.')
+    parser.add_argument('--nb_process', type=int, default=NB_PROCESS,
+                        help='Number of processes used to play the episodes.')
+    parser.add_argument('--max_iter', type=int, default=MAX_ITER,
+                        help='Maximum number of steps of each episode.')
+    parser.add_argument("--no_test", type=str2bool, nargs='?',
+                        const=True, default=False,
+                        help="Do not use a test environment for the profiling (default to False: meaning you use a test env)")
+    parser.add_argument("--longest_first", type=str2bool, nargs='?',
+                        const=True, default=False,
+                        help="Start with the longest episodes (default to False)")
+    args = parser.parse_args()
+    main(str(args.name), int(args.nb_episode), int(args.nb_process), int(args.max_iter), test_env=not args.no_test,
+         longest_first=args.longest_first)
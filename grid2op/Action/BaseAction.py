@@ -7,6 +7,7 @@
 # This file is part of Grid2Op, Grid2Op a testbed platform to model sequential decision making in power systems.
 
 
+import copy
 import numpy as np
 import warnings
 
@@ -180,6 +181,14 @@ class BaseAction(GridObjects):
         on a generator, and on another you ask +10 MW then the total setpoint for this generator that the environment
         will try to implement is +20MW.
 
+    _ambiguity_checked: ``bool`` or ``None``
+        ``None`` if the action has not been checked for ambiguity since its last modification. Otherwise it stores the
+        value of :attr:`BaseAction._single_act` used when the action has been found not ambiguous. It is reset by
+        :func:`BaseAction._reset_vect`, which is called each time the action is modified by
+        :func:`BaseAction.update`, :func:`BaseAction.__iadd__`, :func:`BaseAction.from_vect` or
+        :func:`BaseAction.reset`. **NB** If you modify the internal vectors of an action directly, you need to call
+        :func:`BaseAction._reset_vect` afterwards.
+
     """
     authorized_keys = {"injection",
                        "hazards", "maintenance", "set_line_status", "change_line_status",
@@ -229,6 +238,9 @@ class BaseAction(GridObjects):
         self._vectorized = None
         self._lines_impacted = None
         self._subs_impacted = None
+        self._impact_status_independant = False
+        self._impact_powerline_status = None
+        self._ambiguity_checked = None
 
         # shunts
         if self.shunts_data_available:
@@ -265,6 +277,7 @@ class BaseAction(GridObjects):
         return res
 
     def _assign_attr_from_name(self, attr_nm, vect):
+        self._reset_vect()
         if hasattr(self, attr_nm):
             super()._assign_attr_from_name(attr_nm, vect)
         else:
@@ -299,7 +312,7 @@ class BaseAction(GridObjects):
             Or any of its more precise subclasses, depending on which assumption is not met.
 
         """
-        self._check_for_ambiguity()
+        self._check_for_ambiguity_cached()
 
     def get_set_line_status_vect(self):
         """
@@ -455,6 +468,17 @@ class BaseAction(GridObjects):
         Any such "change" that would be illegal is declared as "illegal" regardless of the real impact of this action
         on the powergrid.
 
+        The results are stored in the action (see :attr:`BaseAction._lines_impacted` and
+        :attr:`BaseAction._subs_impacted`) and are not recomputed until the action is modified. This is why the
+        vectors returned should not be modified.
+
+        Parameters
+        ----------
+        powerline_status: :class:`numpy.array`, dtype:dt_bool
+            The status of the powerlines (``True`` connected, ``False`` disconnected). If ``None`` all the powerlines
+            are considered disconnected: acting on the bus of the end of a powerline whose status is also modified does
+            not impact the substation.
+
         Returns
         -------
         lines_impacted: :class:`numpy.array`, dtype:dt_bool
@@ -468,23 +492,43 @@ class BaseAction(GridObjects):
             :attr:`BaseAction._subs_impacted` for more information.
 
         """
-        if powerline_status is None:
-            isnotconnected = np.full(self.n_line, fill_value=True, dtype=dt_bool)
-        else:
-            isnotconnected = ~powerline_status
-
-        self._lines_impacted = self._switch_line_status | (self._set_line_status != 0)
-        self._subs_impacted = np.full(shape=self.sub_info.shape, fill_value=False, dtype=dt_bool)
-
-        # todo could be set as a class attribute
-        _topo_vect_to_sub = np.repeat(np.arange(self.n_sub), repeats=self.sub_info)
+        if self._lines_impacted is not None:
+            # the impact has already been computed since the last modification of this action
+            if self._impact_status_independant:
+                return self._lines_impacted, self._subs_impacted
+            if powerline_status is None and self._impact_powerline_status is None:
+                return self._lines_impacted, self._subs_impacted
+            if powerline_status is not None and self._impact_powerline_status is not None and \
+                    np.array_equal(powerline_status, self._impact_powerline_status):
+                return self._lines_impacted, self._subs_impacted
+
+        lines_impacted = self._switch_line_status | (self._set_line_status != 0)
+        subs_impacted = np.full(shape=self.sub_info.shape, fill_value=False, dtype=dt_bool)
 
         # compute the changes of the topo vector
         effective_change = self._change_bus_vect | (self._set_topo_vect != 0)
         # remove the change due to powerline only
-        effective_change[self.line_or_pos_topo_vect[self._lines_impacted & isnotconnected]] = False
-        effective_change[self.line_ex_pos_topo_vect[self._lines_impacted & isnotconnected]] = False
-        self._subs_impacted[_topo_vect_to_sub[effective_change]] = True
+        impacted_or = self.line_or_pos_topo_vect[lines_impacted]
+        impacted_ex = self.line_ex_pos_topo_vect[lines_impacted]
+        status_independant = not (effective_change[impacted_or].any() or effective_change[impacted_ex].any())
+        if not status_independant:
+            if powerline_status is None:
+                isnotconnected = lines_impacted
+            else:
+                isnotconnected = lines_impacted & ~powerline_status
+            effective_change[self.line_or_pos_topo_vect[isnotconnected]] = False
+            effective_change[self.line_ex_pos_topo_vect[isnotconnected]] = False
+
+        topo_vect_to_sub = self._topo_vect_to_sub
+        if topo_vect_to_sub is None:
+            # the class has not been initialized with :func:`GridObjects.init_grid`
+            topo_vect_to_sub = np.repeat(np.arange(self.n_sub), repeats=self.sub_info)
+        subs_impacted[topo_vect_to_sub[effective_change]] = True
+
+        self._lines_impacted = lines_impacted
+        self._subs_impacted = subs_impacted
+        self._impact_status_independant = status_independant
+        self._impact_powerline_status = None if powerline_status is None else copy.copy(powerline_status)
         return self._lines_impacted, self._subs_impacted
 
     def reset(self):
@@ -513,9 +557,7 @@ class BaseAction(GridObjects):
         # redispatching vector
         self._redispatch[:] = 0.
 
-        self._vectorized = None
-        self._lines_impacted = None
-        self._subs_impacted = None
+        self._reset_vect()
 
         # shunts
         if self.shunts_data_available:
@@ -536,6 +578,23 @@ class BaseAction(GridObjects):
         else:
             getattr(self, attr_name)[:] = new_value
 
+    @staticmethod
+    def _aux_iadd_set_change(other_set, other_change, me_set, me_change):
+        """
+        Combine the "change" part of two (set, change) vectors, inplace in `me_change`. This is common to the
+        powerline status and to the buses.
+        """
+        # i change, but so does the other, i do nothing
+        canceled_change = other_change & me_change
+        # i dont change, the other change, i change
+        update_change = other_change & ~me_change
+        # Defered apply to prevent conflicts
+        me_change[canceled_change] = False
+        me_change[update_change] = True
+
+        # i change, but the other set, it's erased
+        me_change[other_set != 0] = False
+
     def __iadd__(self, other):
         """
         Add an action to this one.
@@ -554,24 +613,23 @@ class BaseAction(GridObjects):
         -------
 
         """
+        self._reset_vect()
 
         # deal with injections
-        for el in self.attr_list_vect:
-            if el in other._dict_inj:
-                if el not in self._dict_inj:
-                    self._dict_inj[el] = other._dict_inj[el]
-                else:
-                    val = other._dict_inj[el]
-                    ok_ind = np.isfinite(val)
-                    self._dict_inj[el][ok_ind] = val[ok_ind]
-        # warning if the action cannot be added
-        for el in other._dict_inj:
-            if not el in self.attr_list_set:
+        for el, val in other._dict_inj.items():
+            if el not in self.attr_list_set:
+                # warning if the action cannot be added
                 warnings.warn("The action added to me will be cut, because i don't support modification of \"{}\""
                               "".format(el))
+            elif el not in self._dict_inj:
+                self._dict_inj[el] = val
+            else:
+                ok_ind = np.isfinite(val)
+                self._dict_inj[el][ok_ind] = val[ok_ind]
+
         # redispatching
         redispatching = other._redispatch
-        if np.any(redispatching != 0.):
+        if redispatching.any():
             if "_redispatch" not in self.attr_list_set:
                 warnings.warn("The action added to me will be cut, because i don't support modification of \"{}\""
                               "".format("_redispatch"))
@@ -582,84 +640,69 @@ class BaseAction(GridObjects):
         # set and change status
         other_set = other._set_line_status
         other_change = other._switch_line_status
-        me_set = self._set_line_status
-        me_change = self._switch_line_status
+        if other_change.any() or other_set.any():
+            me_set = self._set_line_status
+            me_change = self._switch_line_status
+            self._aux_iadd_set_change(other_set, other_change, me_set, me_change)
 
-        # i change, but so does the other, i do nothing
-        canceled_change = other_change & me_change
-        # i dont change, the other change, i change
-        update_change = other_change & ~me_change
-        # Defered apply to prevent conflicts
-        me_change[canceled_change] = False
-        me_change[update_change] = True
+            # i set, but the other change, set to the opposite
+            inverted_set = other_change & (me_set != 0)
+            # so change +1 becomes -1 and -1 becomes +1
+            me_set[inverted_set] *= -1
+            # Has been inverted, cancel change
+            me_change[inverted_set] = False
 
-        # i change, but the other set, it's erased
-        me_change[other_set != 0 & me_change] = False
+            # i set, the other set
+            me_set[other_set != 0] = other_set[other_set != 0]
 
-        # i set, but the other change, set to the opposite
-        inverted_set = other_change & (me_set != 0)
-        # so change +1 becomes -1 and -1 becomes +1
-        me_set[inverted_set] *= -1
-        # Has been inverted, cancel change
-        me_change[inverted_set] = False
-
-        # i set, the other set
-        me_set[other_set != 0] = other_set[other_set != 0]
-
-        self._assign_iadd_or_warn("_set_line_status", me_set)
-        self._assign_iadd_or_warn("_switch_line_status", me_change)
+            self._assign_iadd_or_warn("_set_line_status", me_set)
+            self._assign_iadd_or_warn("_switch_line_status", me_change)
 
         # set and change bus
         other_set = other._set_topo_vect
         other_change = other._change_bus_vect
-        me_set = self._set_topo_vect
-        me_change = self._change_bus_vect
-
-        # i change, but so does the other, i do nothing
-        canceled_change = other_change & me_change
-        # i dont change, the other change, i change
-        update_change = other_change & ~me_change
-        # Defered apply to prevent conflicts
-        me_change[canceled_change] = False
-        me_change[update_change] = True
-
-        # i change, but the other set, it's erased
-        me_change[other_set != 0 & me_change] = False
-
-        # i set, but the other change, set to the opposite
-        inverted_set = other_change & (me_set != 0)
-        # so change +1 becomes +2 and +2 becomes +1
-        me_set[inverted_set] -= 1  # 1 becomes 0 and 2 becomes 1
-        me_set[inverted_set] *= -1  # 1 is 0 and 2 becomes -1
-        me_set[inverted_set] += 2  # 1 is 2 and 2 becomes 1
-        # Has been inverted, cancel change
-        me_change[inverted_set] = False
-
-        # i set, the other set
-        me_set[other_set != 0] = other_set[other_set != 0]
-        
-        self._assign_iadd_or_warn("_set_topo_vect", me_set)
-        self._assign_iadd_or_warn("_change_bus_vect", me_change)
+        if other_change.any() or other_set.any():
+            me_set = self._set_topo_vect
+            me_change = self._change_bus_vect
+            self._aux_iadd_set_change(other_set, other_change, me_set, me_change)
+
+            # i set, but the other change, set to the opposite
+            inverted_set = other_change & (me_set != 0)
+            # so change +1 becomes +2 and +2 becomes +1
+            me_set[inverted_set] -= 1  # 1 becomes 0 and 2 becomes 1
+            me_set[inverted_set] *= -1  # 1 is 0 and 2 becomes -1
+            me_set[inverted_set] += 2  # 1 is 2 and 2 becomes 1
+            # Has been inverted, cancel change
+            me_change[inverted_set] = False
+
+            # i set, the other set
+            me_set[other_set != 0] = other_set[other_set != 0]
+
+            self._assign_iadd_or_warn("_set_topo_vect", me_set)
+            self._assign_iadd_or_warn("_change_bus_vect", me_change)
 
         # shunts
         if self.shunts_data_available:
             val = other.shunt_p
             ok_ind = np.isfinite(val)
-            shunt_p = 1.0 * self.shunt_p
-            shunt_p[ok_ind] = val[ok_ind]
-            self._assign_iadd_or_warn("shunt_p", shunt_p)
+            if ok_ind.any():
+                shunt_p = 1.0 * self.shunt_p
+                shunt_p[ok_ind] = val[ok_ind]
+                self._assign_iadd_or_warn("shunt_p", shunt_p)
 
             val = other.shunt_q
             ok_ind = np.isfinite(val)
-            shunt_q = 1.0 * self.shunt_q
-            shunt_q[ok_ind] = val[ok_ind]
-            self._assign_iadd_or_warn("shunt_q", shunt_q)
+            if ok_ind.any():
+                shunt_q = 1.0 * self.shunt_q
+                shunt_q[ok_ind] = val[ok_ind]
+                self._assign_iadd_or_warn("shunt_q", shunt_q)
 
             val = other.shunt_bus
             ok_ind = val != 0
-            shunt_bus = 1 * self.shunt_bus
-            shunt_bus[ok_ind] = val[ok_ind]
-            self._assign_iadd_or_warn("shunt_bus", shunt_bus)
+            if ok_ind.any():
+                shunt_bus = 1 * self.shunt_bus
+                shunt_bus[ok_ind] = val[ok_ind]
+                self._assign_iadd_or_warn("shunt_bus", shunt_bus)
 
         return self
 
@@ -709,7 +752,7 @@ class BaseAction(GridObjects):
 
         """
 
-        self._check_for_ambiguity()
+        self._check_for_ambiguity_cached()
 
         dict_inj = self._dict_inj
         set_line_status = self._set_line_status
@@ -1038,6 +1081,23 @@ class BaseAction(GridObjects):
         self._vectorized = None
         self._subs_impacted = None
         self._lines_impacted = None
+        self._ambiguity_checked = None
+
+    def _set_redispatch(self, values):
+        """
+        Set the redispatching vector :attr:`BaseAction._redispatch` to `values` (a scalar or an array of size
+        `n_gen`) in place. If this modifies it, what is cached about the action is invalidated (see
+        :func:`BaseAction._reset_vect`).
+
+        Parameters
+        ----------
+        values: ``float`` or :class:`numpy.ndarray`, dtype:float
+            The new redispatching vector
+        """
+        if np.all(self._redispatch == values):
+            return
+        self._redispatch[:] = values
+        self._reset_vect()
 
     def update(self, dict_):
         """
@@ -1241,7 +1301,7 @@ class BaseAction(GridObjects):
             More information about the error. If the action is not ambiguous, it values to ``None``
         """
         try:
-            self._check_for_ambiguity()
+            self._check_for_ambiguity_cached()
             res = False
             info = None
         except AmbiguousAction as e:
@@ -1249,6 +1309,25 @@ class BaseAction(GridObjects):
             res = True
         return res, info
 
+    def _check_for_ambiguity_cached(self):
+        """
+        Performs the same check as :func:`BaseAction._check_for_ambiguity` but only if the action has been modified
+        since the last successful check (see :attr:`BaseAction._ambiguity_checked`).
+
+        This is useful for actions that are used multiple times (for example the actions stored in a
+        :class:`grid2op.Converter.IdToAct` converter): they are fully checked only once.
+
+        Raises
+        -------
+        :class:`grid2op.Exceptions.AmbiguousAction`
+            Or any of its more precise subclasses, depending on which assumption is not met.
+
+        """
+        if self._ambiguity_checked is not None and self._ambiguity_checked == self._single_act:
+            return
+        self._check_for_ambiguity()
+        self._ambiguity_checked = self._single_act
+
     def _check_for_ambiguity(self):
         """
         This method checks if an action is ambiguous or not. If the instance is ambiguous, an
@@ -1299,7 +1378,16 @@ class BaseAction(GridObjects):
 
 
         """
-        if np.any(self._set_line_status[self._switch_line_status] != 0):
+        # the checks below are only performed on the part of the action that is used, a "do nothing" action, for
+        # example, only goes through the size checks
+        set_status = self._set_line_status
+        switch_status = self._switch_line_status
+        set_topo_vect = self._set_topo_vect
+        change_bus_vect = self._change_bus_vect
+        redispatch = self._redispatch
+
+        is_switch_status = switch_status.any()
+        if is_switch_status and set_status[switch_status].any():
             raise InvalidLineStatus("You asked to change the status (connected / disconnected) of a powerline by"
                                     " using the keyword \"change_status\" and set this same line state in "
                                     "\"set_status\" "
@@ -1322,40 +1410,40 @@ class BaseAction(GridObjects):
                 raise InvalidNumberOfGenerators("This action acts on {} generators while there are {} in "
                                                 "the _grid".format(len(self._dict_inj["prod_v"]), self.n_gen))
 
-        if len(self._switch_line_status) != self.n_line:
+        if len(switch_status) != self.n_line:
                 raise InvalidNumberOfLines("This action acts on {} lines while there are {} in "
-                                           "the _grid".format(len(self._switch_line_status), self.n_line))
+                                           "the _grid".format(len(switch_status), self.n_line))
 
-        if len(self._set_topo_vect) != self.dim_topo:
+        if len(set_topo_vect) != self.dim_topo:
                 raise InvalidNumberOfObjectEnds("This action acts on {} ends of object while there are {} "
-                                                "in the _grid".format(len(self._set_topo_vect), self.dim_topo))
-        if len(self._change_bus_vect) != self.dim_topo:
+                                                "in the _grid".format(len(set_topo_vect), self.dim_topo))
+        if len(change_bus_vect) != self.dim_topo:
                 raise InvalidNumberOfObjectEnds("This action acts on {} ends of object while there are {} "
-                                                "in the _grid".format(len(self._change_bus_vect), self.dim_topo))
+                                                "in the _grid".format(len(change_bus_vect), self.dim_topo))
 
-        if len(self._redispatch) != self.n_gen:
+        if len(redispatch) != self.n_gen:
             raise InvalidNumberOfGenerators("This action acts on {} generators (redispatching= while "
-                                            "there are {} in the grid".format(len(self._redispatch), self.n_gen))
+                                            "there are {} in the grid".format(len(redispatch), self.n_gen))
 
         # redispatching specific check
-        if np.any(self._redispatch != 0.):
+        if redispatch.any():
             if not self.redispatching_unit_commitment_availble:
                 raise UnitCommitorRedispachingNotAvailable("Impossible to use a redispatching action in this "
                                                            "environment. Please set up the proper costs for generator")
 
-            if np.any(self._redispatch[~self.gen_redispatchable] != 0.):
+            if redispatch[~self.gen_redispatchable].any():
                 raise InvalidRedispatching("Trying to apply a redispatching action on a non redispatchable generator")
 
             if self._single_act:
                 # TODO check that when action is made (and check also the buses id, don't put 3 for example...)
-                if np.any(self._redispatch > self.gen_max_ramp_up):
+                if np.any(redispatch > self.gen_max_ramp_up):
                    raise InvalidRedispatching("Some redispatching amount are above the maximum ramp up")
-                if np.any(-self._redispatch > self.gen_max_ramp_down):
+                if np.any(-redispatch > self.gen_max_ramp_down):
                    raise InvalidRedispatching("Some redispatching amount are bellow the maximum ramp down")
 
                 if "prod_p" in self._dict_inj:
                     new_p = self._dict_inj["prod_p"]
-                    tmp_p = new_p + self._redispatch
+                    tmp_p = new_p + redispatch
                     indx_ok = np.isfinite(new_p)
                     if np.any(tmp_p[indx_ok] > self.gen_pmax[indx_ok]):
                         raise InvalidRedispatching("Some redispatching amount, cumulated with the production setpoint, "
@@ -1365,19 +1453,22 @@ class BaseAction(GridObjects):
                                                    "are below pmin for some generator.")
 
         # topological action
-        if np.any(self._set_topo_vect[self._change_bus_vect] != 0):
-            raise InvalidBusStatus("You asked to change the bus of an object with"
-                                   " using the keyword \"change_bus\" and set this same object state in \"set_bus\""
-                                   ". This ambiguous behaviour is not supported")
-        if np.any(self._set_topo_vect < -1):
-            raise InvalidBusStatus("Invalid set_bus. Buses should be either -1 (disconnect), 0 (change nothing),"
-                                   "1 (assign this object to bus one) or 2 (assign this object to bus"
-                                   "2). A negative number has been found.")
-        if np.any(self._set_topo_vect > 2):
-            raise InvalidBusStatus("Invalid set_bus. Buses should be either -1 (disconnect), 0 (change nothing),"
-                                   "1 (assign this object to bus one) or 2 (assign this object to bus"
-                                   "2). A number higher than 2 has been found: substations with more than 2 busbars"
-                                   "are not supported by grid2op.")
+        is_set_topo = set_topo_vect.any()
+        is_change_bus = change_bus_vect.any()
+        if is_set_topo:
+            if is_change_bus and set_topo_vect[change_bus_vect].any():
+                raise InvalidBusStatus("You asked to change the bus of an object with"
+                                       " using the keyword \"change_bus\" and set this same object state in \"set_bus\""
+                                       ". This ambiguous behaviour is not supported")
+            if set_topo_vect.min() < -1:
+                raise InvalidBusStatus("Invalid set_bus. Buses should be either -1 (disconnect), 0 (change nothing),"
+                                       "1 (assign this object to bus one) or 2 (assign this object to bus"
+                                       "2). A negative number has been found.")
+            if set_topo_vect.max() > 2:
+                raise InvalidBusStatus("Invalid set_bus. Buses should be either -1 (disconnect), 0 (change nothing),"
+                                       "1 (assign this object to bus one) or 2 (assign this object to bus"
+                                       "2). A number higher than 2 has been found: substations with more than 2 busbars"
+                                       "are not supported by grid2op.")
 
         if False:
             # TODO find an elegant way to disable that
@@ -1391,23 +1482,27 @@ class BaseAction(GridObjects):
                         raise InvalidLineStatus("You ask to reconnect powerline {} yet didn't tell on"
                                                 " which bus.".format(q_id))
 
-        # if i disconnected of a line, but i modify also the bus where it's connected
-        idx = self._set_line_status == -1
-        id_disc = np.where(idx)[0]
-        if np.any(self._set_topo_vect[self.line_or_pos_topo_vect[id_disc]] > 0) or \
-                np.any(self._set_topo_vect[self.line_ex_pos_topo_vect[id_disc]] > 0):
-                    raise InvalidLineStatus("You ask to disconnect a powerline but also to connect it "
-                                            "to a certain bus.")
-        if np.any(self._change_bus_vect[self.line_or_pos_topo_vect[id_disc]] > 0) or \
-                np.any(self._change_bus_vect[self.line_ex_pos_topo_vect[id_disc]] > 0):
-            raise InvalidLineStatus("You ask to disconnect a powerline but also to change its bus.")
-
-        if np.any(self._change_bus_vect[self.line_or_pos_topo_vect[self._set_line_status == 1]]):
-            raise InvalidLineStatus("You ask to connect an origin powerline but also to *change* the bus  to which it "
-                                    "is connected. This is ambiguous. You must *set* this bus instead.")
-        if np.any(self._change_bus_vect[self.line_ex_pos_topo_vect[self._set_line_status == 1]]):
-            raise InvalidLineStatus("You ask to connect an extremity powerline but also to *change* the bus  to which "
-                                    "it is connected. This is ambiguous. You must *set* this bus instead.")
+        if (is_set_topo or is_change_bus) and set_status.any():
+            # if i disconnected of a line, but i modify also the bus where it's connected
+            id_disc = np.where(set_status == -1)[0]
+            if is_set_topo and (np.any(set_topo_vect[self.line_or_pos_topo_vect[id_disc]] > 0) or
+                                np.any(set_topo_vect[self.line_ex_pos_topo_vect[id_disc]] > 0)):
+                raise InvalidLineStatus("You ask to disconnect a powerline but also to connect it "
+                                        "to a certain bus.")
+            if is_change_bus:
+                if change_bus_vect[self.line_or_pos_topo_vect[id_disc]].any() or \
+                        change_bus_vect[self.line_ex_pos_topo_vect[id_disc]].any():
+                    raise InvalidLineStatus("You ask to disconnect a powerline but also to change its bus.")
+
+                id_reco = set_status == 1
+                if change_bus_vect[self.line_or_pos_topo_vect[id_reco]].any():
+                    raise InvalidLineStatus("You ask to connect an origin powerline but also to *change* the bus  to "
+                                            "which it is connected. This is ambiguous. You must *set* this bus "
+                                            "instead.")
+                if change_bus_vect[self.line_ex_pos_topo_vect[id_reco]].any():
+                    raise InvalidLineStatus("You ask to connect an extremity powerline but also to *change* the bus  "
+                                            "to which it is connected. This is ambiguous. You must *set* this bus "
+                                            "instead.")
 
         if self.shunts_data_available:
             if self.shunt_p.shape[0] != self.n_shunt:
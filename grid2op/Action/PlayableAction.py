@@ -77,7 +77,7 @@ class PlayableAction(BaseAction):
         if self._dict_inj:
             raise AmbiguousAction("Injections actions are not playable.")
 
-        self._check_for_ambiguity()
+        self._check_for_ambiguity_cached()
         return {}, \
             self._set_line_status, self._switch_line_status, \
             self._set_topo_vect, self._change_bus_vect,\
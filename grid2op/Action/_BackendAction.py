@@ -15,12 +15,26 @@ from grid2op.Space import GridObjects
 
 # TODO see if it can be done in c++ easily
 class ValueStore:
+    """
+    Internal class, use at your own risk.
+
+    Stores the values of one type of setpoint (for example the active production of the generators or the topology
+    vector) and which of them have been modified since the last call to :func:`ValueStore.reset`.
+
+    The positions of the modified elements can be retrieved, as a single array, with
+    :func:`ValueStore.changed_indices` and their new values with :func:`ValueStore.changed_values`. This is the
+    preferred way for a backend to apply the modifications (with fancy indexing, all at once) rather than to
+    iterate through this object, which yields the tuples ``(position, new_value)`` one by one.
+
+    """
     def __init__(self, size, dtype):
         ## TODO at the init it's mandatory to have everything at "1" here
         # if topo is not "fully connected" it will not work
         self.values = np.ones(size, dtype=dtype)
         self.changed = np.full(size, dtype=dt_bool, fill_value=False)
         self.last_index = 0
+        # positions of the elements that changed, computed only when needed (None if it needs to be computed again)
+        self._changed_ids = None
         self.__size = size
 
         if issubclass(dtype, dt_int):
@@ -31,21 +45,25 @@ class ValueStore:
             self.change_val = self._change_val_float
 
     def _set_val_float(self, newvals):
+        self._changed_ids = None
         changed_ = np.isfinite(newvals)
         self.changed[changed_] = True
         self.values[changed_] = newvals[changed_]
 
     def _set_val_int(self, newvals):
+        self._changed_ids = None
         changed_ = newvals != 0
         self.changed[changed_] = True
         self.values[changed_] = newvals[changed_]
 
     def _change_val_int(self, newvals):
+        self._changed_ids = None
         changed_ = newvals & (self.values > 0)
         self.changed[changed_] = True
         self.values[changed_] = (1 - self.values[changed_]) + 2
 
     def _change_val_float(self, newvals):
+        self._changed_ids = None
         changed_ = newvals != 0.
         self.changed[changed_] = True
         self.values[changed_] += newvals[changed_]
@@ -53,8 +71,10 @@ class ValueStore:
     def reset(self):
         self.changed[:] = False
         self.last_index = 0
+        self._changed_ids = None
 
     def change_status(self, switch, lineor_id, lineex_id, old_vect):
+        self._changed_ids = None
         # changed
         changed_ = switch
 
@@ -82,6 +102,7 @@ class ValueStore:
         self.values[reco_ex] = old_vect[reco_ex]
 
     def set_status(self, set, lineor_id, lineex_id, old_vect):
+        self._changed_ids = None
         id_or = lineor_id
         id_ex = lineex_id
 
@@ -119,28 +140,53 @@ class ValueStore:
         self.reset()
         self.changed[:] = True
 
+    def changed_indices(self):
+        """
+        Positions of the elements that have been modified, in increasing order. They are computed once and kept
+        until a new modification is made.
+
+        Returns
+        -------
+        res: ``numpy.ndarray``, dtype:int
+            The positions of the modified elements (this array is read only)
+
+        """
+        if self._changed_ids is None:
+            self._changed_ids = np.flatnonzero(self.changed)
+            self._changed_ids.flags.writeable = False
+        return self._changed_ids
+
+    def changed_values(self):
+        """
+        New values of the elements that have been modified, in the same order as :func:`ValueStore.changed_indices`
+
+        Returns
+        -------
+        res: ``numpy.ndarray``
+            The new values of the modified elements (this is a copy)
+
+        """
+        return self.values[self.changed_indices()]
+
     def __getitem__(self, item):
         return self.values[item]
 
     def __setitem__(self, key, value):
         self.values[key] = value
         self.changed[key] = value
+        self._changed_ids = None
 
     def __iter__(self):
         return self
 
     def __next__(self):
-        res = None
-        while self.last_index < self.values.shape[0]:
-            if self.changed[self.last_index]:
-                res = (self.last_index, self.values[self.last_index])
-            self.last_index += 1
-            if res is not None:
-                break
-        if res is not None:
-            return res
-        else:
+        # only the modified elements are visited, last_index is the position in `changed_indices()`
+        changed_ids = self.changed_indices()
+        if self.last_index >= changed_ids.shape[0]:
             raise StopIteration
+        id_el = changed_ids[self.last_index]
+        self.last_index += 1
+        return id_el, self.values[id_el]
 
     def __len__(self):
         return self.__size
@@ -153,6 +199,9 @@ class _BackendAction(GridObjects):
     This class "digest" the players / environment / opponent / voltage controlers "action",
     and transform it to setpoint for the backend.
     """
+    # the injections that can be set by an action (the keys of `BaseAction._dict_inj`)
+    _injection_attr = {"load_p", "load_q", "prod_p", "prod_v"}
+
     def __init__(self):
         GridObjects.__init__(self)
         # last connected registered
@@ -168,7 +217,10 @@ class _BackendAction(GridObjects):
         self.load_q = ValueStore(self.n_load, dtype=dt_float)
 
         self.activated_bus = np.full((self.n_sub, 2), dtype=dt_bool, fill_value=False)
-        self.big_topo_to_subid = np.repeat(list(range(self.n_sub)), repeats=self.sub_info)
+        if self._topo_vect_to_sub is not None:
+            self.big_topo_to_subid = self._topo_vect_to_sub
+        else:
+            self.big_topo_to_subid = np.repeat(list(range(self.n_sub)), repeats=self.sub_info)
 
         # shunts
         if self.shunts_data_available:
@@ -240,61 +292,53 @@ class _BackendAction(GridObjects):
 
         # I deal with injections
         # Ia set the injection
-        if "load_p" in dict_injection:
-            tmp = dict_injection["load_p"]
-            self.load_p.set_val(tmp)
-        if "load_q" in dict_injection:
-            tmp = dict_injection["load_q"]
-            self.load_q.set_val(tmp)
-        if "prod_p" in dict_injection:
-            tmp = dict_injection["prod_p"]
-            self.prod_p.set_val(tmp)
-        if "prod_v" in dict_injection:
-            tmp = dict_injection["prod_v"]
-            self.prod_v.set_val(tmp)
+        for attr_nm, tmp in dict_injection.items():
+            if attr_nm in self._injection_attr:
+                getattr(self, attr_nm).set_val(tmp)
         # Ib change the injection aka redispatching
-        self.prod_p.change_val(redispatching)
+        if redispatching.any():
+            self.prod_p.change_val(redispatching)
 
         # II shunts
-        if self.shunts_data_available:
-            shunts = {}
-            if other.shunts_data_available:
-                shunts["shunt_p"] = other.shunt_p
-                shunts["shunt_q"] = other.shunt_q
-                shunts["shunt_bus"] = other.shunt_bus
-
-            arr_ = shunts["shunt_p"]
-            self.shunt_p.set_val(arr_)
-            arr_ = shunts["shunt_q"]
-            self.shunt_q.set_val(arr_)
-            arr_ = shunts["shunt_bus"]
-            self.shunt_bus.set_val(arr_)
+        if self.shunts_data_available and other.shunts_data_available:
+            self.shunt_p.set_val(other.shunt_p)
+            self.shunt_q.set_val(other.shunt_q)
+            self.shunt_bus.set_val(other.shunt_bus)
+
+        modif_status = switch_status.any() or set_status.any()
+        modif_topo = switcth_topo_vect.any() or set_topo_vect.any()
+        if not (modif_status or modif_topo):
+            # this action does not affect the topology, nothing more to do
+            return self
 
         # III line status
         # this need to be done BEFORE the topology, as a connected powerline will be connected to their old bus.
         # regardless if the status is changed in the action or not.
-        self.current_topo.change_status(switch_status,
-                                        self.line_or_pos_topo_vect,
-                                        self.line_ex_pos_topo_vect,
-                                        self.last_topo_registered)
-        self.current_topo.set_status(set_status,
-                                     self.line_or_pos_topo_vect,
-                                     self.line_ex_pos_topo_vect,
-                                     self.last_topo_registered)
+        if modif_status:
+            self.current_topo.change_status(switch_status,
+                                            self.line_or_pos_topo_vect,
+                                            self.line_ex_pos_topo_vect,
+                                            self.last_topo_registered)
+            self.current_topo.set_status(set_status,
+                                         self.line_or_pos_topo_vect,
+                                         self.line_ex_pos_topo_vect,
+                                         self.last_topo_registered)
 
         self._status_or_before[:], self._status_ex_before[:] = self.current_topo.get_line_status(self.line_or_pos_topo_vect,
                                                                                                  self.line_ex_pos_topo_vect)
         # IV topo
-        self.current_topo.change_val(switcth_topo_vect)
-        self.current_topo.set_val(set_topo_vect)
+        if modif_topo:
+            self.current_topo.change_val(switcth_topo_vect)
+            self.current_topo.set_val(set_topo_vect)
 
         # V Force disconnection of disconnected powerlines
         disco_before_topo = (self._status_or_before == -1) | (self._status_ex_before == -1)
-        self.current_topo.set_status(self._status_or_before[disco_before_topo],
-                                     self.line_or_pos_topo_vect[disco_before_topo],
-                                     self.line_ex_pos_topo_vect[disco_before_topo],
-                                     self._status_or_before[disco_before_topo]  # unused
-                                     )
+        if disco_before_topo.any():
+            self.current_topo.set_status(self._status_or_before[disco_before_topo],
+                                         self.line_or_pos_topo_vect[disco_before_topo],
+                                         self.line_ex_pos_topo_vect[disco_before_topo],
+                                         self._status_or_before[disco_before_topo]  # unused
+                                         )
 
         return self
 
@@ -8,6 +8,7 @@
 
 import copy
 import os
+import time
 import warnings
 import json
 
@@ -61,6 +62,10 @@ class Backend(GridObjects, ABC):
     """
     env_name = "unknown"
 
+    # version of the state returned by `get_construction_state`, part of the key of the on disk cache of the
+    # environments: it must be increased each time `load_grid` (or the state itself) changes.
+    CONSTRUCTION_STATE_VERSION = 0
+
     def __init__(self, detailed_infos_for_cascading_failures=False):
         """
         Initialize an instance of Backend. This does nothing per se. Only the call to :func:`Backend.load_grid`
@@ -541,6 +546,22 @@ class Backend(GridObjects, ABC):
         """
         raise Grid2OpException("This backend doesn't allow to get the substation from the bus id.")
 
+    def get_line_susceptance(self):
+        """
+        Optional method that gives the susceptance of each powerline (taking into account the ratio of the
+        transformers) used to compute the linear (DC) approximation of the flows. It is used by
+        :class:`grid2op.Backend.PTDFScreening`.
+
+        Only the relative values of these susceptances matter: they can be expressed in any (consistent) unit.
+
+        Returns
+        -------
+        res: ``numpy.ndarray``, dtype:float
+            The susceptance of each powerline (same order as :func:`Backend.get_line_status`)
+
+        """
+        raise BackendError("This backend doesn't allow to get the susceptance of the powerlines.")
+
     @abstractmethod
     def _disconnect_line(self, id):
         """
@@ -559,6 +580,44 @@ class Backend(GridObjects, ABC):
         """
         pass
 
+    def _disconnect_lines(self, ids):
+        """
+        Disconnect all the powerlines whose ids are in `ids` in the backend. It is used when computing the
+        cascading failures (see :func:`Backend.next_grid_state`) to disconnect all the powerlines that trips at the
+        same time.
+
+        By default it calls :func:`Backend._disconnect_line` for each of them. Backends able to do it more
+        efficiently (in one call) should overload this method.
+
+        Parameters
+        ----------
+        ids: ``numpy.ndarray``, dtype:int
+            The ids of the powerlines to disconnect (see :func:`Backend._disconnect_line` for the definition of the
+            id of a powerline)
+
+        """
+        for id_ in ids:
+            self._disconnect_line(id_)
+
+    def _get_cascading_failure_snapshot(self):
+        """
+        Retrieve the state of the powerlines after a step of a cascading failure. This is what is stored in the
+        detailed information about the cascading failures (when :attr:`Backend.detailed_infos_for_cascading_failures`
+        is ``True``).
+
+        Returns
+        -------
+        res: ``dict``
+            With keys "line_status", "p_or", "q_or", "v_or", "a_or", "p_ex", "q_ex", "v_ex" and "a_ex" and, as values,
+            copies of the corresponding vectors (see :func:`Backend.get_line_status`,
+            :func:`Backend.lines_or_info` and :func:`Backend.lines_ex_info`).
+
+        """
+        res = {"line_status": copy.deepcopy(self.get_line_status())}
+        res["p_or"], res["q_or"], res["v_or"], res["a_or"] = copy.deepcopy(self.lines_or_info())
+        res["p_ex"], res["q_ex"], res["v_ex"], res["a_ex"] = copy.deepcopy(self.lines_ex_info())
+        return res
+
     def _runpf_with_diverging_exception(self, is_dc):
         """
         Computes a power flow on the _grid and raises an exception in case of diverging power flow, or any other
@@ -581,6 +640,18 @@ class Backend(GridObjects, ABC):
                                      "or a load has been disconnected or a generator has been disconnected.")
         return res
 
+    def _runpf_profiled(self, is_dc, profiler):
+        """
+        Same as :func:`Backend._runpf_with_diverging_exception` but the duration of the powerflow is given to the
+        step profiler of the environment (see :class:`grid2op.Environment.StepProfiler`), if any.
+        """
+        if profiler is None:
+            return self._runpf_with_diverging_exception(is_dc)
+        beg_ = time.perf_counter()
+        conv_ = self._runpf_with_diverging_exception(is_dc)
+        profiler.add_powerflow(time.perf_counter() - beg_)
+        return conv_
+
     def next_grid_state(self, env, is_dc=False):
         """
         This method is called by the environment to compute the next _grid states.
@@ -601,46 +672,49 @@ class Backend(GridObjects, ABC):
             or ``False`` otherwise.
 
         infos: ``list``
-            If :attr:`Backend.detailed_infos_for_cascading_failures` is ``True`` then it returns the different
-            state computed by the powerflow (can drastically slow down this function, as it requires
-            deep copy of backend object). Otherwise the list is always empty.
+            If :attr:`Backend.detailed_infos_for_cascading_failures` is ``True`` then it returns the state of the
+            powerlines computed after each step of the cascading failure (see
+            :func:`Backend._get_cascading_failure_snapshot`). Otherwise the list is always empty.
 
         """
         infos = []
+        profiler = env._step_profiler
         disconnected_during_cf = np.full(self.n_line, fill_value=False, dtype=dt_bool)
-        conv_ = self._runpf_with_diverging_exception(is_dc)
+        conv_ = self._runpf_profiled(is_dc, profiler)
         if env.no_overflow_disconnection or conv_ is not None:
             return disconnected_during_cf, infos, conv_
 
         # the environment disconnect some
-
-        init_time_step_overflow = copy.deepcopy(env.timestep_overflow)
+        init_time_step_overflow = env.timestep_overflow.copy()
+        thermal_limits = self.get_thermal_limit()
+        hard_limits = env.hard_overflow_threshold * thermal_limits
         while True:
             # simulate the cascading failure
             lines_flows = self.get_line_flow()
-            thermal_limits = self.get_thermal_limit()
             lines_status = self.get_line_status()
 
             # a) disconnect lines on hard overflow
-            to_disc = lines_flows > env.hard_overflow_threshold * thermal_limits
+            to_disc = lines_flows > hard_limits
 
             # b) deals with soft overflow
-            init_time_step_overflow[ (lines_flows >= thermal_limits) & (lines_status)] += 1
+            init_time_step_overflow[(lines_flows >= thermal_limits) & lines_status] += 1
             to_disc[init_time_step_overflow > env.nb_timestep_overflow_allowed] = True
 
             # disconnect the current power lines
-            if np.sum(to_disc[lines_status]) == 0:
+            if not to_disc[lines_status].any():
                 # no powerlines have been disconnected at this time step, i stop the computation there
                 break
             disconnected_during_cf[to_disc] = True
 
             # perform the disconnection action
-            [self._disconnect_line(i) for i, el in enumerate(to_disc) if el]
+            self._disconnect_lines(np.where(to_disc)[0])
+            if profiler is not None:
+                profiler.incr("cascade_depth")
 
             # start a powerflow on this new state
-            conv_ = self._runpf_with_diverging_exception(is_dc)
+            conv_ = self._runpf_profiled(is_dc, profiler)
             if self.detailed_infos_for_cascading_failures:
-                infos.append(self.copy())
+                infos.append(self._get_cascading_failure_snapshot())
 
             if conv_ is not None:
                 break
@@ -833,6 +907,42 @@ class Backend(GridObjects, ABC):
 
         self.attach_layout(grid_layout=new_grid_layout)
 
+    def get_construction_state(self):
+        """
+        The state of the backend once the powergrid has been loaded (by :func:`Backend.load_grid` and
+        :func:`Backend.load_redispacthing_data`). It is stored in the on disk cache of
+        :func:`grid2op.MakeEnv.make_from_dataset_path` (see the "cache_dir" argument) and restored with
+        :func:`Backend.set_construction_state` instead of loading the powergrid again.
+
+        It must not depend on the arguments used to build the backend: these are not part of the key of the cache.
+        The class attribute `CONSTRUCTION_STATE_VERSION` is part of this key: it must be increased when
+        :func:`Backend.load_grid` or this state change, so that the entries stored before are not used.
+
+        By default, this returns ``None``: the powergrid is always loaded from the files.
+
+        Returns
+        -------
+        state: ``object``
+            The state of the backend (it must be picklable) or ``None`` if this is not supported by the backend.
+
+        """
+        return None
+
+    def set_construction_state(self, state):
+        """
+        Restore the state returned by :func:`Backend.get_construction_state`, instead of loading the powergrid with
+        :func:`Backend.load_grid` and :func:`Backend.load_redispacthing_data`.
+
+        Parameters
+        ----------
+        state: ``object``
+            The state returned by :func:`Backend.get_construction_state`, for the same powergrid, by a backend of
+            the same type.
+
+        """
+        raise NotImplementedError("The backend of type \"{}\" does not support the cache of the construction of "
+                                  "the environments.".format(type(self)))
+
     def get_action_to_set(self):
         line_status = self.get_line_status()
         line_status = 2 * line_status - 1
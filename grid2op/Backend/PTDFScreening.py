@@ -0,0 +1,337 @@
+# Copyright (c) 2019-2020, RTE (https://www.rte-france.com)
+# See AUTHORS.txt
+# This Source Code Form is subject to the terms of the Mozilla Public License, version 2.0.
+# If a copy of the Mozilla Public License, version 2.0 was not distributed with this file,
+# you can obtain one at http://mozilla.org/MPL/2.0/.
+# SPDX-License-Identifier: MPL-2.0
+# This file is part of Grid2Op, Grid2Op a testbed platform to model sequential decision making in power systems.
+
+import numpy as np
+from scipy.sparse import csr_matrix
+from scipy.sparse.csgraph import connected_components
+
+from grid2op.dtypes import dt_int, dt_float, dt_bool
+from grid2op.Exceptions import Grid2OpException
+
+
+class PTDFScreening(object):
+    """
+    This class allows to estimate quickly (and approximately) the flows on the powerlines after some of them are
+    disconnected, for example to rank a large number of candidate actions and to assess only the most promising
+    ones with :func:`grid2op.Observation.BaseObservation.simulate`.
+
+    It relies on the linear (DC) sensitivities of the flows with respect to the injections:
+
+      - the power transfer distribution factors (:attr:`PTDFScreening.ptdf`) give the variation of the active flow on
+        each powerline when one MW is injected at a bus (and withdrawn at the reference bus of its connected component)
+      - the line outage distribution factors (:attr:`PTDFScreening.lodf`) give the variation of the active flow on
+        each powerline when a powerline is disconnected, as a fraction of the flow on this powerline before its
+        disconnection.
+
+    These matrices are computed for the topology of an observation (see :func:`PTDFScreening.update`) and are then
+    applied to the flows of this observation. Each disconnection of a powerline is then evaluated in
+    `O(n_line)` and a batch of disconnections is evaluated with matrix products. The reactive flows and the voltages
+    are assumed not to change.
+
+    Only the actions that disconnect some powerlines (or do nothing) can be screened this way.
+
+    Attributes
+    ----------
+    line_susceptance: ``numpy.ndarray``, dtype:float
+        The susceptance of each powerline, given by :func:`grid2op.Backend.Backend.get_line_susceptance`
+
+    thermal_limit: ``numpy.ndarray``, dtype:float
+        The thermal limit of each powerline, given by :func:`grid2op.Backend.Backend.get_thermal_limit`. It is read
+        again by each call to :func:`PTDFScreening.update`, so that the changes of the thermal limits (for example with
+        :func:`grid2op.Environment.Environment.set_thermal_limit`) are taken into account.
+
+    ptdf: ``numpy.ndarray``, dtype:float
+        The power transfer distribution factors, of shape `(n_line, 2 * n_sub)`: ``ptdf[l_id, bus_id]`` is the variation
+        of the active flow (origin side) of powerline `l_id` when one MW is injected at bus `bus_id`. The
+        bus `bus_id` is the bus 1 of substation `bus_id` if `bus_id < n_sub` or the bus 2 of substation
+        `bus_id - n_sub` otherwise.
+
+    lodf: ``numpy.ndarray``, dtype:float
+        The line outage distribution factors, of shape `(n_line, n_line)`: ``lodf[l_id, k_id]`` is the variation
+        of the active flow on powerline `l_id` when powerline `k_id` is disconnected, divided by the active flow
+        on powerline `k_id` before its disconnection. The columns of the powerlines that are disconnected or whose
+        disconnection would split the grid are ``numpy.NaN``.
+
+    Examples
+    --------
+    .. code-block:: python
+
+        import grid2op
+        from grid2op.Backend import PTDFScreening
+        env = grid2op.make()
+        screening = PTDFScreening(env.backend)
+
+        obs = env.reset()
+        actions = [env.action_space({"set_line_status": [(l_id, -1)]}) for l_id in range(env.n_line)]
+
+        # the approximate maximum relative flow after each action
+        rho_max = screening.screen(obs, actions)
+
+        # only the 5 most promising actions are simulated
+        top_ids, simulations = screening.simulate_top_k(obs, actions, k=5)
+        sim_obs, sim_reward, sim_done, sim_info = simulations[0]
+
+    """
+    def __init__(self, backend):
+        self.n_line = backend.n_line
+        self.n_sub = backend.n_sub
+        self.line_or_to_subid = backend.line_or_to_subid
+        self.line_ex_to_subid = backend.line_ex_to_subid
+        self.line_or_pos_topo_vect = backend.line_or_pos_topo_vect
+        self.line_ex_pos_topo_vect = backend.line_ex_pos_topo_vect
+
+        self._backend = backend
+        self.line_susceptance = np.array(backend.get_line_susceptance(), dtype=dt_float)
+        self.thermal_limit = np.array(backend.get_thermal_limit(), dtype=dt_float)
+
+        self.ptdf = None
+        self.lodf = None
+        self._line_status = None
+        self._p_or = None
+        self._q_or = None
+        self._v_or = None
+        self._h_mat = None
+
+    def _get_bus_or_ex(self, topo_vect, line_status):
+        """bus (from 0 to 2 * n_sub - 1) of each end of the powerlines, -1 for disconnected ones"""
+        bus_or = topo_vect[self.line_or_pos_topo_vect]
+        bus_ex = topo_vect[self.line_ex_pos_topo_vect]
+        res_or = np.where(line_status, self.line_or_to_subid + (bus_or - 1) * self.n_sub, -1).astype(dt_int)
+        res_ex = np.where(line_status, self.line_ex_to_subid + (bus_ex - 1) * self.n_sub, -1).astype(dt_int)
+        return res_or, res_ex
+
+    def update(self, obs):
+        """
+        Compute the PTDF and the LODF for the topology of the observation `obs`, and store the flows of this
+        observation and the current thermal limits of the backend. This is called by :func:`PTDFScreening.screen`.
+
+        Parameters
+        ----------
+        obs: :class:`grid2op.Observation.BaseObservation`
+            The observation from which the topology and the flows are read.
+
+        """
+        n_bus = 2 * self.n_sub
+        line_status = np.array(obs.line_status, dtype=dt_bool)
+        bus_or, bus_ex = self._get_bus_or_ex(obs.topo_vect, line_status)
+        line_ids = np.flatnonzero(line_status)
+        b = self.line_susceptance[line_ids].astype(np.float64)
+
+        # incidence matrix of the powerlines in service
+        incidence = np.zeros((self.n_line, n_bus))
+        incidence[line_ids, bus_or[line_ids]] = 1.
+        incidence[line_ids, bus_ex[line_ids]] -= 1.
+
+        # (weighted) laplacian of the grid, one bus of each connected component is used as reference
+        laplacian = incidence[line_ids].T @ (b[:, None] * incidence[line_ids])
+        nb_comp, labels = connected_components(csr_matrix(laplacian != 0.), directed=False)
+        _, ref_buses = np.unique(labels, return_index=True)
+        keep = np.ones(n_bus, dtype=dt_bool)
+        keep[ref_buses] = False
+        x_mat = np.zeros((n_bus, n_bus))
+        x_mat[np.ix_(keep, keep)] = np.linalg.inv(laplacian[np.ix_(keep, keep)])
+
+        self.ptdf = (self.line_susceptance[:, None] * incidence) @ x_mat
+        # h_mat[l_id, k_id]: variation of the flow on l_id when one MW is transferred between the two ends of k_id
+        self._h_mat = self.ptdf @ incidence.T
+        denom = 1. - np.diag(self._h_mat)
+        is_valid = line_status & (np.abs(denom) > 1e-6)
+        self.lodf = np.full((self.n_line, self.n_line), fill_value=np.NaN)
+        self.lodf[:, is_valid] = self._h_mat[:, is_valid] / denom[is_valid]
+        self.lodf[is_valid, is_valid] = -1.
+
+        self.thermal_limit = np.array(self._backend.get_thermal_limit(), dtype=dt_float)
+        self._line_status = line_status
+        self._p_or = np.array(obs.p_or, dtype=np.float64)
+        self._q_or = np.array(obs.q_or, dtype=np.float64)
+        self._v_or = np.array(obs.v_or, dtype=np.float64)
+
+    def _check_updated(self):
+        if self.lodf is None:
+            raise Grid2OpException("The PTDFScreening is not initialized. Call \"update(obs)\" first.")
+
+    def _get_rho(self, p_or, line_status):
+        """relative flows, assuming the reactive flows and the voltages do not change"""
+        with np.errstate(divide="ignore", invalid="ignore"):
+            a_or = np.sqrt(p_or ** 2 + self._q_or ** 2) / (np.sqrt(3.) * self._v_or) * 1000.
+            res = a_or / self.thermal_limit
+        res[~line_status] = 0.
+        res[~np.isfinite(res)] = 0.
+        return res
+
+    def p_or_after_disconnection(self, line_ids):
+        """
+        Approximate active flows (origin side) after the disconnection of each powerline of `line_ids` (one at a time).
+
+        Parameters
+        ----------
+        line_ids: ``numpy.ndarray``, dtype:int
+            The id of the powerlines to disconnect, one at a time.
+
+        Returns
+        -------
+        res: ``numpy.ndarray``, dtype:float
+            Array of shape `(len(line_ids), n_line)`: ``res[i]`` are the flows after the disconnection of powerline
+            ``line_ids[i]``. The rows of the powerlines whose disconnection would split the grid are ``numpy.NaN``
+            (disconnecting a powerline that is already disconnected does not change the flows).
+
+        """
+        self._check_updated()
+        line_ids = np.array(line_ids, dtype=dt_int).reshape(-1)
+        res = self._p_or[None, :] + self.lodf[:, line_ids].T * self._p_or[line_ids][:, None]
+        res[np.arange(line_ids.shape[0]), line_ids] = 0.
+        already_disc = ~self._line_status[line_ids]
+        res[already_disc] = self._p_or
+        return res
+
+    def p_or_after_line_status(self, line_status):
+        """
+        Approximate active flows (origin side) for some new status of the powerlines. Only disconnections are
+        supported: the powerlines disconnected in the observation used in :func:`PTDFScreening.update` must stay
+        disconnected.
+
+        Parameters
+        ----------
+        line_status: ``numpy.ndarray``, dtype:bool
+            Array of shape `(n_line,)` or `(nb_status, n_line)` giving the new status of the powerlines.
+
+        Returns
+        -------
+        res: ``numpy.ndarray``, dtype:float
+            Array of shape `(nb_status, n_line)` with the flows for each status. The rows of the status for which
+            the grid is split are ``numpy.NaN``.
+
+        """
+        self._check_updated()
+        line_status = np.array(line_status, dtype=dt_bool).reshape(-1, self.n_line)
+        if np.any(line_status & ~self._line_status):
+            raise Grid2OpException("PTDFScreening cannot assess the reconnection of powerlines.")
+        res = np.tile(self._p_or, (line_status.shape[0], 1))
+        for i, status in enumerate(line_status):
+            line_ids = np.flatnonzero(self._line_status & ~status)
+            if line_ids.shape[0] == 0:
+                continue
+            h_kk = np.eye(line_ids.shape[0]) - self._h_mat[np.ix_(line_ids, line_ids)]
+            if np.linalg.cond(h_kk) > 1e8:
+                # these disconnections split the grid
+                res[i] = np.NaN
+                continue
+            res[i] += self._h_mat[:, line_ids] @ np.linalg.solve(h_kk, self._p_or[line_ids])
+            res[i, line_ids] = 0.
+        return res
+
+    def rho_after_line_status(self, line_status):
+        """
+        Approximate relative flows (flows divided by the thermal limits) for some new status of the
+        powerlines, see :func:`PTDFScreening.p_or_after_line_status`.
+
+        Returns
+        -------
+        res: ``numpy.ndarray``, dtype:float
+            Array of shape `(nb_status, n_line)` with the relative flows for each status. The rows of the status
+            for which the grid is split are ``numpy.inf``.
+
+        """
+        line_status = np.array(line_status, dtype=dt_bool).reshape(-1, self.n_line)
+        p_or = self.p_or_after_line_status(line_status)
+        res = np.array([self._get_rho(p_, status) for p_, status in zip(p_or, line_status)]).reshape(-1, self.n_line)
+        res[np.any(~np.isfinite(p_or), axis=1)] = np.inf
+        return res
+
+    def _get_status_after_action(self, action):
+        """the status of the powerlines after the action, or ``None`` if this action cannot be screened"""
+        injection, voltage, topology, line, redispatching = action.get_types()
+        if injection or voltage or topology or redispatching:
+            return None
+        res = self._line_status.copy()
+        res[action._switch_line_status] = ~res[action._switch_line_status]
+        res[action._set_line_status == 1] = True
+        res[action._set_line_status == -1] = False
+        if np.any(res & ~self._line_status):
+            # a powerline is reconnected
+            return None
+        return res
+
+    def screen(self, obs, actions):
+        """
+        Approximate maximum relative flow (flow divided by the thermal limit) on the powergrid after each action
+        of `actions`, starting from the state of `obs`.
+
+        Parameters
+        ----------
+        obs: :class:`grid2op.Observation.BaseObservation`
+            The current observation
+
+        actions: ``list``
+            List of :class:`grid2op.Action.BaseAction`
+
+        Returns
+        -------
+        res: ``numpy.ndarray``, dtype:float
+            The approximate maximum relative flow after each action. It is ``numpy.inf`` for the actions that split
+            the grid and ``numpy.NaN`` for the actions that cannot be screened (actions that do something else than
+            disconnecting powerlines).
+
+        """
+        self.update(obs)
+        res = np.full(len(actions), fill_value=np.NaN, dtype=dt_float)
+        act_ids = []
+        all_status = []
+        for act_id, action in enumerate(actions):
+            status = self._get_status_after_action(action)
+            if status is not None:
+                act_ids.append(act_id)
+                all_status.append(status)
+        if not act_ids:
+            return res
+
+        all_status = np.array(all_status, dtype=dt_bool)
+        nb_disc = np.sum(self._line_status & ~all_status, axis=1)
+        rho = np.zeros((len(act_ids), self.n_line))
+        is_single = nb_disc == 1
+        if np.any(is_single):
+            # one powerline is disconnected: the LODF are used directly
+            line_ids = np.argmax(self._line_status & ~all_status[is_single], axis=1)
+            p_or = self.p_or_after_disconnection(line_ids)
+            rho[is_single] = [self._get_rho(p_, status) for p_, status in zip(p_or, all_status[is_single])]
+            rho[np.flatnonzero(is_single)[np.any(~np.isfinite(p_or), axis=1)]] = np.inf
+        if np.any(~is_single):
+            rho[~is_single] = self.rho_after_line_status(all_status[~is_single])
+        res[act_ids] = np.max(rho, axis=1)
+        return res
+
+    def simulate_top_k(self, obs, actions, k):
+        """
+        Screen the actions (see :func:`PTDFScreening.screen`) and simulate
+        (with :func:`grid2op.Observation.BaseObservation.simulate`) the `k` ones with the lowest approximate maximum
+        relative flow. The actions that cannot be screened are ranked last.
+
+        Parameters
+        ----------
+        obs: :class:`grid2op.Observation.BaseObservation`
+            The current observation
+
+        actions: ``list``
+            List of :class:`grid2op.Action.BaseAction`
+
+        k: ``int``
+            Number of actions to simulate
+
+        Returns
+        -------
+        top_ids: ``numpy.ndarray``, dtype:int
+            The ids (in `actions`) of the simulated actions, from the most promising to the least promising one
+
+        simulations: ``list``
+            The result of ``obs.simulate(actions[act_id])`` for each `act_id` in `top_ids`
+
+        """
+        rho_max = self.screen(obs, actions)
+        top_ids = np.argsort(rho_max, kind="stable")[:k].astype(dt_int)
+        simulations = [obs.simulate(actions[act_id]) for act_id in top_ids]
+        return top_ids, simulations
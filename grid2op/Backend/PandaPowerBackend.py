@@ -18,15 +18,18 @@ import os  # load the python os default module
 import sys  # laod the python sys default module
 import copy
 import warnings
+from collections import OrderedDict
 
 import numpy as np
 import pandas as pd
 
 import pandapower as pp
+from pandapower.pypower.idx_brch import BR_X, TAP, SHIFT
 import scipy
 
 from grid2op.dtypes import dt_int, dt_float, dt_bool
 from grid2op.Backend.Backend import Backend
+from grid2op.Backend._DCSolver import _DCSolver
 from grid2op.Action import BaseAction
 from grid2op.Exceptions import *
 
@@ -83,8 +86,45 @@ class PandaPowerBackend(Backend):
     v_ex: :class:`numpy.array`, dtype:float
         The voltage magnitude at the extremity bus of the powerline
 
+    warm_start_cache_size: ``int``
+        Maximum number of topologies for which the voltages (magnitude and angle) of the last converged AC powerflow
+        are kept. When a powerflow is computed on one of these topologies, it is initialized with these voltages
+        instead of the default initialization. The least recently used topologies are removed first. Set it to
+        ``0`` to deactivate this cache. See :func:`PandaPowerBackend.get_warm_start_stats` to know how many
+        powerflows benefited from it.
+
+    use_native_dc: ``bool``
+        Whether to compute the DC powerflows (``runpf(is_dc=True)``) with a solver that reuses the factorization of
+        the susceptance matrix from one call to another, and that updates it when only a few buses are affected
+        by a change of topology (instead of calling ``pandapower.rundcpp``). The results are written in the result
+        tables of the pandapower grid as ``pandapower.rundcpp`` does, so all the outputs of the backend are the same
+        with both methods, except that the loads on a bus isolated from the rest of the grid do not consume any
+        power. It is deactivated by default. Powergrids with elements not handled by this solver (static
+        generators, storage units, wards, switches, 3 windings transformers, ...) or with multiple slack buses always
+        use ``pandapower.rundcpp``.
+
     """
-    def __init__(self, detailed_infos_for_cascading_failures=False):
+    # columns of the pandapower tables that can be modified when the backend is used (see
+    # :func:`PandaPowerBackend.reset`)
+    _modifiable_columns = {"bus": ["in_service"],
+                           "load": ["p_mw", "q_mvar", "bus", "in_service"],
+                           "gen": ["p_mw", "vm_pu", "bus", "in_service"],
+                           "line": ["from_bus", "to_bus", "in_service"],
+                           "trafo": ["hv_bus", "lv_bus", "in_service"],
+                           "shunt": ["p_mw", "q_mvar", "bus", "in_service"],
+                           "ext_grid": ["vm_pu", "va_degree", "bus", "in_service"]}
+
+    # see Backend.CONSTRUCTION_STATE_VERSION
+    CONSTRUCTION_STATE_VERSION = 1
+
+    # attributes not stored by `get_construction_state`: the arguments of the constructor, the warm start cache and
+    # the objects rebuilt by `set_construction_state`
+    _NOT_IN_CONSTRUCTION_STATE = frozenset(["detailed_infos_for_cascading_failures", "warm_start_cache_size",
+                                            "use_native_dc", "_warm_start_cache", "_warm_start_stats",
+                                            "_get_vector_inj", "_dc_solver", "_dc_bus_lookup",
+                                            "_line_susceptance"])
+
+    def __init__(self, detailed_infos_for_cascading_failures=False, warm_start_cache_size=16, use_native_dc=False):
         Backend.__init__(self, detailed_infos_for_cascading_failures=detailed_infos_for_cascading_failures)
         self.prod_pu_to_kv = None
         self.load_pu_to_kv = None
@@ -127,17 +167,27 @@ class PandaPowerBackend(Backend):
         self._vars_action_set = BaseAction.attr_list_vect
         self.cst_1 = dt_float(1.0)
         self._topo_vect = None
+        self._bus1_pos = None
+        self._bus2_pos = None
         self.slack_id = None
 
-        # Mapping some fun to apply bus updates
-        self._type_to_bus_set = [
-            self._apply_load_bus,
-            self._apply_gen_bus,
-            self._apply_lor_bus,
-            self._apply_trafo_hv,
-            self._apply_lex_bus,
-            self._apply_trafo_lv
-        ]
+        # initial state of the grid, restored by `reset`
+        self._init_state_tables = {}
+        self._init_state_results = {}
+        self._init_state_attr = {}
+        self._init_nb_bus_before = None
+
+        # voltages of the last converged powerflow for the most recently used topologies (see `runpf`)
+        self.warm_start_cache_size = int(warm_start_cache_size)
+        self._warm_start_cache = OrderedDict()
+        self._warm_start_stats = {"nb_powerflow": 0, "nb_converged": 0, "hits": 0, "misses": 0,
+                                  "nb_iterations": 0}
+
+        # dedicated DC powerflow solver (see `_runpf_native_dc`)
+        self.use_native_dc = use_native_dc
+        self._dc_solver = None
+        self._dc_bus_lookup = None
+        self._line_susceptance = None
 
     def get_nb_active_bus(self):
         """
@@ -169,14 +219,44 @@ class PandaPowerBackend(Backend):
     def reset(self, path=None, filename=None):
         """
         Reload the grid.
-        For pandapower, it is a bit faster to store of a copy of itself at the end of load_grid
-        and deep_copy it to itself instead of calling load_grid again
+        For pandapower, it is a lot faster to restore the columns of the grid that can be modified by grid2op, as saved
+        at the end of :func:`PandaPowerBackend.load_grid`, than to call load_grid again (or to deep copy the whole
+        grid). The internal structures of pandapower are kept and the powerflow results saved at the end of load_grid
+        are used to initialize the next powerflow.
         """
-        # Assign the content of itself as saved at the end of load_grid
-        # This overide all the attributes with the attributes from the copy in __pp_backend_initial_state
-        self.__dict__.update(copy.deepcopy(self.__pp_backend_initial_state).__dict__)
+        grid = self._grid
+        for table_nm, cols in self._init_state_tables.items():
+            for col_nm, vals in cols.items():
+                grid[table_nm][col_nm] = copy.copy(vals)
+        for table_nm, res_table in self._init_state_results.items():
+            grid[table_nm] = res_table.copy()
+        grid["converged"] = True
+
+        for attr_nm, vals in self._init_state_attr.items():
+            setattr(self, attr_nm, copy.copy(vals))
+        self._nb_bus_before = self._init_nb_bus_before
         self._topo_vect[:] = self._get_topo_vect()
 
+    def _save_initial_state(self):
+        """
+        Save the part of the grid (and of this backend) that can be modified when the backend is used, to restore it
+        in :func:`PandaPowerBackend.reset`: the columns of the tables that are modified by grid2op, the powerflow
+        results and the vectors holding the results of the last powerflow.
+        """
+        grid = self._grid
+        self._init_state_tables = {}
+        for table_nm, cols in self._modifiable_columns.items():
+            self._init_state_tables[table_nm] = {col_nm: copy.copy(grid[table_nm][col_nm].values)
+                                                 for col_nm in cols if col_nm in grid[table_nm].columns}
+        self._init_state_results = {"res_{}".format(table_nm): grid["res_{}".format(table_nm)].copy()
+                                    for table_nm in self._init_state_tables.keys()
+                                    if "res_{}".format(table_nm) in grid}
+        self._init_state_attr = {attr_nm: copy.copy(getattr(self, attr_nm))
+                                 for attr_nm in ["p_or", "q_or", "v_or", "a_or", "p_ex", "q_ex", "v_ex", "a_ex",
+                                                 "line_status", "load_p", "load_q", "load_v",
+                                                 "prod_p", "prod_q", "prod_v", "thermal_limit_a", "_pf_init"]}
+        self._init_nb_bus_before = self._nb_bus_before
+
     def load_grid(self, path=None, filename=None):
         """
         Load the _grid, and initialize all the member of the class. Note that in order to perform topological
@@ -368,11 +448,7 @@ class PandaPowerBackend(Backend):
         # utilities for imeplementing apply_action
         self._corresp_name_fun = {}
 
-        self._get_vector_inj = {}
-        self._get_vector_inj["load_p"] = self._load_grid_load_p_mw #lambda grid: grid.load["p_mw"]
-        self._get_vector_inj["load_q"] = self._load_grid_load_q_mvar #lambda grid: grid.load["q_mvar"]
-        self._get_vector_inj["prod_p"] = self._load_grid_gen_p_mw #lambda grid: grid.gen["p_mw"]
-        self._get_vector_inj["prod_v"] = self._load_grid_gen_vm_pu #lambda grid: grid.gen["vm_pu"]
+        self._set_vector_inj_getters()
 
         # "hack" to handle topological changes, for now only 2 buses per substation
         add_topo = copy.deepcopy(self._grid.bus)
@@ -431,28 +507,44 @@ class PandaPowerBackend(Backend):
         for l_id, pos_big_topo  in enumerate(self.line_ex_pos_topo_vect):
             self._big_topo_to_obj[pos_big_topo] = (l_id, nm_)
 
-        # store the topoid -> objid
-        self._big_topo_to_backend = [(None, None, None) for _ in range(self.dim_topo)]
-        for load_id, pos_big_topo in enumerate(self.load_pos_topo_vect):
-            self._big_topo_to_backend[pos_big_topo] = (load_id, load_id, 0)
-        for gen_id, pos_big_topo  in enumerate(self.gen_pos_topo_vect):
-            self._big_topo_to_backend[pos_big_topo] = (gen_id, gen_id, 1)
-        for l_id, pos_big_topo in enumerate(self.line_or_pos_topo_vect):
-            if l_id < self.__nb_powerline:
-                self._big_topo_to_backend[pos_big_topo] = (l_id, l_id, 2)
-            else:
-                self._big_topo_to_backend[pos_big_topo] = (l_id, l_id - self.__nb_powerline, 3)
-        for l_id, pos_big_topo  in enumerate(self.line_ex_pos_topo_vect):
-            if l_id < self.__nb_powerline:
-                self._big_topo_to_backend[pos_big_topo] = (l_id, l_id, 4)
-            else:
-                self._big_topo_to_backend[pos_big_topo] = (l_id, l_id - self.__nb_powerline, 5)
+        # position, in the table of the buses, of the bus 1 and of the bus 2 of each substation
+        sub_ids = np.arange(self.n_sub)
+        self._bus1_pos = self._grid.bus.index.get_indexer(sub_ids)
+        self._bus2_pos = self._grid.bus.index.get_indexer(sub_ids + self.__nb_bus_before)
 
         self._topo_vect = self._get_topo_vect()
-        # Create a deep copy of itself in the initial state
-        pp_backend_initial_state = copy.deepcopy(self)
-        # Store it under super private attribute
-        self.__pp_backend_initial_state = pp_backend_initial_state
+
+        # compute the powerflow on the final grid (with the buses added) so that its results can be used to
+        # initialize the first powerflow of each episode
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore", category=RuntimeWarning)
+            pp.runpp(self._grid, check_connectivity=False, numba=numba_)
+        self._nb_bus_before = self.get_nb_active_bus()
+        self._init_dc_solver()
+        self._save_initial_state()
+
+    def _set_vector_inj_getters(self):
+        self._get_vector_inj = {}
+        self._get_vector_inj["load_p"] = self._load_grid_load_p_mw #lambda grid: grid.load["p_mw"]
+        self._get_vector_inj["load_q"] = self._load_grid_load_q_mvar #lambda grid: grid.load["q_mvar"]
+        self._get_vector_inj["prod_p"] = self._load_grid_gen_p_mw #lambda grid: grid.gen["p_mw"]
+        self._get_vector_inj["prod_v"] = self._load_grid_gen_vm_pu #lambda grid: grid.gen["vm_pu"]
+
+    def get_construction_state(self):
+        """
+        All the attributes of the backend once the grid is loaded (see :func:`grid2op.Backend.Backend.get_construction_state`),
+        except the ones set by the arguments of its constructor and the warm start cache.
+        """
+        return {key: val for key, val in self.__dict__.items() if key not in self._NOT_IN_CONSTRUCTION_STATE}
+
+    def set_construction_state(self, state):
+        """
+        Restore the state returned by :func:`PandaPowerBackend.get_construction_state`
+        (see :func:`grid2op.Backend.Backend.set_construction_state`).
+        """
+        self.__dict__.update(state)
+        self._set_vector_inj_getters()
+        self._init_dc_solver()
 
     def _convert_id_topo(self, id_big_topo):
         """
@@ -470,130 +562,439 @@ class PandaPowerBackend(Backend):
         """
         active_bus, (prod_p, prod_v, load_p, load_q), topo__, shunts__ = backendAction()
 
-        tmp_prod_p = self._get_vector_inj["prod_p"](self._grid)
-        if np.any(prod_p.changed == True):
-            tmp_prod_p.iloc[prod_p.changed] = prod_p.values[prod_p.changed]
-
-        tmp_prod_v = self._get_vector_inj["prod_v"](self._grid)
-        if np.any(prod_v.changed == True):
-            tmp_prod_v.iloc[prod_v.changed] = prod_v.values[prod_v.changed] / self.prod_pu_to_kv[prod_v.changed]
+        for (table_nm, col_nm), inj_vals in [(("gen", "p_mw"), prod_p), (("load", "p_mw"), load_p),
+                                             (("load", "q_mvar"), load_q)]:
+            ids = inj_vals.changed_indices()
+            if ids.shape[0]:
+                self._set_column(table_nm, col_nm, ids, inj_vals.changed_values())
 
-        if self._id_bus_added is not None and prod_v.changed[self._id_bus_added]:
-            # handling of the slack bus, where "2" generators are present.
-            self._grid["ext_grid"]["vm_pu"] = 1.0 * tmp_prod_v[self._id_bus_added]
-
-        tmp_load_p = self._get_vector_inj["load_p"](self._grid)
-        if np.any(load_p.changed == True):
-            tmp_load_p.iloc[load_p.changed] = load_p.values[load_p.changed]
-
-        tmp_load_q = self._get_vector_inj["load_q"](self._grid)
-        if np.any(load_q.changed == True):
-            tmp_load_q.iloc[load_q.changed] = load_q.values[load_q.changed]
+        ids = prod_v.changed_indices()
+        if ids.shape[0]:
+            self._set_column("gen", "vm_pu", ids, prod_v.changed_values() / self.prod_pu_to_kv[ids])
+            if self._id_bus_added is not None and prod_v.changed[self._id_bus_added]:
+                # handling of the slack bus, where "2" generators are present.
+                self._grid["ext_grid"]["vm_pu"] = 1.0 * self._grid.gen["vm_pu"].iat[self._id_bus_added]
 
         if self.shunts_data_available:
             shunt_p, shunt_q, shunt_bus = shunts__
 
-            if np.any(shunt_p.changed == True):
-                self._grid.shunt["p_mw"].iloc[shunt_p.changed] = shunt_p.values[shunt_p.changed]
-            if np.any(shunt_q.changed == True):
-                self._grid.shunt["q_mvar"].iloc[shunt_q.changed] = shunt_q.values[shunt_q.changed]
-            if np.any(shunt_bus.changed == True):
-                sh_service = shunt_bus.values[shunt_bus.changed] != -1
-                self._grid.shunt["in_service"].iloc[shunt_bus.changed] = sh_service
-                sh_bus1 = np.arange(len(shunt_bus))[shunt_bus.changed & shunt_bus.values == 1]
-                sh_bus2 = np.arange(len(shunt_bus))[shunt_bus.changed & shunt_bus.values == 2]
-                if len(sh_bus1) > 0:
-                    self._grid.shunt["bus"][sh_bus1] = self.shunt_to_subid[sh_bus1]
-                if len(sh_bus2) > 0:
-                    self._grid.shunt["bus"][sh_bus2] = self.shunt_to_subid[sh_bus2] + self.__nb_bus_before
+            for col_nm, sh_vals in [("p_mw", shunt_p), ("q_mvar", shunt_q)]:
+                ids = sh_vals.changed_indices()
+                if ids.shape[0]:
+                    self._set_column("shunt", col_nm, ids, sh_vals.changed_values())
+            ids = shunt_bus.changed_indices()
+            if ids.shape[0]:
+                sh_bus = shunt_bus.changed_values()
+                self._set_column("shunt", "in_service", ids, sh_bus != -1)
+                sh_connected = ids[sh_bus != -1]
+                if sh_connected.shape[0]:
+                    self._set_column("shunt", "bus", sh_connected,
+                                     self._pp_bus_from_grid2op_bus(sh_bus[sh_bus != -1],
+                                                                   self.shunt_to_subid[sh_connected]))
 
         # i made at least a real change, so i implement it in the backend
-        for id_el, new_bus in topo__:
-            id_el_backend, id_topo, type_obj = self._big_topo_to_backend[id_el]
-            self._type_to_bus_set[type_obj](new_bus, id_el_backend, id_topo)
-
-        bus_is = self._grid.bus["in_service"]
-        for i, (bus1_status, bus2_status) in enumerate(active_bus):
-            bus_is[i] = bus1_status  # no iloc for bus, don't ask me why please :-/
-            bus_is[i + self.__nb_bus_before] = bus2_status
-
-    def _apply_load_bus(self, new_bus, id_el_backend, id_topo):
-        new_bus_backend = self._pp_bus_from_grid2op_bus(new_bus, self._init_bus_load[id_el_backend])
-        self._grid.load["bus"].iat[id_el_backend] = new_bus_backend
-
-    def _apply_gen_bus(self, new_bus, id_el_backend, id_topo):
-        new_bus_backend = self._pp_bus_from_grid2op_bus(new_bus, self._init_bus_gen[id_el_backend])
-        self._grid.gen["bus"].iat[id_el_backend] = new_bus_backend
-        # remember in this case slack bus is actually 2 generators for pandapower !
-        if id_el_backend == (self._grid.gen.shape[0] - 1) and self._iref_slack is not None:
-            self._grid.ext_grid["bus"].iat[0] = new_bus_backend        
-
-    def _apply_lor_bus(self, new_bus, id_el_backend, id_topo):
-        new_bus_backend = self._pp_bus_from_grid2op_bus(new_bus, self._init_bus_lor[id_el_backend])
-        self.change_bus_powerline_or(id_el_backend, new_bus_backend)
+        if topo__.changed_indices().shape[0]:
+            self._apply_topo(topo__.values, topo__.changed)
+
+        self._set_column("bus", "in_service", self._bus1_pos, active_bus[:, 0])
+        self._set_column("bus", "in_service", self._bus2_pos, active_bus[:, 1])
+
+    def _set_column(self, table_nm, col_nm, ids, values):
+        """
+        Set the values at positions `ids` (integers or boolean mask) of the column `col_nm` of the table `table_nm`
+        of the grid, at once. The values are written through the table itself (and not through the array returned by
+        ``.values``, which is a copy with the "copy on write" mode of pandas) so the grid is always modified.
+        """
+        table = self._grid[table_nm]
+        table.iloc[ids, table.columns.get_loc(col_nm)] = values
+
+    def _apply_topo(self, new_bus, changed):
+        """
+        Apply the new buses of the elements (given in the topology vector of grid2op) that have `changed`. All the
+        elements of the same type are modified at once.
+        """
+        for table_nm, pos_topo, init_bus in [("load", self.load_pos_topo_vect, self._init_bus_load),
+                                             ("gen", self.gen_pos_topo_vect, self._init_bus_gen)]:
+            el_changed = np.flatnonzero(changed[pos_topo])
+            if not el_changed.shape[0]:
+                continue
+            new_bus_backend = self._pp_bus_from_grid2op_bus(new_bus[pos_topo[el_changed]], init_bus[el_changed])
+            self._set_column(table_nm, "bus", el_changed, new_bus_backend)
+            if table_nm == "gen" and el_changed[-1] == pos_topo.shape[0] - 1 and self._iref_slack is not None:
+                # remember in this case slack bus is actually 2 generators for pandapower !
+                self._set_column("ext_grid", "bus", 0, new_bus_backend[-1])
+
+        nb_line = self._number_true_line
+        self._apply_branch_bus("line", "from_bus", "to_bus", slice(0, nb_line), new_bus, changed)
+        self._apply_branch_bus("trafo", "hv_bus", "lv_bus", slice(nb_line, self.n_line), new_bus, changed)
+
+    def _apply_branch_bus(self, table_nm, col_or, col_ex, line_ids, new_bus, changed):
+        """
+        Apply the new buses of the powerlines `line_ids` (all stored in the table `table_nm` of the grid). An end
+        disconnected (bus -1) disconnects the powerline, an end connected to a bus connects it. If both ends are
+        modified, the status of the powerline is given by the end that comes last in the topology vector.
+        """
+        pos_or = self.line_or_pos_topo_vect[line_ids]
+        pos_ex = self.line_ex_pos_topo_vect[line_ids]
+        chg_or = changed[pos_or]
+        chg_ex = changed[pos_ex]
+        chg = chg_or | chg_ex
+        if not chg.any():
+            return
+        new_bus_or = new_bus[pos_or]
+        new_bus_ex = new_bus[pos_ex]
+        for col_nm, chg_, pos_, new_bus_, init_bus in [(col_or, chg_or, pos_or, new_bus_or, self._init_bus_lor),
+                                                       (col_ex, chg_ex, pos_ex, new_bus_ex, self._init_bus_lex)]:
+            ids = np.flatnonzero(chg_)
+            if not ids.shape[0]:
+                continue
+            bus_backend = self._pp_bus_from_grid2op_bus(new_bus_[ids], init_bus[line_ids][ids])
+            is_connected = bus_backend >= 0
+            self._set_column(table_nm, col_nm, ids[is_connected], bus_backend[is_connected])
+        last_is_ex = chg_ex & (~chg_or | (pos_ex > pos_or))
+        new_status = np.where(last_is_ex, new_bus_ex > 0, new_bus_or > 0)
+        self._set_column(table_nm, "in_service", chg, new_status[chg])
 
     def change_bus_powerline_or(self, id_powerline_backend, new_bus_backend):
         if new_bus_backend >= 0:
-            self._grid.line["in_service"].iat[id_powerline_backend] = True
-            self._grid.line["from_bus"].iat[id_powerline_backend] = new_bus_backend
+            self._set_column("line", "in_service", id_powerline_backend, True)
+            self._set_column("line", "from_bus", id_powerline_backend, new_bus_backend)
         else:
-            self._grid.line["in_service"].iat[id_powerline_backend] = False
-
-    def _apply_lex_bus(self, new_bus, id_el_backend, id_topo):
-        new_bus_backend = self._pp_bus_from_grid2op_bus(new_bus, self._init_bus_lex[id_el_backend])
-        self.change_bus_powerline_ex(id_el_backend, new_bus_backend)
+            self._set_column("line", "in_service", id_powerline_backend, False)
 
     def change_bus_powerline_ex(self, id_powerline_backend, new_bus_backend):
         if new_bus_backend >= 0:
-            self._grid.line["in_service"].iat[id_powerline_backend] = True
-            self._grid.line["to_bus"].iat[id_powerline_backend] = new_bus_backend
+            self._set_column("line", "in_service", id_powerline_backend, True)
+            self._set_column("line", "to_bus", id_powerline_backend, new_bus_backend)
         else:
-            self._grid.line["in_service"].iat[id_powerline_backend] = False
-
-    def _apply_trafo_hv(self, new_bus, id_el_backend, id_topo):
-        new_bus_backend = self._pp_bus_from_grid2op_bus(new_bus, self._init_bus_lor[id_el_backend])
-        self.change_bus_trafo_hv(id_topo, new_bus_backend)
+            self._set_column("line", "in_service", id_powerline_backend, False)
 
     def change_bus_trafo_hv(self, id_powerline_backend, new_bus_backend):
         if new_bus_backend >= 0:
-            self._grid.trafo["in_service"].iat[id_powerline_backend] = True
-            self._grid.trafo["hv_bus"].iat[id_powerline_backend] = new_bus_backend
+            self._set_column("trafo", "in_service", id_powerline_backend, True)
+            self._set_column("trafo", "hv_bus", id_powerline_backend, new_bus_backend)
         else:
-            self._grid.trafo["in_service"].iat[id_powerline_backend] = False
-
-    def _apply_trafo_lv(self, new_bus, id_el_backend, id_topo):
-        new_bus_backend = self._pp_bus_from_grid2op_bus(new_bus, self._init_bus_lex[id_el_backend])
-        self.change_bus_trafo_lv(id_topo, new_bus_backend)
+            self._set_column("trafo", "in_service", id_powerline_backend, False)
 
     def change_bus_trafo_lv(self, id_powerline_backend, new_bus_backend):
         if new_bus_backend >= 0:
-            self._grid.trafo["in_service"].iat[id_powerline_backend] = True
-            self._grid.trafo["lv_bus"].iat[id_powerline_backend] = new_bus_backend
+            self._set_column("trafo", "in_service", id_powerline_backend, True)
+            self._set_column("trafo", "lv_bus", id_powerline_backend, new_bus_backend)
         else:
-            self._grid.trafo["in_service"].iat[id_powerline_backend] = False
+            self._set_column("trafo", "in_service", id_powerline_backend, False)
 
     def _pp_bus_from_grid2op_bus(self, grid2op_bus, grid2op_bus_init):
-        if grid2op_bus == 1:
-            res = grid2op_bus_init
-        elif grid2op_bus == 2:
-            res = grid2op_bus_init + self.__nb_bus_before
-        elif grid2op_bus == -1:
-            res = -1
-        else:
+        """
+        Convert the buses of some elements (-1, 1 or 2 in grid2op) into the buses of pandapower (-1 for
+        disconnected elements), knowing the bus `grid2op_bus_init` of these elements when they are connected to bus 1.
+        """
+        grid2op_bus = np.asarray(grid2op_bus)
+        is_bus2 = grid2op_bus == 2
+        is_disc = grid2op_bus == -1
+        if (~(is_bus2 | is_disc) & (grid2op_bus != 1)).any():
             raise BackendError("grid2op bus must be -1, 1 or 2")
-        return int(res)
+        res = grid2op_bus_init.astype(dt_int)
+        res[is_bus2] += self.__nb_bus_before
+        res[is_disc] = -1
+        return res
 
     def _aux_get_line_info(self, colname1, colname2):
         res = np.concatenate((self._grid.res_line[colname1].values, self._grid.res_trafo[colname2].values))
         return res
 
+    def _get_topo_key(self):
+        """
+        Key identifying the active topology of the grid (status of the buses and of the powerlines, and the bus to
+        which each element is connected), used by the warm start cache of :func:`PandaPowerBackend.runpf`.
+        """
+        grid = self._grid
+        return b"".join([grid.bus["in_service"].values.tobytes(),
+                         grid.line["in_service"].values.tobytes(),
+                         grid.trafo["in_service"].values.tobytes(),
+                         grid.line["from_bus"].values.tobytes(),
+                         grid.line["to_bus"].values.tobytes(),
+                         grid.trafo["hv_bus"].values.tobytes(),
+                         grid.trafo["lv_bus"].values.tobytes(),
+                         grid.gen["bus"].values.tobytes(),
+                         grid.load["bus"].values.tobytes()])
+
+    def _store_warm_start(self, topo_key):
+        """
+        Save the voltages computed by the last (converged) AC powerflow for the topology `topo_key`.
+        """
+        self._warm_start_cache[topo_key] = (np.nan_to_num(self._grid.res_bus["vm_pu"].values, nan=1.0),
+                                            np.nan_to_num(self._grid.res_bus["va_degree"].values, nan=0.))
+        self._warm_start_cache.move_to_end(topo_key)
+        while len(self._warm_start_cache) > self.warm_start_cache_size:
+            self._warm_start_cache.popitem(last=False)
+
+    def get_warm_start_stats(self):
+        """
+        Statistics about the AC powerflows computed with :func:`PandaPowerBackend.runpf` and about how many of them
+        have been initialized with the voltages of a previous powerflow on the same topology (see
+        :attr:`PandaPowerBackend.warm_start_cache_size`).
+
+        Returns
+        -------
+        res: ``dict``
+            With keys:
+
+              - "nb_powerflow": the number of AC powerflows computed
+              - "nb_converged": the number of them that converged
+              - "hits": the number of them initialized with voltages found in the cache
+              - "misses": the number of them for which the topology was not in the cache
+              - "hit_rate": "hits" divided by "nb_powerflow" (``0.`` if no powerflow has been computed)
+              - "nb_iterations": the total number of Newton-Raphson iterations for the converged powerflows
+              - "mean_iterations": the average number of Newton-Raphson iterations of the converged powerflows
+
+        """
+        res = copy.deepcopy(self._warm_start_stats)
+        res["hit_rate"] = res["hits"] / res["nb_powerflow"] if res["nb_powerflow"] else 0.
+        res["mean_iterations"] = res["nb_iterations"] / res["nb_converged"] if res["nb_converged"] else 0.
+        return res
+
+    def _init_dc_solver(self):
+        """
+        Initialize the DC powerflow solver (see :attr:`PandaPowerBackend.use_native_dc`) from the model of the
+        branches computed by pandapower in the last powerflow. It is not initialized if the grid contains elements
+        it does not handle.
+        """
+        self._dc_solver = None
+        self._dc_bus_lookup = None
+        self._line_susceptance = None
+        grid = self._grid
+        branch_lookup = grid._pd2ppc_lookups["branch"]
+        if set(branch_lookup.keys()) - {"line", "trafo"}:
+            return
+        branch = grid._ppc["branch"][:self.n_line]
+        if branch.shape[0] != self.n_line:
+            return
+        tap = branch[:, TAP].real.copy()
+        tap[tap == 0.] = 1.
+        branch_b = 1. / (branch[:, BR_X].real * tap)
+        if not np.all(np.isfinite(branch_b)):
+            return
+        self._line_susceptance = branch_b
+        for table_nm in ["sgen", "storage", "ward", "xward", "impedance", "trafo3w", "dcline", "switch"]:
+            if table_nm in grid and grid[table_nm].shape[0]:
+                return
+        self._dc_bus_lookup = np.full(np.max(grid.bus.index.values) + 1, fill_value=-1, dtype=dt_int)
+        self._dc_bus_lookup[grid.bus.index.values] = np.arange(grid.bus.shape[0])
+        self._dc_solver = _DCSolver(grid.bus.shape[0], branch_b, branch[:, SHIFT].real * np.pi / 180.)
+
+    def _runpf_native_dc(self):
+        """
+        Compute a DC powerflow with the dedicated solver (see :attr:`PandaPowerBackend.use_native_dc`).
+
+        Returns
+        -------
+        res: ``bool``
+            Whether the powerflow converged, or ``None`` if this solver cannot be used for the current state of
+            the grid (and ``pandapower.rundcpp`` should be used instead).
+        """
+        grid = self._grid
+        lookup = self._dc_bus_lookup
+        bus_is = grid.bus["in_service"].values
+        n_bus = bus_is.shape[0]
+
+        gen_bus = lookup[grid.gen["bus"].values]
+        gen_is = grid.gen["in_service"].values & bus_is[gen_bus]
+        slack_gen = np.flatnonzero(gen_is & grid.gen["slack"].values)
+        if slack_gen.shape[0] != 1:
+            return None
+        slack_gen = slack_gen[0]
+        slack_bus = gen_bus[slack_gen]
+        ext_is = grid.ext_grid["in_service"].values
+        if np.any(lookup[grid.ext_grid["bus"].values[ext_is]] != slack_bus):
+            return None
+
+        branch_from = lookup[np.concatenate((grid.line["from_bus"].values, grid.trafo["hv_bus"].values))]
+        branch_to = lookup[np.concatenate((grid.line["to_bus"].values, grid.trafo["lv_bus"].values))]
+        line_status = self._get_line_status()
+        key = self._get_topo_key() + np.array([slack_bus]).tobytes()
+        # buses without any powerline connected are not part of the grid (as in pandapower)
+        branch_is = line_status & bus_is[branch_from] & bus_is[branch_to]
+        bus_connected = np.bincount(branch_from[branch_is], minlength=n_bus) > 0
+        bus_connected |= np.bincount(branch_to[branch_is], minlength=n_bus) > 0
+        bus_connected[slack_bus] = True
+        bus_is = bus_is & bus_connected
+        if not np.all(self._dc_solver.get_connected_buses(key, bus_is, line_status, branch_from, branch_to,
+                                                          slack_bus)[bus_is]):
+            # the grid is split in multiple parts
+            return False
+        if np.any(gen_is & ~bus_is[gen_bus]):
+            # a generator is isolated
+            return False
+        load_bus = lookup[grid.load["bus"].values]
+        load_is = grid.load["in_service"].values & bus_is[load_bus]
+        shunt_bus = lookup[grid.shunt["bus"].values]
+        shunt_is = grid.shunt["in_service"].values & bus_is[shunt_bus]
+        ext_bus = lookup[grid.ext_grid["bus"].values]
+        vn_kv = grid.bus["vn_kv"].values
+        shunt_ratio = (vn_kv[shunt_bus] / grid.shunt["vn_kv"].values) ** 2
+        gen_p = np.where(gen_is, grid.gen["p_mw"].values * grid.gen["scaling"].values, 0.)
+        load_p = np.where(load_is, grid.load["p_mw"].values * grid.load["scaling"].values, 0.)
+        shunt_p = np.where(shunt_is, grid.shunt["p_mw"].values * grid.shunt["step"].values * shunt_ratio, 0.)
+        p_bus = np.bincount(gen_bus, weights=gen_p, minlength=n_bus)
+        p_bus -= np.bincount(load_bus, weights=load_p, minlength=n_bus)
+        p_bus -= np.bincount(shunt_bus, weights=shunt_p, minlength=n_bus)
+        p_bus /= grid.sn_mva
+
+        theta, p_branch = self._dc_solver.solve(key, bus_is, line_status, branch_from, branch_to, slack_bus, p_bus)
+        if theta is None:
+            return False
+
+        # as in pandapower, the imbalance between production and consumption is shared equally by the external
+        # grids and the slack generator
+        ext_p = np.zeros(ext_is.shape[0])
+        slack_p = - np.sum(p_bus) * grid.sn_mva / (np.sum(ext_is) + 1)
+        ext_p[ext_is] = slack_p
+        gen_p[slack_gen] += slack_p
+
+        # voltages as in the pandapower model used by "rundcpp": angles relative to the one of the external grid,
+        # magnitudes are the setpoints of the external grids and of the generators (1. pair unit elsewhere)
+        va_ref = grid.ext_grid["va_degree"].values[ext_is]
+        va_degree = theta * 180. / np.pi + (va_ref[0] if va_ref.shape[0] else 0.)
+        vm_pu = np.ones(n_bus)
+        vm_pu[ext_bus[ext_is]] = grid.ext_grid["vm_pu"].values[ext_is]
+        vm_pu[gen_bus[gen_is]] = grid.gen["vm_pu"].values[gen_is]
+        va_degree[~bus_is] = np.NaN
+        vm_pu[~bus_is] = np.NaN
+
+        self._set_dc_results(p_branch * grid.sn_mva, branch_from, branch_to, va_degree, vm_pu,
+                             gen_p, gen_is, gen_bus, load_p, load_bus, shunt_p, shunt_is, shunt_bus, ext_p, ext_bus)
+        return True
+
+    def _set_dc_results(self, p_branch, branch_from, branch_to, va_degree, vm_pu,
+                        gen_p, gen_is, gen_bus, load_p, load_bus, shunt_p, shunt_is, shunt_bus, ext_p, ext_bus):
+        """
+        Write the results of :func:`PandaPowerBackend._runpf_native_dc` in the result tables of the pandapower grid,
+        as ``pandapower.rundcpp`` does: the columns not computed by a DC powerflow (for example the reactive
+        powers and the voltage magnitudes of the buses) keep the values of the previous powerflow.
+        """
+        grid = self._grid
+        vn_kv = grid.bus["vn_kv"].values
+        vm_from = vm_pu[branch_from]
+        vm_to = vm_pu[branch_to]
+        with np.errstate(invalid="ignore"):
+            i_from = np.abs(p_branch) / (vm_from * vn_kv[branch_from]) / np.sqrt(3.)
+            i_to = np.abs(p_branch) / (vm_to * vn_kv[branch_to]) / np.sqrt(3.)
+            i_max = np.fmax(i_from, i_to)
+
+        n_line = self._number_true_line
+        line = grid.line
+        res_line = grid.res_line
+        res_line["p_from_mw"] = p_branch[:n_line]
+        res_line["q_from_mvar"] = 0.
+        res_line["p_to_mw"] = -p_branch[:n_line]
+        res_line["q_to_mvar"] = 0.
+        res_line["pl_mw"] = 0.
+        res_line["ql_mvar"] = 0.
+        res_line["i_from_ka"] = i_from[:n_line]
+        res_line["i_to_ka"] = i_to[:n_line]
+        res_line["i_ka"] = i_max[:n_line]
+        res_line["vm_from_pu"] = vm_from[:n_line]
+        res_line["va_from_degree"] = va_degree[branch_from[:n_line]]
+        res_line["vm_to_pu"] = vm_to[:n_line]
+        res_line["va_to_degree"] = va_degree[branch_to[:n_line]]
+        res_line["loading_percent"] = i_max[:n_line] / (line["max_i_ka"].values * line["df"].values *
+                                                         line["parallel"].values) * 100.
+
+        trafo = grid.trafo
+        res_trafo = grid.res_trafo
+        res_trafo["p_hv_mw"] = p_branch[n_line:]
+        res_trafo["q_hv_mvar"] = 0.
+        res_trafo["p_lv_mw"] = -p_branch[n_line:]
+        res_trafo["q_lv_mvar"] = 0.
+        res_trafo["pl_mw"] = 0.
+        res_trafo["ql_mvar"] = 0.
+        res_trafo["i_hv_ka"] = i_from[n_line:]
+        res_trafo["i_lv_ka"] = i_to[n_line:]
+        res_trafo["vm_hv_pu"] = vm_from[n_line:]
+        res_trafo["va_hv_degree"] = va_degree[branch_from[n_line:]]
+        res_trafo["vm_lv_pu"] = vm_to[n_line:]
+        res_trafo["va_lv_degree"] = va_degree[branch_to[n_line:]]
+        with np.errstate(invalid="ignore"):
+            loading_trafo = np.fmax(i_from[n_line:] * trafo["vn_hv_kv"].values,
+                                    i_to[n_line:] * trafo["vn_lv_kv"].values) * np.sqrt(3.) / trafo["sn_mva"].values
+        res_trafo["loading_percent"] = loading_trafo * 100. / trafo["parallel"].values / trafo["df"].values
+
+        vm_gen = np.where(gen_is, vm_pu[gen_bus], 0.)
+        grid.res_gen["p_mw"] = gen_p
+        grid.res_gen["va_degree"] = np.where(gen_is, va_degree[gen_bus], 0.)
+        grid.res_gen["vm_pu"] = vm_gen
+        grid.res_load["p_mw"] = load_p
+        res_shunt_p = np.nan_to_num(vm_pu[shunt_bus]) ** 2 * shunt_p
+        grid.res_shunt["p_mw"] = res_shunt_p
+        grid.res_ext_grid["p_mw"] = ext_p
+
+        n_bus = va_degree.shape[0]
+        p_bus = np.bincount(load_bus, weights=load_p, minlength=n_bus)
+        p_bus += np.bincount(shunt_bus, weights=res_shunt_p, minlength=n_bus)
+        p_bus -= np.bincount(gen_bus, weights=gen_p, minlength=n_bus)
+        p_bus -= np.bincount(ext_bus, weights=ext_p, minlength=n_bus)
+        grid.res_bus["va_degree"] = va_degree
+        grid.res_bus["p_mw"] = p_bus
+        # "rundcpp" does not store the results of the slack generators (see `_gens_info`)
+        if "internal" in grid._ppc:
+            grid._ppc["internal"].pop("gen", None)
+
+    def _get_results(self, is_dc):
+        """
+        Read the results of the last powerflow in the result tables of the pandapower grid.
+        """
+        self.load_p[:], self.load_q[:], self.load_v[:] = self._loads_info()
+        if not is_dc:
+            if not np.all(np.isfinite(self.load_v)):
+                # TODO see if there is a better way here
+                # some loads are disconnected: it's a game over case!
+                raise pp.powerflow.LoadflowNotConverged("Isolated load")
+
+        self.line_status[:] = self._get_line_status()
+        # I retrieve the data once for the flows, so has to not re read multiple dataFrame
+        self.p_or[:] = self._aux_get_line_info("p_from_mw", "p_hv_mw")
+        self.q_or[:] = self._aux_get_line_info("q_from_mvar", "q_hv_mvar")
+        self.v_or[:] = self._aux_get_line_info("vm_from_pu", "vm_hv_pu")
+        self.a_or[:] = self._aux_get_line_info("i_from_ka", "i_hv_ka") * 1000
+        self.a_or[~np.isfinite(self.a_or)] = 0.
+        self.v_or[~np.isfinite(self.v_or)] = 0.
+
+        # it seems that pandapower does not take into account disconencted powerline for their voltage
+        self.v_or[~self.line_status] = 0.
+        self.v_ex[~self.line_status] = 0.
+
+        self.p_ex[:] = self._aux_get_line_info("p_to_mw", "p_lv_mw")
+        self.q_ex[:] = self._aux_get_line_info("q_to_mvar", "q_lv_mvar")
+        self.v_ex[:] = self._aux_get_line_info("vm_to_pu", "vm_lv_pu")
+        self.a_ex[:] = self._aux_get_line_info("i_to_ka", "i_lv_ka") * 1000
+        self.a_ex[~np.isfinite(self.a_ex)] = 0.
+        self.v_ex[~np.isfinite(self.v_ex)] = 0.
+
+        self.v_or[:] *= self.lines_or_pu_to_kv
+        self.v_ex[:] *= self.lines_ex_pu_to_kv
+
+        self.prod_p[:], self.prod_q[:], self.prod_v[:] = self._gens_info()
+
     def runpf(self, is_dc=False):
         """
         Run a power flow on the underlying _grid. This implements an optimization of the powerflow
-        computation: if the number of
-        buses has not changed between two calls, the previous results are re used. This speeds up the computation
-        in case of "do nothing" action applied.
+        computation: if the topology of the grid is one of the last topologies for which an AC powerflow converged
+        (see :attr:`PandaPowerBackend.warm_start_cache_size`), the voltages computed at that time are used to
+        initialize the powerflow. Otherwise, if the number of buses has not changed since the last results, these
+        results are re used. This speeds up the computation in case of "do nothing" action applied, or when the
+        same topologies are often visited.
         """
+        if is_dc and self.use_native_dc and self._dc_solver is not None:
+            conv = self._runpf_native_dc()
+            if conv is not None:
+                if not conv:
+                    self._set_results_nan()
+                    return False
+                self._get_results(is_dc)
+                self._nb_bus_before = None
+                self._topo_vect[:] = self._get_topo_vect()
+                return True
+
         conv = True
         nb_bus = self.get_nb_active_bus()
         try:
@@ -607,48 +1008,36 @@ class PandaPowerBackend(Backend):
                     self._pf_init = "results"
                 else:
                     self._pf_init = "auto"
+                topo_key = None
                 if is_dc:
                     pp.rundcpp(self._grid, check_connectivity=False)
                     self._nb_bus_before = None  # if dc i start normally next time i call an ac powerflow
                 else:
-                    pp.runpp(self._grid, check_connectivity=False, init=self._pf_init, numba=numba_)
+                    init_v = None
+                    if self.warm_start_cache_size > 0:
+                        topo_key = self._get_topo_key()
+                        init_v = self._warm_start_cache.get(topo_key)
+                    self._warm_start_stats["nb_powerflow"] += 1
+                    if init_v is not None:
+                        self._warm_start_stats["hits"] += 1
+                        pp.runpp(self._grid, check_connectivity=False, init="auto",
+                                 init_vm_pu=init_v[0], init_va_degree=init_v[1], numba=numba_)
+                    else:
+                        self._warm_start_stats["misses"] += 1
+                        pp.runpp(self._grid, check_connectivity=False, init=self._pf_init, numba=numba_)
 
                 if self._grid.res_gen.isnull().values.any():
                     # TODO see if there is a better way here -> do not handle this here, but rather in Backend._next_grid_state
                     # sometimes pandapower does not detect divergence and put Nan.
                     raise pp.powerflow.LoadflowNotConverged("Isolated gen")
 
-                self.load_p[:], self.load_q[:], self.load_v[:] = self._loads_info()
+                self._get_results(is_dc)
+
                 if not is_dc:
-                    if not np.all(np.isfinite(self.load_v)):
-                        # TODO see if there is a better way here
-                        # some loads are disconnected: it's a game over case!
-                        raise pp.powerflow.LoadflowNotConverged("Isolated load")
-
-                self.line_status[:] = self._get_line_status()
-                # I retrieve the data once for the flows, so has to not re read multiple dataFrame
-                self.p_or[:] = self._aux_get_line_info("p_from_mw", "p_hv_mw")
-                self.q_or[:] = self._aux_get_line_info("q_from_mvar", "q_hv_mvar")
-                self.v_or[:] = self._aux_get_line_info("vm_from_pu", "vm_hv_pu")
-                self.a_or[:] = self._aux_get_line_info("i_from_ka", "i_hv_ka") * 1000
-                self.a_or[~np.isfinite(self.a_or)] = 0.
-                self.v_or[~np.isfinite(self.v_or)] = 0.
-
-                # it seems that pandapower does not take into account disconencted powerline for their voltage
-                self.v_or[~self.line_status] = 0.
-                self.v_ex[~self.line_status] = 0.
-
-                self.p_ex[:] = self._aux_get_line_info("p_to_mw", "p_lv_mw")
-                self.q_ex[:] = self._aux_get_line_info("q_to_mvar", "q_lv_mvar")
-                self.v_ex[:] = self._aux_get_line_info("vm_to_pu", "vm_lv_pu")
-                self.a_ex[:] = self._aux_get_line_info("i_to_ka", "i_lv_ka") * 1000
-                self.a_ex[~np.isfinite(self.a_ex)] = 0.
-                self.v_ex[~np.isfinite(self.v_ex)] = 0.
-
-                self.v_or[:] *= self.lines_or_pu_to_kv
-                self.v_ex[:] *= self.lines_ex_pu_to_kv
-
-                self.prod_p[:], self.prod_q[:], self.prod_v[:] = self._gens_info()
+                    self._warm_start_stats["nb_converged"] += 1
+                    self._warm_start_stats["nb_iterations"] += int(self._grid._ppc.get("iterations", 0))
+                    if topo_key is not None:
+                        self._store_warm_start(topo_key)
 
                 self._nb_bus_before = None
                 self._grid._ppc["gen"][self._iref_slack, 1] = 0.
@@ -657,24 +1046,28 @@ class PandaPowerBackend(Backend):
 
         except pp.powerflow.LoadflowNotConverged as exc_:
             # of the powerflow has not converged, results are Nan
-            self.p_or[:] = np.NaN
-            self.q_or[:] = np.NaN
-            self.v_or[:] = np.NaN
-            self.a_or[:] = np.NaN
-            self.p_ex[:] = np.NaN
-            self.q_ex[:] = np.NaN
-            self.v_ex[:] = np.NaN
-            self.a_ex[:] = np.NaN
-            self.prod_p[:] = np.NaN
-            self.prod_q[:] = np.NaN
-            self.prod_v[:] = np.NaN
-            self.load_p[:] = np.NaN
-            self.load_q[:] = np.NaN
-            self.load_v[:] = np.NaN
-
-            self._nb_bus_before = None
+            self._set_results_nan()
             return False
 
+    def _set_results_nan(self):
+        """the powerflow has not converged: results are Nan"""
+        self.p_or[:] = np.NaN
+        self.q_or[:] = np.NaN
+        self.v_or[:] = np.NaN
+        self.a_or[:] = np.NaN
+        self.p_ex[:] = np.NaN
+        self.q_ex[:] = np.NaN
+        self.v_ex[:] = np.NaN
+        self.a_ex[:] = np.NaN
+        self.prod_p[:] = np.NaN
+        self.prod_q[:] = np.NaN
+        self.prod_v[:] = np.NaN
+        self.load_p[:] = np.NaN
+        self.load_q[:] = np.NaN
+        self.load_v[:] = np.NaN
+
+        self._nb_bus_before = None
+
     def copy(self):
         """
         Performs a deep copy of the power :attr:`_grid`.
@@ -709,6 +1102,15 @@ class PandaPowerBackend(Backend):
     def _get_line_status(self):
         return np.concatenate((self._grid.line["in_service"].values, self._grid.trafo["in_service"].values)).astype(dt_bool)
 
+    def get_line_susceptance(self):
+        """
+        Susceptance (in pair unit, taking into account the ratio of the transformers) of each powerline, as used in
+        the DC approximation of the powerflow.
+        """
+        if self._line_susceptance is None:
+            raise BackendError("The susceptance of the powerlines is not available for this grid.")
+        return self._line_susceptance.copy()
+
     def get_line_flow(self):
         """
         return the powerflow in amps in all powerlines.
@@ -718,65 +1120,54 @@ class PandaPowerBackend(Backend):
 
     def _disconnect_line(self, id_):
         if id_ < self._number_true_line:
-            self._grid.line["in_service"].iloc[id_] = False
+            self._set_column("line", "in_service", id_, False)
         else:
-            self._grid.trafo["in_service"].iloc[id_ - self._number_true_line] = False
+            self._set_column("trafo", "in_service", id_ - self._number_true_line, False)
         self._topo_vect[self.line_or_pos_topo_vect[id_]] = -1
         self._topo_vect[self.line_ex_pos_topo_vect[id_]] = -1
         self.line_status[id_] = False
 
+    def _disconnect_lines(self, ids):
+        """
+        Disconnect all the powerlines in `ids` at once (see :func:`grid2op.Backend.Backend._disconnect_lines`).
+
+        The buses are not modified by this method, so the next powerflow is initialized with the results of the
+        last one (if any) rather than starting from a "dc" approximation.
+        """
+        is_line = ids < self._number_true_line
+        if is_line.any():
+            self._set_column("line", "in_service", ids[is_line], False)
+        if not is_line.all():
+            self._set_column("trafo", "in_service", ids[~is_line] - self._number_true_line, False)
+        self._topo_vect[self.line_or_pos_topo_vect[ids]] = -1
+        self._topo_vect[self.line_ex_pos_topo_vect[ids]] = -1
+        self.line_status[ids] = False
+        if self._grid.converged:
+            self._nb_bus_before = self.get_nb_active_bus()
+
     def _reconnect_line(self, id_):
         if id_ < self._number_true_line:
-            self._grid.line["in_service"].iloc[id_] = True
+            self._set_column("line", "in_service", id_, True)
         else:
-            self._grid.trafo["in_service"].iloc[id_ - self._number_true_line] = True
+            self._set_column("trafo", "in_service", id_ - self._number_true_line, True)
         self.line_status[id_] = True
 
     def get_topo_vect(self):
         return self._topo_vect
 
     def _get_topo_vect(self):
-        res = np.full(self.dim_topo, fill_value=np.NaN, dtype=dt_int)
+        res = np.full(self.dim_topo, fill_value=-1, dtype=dt_int)
 
         line_status = self.get_line_status()
-
-        i = 0
-        for row in self._grid.line[["from_bus", "to_bus"]].values:
-            bus_or_id = row[0]
-            bus_ex_id = row[1]
-            if line_status[i]:
-                res[self.line_or_pos_topo_vect[i]] = 1 if bus_or_id == self.line_or_to_subid[i] else 2
-                res[self.line_ex_pos_topo_vect[i]] = 1 if bus_ex_id == self.line_ex_to_subid[i] else 2
-            else:
-                res[self.line_or_pos_topo_vect[i]] = -1
-                res[self.line_ex_pos_topo_vect[i]] = -1
-            i += 1
-
-        nb = self._number_true_line
-        i = 0
-        for row in self._grid.trafo[["hv_bus", "lv_bus"]].values:
-            bus_or_id = row[0]
-            bus_ex_id = row[1]
-
-            j = i + nb
-            if line_status[j]:
-                res[self.line_or_pos_topo_vect[j]] = 1 if bus_or_id == self.line_or_to_subid[j] else 2
-                res[self.line_ex_pos_topo_vect[j]] = 1 if bus_ex_id == self.line_ex_to_subid[j] else 2
-            else:
-                res[self.line_or_pos_topo_vect[j]] = -1
-                res[self.line_ex_pos_topo_vect[j]] = -1
-            i += 1
-
-        i = 0
-        for bus_id in self._grid.gen["bus"].values:
-            res[self.gen_pos_topo_vect[i]] = 1 if bus_id == self.gen_to_subid[i] else 2
-            i += 1
-
-        i = 0
-        for bus_id in self._grid.load["bus"].values:
-            res[self.load_pos_topo_vect[i]] = 1 if bus_id == self.load_to_subid[i] else 2
-            i += 1
-
+        bus_or_id = np.concatenate((self._grid.line["from_bus"].values, self._grid.trafo["hv_bus"].values))
+        bus_ex_id = np.concatenate((self._grid.line["to_bus"].values, self._grid.trafo["lv_bus"].values))
+        res[self.line_or_pos_topo_vect] = np.where(bus_or_id == self.line_or_to_subid, 1, 2)
+        res[self.line_ex_pos_topo_vect] = np.where(bus_ex_id == self.line_ex_to_subid, 1, 2)
+        res[self.line_or_pos_topo_vect[~line_status]] = -1
+        res[self.line_ex_pos_topo_vect[~line_status]] = -1
+
+        res[self.gen_pos_topo_vect] = np.where(self._grid.gen["bus"].values == self.gen_to_subid, 1, 2)
+        res[self.load_pos_topo_vect] = np.where(self._grid.load["bus"].values == self.load_to_subid, 1, 2)
         return res
 
     def _gens_info(self):
@@ -0,0 +1,261 @@
+# Copyright (c) 2019-2020, RTE (https://www.rte-france.com)
+# See AUTHORS.txt
+# This Source Code Form is subject to the terms of the Mozilla Public License, version 2.0.
+# If a copy of the Mozilla Public License, version 2.0 was not distributed with this file,
+# you can obtain one at http://mozilla.org/MPL/2.0/.
+# SPDX-License-Identifier: MPL-2.0
+# This file is part of Grid2Op, Grid2Op a testbed platform to model sequential decision making in power systems.
+
+import warnings
+from collections import OrderedDict
+
+import numpy as np
+import scipy.linalg
+from scipy.sparse import csc_matrix
+from scipy.sparse.linalg import splu
+from scipy.sparse.csgraph import connected_components
+
+
+class _DCSolver(object):
+    """
+    This class is internal to grid2op and should not be used outside of the backends.
+
+    It solves the DC powerflow equations :math:`B \\theta = P` on a powergrid with a fixed number of buses and of
+    branches (powerlines and transformers). Only the topology (buses in service, status of the branches and buses
+    at each of their ends), the slack bus and the injections change between two calls.
+
+    The susceptance matrix is built for all the buses: the buses out of service and the slack bus are "grounded"
+    (their row and column are replaced by the identity) so that its size never changes. This allows to:
+
+      - reuse the factorization of this matrix for all the calls on the same topology (a bounded number of
+        topologies are kept, the least recently used ones are removed first)
+      - when a topology is not known, to express its matrix as a low rank modification of the matrix of the
+        first topology factorized (the "base" topology) if only a few buses are affected (for example a few
+        powerlines disconnected or a bus split), and to solve the system with the Woodbury identity instead of
+        factorizing a new matrix.
+
+    The factorizations are not copied (nor pickled) with this object: they are computed again when needed.
+
+    Attributes
+    ----------
+    n_bus: ``int``
+        Total number of buses (in service or not)
+
+    branch_b: ``numpy.ndarray``, dtype:float
+        Susceptance (in pair unit) of each branch (including the ratio of the transformers)
+
+    branch_shift: ``numpy.ndarray``, dtype:float
+        Phase shift (in radian) of each branch
+
+    cache_size: ``int``
+        Maximum number of topologies for which the solver is kept
+
+    max_rank: ``int``
+        Maximum number of buses affected by a modification of the base topology for it to be handled by the Woodbury
+        identity (otherwise the matrix is factorized)
+
+    """
+    def __init__(self, n_bus, branch_b, branch_shift, cache_size=16, max_rank=20):
+        self.n_bus = int(n_bus)
+        self.branch_b = np.array(branch_b, dtype=np.float64)
+        self.branch_shift = np.array(branch_shift, dtype=np.float64)
+        self.cache_size = int(cache_size)
+        self.max_rank = int(max_rank)
+        self._init_factorizations()
+
+    def _init_factorizations(self):
+        self._solvers = OrderedDict()
+        self._connected = OrderedDict()
+        self._base = None
+        self.nb_factorization = 0
+        self.nb_low_rank = 0
+
+    def __getstate__(self):
+        res = self.__dict__.copy()
+        for attr_nm in ["_solvers", "_connected", "_base", "nb_factorization", "nb_low_rank"]:
+            del res[attr_nm]
+        return res
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._init_factorizations()
+
+    def _get_matrix(self, bus_is, branch_is, branch_from, branch_to, slack_bus):
+        """build the (grounded) susceptance matrix, and the susceptance of the branches really in service"""
+        b = self.branch_b * (branch_is & bus_is[branch_from] & bus_is[branch_to])
+        keep = bus_is.copy()
+        keep[slack_bus] = False
+        rows = np.concatenate((branch_from, branch_to, branch_from, branch_to))
+        cols = np.concatenate((branch_from, branch_to, branch_to, branch_from))
+        vals = np.concatenate((b, b, -b, -b))
+        mask = keep[rows] & keep[cols] & (vals != 0.)
+        grounded = np.flatnonzero(~keep)
+        rows = np.concatenate((rows[mask], grounded))
+        cols = np.concatenate((cols[mask], grounded))
+        vals = np.concatenate((vals[mask], np.ones(grounded.shape[0])))
+        mat = csc_matrix((vals, (rows, cols)), shape=(self.n_bus, self.n_bus))
+        return mat, b, keep
+
+    def _factorize(self, mat):
+        self.nb_factorization += 1
+        try:
+            return splu(mat).solve
+        except RuntimeError:
+            # matrix is exactly singular
+            return None
+
+    def _low_rank_solver(self, mat):
+        """
+        solver for `mat` using the factorization of the base matrix, or ``None`` if `mat` differs too much from it
+        """
+        base_mat, base_solve = self._base
+        diff = (mat - base_mat).tocsr()
+        diff.eliminate_zeros()
+        buses = np.flatnonzero(np.diff(diff.indptr))
+        if buses.shape[0] == 0:
+            return base_solve
+        if buses.shape[0] > self.max_rank:
+            return None
+        nb_ = buses.shape[0]
+        c_mat = diff[buses][:, buses].toarray()
+        e_mat = np.zeros((self.n_bus, nb_))
+        e_mat[buses, np.arange(nb_)] = 1.
+        z_mat = base_solve(e_mat)
+        with warnings.catch_warnings():
+            warnings.filterwarnings("error")
+            try:
+                lu_ = scipy.linalg.lu_factor(np.eye(nb_) + z_mat[buses] @ c_mat)
+            except (scipy.linalg.LinAlgWarning, scipy.linalg.LinAlgError, RuntimeWarning):
+                return None
+        zc_mat = z_mat @ c_mat
+        self.nb_low_rank += 1
+
+        def solve(rhs):
+            y = base_solve(rhs)
+            return y - zc_mat @ scipy.linalg.lu_solve(lu_, y[buses])
+        return solve
+
+    def get_connected_buses(self, key, bus_is, branch_is, branch_from, branch_to, slack_bus):
+        """
+        Buses in service that are connected to the slack bus. The result is kept for the most recently used
+        topologies.
+
+        Parameters
+        ----------
+        key, bus_is, branch_is, branch_from, branch_to, slack_bus:
+            See :func:`_DCSolver.solve`
+
+        Returns
+        -------
+        res: ``numpy.ndarray``, dtype:bool
+            For each bus, whether it is in service and connected to the slack bus
+
+        """
+        if key in self._connected:
+            self._connected.move_to_end(key)
+            return self._connected[key]
+        br_is = branch_is & bus_is[branch_from] & bus_is[branch_to]
+        adj = csc_matrix((np.ones(np.sum(br_is)), (branch_from[br_is], branch_to[br_is])),
+                         shape=(self.n_bus, self.n_bus))
+        _, labels = connected_components(adj, directed=False)
+        res = bus_is & (labels == labels[slack_bus])
+        self._connected[key] = res
+        while len(self._connected) > self.cache_size:
+            self._connected.popitem(last=False)
+        return res
+
+    def _get_solver(self, key, mat):
+        """
+        returns the solver for the topology `key` (whose matrix is `mat`), and whether it comes from a direct
+        factorization of `mat`
+        """
+        if key in self._solvers:
+            self._solvers.move_to_end(key)
+            return self._solvers[key]
+
+        solve = None
+        is_direct = False
+        if self._base is not None:
+            solve = self._low_rank_solver(mat)
+        if solve is None:
+            solve = self._factorize(mat)
+            is_direct = True
+            if self._base is None and solve is not None:
+                self._base = (mat, solve)
+        self._set_solver(key, solve, is_direct)
+        return solve, is_direct
+
+    def _set_solver(self, key, solve, is_direct):
+        self._solvers[key] = (solve, is_direct)
+        self._solvers.move_to_end(key)
+        while len(self._solvers) > self.cache_size:
+            self._solvers.popitem(last=False)
+
+    @staticmethod
+    def _apply_solver(solve, mat, rhs):
+        """solve the system, and check the solution is correct (``None`` otherwise)"""
+        if solve is None:
+            return None
+        theta = solve(rhs)
+        if not np.all(np.isfinite(theta)):
+            return None
+        if np.abs(mat @ theta - rhs).max() > 1e-8 * (1. + np.abs(rhs).max()):
+            return None
+        return theta
+
+    def solve(self, key, bus_is, branch_is, branch_from, branch_to, slack_bus, p_bus):
+        """
+        Solve the DC powerflow.
+
+        Parameters
+        ----------
+        key: hashable
+            Identifies the topology (buses and branches status, buses at each end of the branches and slack bus)
+
+        bus_is: ``numpy.ndarray``, dtype:bool
+            For each bus, whether it is in service
+
+        branch_is: ``numpy.ndarray``, dtype:bool
+            For each branch, whether it is in service
+
+        branch_from: ``numpy.ndarray``, dtype:int
+            Bus (position) at the origin side of each branch
+
+        branch_to: ``numpy.ndarray``, dtype:int
+            Bus (position) at the extremity side of each branch
+
+        slack_bus: ``int``
+            Bus (position) of the slack bus
+
+        p_bus: ``numpy.ndarray``, dtype:float
+            Active power injected at each bus (in pair unit)
+
+        Returns
+        -------
+        theta: ``numpy.ndarray``, dtype:float
+            The voltage angle at each bus (in radian, ``0.`` for the slack bus and the buses out of service) or
+            ``None`` if the system cannot be solved (for example if some buses are not connected to the slack bus)
+
+        p_branch: ``numpy.ndarray``, dtype:float
+            The active power flowing at the origin side of each branch (in pair unit) or ``None`` if the system cannot
+            be solved
+
+        """
+        mat, b, keep = self._get_matrix(bus_is, branch_is, branch_from, branch_to, slack_bus)
+        p_finj = - b * self.branch_shift
+        rhs = p_bus - np.bincount(branch_from, weights=p_finj, minlength=self.n_bus) \
+            + np.bincount(branch_to, weights=p_finj, minlength=self.n_bus)
+        rhs[~keep] = 0.
+
+        solve, is_direct = self._get_solver(key, mat)
+        theta = self._apply_solver(solve, mat, rhs)
+        if theta is None and not is_direct:
+            # the low rank update might not be accurate enough, the matrix is factorized
+            solve = self._factorize(mat)
+            self._set_solver(key, solve, True)
+            theta = self._apply_solver(solve, mat, rhs)
+        if theta is None:
+            # the system cannot be solved (some buses are not connected to the slack bus for example)
+            return None, None
+        p_branch = b * (theta[branch_from] - theta[branch_to]) + p_finj
+        return theta, p_branch
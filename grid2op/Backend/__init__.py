@@ -1,7 +1,9 @@
 __all__ = [
     "Backend", 
-    "PandaPowerBackend"
+    "PandaPowerBackend",
+    "PTDFScreening"
 ]
 
 from grid2op.Backend.Backend import Backend
 from grid2op.Backend.PandaPowerBackend import PandaPowerBackend
+from grid2op.Backend.PTDFScreening import PTDFScreening
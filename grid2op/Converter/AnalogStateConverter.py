@@ -20,10 +20,82 @@ class AnalogStateConverter(Converter):
     The grid2op action is created from a set of real valued arrays
     """
 
+    # part of the converted observation, in order: name of the attribute of the observation, scaling value and
+    # padding value (used to replace non finite values). The "*_bus" entries are computed from the topology vector
+    # and "gen_cost_per_MW" is a property of the grid.
+    _obs_attr_norm = [
+        # Time
+        ("month", 12.0, 0.0), ("day", 31.0, 0.0), ("day_of_week", 7.0, 0.0),
+        ("hour_of_day", 24.0, 0.0), ("minute_of_hour", 60.0, 0.0),
+        ("time_before_cooldown_line", 10.0, -1.0), ("time_before_cooldown_sub", 10.0, -1.0),
+        ("time_next_maintenance", 10.0, 0.0),
+        # Gens
+        ("prod_p", 1000.0, 0.0), ("prod_q", 1000.0, 0.0), ("prod_v", 1000.0, 0.0),
+        ("actual_dispatch", 150.0, 0.0), ("target_dispatch", 150.0, 0.0), ("gen_bus", 3.0, -1.0),
+        ("gen_cost_per_MW", 1.0, 0.0),
+        # Loads
+        ("load_p", 1000.0, 0.0), ("load_q", 1000.0, 0.0), ("load_v", 1000.0, 0.0), ("load_bus", 3.0, -1.0),
+        # Origins
+        ("p_or", 1000.0, 0.0), ("q_or", 1000.0, 0.0), ("v_or", 1000.0, 0.0), ("line_or_bus", 3.0, -1.0),
+        ("rho", 1.0, -1.0),
+        # Extremities
+        ("p_ex", 1000.0, 0.0), ("q_ex", 1000.0, 0.0), ("v_ex", 1000.0, 0.0), ("line_ex_bus", 3.0, -1.0),
+        ("rho", 1.0, -1.0),
+    ]
+
     def __init__(self, action_space, bias=0.0):
         super().__init__(action_space)
         self.__class__ = AnalogStateConverter.init_grid(action_space)
         self.__bias = 0.0
+        self._init_obs_layout()
+
+    def _init_obs_layout(self):
+        """
+        Precomputes the position of each part of the converted observation, as well as the scaling and padding
+        vectors, so that an observation can be converted with a few vectorized operations.
+        """
+        bus_pos = {"gen_bus": self.gen_pos_topo_vect,
+                   "load_bus": self.load_pos_topo_vect,
+                   "line_or_bus": self.line_or_pos_topo_vect,
+                   "line_ex_bus": self.line_ex_pos_topo_vect}
+        sizes = {"time_before_cooldown_line": self.n_line, "time_before_cooldown_sub": self.n_sub,
+                 "time_next_maintenance": self.n_line, "gen_cost_per_MW": self.n_gen}
+        for attr_nm in ["prod_p", "prod_q", "prod_v", "actual_dispatch", "target_dispatch"]:
+            sizes[attr_nm] = self.n_gen
+        for attr_nm in ["load_p", "load_q", "load_v"]:
+            sizes[attr_nm] = self.n_load
+        for attr_nm in ["p_or", "q_or", "v_or", "p_ex", "q_ex", "v_ex", "rho"]:
+            sizes[attr_nm] = self.n_line
+
+        self._obs_fields = []  # (attribute name, beg_, end_) for the values read directly from the observation
+        bus_idx = []
+        bus_topo_pos = []
+        scale_v = []
+        pad_v = []
+        beg_ = 0
+        for attr_nm, scale, pad in self._obs_attr_norm:
+            if attr_nm in bus_pos:
+                size = bus_pos[attr_nm].shape[0]
+                bus_idx.append(np.arange(beg_, beg_ + size))
+                bus_topo_pos.append(bus_pos[attr_nm])
+            else:
+                size = sizes.get(attr_nm, 1)
+                if attr_nm == "gen_cost_per_MW":
+                    self._cost_slice = slice(beg_, beg_ + size)
+                else:
+                    self._obs_fields.append((attr_nm, beg_, beg_ + size))
+            scale_v.append(np.full(size, fill_value=scale, dtype=np.float64))
+            pad_v.append(np.full(size, fill_value=pad, dtype=np.float32))
+            beg_ += size
+        self._size_obs = beg_
+        self._bus_idx = np.concatenate(bus_idx)
+        self._bus_topo_pos = np.concatenate(bus_topo_pos)
+        self._scale_v = np.concatenate(scale_v)
+        self._pad_v = np.concatenate(pad_v)
+        if self.gen_cost_per_MW is not None:
+            self._gen_cost = np.array(self.gen_cost_per_MW, dtype=np.float64)
+        else:
+            self._gen_cost = np.full(self.n_gen, fill_value=np.NaN, dtype=np.float64)
 
     @staticmethod
     def to_norm_vect(inputv, pad_v = 0.0, scale_v = 1.0):
@@ -32,7 +104,16 @@ class AnalogStateConverter(Converter):
         vsafe = np.nan_to_num(v, nan=pad_v, posinf=pad_v, neginf=pad_v)
         return vsafe.astype(np.float32)
 
-    def convert_obs(self, obs):
+    def _normalize(self, raw, out):
+        """scale the raw values and replace the non finite ones by the padding values, the result is stored in out"""
+        raw /= self._scale_v
+        finite = np.isfinite(raw)
+        np.copyto(out, self._pad_v)  # broadcast in case of a batch
+        np.copyto(out, raw, where=finite, casting="same_kind")
+        out += self.__bias
+        return out
+
+    def convert_obs(self, obs, out=None):
         """
         This converter will convert the observation into a 1D vector,
         with all values normalized, plus bias (if provided)
@@ -42,8 +123,9 @@ class AnalogStateConverter(Converter):
         obs: :class:`grid2op.Observation.Observation`
             The input observation.
 
-        bias: ``float``
-            Bias to add to the vector, defaults to 0.0
+        out: ``np.array``
+            A 1D array of np.float32 of size :func:`AnalogStateConverter.size_obs` in which the result is written.
+            If ``None`` (default) a new array is allocated.
 
         Returns
         -------
@@ -52,86 +134,59 @@ class AnalogStateConverter(Converter):
         """
         # Store the obs for action convertion
         self.__obs = obs
-        # Store some shortcuts
-        topo = obs.topo_vect
-        g_pos = obs.gen_pos_topo_vect
-        l_pos = obs.load_pos_topo_vect
-        lor_pos = obs.line_or_pos_topo_vect
-        lex_pos = obs.line_ex_pos_topo_vect
-
-        # Get time data
-        time_li = [obs.month / 12.0, obs.day / 31.0, obs.day_of_week / 7.0,
-                   obs.hour_of_day / 24.0, obs.minute_of_hour / 60.0]
-        time_v = self.to_norm_vect(time_li)
-        time_line_cd = self.to_norm_vect(obs.time_before_cooldown_line,
-                                    pad_v=-1.0, scale_v=10.0)
-        time_line_nm = self.to_norm_vect(obs.time_next_maintenance,
-                                         scale_v=10.0)
-        time_sub_cd = self.to_norm_vect(obs.time_before_cooldown_sub,
-                                   pad_v=-1.0, scale_v=10.0)
-    
-        # Get generators info
-        g_p = self.to_norm_vect(obs.prod_p, scale_v=1000.0)
-        g_q = self.to_norm_vect(obs.prod_q, scale_v=1000.0)
-        g_v = self.to_norm_vect(obs.prod_v, scale_v=1000.0)
-        g_tr = self.to_norm_vect(obs.target_dispatch, scale_v=150.0)
-        g_ar = self.to_norm_vect(obs.actual_dispatch, scale_v=150.0)
-        g_cost = self.to_norm_vect(obs.gen_cost_per_MW, pad_v=0.0, scale_v=1.0)
-        g_buses = np.zeros(obs.n_gen)
-        for gen_id in range(obs.n_gen):
-            g_buses[gen_id] = topo[g_pos[gen_id]]
-            if g_buses[gen_id] <= 0.0:
-                g_buses[gen_id] = 0.0
-        g_bus = self.to_norm_vect(g_buses, pad_v=-1.0, scale_v=3.0)
-
-        # Get loads info
-        l_p = self.to_norm_vect(obs.load_p, scale_v=1000.0)
-        l_q = self.to_norm_vect(obs.load_q, scale_v=1000.0)
-        l_v = self.to_norm_vect(obs.load_v, scale_v=1000.0)
-        l_buses = np.zeros(obs.n_load)
-        for load_id in range(obs.n_load):
-            l_buses[load_id] = topo[l_pos[load_id]]
-            if l_buses[load_id] <= 0.0:
-                l_buses[load_id] = 0.0
-        l_bus = self.to_norm_vect(l_buses, pad_v=-1.0, scale_v=3.0)
-
-        # Get lines origin info
-        or_p = self.to_norm_vect(obs.p_or, scale_v=1000.0)
-        or_q = self.to_norm_vect(obs.q_or, scale_v=1000.0)
-        or_v = self.to_norm_vect(obs.v_or, scale_v=1000.0)
-        or_buses = np.zeros(obs.n_line)
-        for line_id in range(obs.n_line):
-            or_buses[line_id] = topo[lor_pos[line_id]]
-            if or_buses[line_id] <= 0.0:
-                or_buses[line_id] = 0.0
-        or_bus = self.to_norm_vect(or_buses, pad_v=-1.0, scale_v=3.0)
-        or_rho = self.to_norm_vect(obs.rho, pad_v=-1.0)
-    
-        # Get extremities origin info
-        ex_p = self.to_norm_vect(obs.p_ex, scale_v=1000.0)
-        ex_q = self.to_norm_vect(obs.q_ex, scale_v=1000.0)
-        ex_v = self.to_norm_vect(obs.v_ex, scale_v=1000.0)
-        ex_buses = np.zeros(obs.n_line)
-        for line_id in range(obs.n_line):
-            ex_buses[line_id] = topo[lex_pos[line_id]]
-            if ex_buses[line_id] <= 0.0:
-                ex_buses[line_id] = 0.0
-        ex_bus = self.to_norm_vect(ex_buses, pad_v=-1.0, scale_v=3.0)
-        ex_rho = self.to_norm_vect(obs.rho, pad_v=-1.0)
-
-        res = np.concatenate([
-            # Time
-            time_v, time_line_cd, time_sub_cd, time_line_nm,
-            # Gens
-            g_p, g_q, g_v, g_ar, g_tr, g_bus, g_cost,
-            # Loads
-            l_p, l_q, l_v, l_bus,
-            # Origins
-            or_p, or_q, or_v, or_bus, or_rho,
-            # Extremities
-            ex_p, ex_q, ex_v, ex_bus, ex_rho
-        ])
-        return res + self.__bias
+
+        raw = np.empty(self._size_obs, dtype=np.float64)
+        for attr_nm, beg_, end_ in self._obs_fields:
+            raw[beg_:end_] = getattr(obs, attr_nm)
+        raw[self._bus_idx] = np.maximum(obs.topo_vect[self._bus_topo_pos], 0)
+        raw[self._cost_slice] = self._gen_cost
+
+        if out is None:
+            out = np.empty(self._size_obs, dtype=np.float32)
+        return self._normalize(raw, out)
+
+    def convert_obs_batch(self, obs_vects, observation_space, out=None):
+        """
+        Same as :func:`AnalogStateConverter.convert_obs` but for a batch of observations represented as vectors
+        (see :func:`grid2op.Observation.BaseObservation.to_vect`). All the observations are converted at once.
+
+        **NB** contrary to :func:`AnalogStateConverter.convert_obs` the observations are not stored, so this
+        function cannot be used before a call to :func:`AnalogStateConverter.convert_act`.
+
+        Parameters
+        ----------
+        obs_vects: ``np.array``
+            A 2D array, each row being an observation converted to a vector.
+
+        observation_space: :class:`grid2op.Observation.ObservationSpace`
+            The observation space from which the observations come. It is used to know where each attribute is
+            stored in the vectors.
+
+        out: ``np.array``
+            A 2D array of np.float32 of shape (number of observations, :func:`AnalogStateConverter.size_obs`) in which
+            the result is written. If ``None`` (default) a new array is allocated.
+
+        Returns
+        -------
+        ``np.array`` 2D array of np.float32 normalized values, one row per observation
+
+        """
+        obs_vects = np.atleast_2d(obs_vects)
+        src_idx = np.empty(self._size_obs, dtype=np.int64)
+        for attr_nm, beg_, end_ in self._obs_fields:
+            beg_src, end_src, _ = observation_space.get_indx_extract(attr_nm)
+            src_idx[beg_:end_] = np.arange(beg_src, end_src)
+        beg_topo, _, _ = observation_space.get_indx_extract("topo_vect")
+        src_idx[self._bus_idx] = beg_topo + self._bus_topo_pos
+        src_idx[self._cost_slice] = 0  # not read from the observation
+
+        raw = obs_vects[:, src_idx].astype(np.float64)
+        raw[:, self._bus_idx] = np.maximum(raw[:, self._bus_idx], 0)
+        raw[:, self._cost_slice] = self._gen_cost
+
+        if out is None:
+            out = np.empty(raw.shape, dtype=np.float32)
+        return self._normalize(raw, out)
 
     def convert_act(self, netstate):
         """
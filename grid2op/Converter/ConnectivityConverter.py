@@ -174,37 +174,38 @@ class ConnectivityConverter(Converter):
         """
         argsort = np.argsort(np.minimum(encoded_act, 1-encoded_act))
         topo_vect = np.zeros(self.dim_topo, dtype=dt_int)
+
+        # the first (most "certain") pair of each substation is used to initialize it, in the order given by argsort
+        _, first_pos = np.unique(self.subs_ids[argsort], return_index=True)
+        first_pos = np.sort(first_pos)[:self.max_sub_changed]
+        topo_vect[self.pos_topo[argsort[first_pos], 0]] = 1   # todo with self.last_obs !
         subs_added = np.full(self.n_sub, fill_value=False)
-        sub_changed = 0
-        for el in argsort:
-            my_sub = self.subs_ids[el]
-            if not subs_added[my_sub]:
-                subs_added[my_sub] = True
-                topo_vect[self.pos_topo[el, 0]] = 1   # todo with self.last_obs !
-                sub_changed += 1
-                if sub_changed >= self.max_sub_changed:
-                    break
-
-        for el in argsort:
-            bus_1_id = self.pos_topo[el, 0]
-            bus_2_id = self.pos_topo[el, 1]
-            need_1 = topo_vect[bus_1_id] <= 0
-            need_2 = topo_vect[bus_2_id] <= 0
-            val = encoded_act[el]
+        subs_added[self.subs_ids[argsort[first_pos]]] = True
+
+        # only the pairs of the substations initialized above can be affected
+        argsort = argsort[subs_added[self.subs_ids[argsort]]]
+        bus_1_ids = self.pos_topo[argsort, 0].tolist()
+        bus_2_ids = self.pos_topo[argsort, 1].tolist()
+        vals = encoded_act[argsort].tolist()
+        topo = topo_vect.tolist()
+        for bus_1_id, bus_2_id, val in zip(bus_1_ids, bus_2_ids, vals):
+            need_1 = topo[bus_1_id] <= 0
+            need_2 = topo[bus_2_id] <= 0
             if need_2 and not need_1:
                 if val > 0.5:
                     # they are on same bus
-                    topo_vect[bus_2_id] = topo_vect[bus_1_id]
+                    topo[bus_2_id] = topo[bus_1_id]
                 else:
                     # they are on different bus
-                    topo_vect[bus_2_id] = 1 - topo_vect[bus_1_id] + 2
+                    topo[bus_2_id] = 1 - topo[bus_1_id] + 2
             elif need_1 and not need_2:
                 if val > 0.5:
                     # they are on same bus
-                    topo_vect[bus_1_id] = topo_vect[bus_2_id]
+                    topo[bus_1_id] = topo[bus_2_id]
                 else:
                     # they are on different bus
-                    topo_vect[bus_1_id] = 1 - topo_vect[bus_2_id] + 2
+                    topo[bus_1_id] = 1 - topo[bus_2_id] + 2
+        topo_vect[:] = topo
 
         act = super().__call__({"set_bus": topo_vect})
         self.last_disagreement = self._compute_disagreement(encoded_act, topo_vect)
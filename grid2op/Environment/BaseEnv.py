@@ -112,6 +112,9 @@ class BaseEnv(GridObjects, RandomObject, ABC):
         self._time_extract_obs = dt_float(0)
         self._time_opponent = dt_float(0)
 
+        # detailed profiling of the steps (see `set_step_profiler`)
+        self._step_profiler = None
+
         # data relative to interpolation
         self._epsilon_poly = dt_float(epsilon_poly)
         self._tol_poly = dt_float(tol_poly)
@@ -849,6 +852,9 @@ class BaseEnv(GridObjects, RandomObject, ABC):
         attack_duration = 0
         lines_attacked, subs_attacked = None, None
         conv_ = None
+        profiler = self._step_profiler
+        if profiler is not None:
+            profiler.start_step(self)
         try:
             # "smart" reconnecting
             beg_ = time.time()
@@ -857,6 +863,8 @@ class BaseEnv(GridObjects, RandomObject, ABC):
                 # action is replace by do nothing
                 action = self.helper_action_player({})
                 except_.append(IllegalAction("BaseAction illegal"))
+            if profiler is not None:
+                profiler.record("rules")
 
             ambiguous, except_tmp = action.is_ambiguous()
             if ambiguous:
@@ -864,10 +872,14 @@ class BaseEnv(GridObjects, RandomObject, ABC):
                 action = self.helper_action_player({})
                 is_ambiguous = True
                 except_.append(except_tmp)
+            if profiler is not None:
+                profiler.record("ambiguity")
 
             # get the modification of generator active setpoint from the environment
             self.env_modification, prod_v_chronics = self._update_actions()
             self.env_modification._single_act = False  # because it absorbs all redispatching actions
+            if profiler is not None:
+                profiler.record("chronics")
             new_p = self._get_new_prod_setpoint(action)
 
             if self.redispatching_unit_commitment_availble:
@@ -895,14 +907,16 @@ class BaseEnv(GridObjects, RandomObject, ABC):
                     is_illegal_reco = True
                     action = self.helper_action_player({})
                     except_.append(except_tmp)
+            if profiler is not None:
+                profiler.record("redispatch")
 
             # make sure the dispatching action is not implemented "as is" by the backend.
             # the environment must make sure it's a zero-sum action.
-            action._redispatch[:] = 0.
+            action._set_redispatch(0.)
             self._backend_action += action
-            action._redispatch[:] = init_disp
+            action._set_redispatch(init_disp)
 
-            self.env_modification._redispatch[:] = self.actual_dispatch
+            self.env_modification._set_redispatch(self.actual_dispatch)
             self._backend_action += self.env_modification
 
             # action, for redispatching is composed of multiple actions, so basically i won't check
@@ -912,6 +926,8 @@ class BaseEnv(GridObjects, RandomObject, ABC):
             # now get the new generator voltage setpoint
             voltage_control_act = self._voltage_control(action, prod_v_chronics)
             self._backend_action += voltage_control_act
+            if profiler is not None:
+                profiler.record("voltage_control")
 
             # have the opponent here
             # TODO code the opponent part here and split more the timings! here "opponent time" is
@@ -930,9 +946,13 @@ class BaseEnv(GridObjects, RandomObject, ABC):
                                 np.maximum(attack_duration, self.times_before_topology_actionable[subs_attacked])
                 self._backend_action += attack
             self._time_opponent += time.time() - tick
+            if profiler is not None:
+                profiler.record("opponent")
             self.backend.apply_action(self._backend_action)
 
             self._time_apply_act += time.time() - beg_
+            if profiler is not None:
+                profiler.record("backend_apply")
 
             self.nb_time_step += 1
             try:
@@ -940,6 +960,8 @@ class BaseEnv(GridObjects, RandomObject, ABC):
                 beg_ = time.time()
                 disc_lines, detailed_info, conv_ = self.backend.next_grid_state(env=self, is_dc=self.env_dc)
                 self._time_powerflow += time.time() - beg_
+                if profiler is not None:
+                    profiler.record("powerflow")
                 if conv_ is None:
                     beg_ = time.time()
                     self.backend.update_thermal_limit(self)  # update the thermal limit, for DLR for example
@@ -963,17 +985,22 @@ class BaseEnv(GridObjects, RandomObject, ABC):
                     if self.max_timestep_line_status_deactivated > 0:
                         # i update the cooldown only when this does not impact the line disconnected for the
                         # opponent or by maitnenance for example
-                        cond = aff_lines  # powerlines i modified
-                        # powerlines that are not affected by any other "forced disconnection"
-                        cond &= self.times_before_line_status_actionable < self.max_timestep_line_status_deactivated
+                        # powerlines i modified and that are not affected by any other "forced disconnection"
+                        # (aff_lines belongs to the action, it must not be modified)
+                        cond = aff_lines & (self.times_before_line_status_actionable <
+                                            self.max_timestep_line_status_deactivated)
                         self.times_before_line_status_actionable[cond] = self.max_timestep_line_status_deactivated
                     if self.max_timestep_topology_deactivated > 0:
                         self.times_before_topology_actionable[self.times_before_topology_actionable > 0] -= 1
                         self.times_before_topology_actionable[aff_subs] = self.max_timestep_topology_deactivated
+                    if profiler is not None:
+                        profiler.record("update_state")
 
                     # build the observation
                     self.current_obs = self.get_obs()
                     self._time_extract_obs += time.time() - beg_
+                    if profiler is not None:
+                        profiler.record("observation")
 
                     # extract production active value at this time step (should be independant of action class)
                     self.gen_activeprod_t[:], *_ = self.backend.generators_info()
@@ -1013,11 +1040,33 @@ class BaseEnv(GridObjects, RandomObject, ABC):
                                                              is_illegal or is_illegal_redisp or is_illegal_reco,
                                                              is_ambiguous)
         infos["rewards"] = other_reward
+        if profiler is not None:
+            profiler.record("reward")
+            profiler.end_step(self)
         # TODO documentation on all the possible way to be illegal now
         if self.done:
             self.__is_init = False
         return self.current_obs, self.current_reward, self.done, infos
 
+    def set_step_profiler(self, profiler):
+        """
+        Attach a profiler, that records the duration of each phase of each step (see
+        :class:`grid2op.Environment.StepProfiler`). Its data are reset each time the environment is reset.
+
+        Parameters
+        ----------
+        profiler: :class:`grid2op.Environment.StepProfiler`
+            The profiler used, or ``None`` to stop profiling the steps (nothing is then recorded).
+
+        """
+        self._step_profiler = profiler
+
+    def get_step_profiler(self):
+        """
+        The profiler attached with :func:`BaseEnv.set_step_profiler` (``None`` if there is none)
+        """
+        return self._step_profiler
+
     def _get_reward(self, action, has_error, is_done, is_illegal, is_ambiguous):
         res = self.reward_helper(action, self, has_error, is_done, is_illegal, is_ambiguous)
         other_rewards = {k: v(action, self, has_error, is_done, is_illegal, is_ambiguous)
@@ -1052,6 +1101,8 @@ class BaseEnv(GridObjects, RandomObject, ABC):
         self._time_powerflow = 0
         self._time_extract_obs = 0
         self._time_opponent = 0
+        if self._step_profiler is not None:
+            self._step_profiler.reset()
 
         # reward and others
         self.current_reward = self.reward_range[0]
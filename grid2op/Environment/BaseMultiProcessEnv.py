@@ -5,16 +5,116 @@
 # you can obtain one at http://mozilla.org/MPL/2.0/.
 # SPDX-License-Identifier: MPL-2.0
 # This file is part of Grid2Op, Grid2Op a testbed platform to model sequential decision making in power systems.
+import time
+import warnings
 from multiprocessing import Process, Pipe
+from multiprocessing.connection import wait
 import numpy as np
 
 from grid2op.dtypes import dt_int
 from grid2op.Exceptions import Grid2OpException, MultiEnvException
 from grid2op.Space import GridObjects
 from grid2op.Environment import Environment
+from grid2op.Environment.InfoPacker import InfoPacker
 from grid2op.Action import BaseAction
 
 
+class _SafeReset(object):
+    """
+    Reset an environment until its first observation is finite, at most `max_reset_retry` times.
+
+    When a reset fails (an exception is raised or the observation is not finite), the chronics used is removed from
+    the chronics that can be played (with :func:`grid2op.Chronics.Multifolder.set_filter`), so that it is not played
+    again. This is only possible when the chronics are stored in a :class:`grid2op.Chronics.Multifolder` (or one of its
+    derived class) and only while at least one chronics remains.
+
+    Attributes
+    ----------
+    stats: ``dict``
+        The number of resets ("nb_reset"), of failed attempts ("nb_retry") and the chronics skipped
+        ("skipped_chronics")
+
+    """
+    def __init__(self, env, space_prng, max_reset_retry):
+        self.env = env
+        self.space_prng = space_prng
+        self.max_reset_retry = int(max_reset_retry)
+        real_data = env.chronics_handler.real_data
+        self._can_skip = hasattr(real_data, "set_filter")
+        self._base_filter = getattr(real_data, "_filter", None)
+        self.stats = {"nb_reset": 0, "nb_retry": 0, "skipped_chronics": []}
+
+    def shuffler(self, x):
+        return x[self.space_prng.choice(len(x), size=len(x), replace=False)]
+
+    def __call__(self, fast_forward=0):
+        """
+        Reset the environment (and fast forward it for a random number of steps between 0 and `fast_forward`)
+
+        Returns
+        -------
+        obs_v: ``numpy.ndarray``
+            The vector representation of the first observation
+
+        Raises
+        ------
+        :class:`grid2op.Exceptions.MultiEnvException` if no finite observation could be obtained after
+        `max_reset_retry` attempts.
+        """
+        self.stats["nb_reset"] += 1
+        error = None
+        for _ in range(self.max_reset_retry):
+            try:
+                self.env.reset()
+                if fast_forward > 0:
+                    self.env.fast_forward_chronics(self.space_prng.randint(0, fast_forward))
+                obs_v = self.env.get_obs().to_vect()
+                if np.all(np.isfinite(obs_v)):
+                    # i make sure that everything is not Nan
+                    # other i consider it's "divergence" so "game over"
+                    return obs_v
+                error = "the observation is not finite"
+            except Exception as exc_:
+                error = exc_
+            self.stats["nb_retry"] += 1
+            self._skip_current_chronics()
+        raise MultiEnvException("Impossible to reset the environment after {} attempts. Last error: \"{}\""
+                                "".format(self.max_reset_retry, error))
+
+    def _skip_current_chronics(self):
+        if not self._can_skip:
+            return
+        try:
+            chronics = self.env.chronics_handler.get_id()
+        except Exception:
+            return
+        skipped = self.stats["skipped_chronics"]
+        if chronics in skipped:
+            return
+        skipped.append(chronics)
+        real_data = self.env.chronics_handler.real_data
+        real_data.set_filter(self._filter)
+        try:
+            real_data.reset()
+        except RuntimeError:
+            # every chronics would be filtered out, this one is kept
+            skipped.pop()
+            real_data.reset()
+        real_data.shuffle(shuffler=self.shuffler)
+
+    def _filter(self, path):
+        if path in self.stats["skipped_chronics"]:
+            return False
+        if self._base_filter is not None:
+            return self._base_filter(path)
+        return True
+
+    def get_stats(self):
+        res = dict(self.stats)
+        res["skipped_chronics"] = [str(el) for el in self.stats["skipped_chronics"]]
+        return res
+
+
 class RemoteEnv(Process):
     """
     This class represent the environment that is executed on a remote process.
@@ -23,8 +123,18 @@ class RemoteEnv(Process):
     it is not possible to access anything directly from it in the main process, where the BaseAgent lives. Only the
     :class:`grid2op.Observation.BaseObservation` are forwarded to the agent.
 
+    When the environment is reset, at most `max_reset_retry` attempts are made to get a finite observation (skipping
+    the chronics that fail, see :class:`_SafeReset`). If none succeeds, the
+    :class:`grid2op.Exceptions.MultiEnvException` is sent back to the main process.
+
+    If an `info_packer` (see :class:`grid2op.Environment.InfoPacker.InfoPacker`) is given, the "info" returned by
+    each step are encoded with it before being sent to the main process.
+
     """
-    def __init__(self, env_params, remote, parent_remote, seed, name=None):
+    MAX_RESET_RETRY = 10
+
+    def __init__(self, env_params, remote, parent_remote, seed, name=None, max_reset_retry=MAX_RESET_RETRY,
+                 info_packer=None):
         Process.__init__(self, group=None, target=None, name=name)
         self.backend = None
         self.env = None
@@ -35,6 +145,10 @@ class RemoteEnv(Process):
         self.space_prng = None
         self.fast_forward = 0
         self.all_seeds = []
+        self.max_reset_retry = max_reset_retry
+        self.info_packer = info_packer
+        self._safe_reset = None
+        self.nb_step = 0
 
     def init_env(self):
         """
@@ -55,33 +169,23 @@ class RemoteEnv(Process):
         self.env = Environment(**self.env_params, backend=self.backend)
         env_seed = self.space_prng.randint(np.iinfo(dt_int).max)
         self.all_seeds = self.env.seed(env_seed)
-        self.env.chronics_handler.shuffle(shuffler=lambda x: x[self.space_prng.choice(len(x), size=len(x), replace=False)])
+        self._safe_reset = _SafeReset(self.env, self.space_prng, self.max_reset_retry)
+        self.env.chronics_handler.shuffle(shuffler=self._safe_reset.shuffler)
 
     def _clean_observation(self, obs):
         obs._forecasted_grid = []
         obs._forecasted_inj = []
+        obs._lazy_forecast = None
         obs._obs_env = None
         obs.action_helper = None
 
     def get_obs_ifnotconv(self):
-        # TODO dirty hack because of wrong chronics
-        # need to check!!!
-        conv = False
-        obs_v = None
-        while not conv:
-            try:
-                obs = self.env.reset()
-                if self.fast_forward > 0:
-                    self.env.fast_forward_chronics(self.space_prng.randint(0, self.fast_forward))
-                obs = self.env.get_obs()
-                obs_v = obs.to_vect()
-                if np.all(np.isfinite(obs_v)):
-                    # i make sure that everything is not Nan
-                    # other i consider it's "divergence" so "game over"
-                    conv = True
-            except:
-                pass
-        return obs_v
+        return self._safe_reset(self.fast_forward)
+
+    def get_stats(self):
+        res = self._safe_reset.get_stats()
+        res["nb_step"] = self.nb_step
+        return res
 
     def run(self):
         if self.env is None:
@@ -95,14 +199,24 @@ class RemoteEnv(Process):
                 # perform a step
                 data = self.env.action_space.from_vect(data)
                 obs, reward, done, info = self.env.step(data)
+                self.nb_step += 1
                 obs_v = obs.to_vect()
-                if done or np.any(~np.isfinite(obs_v)):
-                    # if done do a reset
-                    obs_v = self.get_obs_ifnotconv()
+                try:
+                    if done or np.any(~np.isfinite(obs_v)):
+                        # if done do a reset
+                        obs_v = self.get_obs_ifnotconv()
+                except MultiEnvException as exc_:
+                    self.remote.send(exc_)
+                    continue
+                if self.info_packer is not None:
+                    info = self.info_packer.pack(info)
                 self.remote.send((obs_v, reward, done, info))
             elif cmd == 'r':
                 # perfom a reset
-                obs_v = self.get_obs_ifnotconv()
+                try:
+                    obs_v = self.get_obs_ifnotconv()
+                except MultiEnvException as exc_:
+                    obs_v = exc_
                 # self._clean_observation(obs)
                 self.remote.send(obs_v)
             elif cmd == 'c':
@@ -120,13 +234,162 @@ class RemoteEnv(Process):
                 self.remote.send((self.seed_used, self.all_seeds))
             elif cmd == "params":
                 self.remote.send(self.env.parameters)
+            elif cmd == "stats":
+                self.remote.send(self.get_stats())
             elif hasattr(self.env, cmd):
                 self.remote.send(getattr(self.env, cmd))
             else:
                 raise NotImplementedError
 
 
-class BaseMultiProcessEnvironment(GridObjects):
+class _ProcessSupervisor(object):
+    """
+    Supervision of the sub processes of :class:`BaseMultiProcessEnvironment` and :class:`grid2op.Environment.VectorEnv`.
+
+    The processes are stored in `_ps`, and the pipes to communicate with them in `_remotes`. A process that crashed,
+    or that does not answer within `timeout` seconds (if `timeout` is not ``None``), is killed and started again with
+    `_restart_process` (at most `max_respawn` times, counted in `_nb_respawn`).
+
+    The derived classes define these attributes, as well as `_restart_process(proc_id)` (start a new process, seeded
+    differently, to replace the process `proc_id`) and `_process_desc(proc_id)` (description of the process used in
+    the warnings and the errors).
+    """
+    CLOSE_TIMEOUT = 5.
+
+    def _process_desc(self, proc_id):
+        return "The process {}".format(proc_id)
+
+    def _restart_process(self, proc_id):
+        raise NotImplementedError()
+
+    def _respawn(self, proc_id, reason):
+        """kill the process `proc_id` and start a new one"""
+        if self._nb_respawn[proc_id] >= self.max_respawn:
+            raise MultiEnvException("{} {}. It has already been restarted {} times, it will not be restarted again."
+                                    "".format(self._process_desc(proc_id), reason, self._nb_respawn[proc_id]))
+        warnings.warn("{} {}. It is restarted.".format(self._process_desc(proc_id), reason))
+        self._stop_process(self._ps[proc_id], timeout=None)
+        self._remotes[proc_id].close()
+        self._nb_respawn[proc_id] += 1
+        self._restart_process(proc_id)
+
+    @staticmethod
+    def _stop_process(p, timeout):
+        """wait at most `timeout` seconds for the process `p` to stop, then terminate it (or kill it)"""
+        if timeout is not None:
+            p.join(timeout)
+        if p.is_alive():
+            p.terminate()
+            p.join(1.)
+        if p.is_alive():
+            # for example, a stopped process does not handle SIGTERM
+            p.kill()
+            p.join()
+
+    def _send(self, proc_id, cmd, data=None):
+        """
+        Send a command to a process. If the process has crashed, it is restarted (with the same settings) but the
+        command is not sent.
+
+        Returns
+        -------
+        reason: ``str``
+            Why the process has been restarted (``None`` if it has not been restarted)
+        """
+        try:
+            self._remotes[proc_id].send((cmd, data))
+        except (OSError, EOFError):
+            reason = "crashed"
+            self._respawn(proc_id, reason)
+            return reason
+        return None
+
+    def _wait_results(self):
+        """
+        Receive one message from each process, without waiting more than `timeout` seconds (in total).
+
+        Returns
+        -------
+        results: ``list``
+            The message of each process (``None`` if the process failed)
+
+        failed: ``dict``
+            For each process that failed (key: its id), the reason why
+        """
+        results = [None for _ in self._remotes]
+        failed = {}
+        pending = {remote: proc_id for proc_id, remote in enumerate(self._remotes)}
+        sentinels = {p.sentinel: proc_id for proc_id, p in enumerate(self._ps)}
+        deadline = None if self.timeout is None else time.perf_counter() + self.timeout
+        while pending:
+            remaining = None if deadline is None else max(deadline - time.perf_counter(), 0.)
+            waited = list(pending.keys()) + [self._ps[proc_id].sentinel for proc_id in pending.values()]
+            ready = wait(waited, timeout=remaining)
+            if not ready:
+                for proc_id in pending.values():
+                    failed[proc_id] = "did not answer within {}s".format(self.timeout)
+                break
+            for obj in ready:
+                if obj in sentinels:
+                    continue
+                proc_id = pending.pop(obj)
+                try:
+                    results[proc_id] = obj.recv()
+                except (OSError, EOFError):
+                    failed[proc_id] = "crashed"
+            for obj in ready:
+                if obj not in sentinels:
+                    continue
+                # the process is over, it might have sent its last message before
+                proc_id = sentinels[obj]
+                remote = self._remotes[proc_id]
+                if remote in pending and not remote.poll():
+                    del pending[remote]
+                    failed[proc_id] = "crashed (exit code {})".format(self._ps[proc_id].exitcode)
+        return results, failed
+
+    def _recv_one(self, proc_id, reason):
+        """receive the answer of a process that has just been restarted"""
+        remote = self._remotes[proc_id]
+        if not remote.poll(self.timeout):
+            raise MultiEnvException("{} {}. Once restarted, it did not answer within {}s."
+                                    "".format(self._process_desc(proc_id), reason, self.timeout))
+        try:
+            return remote.recv()
+        except (OSError, EOFError):
+            raise MultiEnvException("{} {}. Once restarted, it crashed again."
+                                    "".format(self._process_desc(proc_id), reason))
+
+    def _request(self, cmd, data=None):
+        """send the same command to all the processes and return their answers"""
+        for proc_id in range(len(self._remotes)):
+            if self._send(proc_id, cmd, data) is not None:
+                self._send(proc_id, cmd, data)
+        results, failed = self._wait_results()
+        for proc_id, reason in failed.items():
+            self._respawn(proc_id, reason)
+            self._send(proc_id, cmd, data)
+            results[proc_id] = self._recv_one(proc_id, reason)
+        return results
+
+    def _close_processes(self):
+        """
+        Send the close command to all the processes, and wait for them to stop. The processes still alive after
+        `CLOSE_TIMEOUT` seconds are terminated.
+        """
+        for remote in self._remotes:
+            try:
+                remote.send(('c', None))
+            except (OSError, EOFError):
+                # this process has already stopped
+                pass
+        for p in self._ps:
+            self._stop_process(p, timeout=self.CLOSE_TIMEOUT)
+        for remote in self._remotes:
+            remote.close()
+
+
+class BaseMultiProcessEnvironment(GridObjects, _ProcessSupervisor):
     """
     This class allows to evaluate a single agent instance on multiple environments running in parrallel.
 
@@ -157,6 +420,23 @@ class BaseMultiProcessEnvironment(GridObjects):
     is "done" then it is automatically reset. This means entails that you can call
     :func:`BaseMultiProcessEnvironment.step` without worrying about having to reset.
 
+    The processes are supervised: if one of them crashes, or does not answer within `timeout` seconds (if `timeout`
+    is not ``None``), it is killed and started again (at most `max_respawn` times for each process), and a warning is
+    issued. The corresponding environment is then considered "done": its observation is the first one of the new
+    process (after a reset), its reward is the minimum reward and the "exception" of its "info" tells what happened.
+    The new process is seeded differently, so it does not play the same chronics again.
+
+    The "info" dictionaries are encoded in the sub processes, with a fixed schema for the most common keys, and
+    decoded in the main process (see :class:`grid2op.Environment.InfoPacker.InfoPacker`). Only the keys selected by
+    `info_filter` (either a list of keys or a function returning the dictionary to send) are sent. Sending only the
+    keys used by the agent can significantly speed up the steps on small grids. The exceptions are sent as short
+    codes: their type is kept, but not their message.
+
+    When an environment is reset, at most `max_reset_retry` attempts are made to get a finite observation, and the
+    chronics that failed are not played again by this process (see :class:`RemoteEnv`). The number of steps, resets,
+    failed attempts, skipped chronics and restarts of each process is given by
+    :func:`BaseMultiProcessEnvironment.get_stats`.
+
     Attributes
     -----------
     envs: `list::grid2op.Environment.Environment`
@@ -167,8 +447,18 @@ class BaseMultiProcessEnvironment(GridObjects):
         that need to be provided in :func:`MultiEnvironment.step` and the return sizes of the list of this
         same function.
 
+    timeout: ``float``
+        Number of seconds after which a process that does not answer is considered hung (``None``: wait forever)
+
+    max_respawn: ``int``
+        Maximum number of times each process can be restarted. Once reached, a
+        :class:`grid2op.Exceptions.MultiEnvException` is raised instead.
+
     """
-    def __init__(self, envs):
+    MAX_RESPAWN = 10
+
+    def __init__(self, envs, timeout=None, max_reset_retry=RemoteEnv.MAX_RESET_RETRY, max_respawn=MAX_RESPAWN,
+                 info_filter=None):
         GridObjects.__init__(self)
         self.envs = envs
         for env in envs:
@@ -178,33 +468,93 @@ class BaseMultiProcessEnvironment(GridObjects):
                                         "".format(type(env)))
 
         self.nb_env = len(envs)
+        self.timeout = timeout
+        self.max_respawn = int(max_respawn)
+        self._max_reset_retry = max_reset_retry
         max_int = np.iinfo(dt_int).max
-        self._remotes, self._work_remotes = zip(*[Pipe() for _ in range(self.nb_env)])
-
-        env_params = [envs[e].get_kwargs(with_backend=False) for e in range(self.nb_env)]
-        self._ps = [RemoteEnv(env_params=env_,
-                              remote=work_remote,
-                              parent_remote=remote,
-                              name="{}_subprocess_{}".format(envs[i].name, i),
-                              seed=envs[i].space_prng.randint(max_int))
-                    for i, (work_remote, remote, env_) in enumerate(zip(self._work_remotes, self._remotes, env_params))]
-
-        for p in self._ps:
-            p.daemon = True  # if the main process crashes, we should not cause things to hang
-            p.start()
-        for remote in self._work_remotes:
-            remote.close()
+        self._env_params = [envs[e].get_kwargs(with_backend=False) for e in range(self.nb_env)]
+        self._seeds = [envs[e].space_prng.randint(max_int) for e in range(self.nb_env)]
+        self._nb_respawn = np.zeros(self.nb_env, dtype=dt_int)
+        self._info_packers = [InfoPacker(envs[e].n_line, info_filter=info_filter) for e in range(self.nb_env)]
+        # settings sent to the processes, sent again when a process is restarted
+        self._chunk_size = None
+        self._ff_max = None
+
+        self._remotes = [None for _ in range(self.nb_env)]
+        self._ps = [None for _ in range(self.nb_env)]
+        for i in range(self.nb_env):
+            self._start_process(i, self._seeds[i])
 
         self._waiting = True
+        self._restarted = {}
+
+    def _start_process(self, env_id, seed):
+        remote, work_remote = Pipe()
+        p = RemoteEnv(env_params=self._env_params[env_id],
+                      remote=work_remote,
+                      parent_remote=remote,
+                      name="{}_subprocess_{}".format(self.envs[env_id].name, env_id),
+                      seed=seed,
+                      max_reset_retry=self._max_reset_retry,
+                      info_packer=self._info_packers[env_id])
+        p.daemon = True  # if the main process crashes, we should not cause things to hang
+        p.start()
+        work_remote.close()
+        self._remotes[env_id] = remote
+        self._ps[env_id] = p
+        if self._chunk_size is not None:
+            remote.send(('z', self._chunk_size))
+        if self._ff_max is not None:
+            remote.send(('f', self._ff_max))
+
+    def _process_desc(self, env_id):
+        return "The process of the environment {}".format(env_id)
+
+    def _restart_process(self, env_id):
+        max_int = np.iinfo(dt_int).max
+        self._start_process(env_id, (self._seeds[env_id] + self._nb_respawn[env_id]) % max_int)
+
+    @staticmethod
+    def _check_results(results):
+        for env_id, res in enumerate(results):
+            if isinstance(res, Exception):
+                raise MultiEnvException("The environment {} failed with error: {}".format(env_id, res)) from res
 
     def _send_act(self, actions):
-        for remote, action in zip(self._remotes, actions):
-            remote.send(('s', action.to_vect()))
+        self._restarted = {}
+        for env_id, action in enumerate(actions):
+            reason = self._send(env_id, 's', action.to_vect())
+            if reason is not None:
+                # the new process only needs to be reset
+                self._restarted[env_id] = reason
+                self._send(env_id, 'r')
         self._waiting = True
 
+    def _restarted_result(self, env_id, obs_v, reason):
+        """the environment has been restarted: it is considered "done" """
+        if isinstance(obs_v, Exception):
+            return obs_v
+        info = {"exception": [MultiEnvException("The process of this environment {} and has been restarted."
+                                                "".format(reason))]}
+        return obs_v, self.envs[env_id].reward_range[0], True, info
+
     def _wait_for_obs(self):
-        results = [remote.recv() for remote in self._remotes]
+        results, failed = self._wait_results()
+        for env_id, res in enumerate(results):
+            if env_id in failed or env_id in self._restarted or isinstance(res, Exception):
+                continue
+            obs_v, reward, done, info = res
+            results[env_id] = obs_v, reward, done, self._info_packers[env_id].unpack(info)
+        for env_id, reason in self._restarted.items():
+            if env_id not in failed:
+                results[env_id] = self._restarted_result(env_id, results[env_id], reason)
+        for env_id, reason in failed.items():
+            self._respawn(env_id, reason)
+            self._send(env_id, 'r')
+            obs_v = self._recv_one(env_id, reason)
+            results[env_id] = self._restarted_result(env_id, obs_v, reason)
         self._waiting = False
+        self._check_results(results)
         obs, rews, dones, infos = zip(*results)
         obs = [self.envs[e].observation_space.from_vect(ob) for e, ob in enumerate(obs)]
         return np.stack(obs), np.stack(rews), np.stack(dones), infos
@@ -337,17 +687,17 @@ class BaseMultiProcessEnvironment(GridObjects):
             an :class:`grid2op.Observation.BaseObservation`.
 
         """
-        for remote in self._remotes:
-            remote.send(('r', None))
-        res = [self.envs[e].observation_space.from_vect(remote.recv()) for e, remote in enumerate(self._remotes)]
+        results = self._request('r')
+        self._check_results(results)
+        res = [self.envs[e].observation_space.from_vect(obs_v) for e, obs_v in enumerate(results)]
         return np.stack(res)
 
     def close(self):
         """
-        Close all the environments and all the processes.
+        Close all the environments and all the processes. The processes that have not stopped after
+        :attr:`BaseMultiProcessEnvironment.CLOSE_TIMEOUT` seconds are terminated.
         """
-        for remote in self._remotes:
-            remote.send(('c', None))
+        self._close_processes()
 
     def set_chunk_size(self, new_chunk_size):
         """
@@ -372,8 +722,9 @@ class BaseMultiProcessEnvironment(GridObjects):
             raise Grid2OpException("Impossible to read less than 1 data at a time. Please make sure \"new_chunk_size\""
                                    "is a positive integer.")
 
-        for remote in self._remotes:
-            remote.send(('z', new_chunk_size))
+        self._chunk_size = new_chunk_size
+        for env_id in range(self.nb_env):
+            self._send(env_id, 'z', new_chunk_size)
 
     def set_ff(self, ff_max=7*24*60/5):
         """
@@ -387,25 +738,45 @@ class BaseMultiProcessEnvironment(GridObjects):
         except:
             raise RuntimeError("ff_max parameters should be convertible to an integer.")
 
-        for remote in self._remotes:
-            remote.send(('f', ff_max))
+        self._ff_max = ff_max
+        for env_id in range(self.nb_env):
+            self._send(env_id, 'f', ff_max)
 
     def get_seeds(self):
         """
         Get the seeds used to initialize each sub environments.
         """
-        for remote in self._remotes:
-            remote.send(('seed', None))
-        res = [remote.recv() for remote in self._remotes]
+        res = self._request('seed')
         return np.stack(res)
 
     def get_parameters(self):
         """
         Get the parameters of each sub environments
         """
-        for remote in self._remotes:
-            remote.send(('params', None))
-        res = [remote.recv() for remote in self._remotes]
+        res = self._request('params')
+        return res
+
+    def get_stats(self):
+        """
+        Get some statistics about each process.
+
+        **NB** When a process is restarted, its statistics start again from 0 (except "nb_respawn").
+
+        Returns
+        -------
+        res: ``list``
+            For each process, a dictionary with keys:
+
+              - "nb_step": the number of steps performed
+              - "nb_reset": the number of resets (including the automatic ones)
+              - "nb_retry": the number of failed attempts to reset
+              - "skipped_chronics": the chronics that are not played anymore because a reset failed with them
+              - "nb_respawn": the number of times the process has been restarted
+
+        """
+        res = self._request('stats')
+        for env_id, stats in enumerate(res):
+            stats["nb_respawn"] = int(self._nb_respawn[env_id])
         return res
 
     def __getattr__(self, name):
@@ -436,9 +807,7 @@ class BaseMultiProcessEnvironment(GridObjects):
         if not res:
             raise RuntimeError("At least one of the sub_env has not the attribute \"{}\". This will not be "
                                "executed.".format(name))
-        for remote in self._remotes:
-            remote.send((name, None))
-        res = [remote.recv() for remote in self._remotes]
+        res = self._request(name)
         return res
 
 
@@ -6,8 +6,12 @@
 # SPDX-License-Identifier: MPL-2.0
 # This file is part of Grid2Op, Grid2Op a testbed platform to model sequential decision making in power systems.
 import os
+import sys
 import copy
+import types
 import warnings
+import numpy as np
+import pandas as pd
 
 from grid2op.dtypes import dt_float
 from grid2op.Action import ActionSpace, BaseAction, TopologyAction, DontAct, CompleteAction
@@ -22,6 +26,38 @@ from grid2op.Environment.BaseEnv import BaseEnv
 from grid2op.Opponent import BaseOpponent, NeverAttackBudget
 
 
+def _memory_size(obj, seen):
+    """
+    Estimate the memory (in bytes) used by `obj` and everything it references. The objects whose id is in `seen`
+    are not counted (and `seen` is updated with the objects counted here). Classes, modules and functions
+    are not counted.
+    """
+    res = 0
+    to_visit = [obj]
+    while to_visit:
+        el = to_visit.pop()
+        if el is None or id(el) in seen:
+            continue
+        if isinstance(el, (type, types.ModuleType, types.FunctionType, types.MethodType,
+                           types.BuiltinFunctionType)):
+            continue
+        seen.add(id(el))
+        if isinstance(el, np.ndarray):
+            res += sys.getsizeof(el) if el.base is None else el.nbytes
+        elif isinstance(el, (pd.DataFrame, pd.Series)):
+            res += int(np.sum(el.memory_usage(deep=True)))
+        else:
+            res += sys.getsizeof(el)
+            if isinstance(el, dict):
+                to_visit.extend(el.keys())
+                to_visit.extend(el.values())
+            elif isinstance(el, (list, tuple, set, frozenset)):
+                to_visit.extend(el)
+            if hasattr(el, "__dict__"):
+                to_visit.append(el.__dict__)
+    return res
+
+
 class Environment(BaseEnv):
     """
     This class is the grid2op implementation of the "Environment" entity in the RL framework.
@@ -130,7 +166,8 @@ class Environment(BaseEnv):
                  opponent_attack_duration=0,
                  opponent_attack_cooldown=99999,
                  kwargs_opponent={},
-                 _raw_backend_class=None
+                 _raw_backend_class=None,
+                 _construction_cache=None
                  ):
         BaseEnv.__init__(self,
                          parameters=parameters,
@@ -168,6 +205,9 @@ class Environment(BaseEnv):
         else:
             self._raw_backend_class = _raw_backend_class
 
+        # on disk cache of the loaded powergrid (see grid2op.MakeEnv.ConstructionCache)
+        self._construction_cache = _construction_cache
+
         # for plotting
         self.init_backend(init_grid_path, chronics_handler, backend,
                           names_chronics_to_backend, actionClass, observationClass,
@@ -214,10 +254,14 @@ class Environment(BaseEnv):
             raise Grid2OpException( "Parameter \"backend\" used to build the Environment should derived form the "
                                     "grid2op.Backend class, type provided is \"{}\"".format(type(backend)))
         self.backend = backend
-        self.backend.load_grid(self.init_grid_path)  # the real powergrid of the environment
-
-        self.backend.load_redispacthing_data(os.path.split(self.init_grid_path)[0])
-        self.backend.load_grid_layout(os.path.split(self.init_grid_path)[0])
+        cache = self._construction_cache
+        if cache is None or not cache.load(self.backend, self.init_grid_path):
+            self.backend.load_grid(self.init_grid_path)  # the real powergrid of the environment
+
+            self.backend.load_redispacthing_data(os.path.split(self.init_grid_path)[0])
+            layout_error = self.backend.load_grid_layout(os.path.split(self.init_grid_path)[0])
+            if cache is not None:
+                cache.save(self.backend, self.init_grid_path, with_layout=layout_error is None)
         self.backend.set_env_name(self.name)
 
         self.backend.assert_grid_correct()
@@ -605,12 +649,51 @@ class Environment(BaseEnv):
 
         """
         tmp_backend = self.backend
-        self.backend = None
-        res = copy.deepcopy(self)
-        res.backend = tmp_backend.copy()
+        new_backend = tmp_backend.copy()
+        # the components sharing the backend of this environment (read only) will share the backend of the copy
+        res = copy.deepcopy(self, {id(tmp_backend): new_backend})
+        res.backend = new_backend
         if self._thermal_limit_a is not None:
             res.backend.set_thermal_limit(self._thermal_limit_a)
-        self.backend = tmp_backend
+        return res
+
+    def memory_report(self):
+        """
+        Estimate the memory used by the main components of this environment. The backends used by
+        :func:`grid2op.Observation.BaseObservation.simulate` and by the voltage controler are created only when they
+        are used for the first time. Until then (or if they are never used) they do not use any memory.
+
+        Objects shared by different components are only counted once (in the first component of the list below that
+        uses them).
+
+        Returns
+        -------
+        res: ``dict``
+            Keys are the name of the components: "backend" (the backend of the environment), "simulate_backend"
+            (the backend used by :func:`grid2op.Observation.BaseObservation.simulate`), "voltage_controler_backend",
+            "chronics_handler", "observation_space" (without its backend), "action_space" and "total" (total
+            memory used by the environment, including everything not listed here). Values are the memory used, in
+            bytes.
+
+        Examples
+        --------
+        .. code-block:: python
+
+            import grid2op
+            env = grid2op.make()
+            print(env.memory_report())
+
+        """
+        seen = set()
+        res = {}
+        res["backend"] = _memory_size(self.backend, seen)
+        obs_env = self.helper_observation.obs_env
+        res["simulate_backend"] = _memory_size(obs_env._backend if obs_env is not None else None, seen)
+        res["voltage_controler_backend"] = _memory_size(self.voltage_controler._backend, seen)
+        res["chronics_handler"] = _memory_size(self.chronics_handler, seen)
+        res["observation_space"] = _memory_size(self.helper_observation, seen)
+        res["action_space"] = _memory_size(self.helper_action_player, seen)
+        res["total"] = sum(res.values()) + _memory_size(self, seen)
         return res
 
     def get_kwargs(self, with_backend=True):
@@ -658,6 +741,7 @@ class Environment(BaseEnv):
         res["other_rewards"] = {k: v.rewardClass for k, v in self.other_rewards.items()}
         res["name"] = self.name
         res["_raw_backend_class"] = self._raw_backend_class
+        res["_construction_cache"] = self._construction_cache
         res["with_forecast"] = self.with_forecast
 
         res["opponent_action_class"] = self.opponent_action_class
@@ -715,6 +799,8 @@ class Environment(BaseEnv):
         res["other_rewards"] = {k: v.rewardClass for k, v in self.other_rewards.items()}
         res["grid_layout"] = self.grid_layout
         res["name_env"] = self.name
+        if self._step_profiler is not None:
+            res["step_profiler_class"] = type(self._step_profiler)
 
         res["opponent_action_class"] = self.opponent_action_class
         res["opponent_class"] = self.opponent_class
@@ -0,0 +1,151 @@
+# Copyright (c) 2019-2020, RTE (https://www.rte-france.com)
+# See AUTHORS.txt
+# This Source Code Form is subject to the terms of the Mozilla Public License, version 2.0.
+# If a copy of the Mozilla Public License, version 2.0 was not distributed with this file,
+# you can obtain one at http://mozilla.org/MPL/2.0/.
+# SPDX-License-Identifier: MPL-2.0
+# This file is part of Grid2Op, Grid2Op a testbed platform to model sequential decision making in power systems.
+import ctypes
+from multiprocessing.sharedctypes import RawArray
+import numpy as np
+
+import grid2op.Exceptions
+from grid2op.dtypes import dt_bool
+from grid2op.Exceptions import MultiEnvException
+
+
+class InfoPacker(object):
+    """
+    Encode the "info" dictionaries returned by :func:`grid2op.Environment.BaseEnv.step` in a sub process, so that
+    they are cheap to send to the main process, and decode them in the main process.
+
+    The "info" is first filtered (see `info_filter`). Then the common keys are encoded with a fixed schema:
+
+      - the flags "is_illegal", "is_ambiguous", "is_dispatching_illegal" and "is_illegal_reco" are the bits of a
+        single integer
+      - "disc_lines" is written in an array of booleans shared by both processes (if the packer has been built with
+        `shared=True`)
+      - each exception of "exception" is sent as a short code (its position in :attr:`InfoPacker.EXCEPTIONS`) if it
+        is one of the grid2op exceptions. Other exceptions are sent as is.
+
+    The other keys (for example "rewards") are sent as is.
+
+    **NB** The exceptions sent as codes are decoded as new exceptions of the same type, but their original message is
+    lost.
+
+    **NB** The shared array of "disc_lines" is overwritten by the next call to :func:`InfoPacker.pack`: the info must
+    be decoded before the sub process performs another step. This is the case with the synchronous multi process
+    environments.
+
+    Parameters
+    ----------
+    n_line: ``int``
+        Number of powerlines of the environment
+
+    info_filter: ``list`` or ``callable``
+        Either the keys of the "info" to send (the other ones are not sent) or a function that takes the "info" as
+        input and returns the dictionary to send. ``None`` (default) to send everything.
+
+    shared: ``bool``
+        Whether to use a shared array for "disc_lines" (default) or to send it with the other data.
+
+    """
+    FLAGS = ("is_illegal", "is_ambiguous", "is_dispatching_illegal", "is_illegal_reco")
+    DISC_LINES = "disc_lines"
+    EXCEPTION = "exception"
+    EXCEPTIONS = tuple(getattr(grid2op.Exceptions, el) for el in grid2op.Exceptions.__all__)
+
+    # bits of the "present" and "flags" integers for "disc_lines" and "exception"
+    _DISC_LINES_BIT = 1 << len(FLAGS)
+    _EXCEPTION_BIT = 1 << (len(FLAGS) + 1)
+
+    def __init__(self, n_line, info_filter=None, shared=True):
+        if info_filter is not None and not callable(info_filter):
+            try:
+                info_filter = frozenset(info_filter)
+            except TypeError:
+                raise MultiEnvException("\"info_filter\" should be either a list of keys or a function, and not "
+                                        "\"{}\"".format(info_filter))
+        self.n_line = int(n_line)
+        self.info_filter = info_filter
+        self._shared_disc_lines = RawArray(ctypes.c_bool, self.n_line) if shared else None
+        self._exceptions_code = {exc_type: code for code, exc_type in enumerate(self.EXCEPTIONS)}
+
+    def filter(self, info):
+        """keep only the keys of `info` selected by :attr:`InfoPacker.info_filter`"""
+        if self.info_filter is None:
+            return info
+        if callable(self.info_filter):
+            return self.info_filter(info)
+        return {key: val for key, val in info.items() if key in self.info_filter}
+
+    def _disc_lines_view(self):
+        return np.frombuffer(self._shared_disc_lines, dtype=dt_bool)
+
+    def pack(self, info):
+        """
+        Encode the dictionary `info` (called in the sub process)
+
+        Returns
+        -------
+        res: ``tuple``
+            The packed info: the integer telling which keys of the schema are present, the integer of the flags,
+            the exceptions codes, and the dictionary of the other keys.
+        """
+        present = 0
+        flags = 0
+        exceptions = ()
+        others = {}
+        for key, val in self.filter(info).items():
+            if key in self.FLAGS:
+                bit = 1 << self.FLAGS.index(key)
+                present |= bit
+                if val:
+                    flags |= bit
+            elif key == self.DISC_LINES:
+                present |= self._DISC_LINES_BIT
+                if val is not None:
+                    flags |= self._DISC_LINES_BIT
+                    if self._shared_disc_lines is not None:
+                        self._disc_lines_view()[:] = val
+                    else:
+                        others[key] = val
+            elif key == self.EXCEPTION:
+                present |= self._EXCEPTION_BIT
+                exceptions = tuple(self._exceptions_code.get(type(exc_), exc_) for exc_ in val)
+            else:
+                others[key] = val
+        return present, flags, exceptions, others
+
+    def unpack(self, packed):
+        """
+        Decode the result of :func:`InfoPacker.pack` (called in the main process)
+
+        Returns
+        -------
+        info: ``dict``
+            The filtered info dictionary
+        """
+        present, flags, exceptions, others = packed
+        info = {}
+        for i, key in enumerate(self.FLAGS):
+            bit = 1 << i
+            if present & bit:
+                info[key] = bool(flags & bit)
+        if present & self._DISC_LINES_BIT:
+            if not flags & self._DISC_LINES_BIT:
+                info[self.DISC_LINES] = None
+            elif self._shared_disc_lines is not None:
+                info[self.DISC_LINES] = self._disc_lines_view().copy()
+            else:
+                info[self.DISC_LINES] = others.pop(self.DISC_LINES)
+        if present & self._EXCEPTION_BIT:
+            info[self.EXCEPTION] = [self._decode_exception(exc_) for exc_ in exceptions]
+        info.update(others)
+        return info
+
+    def _decode_exception(self, exc_):
+        if isinstance(exc_, Exception):
+            return exc_
+        exc_type = self.EXCEPTIONS[exc_]
+        return exc_type("{} raised in a sub process".format(exc_type.__name__))
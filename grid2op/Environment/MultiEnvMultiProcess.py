@@ -11,7 +11,7 @@ import numpy as np
 from grid2op.dtypes import dt_int
 from grid2op.Exceptions import Grid2OpException, MultiEnvException
 from grid2op.Space import GridObjects
-from grid2op.Environment.BaseMultiProcessEnv import BaseMultiProcessEnvironment
+from grid2op.Environment.BaseMultiProcessEnv import BaseMultiProcessEnvironment, RemoteEnv
 from grid2op.Action import BaseAction
 
 
@@ -56,7 +56,8 @@ class MultiEnvMultiProcess(BaseMultiProcessEnvironment):
         observations = multi_env.reset()
 
     """
-    def __init__(self, envs, nb_envs):
+    def __init__(self, envs, nb_envs, timeout=None, max_reset_retry=RemoteEnv.MAX_RESET_RETRY,
+                 max_respawn=BaseMultiProcessEnvironment.MAX_RESPAWN, info_filter=None):
         try:
             nb_envs = np.array(nb_envs)
             nb_envs = nb_envs.astype(dt_int)
@@ -78,7 +79,8 @@ class MultiEnvMultiProcess(BaseMultiProcessEnvironment):
         all_envs = []
         for e, n in enumerate(nb_envs):
             all_envs += [envs[e] for _ in range(n)]
-        super().__init__(all_envs)
+        super().__init__(all_envs, timeout=timeout, max_reset_retry=max_reset_retry, max_respawn=max_respawn,
+                         info_filter=info_filter)
 
 
 if __name__ == "__main__":
@@ -7,12 +7,169 @@
 # This file is part of Grid2Op, Grid2Op a testbed platform to model sequential decision making in power systems.
 
 import os
+from multiprocessing import Process, Pipe
 import numpy as np
 import copy
 
 from grid2op.dtypes import dt_int, dt_float
 from grid2op.Space import GridObjects, RandomObject
 from grid2op.Exceptions import EnvError, Grid2OpException
+from grid2op.Action import BaseAction
+from grid2op.Observation import BaseObservation
+
+
+class _RemoteValue(object):
+    """what a :class:`_MixWorker` sends instead of the values that cannot be sent directly to the main process"""
+    OBSERVATION = "observation"
+    ACTION = "action"
+    METHOD = "method"
+    ERROR = "error"
+
+    def __init__(self, kind, value=None):
+        self.kind = kind
+        self.value = value
+
+
+class _MixWorker(Process):
+    """
+    The process holding one mix of a :class:`MultiMixEnvironment` (when `process_per_mix` is ``True``). The
+    environment is created in this process, and only lives there.
+    """
+    def __init__(self, env_path, make_kwargs, backend_class, remote, name=None):
+        Process.__init__(self, group=None, target=None, name=name)
+        self.env_path = env_path
+        self.make_kwargs = make_kwargs
+        self.backend_class = backend_class
+        self.remote = remote
+        self.env = None
+
+    def _encode(self, value):
+        if isinstance(value, BaseObservation):
+            return _RemoteValue(_RemoteValue.OBSERVATION, value.to_vect())
+        if isinstance(value, tuple):
+            return tuple(self._encode(el) for el in value)
+        return value
+
+    def _decode(self, value):
+        if isinstance(value, _RemoteValue) and value.kind == _RemoteValue.ACTION:
+            return self.env.action_space.from_vect(value.value)
+        return value
+
+    def run(self):
+        # Inline import to prevent cyclical import
+        from grid2op.MakeEnv.Make import make
+
+        build_error = None
+        try:
+            if self.backend_class is not None:
+                self.env = make(self.env_path, backend=self.backend_class(), **self.make_kwargs)
+            else:
+                self.env = make(self.env_path, **self.make_kwargs)
+        except Exception as exc_:
+            build_error = EnvError("MultiMix environment creation failed: {}".format(exc_))
+
+        while True:
+            cmd, data = self.remote.recv()
+            if cmd == "close":
+                if self.env is not None:
+                    self.env.close()
+                self.remote.close()
+                break
+            if build_error is not None:
+                self.remote.send(_RemoteValue(_RemoteValue.ERROR, build_error))
+                continue
+            try:
+                if cmd == "getattr":
+                    res = getattr(self.env, data)
+                    if callable(res):
+                        res = _RemoteValue(_RemoteValue.METHOD)
+                else:
+                    # call a method of the environment
+                    args, kwargs = data
+                    args = [self._decode(el) for el in args]
+                    kwargs = {key: self._decode(val) for key, val in kwargs.items()}
+                    res = getattr(self.env, cmd)(*args, **kwargs)
+                self.remote.send(self._encode(res))
+            except Exception as exc_:
+                # either the call failed or its result cannot be sent
+                self.remote.send(_RemoteValue(_RemoteValue.ERROR, exc_))
+
+
+class _RemoteMix(object):
+    """
+    The mix of a :class:`MultiMixEnvironment` that lives in its own process (see `process_per_mix`).
+
+    Its attributes are read from this process, and its methods are called there (the actions given as input and the
+    observations returned are sent as vectors). Values that cannot be sent between processes (for example the
+    backend) are not available.
+    """
+    def __init__(self, name, env_path, make_kwargs, backend_class, template):
+        self.name = name
+        self._template = template
+        self._remote, work_remote = Pipe()
+        self._process = _MixWorker(env_path, make_kwargs, backend_class, work_remote,
+                                   name="{}_mix_subprocess".format(name))
+        self._process.daemon = True  # if the main process crashes, we should not cause things to hang
+        self._process.start()
+        work_remote.close()
+
+    @property
+    def observation_space(self):
+        return self._template.observation_space
+
+    @property
+    def action_space(self):
+        return self._template.action_space
+
+    def _encode(self, value):
+        if isinstance(value, BaseAction):
+            return _RemoteValue(_RemoteValue.ACTION, value.to_vect())
+        return value
+
+    def _decode(self, value):
+        if isinstance(value, tuple):
+            return tuple(self._decode(el) for el in value)
+        if not isinstance(value, _RemoteValue):
+            return value
+        if value.kind == _RemoteValue.OBSERVATION:
+            return self.observation_space.from_vect(value.value)
+        if value.kind == _RemoteValue.ERROR:
+            raise value.value
+        return value
+
+    def call_async(self, method, *args, **kwargs):
+        """call the method `method` of the environment, without waiting for its result (see :func:`call_wait`)"""
+        args = [self._encode(el) for el in args]
+        kwargs = {key: self._encode(val) for key, val in kwargs.items()}
+        self._remote.send((method, (args, kwargs)))
+
+    def call_wait(self):
+        """wait for the result of the last call to :func:`call_async`"""
+        return self._decode(self._remote.recv())
+
+    def step(self, action):
+        self.call_async("step", action)
+        return self.call_wait()
+
+    def reset(self):
+        self.call_async("reset")
+        return self.call_wait()
+
+    def close(self):
+        self._remote.send(("close", None))
+        self._process.join()
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        self._remote.send(("getattr", name))
+        res = self._decode(self._remote.recv())
+        if isinstance(res, _RemoteValue) and res.kind == _RemoteValue.METHOD:
+            def method(*args, **kwargs):
+                self.call_async(name, *args, **kwargs)
+                return self.call_wait()
+            return method
+        return res
 
 
 class MultiMixEnvironment(GridObjects, RandomObject):
@@ -23,11 +180,22 @@ class MultiMixEnvironment(GridObjects, RandomObject):
     It implements most of the BaseEnv public interface:
     so it can be used as a more classic environment.
 
+    The mixes are created when they are first used (selected by :func:`MultiMixEnvironment.reset`, accessed by
+    name, iterated over etc.), so that only the mixes actually used are kept in memory. The settings of the
+    mixes (seeds, chunk size, forecasts etc.) given before a mix is created are applied when it is created.
+
+    If `process_per_mix` is ``True``, each mix lives in its own process (and the first one is also loaded in the main
+    process, to provide the action and observation spaces). The mixes are then accessed through proxies with the
+    same interface as :class:`Environment` (as for :class:`BaseMultiProcessEnvironment`, the observations cannot be
+    used to :func:`grid2op.Observation.BaseObservation.simulate`). :func:`MultiMixEnvironment.step_all` and
+    :func:`MultiMixEnvironment.reset_all` then run all the mixes concurrently.
+
     # TODO example on how to use it
 
     """
     def __init__(self,
                  envs_dir,
+                 process_per_mix=False,
                  **kwargs):
         GridObjects.__init__(self)
         RandomObject.__init__(self)
@@ -35,47 +203,95 @@ class MultiMixEnvironment(GridObjects, RandomObject):
         self.current_env = None
         self.env_index = None
         self.mix_envs = []
+        self.process_per_mix = process_per_mix
+        self._mix_paths = []
+        self._mix_seeds = []
+        self._mix_settings = {}
+        self._template = None
 
         # Special case handling for backend 
         backendClass = None
         if "backend" in kwargs:
             backendClass = type(kwargs["backend"])
             del kwargs["backend"]
-
-        # Inline import to prevent cyclical import
-        from grid2op.MakeEnv.Make import make
+        self._backend_class = backendClass
+        self._make_kwargs = kwargs
 
         try:
             for env_dir in sorted(os.listdir(envs_dir)):
-                env_path = os.path.join(envs_dir, env_dir)            
+                env_path = os.path.join(envs_dir, env_dir)
                 if not os.path.isdir(env_path):
                     continue
-                # Special case for backend
-                if backendClass is not None:
-                    env = make(env_path,
-                               backend=backendClass(),
-                               **kwargs)
-                else:
-                    env = make(env_path, **kwargs)
-                
-                self.mix_envs.append(env)
+                self._mix_paths.append(env_path)
         except Exception as e:
             err_msg = "MultiMix environment creation failed: {}".format(e)
             raise EnvError(err_msg)
 
-        if len(self.mix_envs) == 0:
+        if len(self._mix_paths) == 0:
             err_msg = "MultiMix envs_dir did not contain any valid env"
             raise EnvError(err_msg)
 
+        self.mix_envs = [None for _ in self._mix_paths]
+        self._mix_seeds = [None for _ in self._mix_paths]
+        self._template = self._make_local_mix(0)
+        if not self.process_per_mix:
+            self.mix_envs[0] = self._template
+
         self.env_index = 0
-        self.current_env = self.mix_envs[self.env_index]
+        self.current_env = self._get_mix(self.env_index)
         # Make sure GridObject class attributes are set from first env
         # Should be fine since the grid is the same for all envs
         multi_env_name = os.path.basename(os.path.abspath(envs_dir))
-        save_env_name = self.current_env.env_name
-        self.current_env.env_name = multi_env_name
-        self.__class__ = self.init_grid(self.current_env)
-        self.current_env.env_name = save_env_name
+        save_env_name = self._template.env_name
+        self._template.env_name = multi_env_name
+        self.__class__ = self.init_grid(self._template)
+        self._template.env_name = save_env_name
+
+    def _make_local_mix(self, mix_id):
+        # Inline import to prevent cyclical import
+        from grid2op.MakeEnv.Make import make
+
+        env_path = self._mix_paths[mix_id]
+        try:
+            # Special case for backend
+            if self._backend_class is not None:
+                env = make(env_path,
+                           backend=self._backend_class(),
+                           **self._make_kwargs)
+            else:
+                env = make(env_path, **self._make_kwargs)
+        except Exception as e:
+            err_msg = "MultiMix environment creation failed: {}".format(e)
+            raise EnvError(err_msg)
+        return env
+
+    def _get_mix(self, mix_id):
+        """the mix `mix_id`, created (and set up) if it does not exist yet"""
+        mix = self.mix_envs[mix_id]
+        if mix is not None:
+            return mix
+
+        if self.process_per_mix:
+            mix = _RemoteMix(self._mix_name(mix_id), self._mix_paths[mix_id], self._make_kwargs,
+                             self._backend_class, self._template)
+        else:
+            mix = self._make_local_mix(mix_id)
+        if self._mix_seeds[mix_id] is not None:
+            mix.seed(self._mix_seeds[mix_id])
+        for method, args in self._mix_settings.values():
+            getattr(mix, method)(*args)
+        self.mix_envs[mix_id] = mix
+        return mix
+
+    def _mix_name(self, mix_id):
+        return os.path.basename(self._mix_paths[mix_id])
+
+    def _set_all_mixes(self, key, method, *args):
+        """call `method` on the mixes already created, and on the other ones when they are created"""
+        self._mix_settings[key] = (method, args)
+        for mix in self.mix_envs:
+            if mix is not None:
+                getattr(mix, method)(*args)
 
     @property
     def current_index(self):
@@ -106,7 +322,7 @@ class MultiMixEnvironment(GridObjects, RandomObject):
 
     def __next__(self):
         if self.env_index < len(self.mix_envs):
-            r =  self.mix_envs[self.env_index]
+            r = self._get_mix(self.env_index)
             self.env_index = self.env_index + 1
             return r
         else:
@@ -117,16 +333,16 @@ class MultiMixEnvironment(GridObjects, RandomObject):
         return getattr(self.current_env, name)
 
     def keys(self):
-        for mix in self.mix_envs:
-            yield mix.name
+        for mix_id in range(len(self.mix_envs)):
+            yield self._mix_name(mix_id)
 
     def values(self):
-        for mix in self.mix_envs:
-            yield mix
+        for mix_id in range(len(self.mix_envs)):
+            yield self._get_mix(mix_id)
 
     def items(self):
-        for mix in self.mix_envs:
-            yield mix.name, mix
+        for mix_id in range(len(self.mix_envs)):
+            yield self._mix_name(mix_id), self._get_mix(mix_id)
 
     def __getitem__(self, key):
         """
@@ -145,9 +361,9 @@ class MultiMixEnvironment(GridObjects, RandomObject):
             assert mix2_env == "mix_2"
         """
         # Search for key
-        for mix in self.mix_envs:
-            if mix.name == key:
-                return mix
+        for mix_id in range(len(self.mix_envs)):
+            if self._mix_name(mix_id) == key:
+                return self._get_mix(mix_id)
 
         # Not found by name
         raise KeyError
@@ -158,10 +374,50 @@ class MultiMixEnvironment(GridObjects, RandomObject):
         else:
             self.env_index = (self.env_index + 1) % len(self.mix_envs)
 
-        self.current_env = self.mix_envs[self.env_index]
+        self.current_env = self._get_mix(self.env_index)
         self.current_env.reset()
         return self.get_obs()
 
+    def reset_all(self):
+        """
+        Reset all the mixes (concurrently if `process_per_mix` is ``True``). The current mix is not changed.
+
+        Returns
+        -------
+        obss: ``list``
+            The first observation of each mix (in the order of :func:`MultiMixEnvironment.keys`)
+        """
+        mixes = [self._get_mix(mix_id) for mix_id in range(len(self.mix_envs))]
+        if not self.process_per_mix:
+            return [mix.reset() for mix in mixes]
+        for mix in mixes:
+            mix.call_async("reset")
+        return [mix.call_wait() for mix in mixes]
+
+    def step_all(self, actions):
+        """
+        Perform a step in all the mixes (concurrently if `process_per_mix` is ``True``).
+
+        Parameters
+        ----------
+        actions: ``list``
+            The action to perform in each mix (in the order of :func:`MultiMixEnvironment.keys`)
+
+        Returns
+        -------
+        res: ``list``
+            The tuple (observation, reward, done, info) returned by each mix
+        """
+        if len(actions) != len(self.mix_envs):
+            raise EnvError("Incorrect number of actions provided. You provided {} actions, but there are {} mixes."
+                           "".format(len(actions), len(self.mix_envs)))
+        mixes = [self._get_mix(mix_id) for mix_id in range(len(self.mix_envs))]
+        if not self.process_per_mix:
+            return [mix.step(act) for mix, act in zip(mixes, actions)]
+        for mix, act in zip(mixes, actions):
+            mix.call_async("step", act)
+        return [mix.call_wait() for mix in mixes]
+
     def seed(self, seed=None):
         """
         Set the seed of this :class:`Environment` for a better control 
@@ -176,7 +432,10 @@ class MultiMixEnvironment(GridObjects, RandomObject):
         ---------
         seeds: ``list``
             The seed used to set the prng (pseudo random number generator) 
-            for all environments, and each environment ``tuple`` seeds
+            for all environments, followed by one element per mix. For a mix already created, this element is
+            the ``tuple`` returned by :func:`grid2op.Environment.BaseEnv.seed`. For a mix not created yet, it is
+            the ``int`` seed that will be passed to :func:`grid2op.Environment.BaseEnv.seed` when the mix is created
+            (the mixes are created lazily, and creating one only to seed it would defeat this purpose).
 
         """
         try:
@@ -189,35 +448,34 @@ class MultiMixEnvironment(GridObjects, RandomObject):
         s = super().seed(seed)
         seeds = [s]
         max_dt_int = np.iinfo(dt_int).max
-        for env in self.mix_envs:
+        for mix_id, env in enumerate(self.mix_envs):
             env_seed = self.space_prng.randint(max_dt_int)
-            env_seeds = env.seed(env_seed)
-            seeds.append(env_seeds)
+            if env is None:
+                self._mix_seeds[mix_id] = env_seed
+                seeds.append(env_seed)
+            else:
+                env_seeds = env.seed(env_seed)
+                seeds.append(env_seeds)
         return seeds
 
     def set_chunk_size(self, new_chunk_size):
-        for mix in self.mix_envs:
-            mix.set_chunk_size(new_chunk_size)
+        self._set_all_mixes("set_chunk_size", "set_chunk_size", new_chunk_size)
 
     def set_id(self, id_):
-        for mix in self.mix_envs:
-            mix.set_id(id_)
+        self._set_all_mixes("set_id", "set_id", id_)
 
     def deactivate_forecast(self):
-        for mix in self.mix_envs:
-            mix.deactivate_forecast()
+        self._set_all_mixes("forecast", "deactivate_forecast")
 
     def reactivate_forecast(self):
-        for mix in self.mix_envs:
-            mix.reactivate_forecast()
+        self._set_all_mixes("forecast", "reactivate_forecast")
 
     def set_thermal_limit(self, thermal_limit):
         """
         Set the thermal limit effectively.
         Will propagate to all underlying environments
         """
-        for mix in self.mix_envs:
-            mix.set_thermal_limit(thermal_limit)
+        self._set_all_mixes("set_thermal_limit", "set_thermal_limit", thermal_limit)
 
     def __enter__(self):
         """
@@ -237,7 +495,10 @@ class MultiMixEnvironment(GridObjects, RandomObject):
 
     def close(self):
         for mix in self.mix_envs:
-            mix.close()
+            if mix is not None:
+                mix.close()
+        if self.process_per_mix:
+            self._template.close()
 
     def attach_layout(self, grid_layout):
         """
@@ -252,5 +513,4 @@ class MultiMixEnvironment(GridObjects, RandomObject):
         -------
 
         """
-        for mix in self.mix_envs:
-            mix.attach_layout(grid_layout)
+        self._set_all_mixes("attach_layout", "attach_layout", grid_layout)
@@ -8,7 +8,7 @@
 
 import numpy as np
 
-from grid2op.Environment.BaseMultiProcessEnv import BaseMultiProcessEnvironment
+from grid2op.Environment.BaseMultiProcessEnv import BaseMultiProcessEnvironment, RemoteEnv
 
 
 class SingleEnvMultiProcess(BaseMultiProcessEnvironment):
@@ -73,9 +73,11 @@ class SingleEnvMultiProcess(BaseMultiProcessEnvironment):
         env.close()
 
     """
-    def __init__(self, env, nb_env):
+    def __init__(self, env, nb_env, timeout=None, max_reset_retry=RemoteEnv.MAX_RESET_RETRY,
+                 max_respawn=BaseMultiProcessEnvironment.MAX_RESPAWN, info_filter=None):
         envs = [env for _ in range(nb_env)]
-        super().__init__(envs)
+        super().__init__(envs, timeout=timeout, max_reset_retry=max_reset_retry, max_respawn=max_respawn,
+                         info_filter=info_filter)
 
 
 if __name__ == "__main__":
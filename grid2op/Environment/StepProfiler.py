@@ -0,0 +1,231 @@
+# Copyright (c) 2019-2020, RTE (https://www.rte-france.com)
+# See AUTHORS.txt
+# This Source Code Form is subject to the terms of the Mozilla Public License, version 2.0.
+# If a copy of the Mozilla Public License, version 2.0 was not distributed with this file,
+# you can obtain one at http://mozilla.org/MPL/2.0/.
+# SPDX-License-Identifier: MPL-2.0
+# This file is part of Grid2Op, Grid2Op a testbed platform to model sequential decision making in power systems.
+import json
+import time
+import numpy as np
+
+from grid2op.Exceptions import Grid2OpException
+
+
+class StepProfiler(object):
+    """
+    Records how long each phase of :func:`grid2op.Environment.BaseEnv.step` takes, at each step, as well as some
+    counters (number of powerflows, depth of the cascading failures, number of Newton-Raphson iterations).
+
+    It is used by an environment once attached to it with :func:`grid2op.Environment.BaseEnv.set_step_profiler`.
+    When no profiler is attached (the default) nothing is recorded.
+
+    The statistics are the ones of the current episode: they are reset when the environment is reset (as the timers
+    :attr:`grid2op.Environment.BaseEnv._time_powerflow` etc.). When the :class:`grid2op.Runner.Runner` is used with a
+    profiler, its summary is stored in the "episode_times.json" file of each episode, and all the data of the
+    profiler in the "step_profile.json" file (see :class:`grid2op.Episode.EpisodeData`).
+
+    The phases of a step are (in this order):
+
+      - "rules": check whether the action is legal
+      - "ambiguity": check whether the action is ambiguous
+      - "chronics": read the next time step of the chronics
+      - "redispatch": compute the redispatching (and check the min up / down times of the generators)
+      - "voltage_control": compute the voltage setpoint of the generators
+      - "opponent": the opponent chooses its attack
+      - "backend_apply": the modifications are applied to the backend (:func:`grid2op.Backend.Backend.apply_action`)
+      - "powerflow": the powerflows, including the ones of the cascading failures
+        (:func:`grid2op.Backend.Backend.next_grid_state`)
+      - "update_state": update of the cooldowns, of the overflow counters etc.
+      - "observation": build the observation
+      - "reward": compute the rewards
+      - "step": the whole step
+
+    A phase that is not performed in a step (for example if the step ends with an error) is not recorded for this
+    step. Each of the powerflows computed by :func:`grid2op.Backend.Backend.next_grid_state` is also timed
+    ("each_powerflow").
+
+    The counters, recorded at each step, are:
+
+      - "nb_powerflow": the number of powerflows computed by :func:`grid2op.Backend.Backend.next_grid_state`
+      - "cascade_depth": the number of steps of the cascading failure (``0`` if no powerline is disconnected)
+      - "nb_iterations": the number of Newton-Raphson iterations (only for the backends providing
+        "get_warm_start_stats", for example :class:`grid2op.Backend.PandaPowerBackend`)
+
+    Examples
+    --------
+
+    .. code-block:: python
+
+        import grid2op
+        from grid2op.Environment import StepProfiler
+
+        env = grid2op.make()
+        profiler = StepProfiler()
+        env.set_step_profiler(profiler)
+
+        obs = env.reset()
+        done = False
+        while not done:
+            obs, reward, done, info = env.step(env.action_space())
+        print(profiler.summary()["phases"]["powerflow"]["p95"])
+
+    """
+    PHASES = ("rules", "ambiguity", "chronics", "redispatch", "voltage_control", "opponent", "backend_apply",
+              "powerflow", "update_state", "observation", "reward", "step")
+    EACH_POWERFLOW = "each_powerflow"
+    COUNTERS = ("nb_powerflow", "cascade_depth", "nb_iterations")
+    PERCENTILES = (50, 95, 99)
+
+    # bins of the histograms (in seconds): from 1us to 10s
+    HIST_BINS = np.logspace(-6, 1, 71)
+
+    def __init__(self):
+        self._times = {}
+        self._counters = {}
+        self._current_times = {}
+        self._current_counters = {}
+        self._beg_step = 0.
+        self._last = 0.
+        self._nb_iterations = None
+        self.nb_step = 0
+        self.reset()
+
+    def reset(self):
+        """forget all the data recorded"""
+        self._times = {phase: [] for phase in self.PHASES}
+        self._times[self.EACH_POWERFLOW] = []
+        self._counters = {counter: [] for counter in self.COUNTERS}
+        self._current_times = {}
+        self._current_counters = {}
+        self.nb_step = 0
+
+    def start_step(self, env):
+        """called by the environment at the beginning of each step"""
+        self._current_times.clear()
+        self._current_counters.clear()
+        self._nb_iterations = self._get_nb_iterations(env)
+        self._beg_step = time.perf_counter()
+        self._last = self._beg_step
+
+    def record(self, phase):
+        """the phase `phase` is over: it lasted since the end of the previous phase"""
+        now = time.perf_counter()
+        self._current_times[phase] = self._current_times.get(phase, 0.) + now - self._last
+        self._last = now
+
+    def incr(self, counter, value=1):
+        """increment the counter `counter` of the current step"""
+        self._current_counters[counter] = self._current_counters.get(counter, 0) + value
+
+    def add_powerflow(self, duration):
+        """called by the backend after each powerflow computed during a step"""
+        self._times[self.EACH_POWERFLOW].append(duration)
+        self.incr("nb_powerflow")
+
+    def end_step(self, env):
+        """called by the environment at the end of each step"""
+        self._current_times["step"] = time.perf_counter() - self._beg_step
+        for phase, duration in self._current_times.items():
+            self._times[phase].append(duration)
+        nb_iterations = self._get_nb_iterations(env)
+        if nb_iterations is not None and self._nb_iterations is not None:
+            self._current_counters["nb_iterations"] = nb_iterations - self._nb_iterations
+        for counter, values in self._counters.items():
+            values.append(self._current_counters.get(counter, 0))
+        self.nb_step += 1
+
+    @staticmethod
+    def _get_nb_iterations(env):
+        """total number of Newton-Raphson iterations of the backend of the environment (if it is known)"""
+        if not hasattr(env.backend, "get_warm_start_stats"):
+            return None
+        return env.backend.get_warm_start_stats()["nb_iterations"]
+
+    def get_times(self, phase):
+        """
+        Duration (in seconds) of the phase `phase` at each step it has been performed (or of each powerflow for
+        "each_powerflow").
+
+        Returns
+        -------
+        res: ``numpy.ndarray``, dtype:float
+        """
+        if phase not in self._times:
+            raise Grid2OpException("Unknown phase \"{}\". Phases are: {}".format(phase, sorted(self._times.keys())))
+        return np.array(self._times[phase], dtype=float)
+
+    def get_counter(self, counter):
+        """
+        Value of the counter `counter` at each step.
+
+        Returns
+        -------
+        res: ``numpy.ndarray``, dtype:int
+        """
+        if counter not in self._counters:
+            raise Grid2OpException("Unknown counter \"{}\". Counters are: {}".format(counter, self.COUNTERS))
+        return np.array(self._counters[counter], dtype=int)
+
+    def _stats(self, values):
+        res = {"nb": int(values.shape[0]),
+               "total": float(values.sum()),
+               "mean": float(values.mean()) if values.shape[0] else 0.,
+               "max": float(values.max()) if values.shape[0] else 0.}
+        for q in self.PERCENTILES:
+            res["p{}".format(q)] = float(np.percentile(values, q)) if values.shape[0] else 0.
+        return res
+
+    def summary(self):
+        """
+        Statistics of the phases (durations in seconds) and of the counters.
+
+        Returns
+        -------
+        res: ``dict``
+            With keys:
+
+              - "nb_step": the number of steps recorded
+              - "phases": for each phase, a dictionary with the number of time it has been recorded ("nb"), the
+                "total", "mean" and "max" durations and their percentiles "p50", "p95" and "p99"
+              - "counters": the same statistics for each counter
+
+        """
+        res = {"nb_step": int(self.nb_step), "phases": {}, "counters": {}}
+        for phase in self._times.keys():
+            res["phases"][phase] = self._stats(self.get_times(phase))
+        for counter in self._counters.keys():
+            res["counters"][counter] = self._stats(self.get_counter(counter))
+        return res
+
+    def histograms(self):
+        """
+        Histograms of the durations of each phase, with the bins :attr:`StepProfiler.HIST_BINS` (the durations out
+        of these bins are counted in the first or last bin).
+
+        Returns
+        -------
+        res: ``dict``
+            For each phase, the number of steps in each bin (a ``list`` of size `len(StepProfiler.HIST_BINS) - 1`)
+        """
+        res = {}
+        for phase in self._times.keys():
+            times = np.clip(self.get_times(phase), self.HIST_BINS[0], self.HIST_BINS[-1])
+            res[phase] = np.histogram(times, bins=self.HIST_BINS)[0].tolist()
+        return res
+
+    def to_dict(self):
+        """
+        All the data of the profiler, as a dictionary that can be serialized in json: its :func:`StepProfiler.summary`
+        ("summary"), its :func:`StepProfiler.histograms` ("histograms") with the bins used ("bins"), and the counters
+        at each step ("counters").
+        """
+        return {"summary": self.summary(),
+                "bins": self.HIST_BINS.tolist(),
+                "histograms": self.histograms(),
+                "counters": {counter: [int(el) for el in values] for counter, values in self._counters.items()}}
+
+    def to_json(self, path):
+        """Save the data of the profiler (see :func:`StepProfiler.to_dict`) in the json file `path`"""
+        with open(path, "w") as f:
+            json.dump(obj=self.to_dict(), fp=f, indent=4, sort_keys=True)
@@ -0,0 +1,480 @@
+# Copyright (c) 2019-2020, RTE (https://www.rte-france.com)
+# See AUTHORS.txt
+# This Source Code Form is subject to the terms of the Mozilla Public License, version 2.0.
+# If a copy of the Mozilla Public License, version 2.0 was not distributed with this file,
+# you can obtain one at http://mozilla.org/MPL/2.0/.
+# SPDX-License-Identifier: MPL-2.0
+# This file is part of Grid2Op, Grid2Op a testbed platform to model sequential decision making in power systems.
+from multiprocessing import Process, Pipe
+import numpy as np
+
+from grid2op.dtypes import dt_int, dt_float, dt_bool
+from grid2op.Exceptions import Grid2OpException, MultiEnvException
+from grid2op.Space import GridObjects
+from grid2op.Environment.Environment import Environment
+from grid2op.Environment.BaseMultiProcessEnv import RemoteEnv, BaseMultiProcessEnvironment, _SafeReset, \
+    _ProcessSupervisor
+from grid2op.Environment.InfoPacker import InfoPacker
+from grid2op.Action import BaseAction
+
+
+class _EnvGroup(object):
+    """
+    Some environments stepped one after the other in the same process (the main one or a sub process of a
+    :class:`VectorEnv`). Their observations are stored, as vectors, in the same array.
+
+    The environments are seeded, their chronics shuffled, and they are reset the same way as in
+    :class:`grid2op.Environment.BaseMultiProcessEnv.RemoteEnv`. The "info" of each environment are filtered (or
+    encoded if `pack_infos` is ``True``) with its :class:`grid2op.Environment.InfoPacker.InfoPacker`.
+    """
+    def __init__(self, envs, seeds, info_packers, pack_infos=False, max_reset_retry=RemoteEnv.MAX_RESET_RETRY):
+        self.envs = envs
+        self.info_packers = info_packers
+        self.pack_infos = pack_infos
+        self.nb_env = len(envs)
+        self.safe_resets = []
+        self.all_seeds = []
+        max_int = np.iinfo(dt_int).max
+        for env, seed in zip(envs, seeds):
+            space_prng = np.random.RandomState()
+            space_prng.seed(seed=seed)
+            env_seed = space_prng.randint(max_int)
+            self.all_seeds.append((seed, env.seed(env_seed)))
+            safe_reset = _SafeReset(env, space_prng, max_reset_retry)
+            env.chronics_handler.shuffle(shuffler=safe_reset.shuffler)
+            self.safe_resets.append(safe_reset)
+
+        self.fast_forward = 0
+        obs_size = envs[0].observation_space.n
+        self.obs_vect = np.full((self.nb_env, obs_size), fill_value=np.NaN, dtype=dt_float)
+        self.rewards = np.zeros(self.nb_env, dtype=dt_float)
+        self.dones = np.full(self.nb_env, fill_value=False, dtype=dt_bool)
+
+    def _reset_env(self, env_id):
+        self.obs_vect[env_id, :] = self.safe_resets[env_id](self.fast_forward)
+
+    def reset(self):
+        for env_id in range(self.nb_env):
+            self._reset_env(env_id)
+        return self.obs_vect
+
+    def step(self, actions):
+        """
+        `actions` are either :class:`grid2op.Action.BaseAction` or their vector representations (one per row of
+        a 2d array)
+        """
+        infos = []
+        for env_id, (env, act) in enumerate(zip(self.envs, actions)):
+            if not isinstance(act, BaseAction):
+                act = env.action_space.from_vect(act)
+            obs, reward, done, info = env.step(act)
+            self.obs_vect[env_id, :] = obs.to_vect()
+            if done or not np.all(np.isfinite(self.obs_vect[env_id, :])):
+                # if done do a reset
+                self._reset_env(env_id)
+            self.rewards[env_id] = reward
+            self.dones[env_id] = done
+            if self.pack_infos:
+                infos.append(self.info_packers[env_id].pack(info))
+            else:
+                infos.append(self.info_packers[env_id].filter(info))
+        return self.obs_vect, self.rewards, self.dones, infos
+
+    def set_chunk_size(self, new_chunk_size):
+        for env in self.envs:
+            env.set_chunk_size(new_chunk_size)
+
+    def close(self):
+        for env in self.envs:
+            env.close()
+
+
+class _RemoteEnvGroup(Process):
+    """
+    The process holding some of the environments of a :class:`VectorEnv` (when it uses more than one process). It
+    communicates with the main process as :class:`grid2op.Environment.BaseMultiProcessEnv.RemoteEnv` does, except that
+    the actions and the observations of all its environments are sent at once (as 2d arrays).
+    """
+    def __init__(self, env_params, remote, parent_remote, seeds, info_packers, name=None,
+                 max_reset_retry=RemoteEnv.MAX_RESET_RETRY):
+        Process.__init__(self, group=None, target=None, name=name)
+        self.max_reset_retry = max_reset_retry
+        self.info_packers = info_packers
+        self.env_params = env_params
+        self.remote = remote
+        self.parent_remote = parent_remote
+        self.seeds = seeds
+        self.group = None
+
+    def init_env(self):
+        # the grid is loaded once in this process, the other environments are copies of the first one
+        backend = self.env_params["_raw_backend_class"]()
+        env = Environment(**self.env_params, backend=backend)
+        envs = [env] + [env.copy() for _ in range(len(self.seeds) - 1)]
+        self.group = _EnvGroup(envs, self.seeds, self.info_packers, pack_infos=True,
+                               max_reset_retry=self.max_reset_retry)
+
+    def run(self):
+        if self.group is None:
+            self.init_env()
+
+        while True:
+            cmd, data = self.remote.recv()
+            if cmd == 's' or cmd == 'r':
+                try:
+                    if cmd == 's':
+                        # perform a step
+                        res = self.group.step(data)
+                    else:
+                        # perfom a reset
+                        res = self.group.reset()
+                except MultiEnvException as exc_:
+                    # the environments could not be reset
+                    res = exc_
+                self.remote.send(res)
+            elif cmd == 'c':
+                # close everything
+                self.group.close()
+                self.remote.close()
+                break
+            elif cmd == 'z':
+                # adapt the chunk size
+                self.group.set_chunk_size(data)
+            elif cmd == "f":
+                # fast forward the chronics when restart
+                self.group.fast_forward = int(data)
+            elif cmd == "seed":
+                self.remote.send(self.group.all_seeds)
+            else:
+                raise NotImplementedError
+
+
+class VectorEnv(GridObjects, _ProcessSupervisor):
+    """
+    This class allows to interact at the same time with different copies of the same environment, like
+    :class:`SingleEnvMultiProcess`, but without using one process per environment.
+
+    With `nb_process` = 1 (the default), all the environments live in the main process and are stepped one after the
+    other: there is no cost of communication between processes. For small grids, this cost is often higher than the
+    cost of a step.
+
+    With `nb_process` > 1, the environments are split between `nb_process` sub processes, each of them holding
+    several environments (stepped one after the other). The actions (and the observations) of all the environments
+    of a process are sent (and received) at once. This allows to tune the number of processes to the cost of the
+    steps of the environment.
+
+    The environments are copies of the one given as input (see :func:`grid2op.Environment.Environment.copy`). The
+    grid is thus loaded only once per process. They are seeded, and their chronics shuffled, the same way as in
+    :class:`SingleEnvMultiProcess`.
+
+    As for :class:`BaseMultiProcessEnvironment`, when an environment is "done", it is automatically reset and the
+    observation returned is the first observation after this reset. At most `max_reset_retry` attempts are made to
+    reset an environment, skipping the chronics that fail (see :class:`grid2op.Environment.BaseMultiProcessEnv.RemoteEnv`).
+
+    Only the keys of the "info" selected by `info_filter` are returned (see :class:`BaseMultiProcessEnvironment`).
+
+    With `nb_process` > 1, the processes are supervised as in :class:`BaseMultiProcessEnvironment`: a process that
+    crashes, or does not answer within `timeout` seconds (if `timeout` is not ``None``), is killed and started again
+    (at most `max_respawn` times for each process). All the environments of this process are then considered "done"
+    (see :func:`VectorEnv.step`).
+
+    **NB** Contrary to :class:`BaseMultiProcessEnvironment` the observations are given as a 2d array: the vector
+    representation (see :func:`grid2op.Observation.BaseObservation.to_vect`) of the observation of each environment.
+    This array is allocated once, and modified in place at each call to :func:`VectorEnv.step` or
+    :func:`VectorEnv.reset`: copy it if you need to keep it. :func:`VectorEnv.get_observations` gives the
+    observations as :class:`grid2op.Observation.BaseObservation`.
+
+    Attributes
+    -----------
+    nb_env: ``int``
+        Number of underlying environments (all the processes included).
+
+    nb_process: ``int``
+        Number of processes used (``1`` if all the environments live in the main process).
+
+    observation_space: :class:`grid2op.Observation.ObservationSpace`
+        The observation space of the environments
+
+    action_space: :class:`grid2op.Action.ActionSpace`
+        The action space of the environments
+
+    timeout: ``float``
+        Number of seconds after which a process that does not answer is considered hung (``None``: wait forever)
+
+    max_respawn: ``int``
+        Maximum number of times each process can be restarted. Once reached, a
+        :class:`grid2op.Exceptions.MultiEnvException` is raised instead.
+
+    Examples
+    --------
+
+    .. code-block:: python
+
+        import grid2op
+        from grid2op.Agent import DoNothingAgent
+        from grid2op.Environment import VectorEnv
+
+        env = grid2op.make("rte_case14_realistic")
+        agent = DoNothingAgent(env.action_space)
+
+        # 16 environments in the main process
+        vect_env = VectorEnv(env, nb_env=16)
+        # or 16 environments in 4 processes (4 environments per process)
+        # vect_env = VectorEnv(env, nb_env=16, nb_process=4)
+
+        obs_vect = vect_env.reset()  # a numpy array of shape (16, env.observation_space.n)
+        rews = np.full(vect_env.nb_env, fill_value=env.reward_range[0])
+        dones = np.full(vect_env.nb_env, fill_value=False)
+        for i in range(100):
+            obss = vect_env.get_observations()
+            acts = [agent.act(obss[env_id], rews[env_id], dones[env_id]) for env_id in range(vect_env.nb_env)]
+            obs_vect, rews, dones, infos = vect_env.step(acts)
+        vect_env.close()
+
+    """
+    def __init__(self, env, nb_env, nb_process=1, max_reset_retry=RemoteEnv.MAX_RESET_RETRY, info_filter=None,
+                 timeout=None, max_respawn=BaseMultiProcessEnvironment.MAX_RESPAWN):
+        GridObjects.__init__(self)
+        if not isinstance(env, Environment):
+            raise MultiEnvException("You provided environment of type \"{}\" which is not supported."
+                                    "Please only provide a grid2op.Environment.Environment class."
+                                    "".format(type(env)))
+        nb_env = int(nb_env)
+        nb_process = int(nb_process)
+        if nb_env <= 0:
+            raise MultiEnvException("A VectorEnv needs at least one environment.")
+        if nb_process <= 0 or nb_process > nb_env:
+            raise MultiEnvException("The number of processes should be between 1 and the number of environments "
+                                    "({}). You provided {}.".format(nb_env, nb_process))
+        self.nb_env = nb_env
+        self.nb_process = nb_process
+        self.observation_space = env.observation_space
+        self.action_space = env.action_space
+        self.timeout = timeout
+        self.max_respawn = int(max_respawn)
+
+        max_int = np.iinfo(dt_int).max
+        seeds = [env.space_prng.randint(max_int) for _ in range(nb_env)]
+        self._seeds = seeds
+        self._name = env.name
+        self._reward_min = env.reward_range[0]
+        self._max_reset_retry = max_reset_retry
+        self._nb_respawn = np.zeros(nb_process, dtype=dt_int)
+        # settings sent to the processes, sent again when a process is restarted
+        self._chunk_size = None
+        self._ff_max = None
+        self._info_packers = [InfoPacker(env.n_line, info_filter=info_filter, shared=nb_process > 1)
+                              for _ in range(nb_env)]
+
+        self._obs_vect = np.full((nb_env, env.observation_space.n), fill_value=np.NaN, dtype=dt_float)
+        self._group = None
+        self._remotes = []
+        self._ps = []
+        if nb_process == 1:
+            self._group = _EnvGroup([env.copy() for _ in range(nb_env)], seeds, self._info_packers,
+                                    max_reset_retry=max_reset_retry)
+            self._obs_vect = self._group.obs_vect
+            self._slices = [slice(0, nb_env)]
+        else:
+            # the environments are split as evenly as possible between the processes
+            bounds = np.linspace(0, nb_env, nb_process + 1).astype(dt_int)
+            self._slices = [slice(beg, end) for beg, end in zip(bounds[:-1], bounds[1:])]
+            self._env_params = env.get_kwargs(with_backend=False)
+            self._remotes = [None for _ in range(nb_process)]
+            self._ps = [None for _ in range(nb_process)]
+            for proc_id in range(nb_process):
+                self._start_process(proc_id, seeds[self._slices[proc_id]])
+
+    def _start_process(self, proc_id, seeds):
+        remote, work_remote = Pipe()
+        slice_ = self._slices[proc_id]
+        p = _RemoteEnvGroup(env_params=self._env_params,
+                            remote=work_remote,
+                            parent_remote=remote,
+                            name="{}_vector_subprocess_{}".format(self._name, proc_id),
+                            seeds=seeds,
+                            info_packers=self._info_packers[slice_],
+                            max_reset_retry=self._max_reset_retry)
+        p.daemon = True  # if the main process crashes, we should not cause things to hang
+        p.start()
+        work_remote.close()
+        self._remotes[proc_id] = remote
+        self._ps[proc_id] = p
+        if self._chunk_size is not None:
+            remote.send(('z', self._chunk_size))
+        if self._ff_max is not None:
+            remote.send(('f', self._ff_max))
+
+    def _process_desc(self, proc_id):
+        slice_ = self._slices[proc_id]
+        return "The process {} (environments {} to {})".format(proc_id, slice_.start, slice_.stop - 1)
+
+    def _restart_process(self, proc_id):
+        max_int = np.iinfo(dt_int).max
+        self._start_process(proc_id, [(seed + self._nb_respawn[proc_id]) % max_int
+                                      for seed in self._seeds[self._slices[proc_id]]])
+
+    def step(self, actions):
+        """
+        Perform a step in all the underlying environments. If one or more of them encounters a game over, it is
+        automatically restarted (see :func:`BaseMultiProcessEnvironment.step`).
+
+        If a process has been restarted (see :class:`VectorEnv`), all its environments are considered "done": their
+        observation is the first one of the new process (after a reset), their reward is the minimum reward and the
+        "exception" of their "info" tells what happened.
+
+        Parameters
+        ----------
+        actions: ``list``
+            List of :attr:`VectorEnv.nb_env` :class:`grid2op.Action.BaseAction`. Each action will be executed
+            in the corresponding underlying environment.
+
+        Returns
+        -------
+        obs: ``numpy.ndarray``
+            The observations of all the underlying environments, as vectors: it has shape
+            (:attr:`VectorEnv.nb_env`, `observation_space.n`). It is modified by the next calls to
+            :func:`VectorEnv.step` and :func:`VectorEnv.reset`.
+
+        rews: ``numpy.ndarray``
+            The rewards returned by each underlying environment.
+
+        dones: ``numpy.ndarray``
+            The "done" returned by each underlying environment.
+
+        infos: ``list``
+            The dictionaries "info" returned by each underlying environment.
+
+        """
+        if len(actions) != self.nb_env:
+            raise MultiEnvException("Incorrect number of actions provided. You provided {} actions, but the "
+                                    "VectorEnv counts {} different environment."
+                                    "".format(len(actions), self.nb_env))
+        for act in actions:
+            if not isinstance(act, BaseAction):
+                raise MultiEnvException("All actions send to VectorEnv.step should be of type \"grid2op.BaseAction\""
+                                        "and not {}".format(type(act)))
+
+        if self._group is not None:
+            obs, rews, dones, infos = self._group.step(actions)
+            return obs, rews.copy(), dones.copy(), infos
+
+        restarted = {}
+        for proc_id, slice_ in enumerate(self._slices):
+            reason = self._send(proc_id, 's', np.stack([act.to_vect() for act in actions[slice_]]))
+            if reason is not None:
+                # the new process only needs to be reset
+                restarted[proc_id] = reason
+                self._send(proc_id, 'r')
+        results, failed = self._wait_results()
+        for proc_id, reason in failed.items():
+            self._respawn(proc_id, reason)
+            self._send(proc_id, 'r')
+            results[proc_id] = self._recv_one(proc_id, reason)
+            restarted[proc_id] = reason
+
+        rews = np.zeros(self.nb_env, dtype=dt_float)
+        dones = np.full(self.nb_env, fill_value=False, dtype=dt_bool)
+        infos = []
+        for proc_id, (res, slice_) in enumerate(zip(results, self._slices)):
+            self._check_result(res)
+            if proc_id in restarted:
+                # the environments of a restarted process are considered "done"
+                self._obs_vect[slice_, :] = res
+                rews[slice_] = self._reward_min
+                dones[slice_] = True
+                infos += [{"exception": [MultiEnvException("The process of this environment {} and has been "
+                                                           "restarted.".format(restarted[proc_id]))]}
+                          for _ in range(slice_.stop - slice_.start)]
+                continue
+            obs_group, rews[slice_], dones[slice_], infos_group = res
+            self._obs_vect[slice_, :] = obs_group
+            infos += [packer.unpack(info) for packer, info in zip(self._info_packers[slice_], infos_group)]
+        return self._obs_vect, rews, dones, infos
+
+    def reset(self):
+        """
+        Reset all the environments, and return their observations (as a 2d array, see :func:`VectorEnv.step`).
+
+        **NB** Except in some specific occasion, there is no need to call this function reset. Indeed, when
+        a sub environment is "done" then it is automatically restarted in the :func:`VectorEnv.step` function.
+        """
+        if self._group is not None:
+            return self._group.reset()
+        for res, slice_ in zip(self._request('r'), self._slices):
+            self._check_result(res)
+            self._obs_vect[slice_, :] = res
+        return self._obs_vect
+
+    @staticmethod
+    def _check_result(res):
+        if isinstance(res, Exception):
+            raise MultiEnvException("One of the environments failed with error: {}".format(res)) from res
+
+    def get_observations(self):
+        """
+        The last observations of all the environments, as :class:`grid2op.Observation.BaseObservation` (built from
+        their vector representations). As for :class:`BaseMultiProcessEnvironment`, they cannot be used to
+        :func:`grid2op.Observation.BaseObservation.simulate`.
+
+        Returns
+        -------
+        res: ``list``
+            The list of the :attr:`VectorEnv.nb_env` observations
+        """
+        return [self.observation_space.from_vect(self._obs_vect[env_id, :]) for env_id in range(self.nb_env)]
+
+    def close(self):
+        """
+        Close all the environments and all the processes. The processes that have not stopped after
+        :attr:`VectorEnv.CLOSE_TIMEOUT` seconds are terminated.
+        """
+        if self._group is not None:
+            self._group.close()
+        self._close_processes()
+
+    def set_chunk_size(self, new_chunk_size):
+        """
+        Dynamically adapt the amount of data read from the hard drive (see
+        :func:`BaseMultiProcessEnvironment.set_chunk_size`).
+        """
+        try:
+            new_chunk_size = int(new_chunk_size)
+        except Exception as e:
+            raise Grid2OpException("Impossible to set the chunk size. It should be convertible a integer, and not"
+                                   "{}".format(new_chunk_size))
+
+        if new_chunk_size <= 0:
+            raise Grid2OpException("Impossible to read less than 1 data at a time. Please make sure \"new_chunk_size\""
+                                   "is a positive integer.")
+        if self._group is not None:
+            self._group.set_chunk_size(new_chunk_size)
+        self._chunk_size = new_chunk_size
+        for proc_id in range(len(self._remotes)):
+            self._send(proc_id, 'z', new_chunk_size)
+
+    def set_ff(self, ff_max=7*24*60/5):
+        """
+        Fast forward the environments for a random number of time steps between 0 and ``ff_max`` when they are reset
+        (see :func:`BaseMultiProcessEnvironment.set_ff`).
+        """
+        try:
+            ff_max = int(ff_max)
+        except:
+            raise RuntimeError("ff_max parameters should be convertible to an integer.")
+        if self._group is not None:
+            self._group.fast_forward = ff_max
+        self._ff_max = ff_max
+        for proc_id in range(len(self._remotes)):
+            self._send(proc_id, 'f', ff_max)
+
+    def get_seeds(self):
+        """
+        Get the seeds used to initialize each sub environments.
+        """
+        if self._group is not None:
+            return self._group.all_seeds
+        res = []
+        for seeds in self._request('seed'):
+            res += seeds
+        return res
@@ -4,7 +4,9 @@ __all__ = [
     "BaseMultiProcessEnvironment",
     "SingleEnvMultiProcess",
     "MultiEnvMultiProcess",
-    "MultiMixEnvironment"
+    "MultiMixEnvironment",
+    "StepProfiler",
+    "VectorEnv"
 ]
 
 from grid2op.Environment.BaseEnv import BaseEnv
@@ -13,3 +15,5 @@ from grid2op.Environment.BaseMultiProcessEnv import BaseMultiProcessEnvironment
 from grid2op.Environment.SingleEnvMultiProcess import SingleEnvMultiProcess
 from grid2op.Environment.MultiEnvMultiProcess import MultiEnvMultiProcess
 from grid2op.Environment.MultiMixEnv import MultiMixEnvironment
+from grid2op.Environment.StepProfiler import StepProfiler
+from grid2op.Environment.VectorEnv import VectorEnv
@@ -23,10 +23,16 @@ will save the information in a structured way. For each episode there will be a
     - "nb_timestep_played": number of time step the agent has succesfully managed
     - "cumulative_reward": its total cumulative reward
 
+    This file is written last: if it exists, all the data of the episode have been saved.
+
   - "episode_times.json": gives some information about the total time spend in multiple part of the runner, mainly the
     :class:`grid2op.Agent.BaseAgent` (and especially its method :func:`grid2op.BaseAgent.act`) and amount of time
     spent in the :class:`grid2op.Environment.Environment`
 
+  - "step_profile.json": only if the environment has a step profiler (see
+    :class:`grid2op.Environment.StepProfiler`): all the data recorded by this profiler (see
+    :func:`grid2op.Environment.StepProfiler.to_dict`). Its summary is also stored in "episode_times.json".
+
   - "_parameters.json": is a representation as json of a the :class:`grid2op.Parameters.Parameters` used for this episode
   - "rewards.npy" is a numpy 1d array giving the rewards at each time step. We adopted the convention that the stored
     reward at index `i` is the one observed by the agent at time `i` and **NOT** the reward sent by the
@@ -68,6 +74,7 @@ class EpisodeData:
     META = "episode_meta.json"
     TIMES = "episode_times.json"
     OTHER_REWARDS = "other_rewards.json"
+    STEP_PROFILE = "step_profile.json"
 
     AG_EXEC_TIMES = "agent_exec_times.npz"
     ACTIONS = "actions.npz"
@@ -142,6 +149,7 @@ class EpisodeData:
         self.params = params
         self.meta = meta
         self.episode_times = episode_times
+        self.step_profile = None
         self.name = name
         self.disc_lines_templ = disc_lines_templ
 
@@ -371,6 +379,10 @@ class EpisodeData:
             self.episode_times["Agent"] = {}
             self.episode_times["Agent"]["total"] = float(time_act)
             self.episode_times["total"] = float(end_ - beg_)
+            profiler = env.get_step_profiler()
+            if profiler is not None:
+                self.step_profile = profiler.to_dict()
+                self.episode_times["Env"]["step_profiler"] = self.step_profile["summary"]
 
     def to_disk(self):
         if self.serialize:
@@ -379,16 +391,16 @@ class EpisodeData:
             with open(parameters_path, "w") as f:
                 json.dump(obj=self.parameters, fp=f, indent=4, sort_keys=True)
 
-            meta_path = os.path.join(self.episode_path, EpisodeData.META)
-            with open(meta_path, "w") as f:
-                json.dump(obj=self.meta, fp=f, indent=4, sort_keys=True)
-
             episode_times_path = os.path.join(
                 self.episode_path, EpisodeData.TIMES)
             with open(episode_times_path, "w") as f:
                 json.dump(obj=self.episode_times, fp=f,
                           indent=4, sort_keys=True)
 
+            if self.step_profile is not None:
+                with open(os.path.join(self.episode_path, EpisodeData.STEP_PROFILE), "w") as f:
+                    json.dump(obj=self.step_profile, fp=f, indent=4, sort_keys=True)
+
             episode_other_rewards_path = os.path.join(
                 self.episode_path, EpisodeData.OTHER_REWARDS)
             with open(episode_other_rewards_path, "w") as f:
@@ -410,6 +422,11 @@ class EpisodeData:
             np.savez_compressed(os.path.join(self.episode_path,
                                  EpisodeData.ATTACK), data=self.attack)
 
+            # the meta data are written last: if they are on the disk, the whole episode is (see `Runner.run_iter`)
+            meta_path = os.path.join(self.episode_path, EpisodeData.META)
+            with open(meta_path, "w") as f:
+                json.dump(obj=self.meta, fp=f, indent=4, sort_keys=True)
+
 
 class CollectionWrapper:
     """
@@ -0,0 +1,176 @@
+# Copyright (c) 2019-2020, RTE (https://www.rte-france.com)
+# See AUTHORS.txt
+# This Source Code Form is subject to the terms of the Mozilla Public License, version 2.0.
+# If a copy of the Mozilla Public License, version 2.0 was not distributed with this file,
+# you can obtain one at http://mozilla.org/MPL/2.0/.
+# SPDX-License-Identifier: MPL-2.0
+# This file is part of Grid2Op, Grid2Op a testbed platform to model sequential decision making in power systems.
+import os
+import hashlib
+import pickle
+import tempfile
+import warnings
+
+import numpy as np
+import pandas as pd
+import pandapower as pp
+
+import grid2op
+from grid2op.Exceptions import EnvError
+
+
+class ConstructionCache(object):
+    """
+    On disk cache of the backend once the powergrid is loaded, used by :class:`grid2op.Environment.Environment`
+    (see the "cache_dir" argument of :func:`grid2op.MakeEnv.make_from_dataset_path`).
+
+    Loading a powergrid (reading the grid file, computing the initial powerflows, reading the redispatching data
+    and the layout) is most of the time spent to build an environment. With a cache, this is done only the first
+    time: the state of the backend (see :func:`grid2op.Backend.Backend.get_construction_state`) and the layout are
+    then saved in the directory `cache_dir`, and restored by the next environments built from the same files.
+
+    The entries of the cache are identified by a hash of the versions of grid2op, numpy, pandas and pandapower, of the
+    type of the backend and its :attr:`grid2op.Backend.Backend.CONSTRUCTION_STATE_VERSION`, and of the content of the
+    files read: the grid file, "prods_charac.csv" and "grid_layout.json". Any modification of these files thus
+    invalidates the entry. Stale entries are never removed: the directory can be deleted at any time.
+
+    Each entry also stores the names of the attributes of the backend and the shapes of its arrays. An entry where
+    one of them is missing or does not have the expected shape is rejected before the backend is modified. An entry
+    that cannot be restored (or that gives a powergrid rejected by
+    :func:`grid2op.Space.GridObjects.assert_grid_correct`) is ignored with a warning: the backend is put back in its
+    previous state and the powergrid is loaded from the files.
+
+    Backends that do not support it (:func:`grid2op.Backend.Backend.get_construction_state` returns ``None``) always
+    load the powergrid from the files.
+
+    Parameters
+    ----------
+    cache_dir: ``str``
+        Path of the directory where the entries are stored (created if it does not exist)
+
+    """
+    REDISPATCHING_FILE = "prods_charac.csv"
+    LAYOUT_FILE = "grid_layout.json"
+    EXT = ".pickle"
+
+    def __init__(self, cache_dir):
+        self.cache_dir = os.path.abspath(cache_dir)
+
+    def get_key(self, backend, grid_path):
+        """the key of the entry of the cache for the powergrid `grid_path` loaded by `backend`"""
+        hash_ = hashlib.sha256()
+        for version in [grid2op.__version__, np.__version__, pd.__version__, pp.__version__]:
+            hash_.update(version.encode("utf-8"))
+        backend_type = type(backend)
+        hash_.update("{}.{}-{}".format(backend_type.__module__, backend_type.__qualname__,
+                                       backend_type.CONSTRUCTION_STATE_VERSION).encode("utf-8"))
+        grid_dir = os.path.split(grid_path)[0]
+        for path_ in [grid_path,
+                      os.path.join(grid_dir, self.REDISPATCHING_FILE),
+                      os.path.join(grid_dir, self.LAYOUT_FILE)]:
+            hash_.update(os.path.basename(path_).encode("utf-8"))
+            if os.path.exists(path_):
+                with open(path_, "rb") as f:
+                    hash_.update(f.read())
+            else:
+                hash_.update(b"missing")
+        return hash_.hexdigest()
+
+    def get_path(self, backend, grid_path):
+        """path of the file of the entry of the cache for the powergrid `grid_path` loaded by `backend`"""
+        return os.path.join(self.cache_dir, self.get_key(backend, grid_path) + self.EXT)
+
+    @staticmethod
+    def _get_shapes(state):
+        """shape of each numpy array of the `state` of a backend (``None`` for the other attributes)"""
+        return {key: val.shape if isinstance(val, np.ndarray) else None for key, val in state.items()}
+
+    def _check_entry(self, backend, entry):
+        """
+        Raise an :class:`grid2op.Exceptions.EnvError` if the state stored in `entry` misses an attribute (stored with
+        the entry or set by the constructor of `backend`) or if one of its arrays does not have the expected shape.
+        """
+        state = entry["backend"]
+        expected_shapes = entry["shapes"]
+        init_state = backend.get_construction_state()
+        expected_keys = set(expected_shapes)
+        if init_state is not None:
+            expected_keys |= set(init_state)
+        missing = sorted(expected_keys - set(state))
+        if missing:
+            raise EnvError("The attributes {} are missing".format(missing))
+        shapes = self._get_shapes(state)
+        wrong_shape = sorted(key for key, shape in expected_shapes.items() if shapes[key] != shape)
+        if wrong_shape:
+            raise EnvError("The attributes {} do not have the expected shape".format(wrong_shape))
+
+    def load(self, backend, grid_path):
+        """
+        Restore the state of `backend` from the cache, instead of calling :func:`grid2op.Backend.Backend.load_grid`,
+        :func:`grid2op.Backend.Backend.load_redispacthing_data` and :func:`grid2op.Backend.Backend.load_grid_layout`.
+
+        Returns
+        -------
+        res: ``bool``
+            Whether the state of the backend has been restored. If not, the backend is left unchanged and the
+            powergrid should be loaded from the files (and the cache updated with :func:`ConstructionCache.save`).
+
+        """
+        path_ = self.get_path(backend, grid_path)
+        if not os.path.exists(path_):
+            return False
+        previous_state = dict(backend.__dict__)
+        try:
+            with open(path_, "rb") as f:
+                entry = pickle.load(f)
+            self._check_entry(backend, entry)
+            backend.set_construction_state(entry["backend"])
+            backend.assert_grid_correct()
+        except Exception as exc_:
+            backend.__dict__.clear()
+            backend.__dict__.update(previous_state)
+            warnings.warn("Impossible to use the entry \"{}\" of the cache of the environments, the powergrid will be "
+                          "loaded from \"{}\". The error was: \"{}\"".format(path_, grid_path, exc_))
+            return False
+        if entry["grid_layout"] is not None:
+            backend.attach_layout(entry["grid_layout"])
+        return True
+
+    def save(self, backend, grid_path, with_layout=True):
+        """
+        Save the state of `backend`, that has just loaded the powergrid `grid_path`, in the cache.
+
+        Parameters
+        ----------
+        backend: :class:`grid2op.Backend.Backend`
+            The backend, just after the calls to :func:`grid2op.Backend.Backend.load_grid`,
+            :func:`grid2op.Backend.Backend.load_redispacthing_data` and :func:`grid2op.Backend.Backend.load_grid_layout`
+
+        grid_path: ``str``
+            The path of the powergrid loaded
+
+        with_layout: ``bool``
+            Whether the layout has been loaded successfully (if not, it is not stored)
+
+        """
+        state = backend.get_construction_state()
+        if state is None:
+            return
+        entry = {"backend": state,
+                 "shapes": self._get_shapes(state),
+                 "grid_layout": backend.grid_layout if with_layout else None}
+        path_ = self.get_path(backend, grid_path)
+        tmp_path = None
+        try:
+            if not os.path.exists(self.cache_dir):
+                os.makedirs(self.cache_dir, exist_ok=True)
+            # write in a temporary file first, so that other processes never read a partial entry
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path_)
+        except Exception as exc_:
+            warnings.warn("Impossible to store the powergrid \"{}\" in the cache of the environments \"{}\". The "
+                          "error was: \"{}\"".format(grid_path, self.cache_dir, exc_))
+            if tmp_path is not None and os.path.exists(tmp_path):
+                os.remove(tmp_path)
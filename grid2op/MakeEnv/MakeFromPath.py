@@ -25,6 +25,7 @@ from grid2op.VoltageControler import ControlVoltageFromFile
 from grid2op.Opponent import BaseOpponent, BaseActionBudget, NeverAttackBudget
 
 from grid2op.MakeEnv.get_default_aux import _get_default_aux
+from grid2op.MakeEnv.ConstructionCache import ConstructionCache
 
 DIFFICULTY_NAME = "difficulty"
 CHALLENGE_NAME = "competition"
@@ -64,6 +65,8 @@ ERR_MSG_KWARGS = {
     "kwargs_opponent": "The extra kwargs argument used to properly initiliazed the opponent "
                        "(\"kwargs_opponent\") shoud "
                        "be a dictionary.",
+    "cache_dir": "The directory of the cache of the loaded powergrids (\"cache_dir\") should be a path "
+                 "(a string) or None.",
     DIFFICULTY_NAME: "Unknown difficulty level {difficulty} for this environment. Authorized difficulties are "
                      "{difficulties}"
 }
@@ -180,6 +183,13 @@ def make_from_dataset_path(dataset_path="/", **kwargs):
     opponent_budget_class: ``type``, optional
         defaults: :class:`grid2op.Opponent.UnlimitedBudget`
 
+    cache_dir: ``str``, optional
+        Directory of an on disk cache of the loaded powergrid (see :class:`grid2op.MakeEnv.ConstructionCache.ConstructionCache`).
+        The first environment built with a cache stores its backend once the powergrid, the redispatching data and
+        the layout are loaded, and the next ones restore it instead of loading the files again. The entries are
+        invalidated when these files, the type of backend or the grid2op version change. It defaults to ``None``
+        (no cache).
+
     Returns
     -------
     env: :class:`grid2op.Environment.Environment`
@@ -471,6 +481,11 @@ def make_from_dataset_path(dataset_path="/", **kwargs):
                                        msg_error=ERR_MSG_KWARGS["kwargs_opponent"],
                                        isclass=False)
 
+    cache_dir = kwargs.get("cache_dir", None)
+    if cache_dir is not None and not isinstance(cache_dir, str):
+        raise EnvError(ERR_MSG_KWARGS["cache_dir"])
+    construction_cache = ConstructionCache(cache_dir) if cache_dir is not None else None
+
     # Finally instanciate env from config & overrides
     env = Environment(init_grid_path=grid_path_abs,
                       chronics_handler=data_feeding,
@@ -492,6 +507,7 @@ def make_from_dataset_path(dataset_path="/", **kwargs):
                       opponent_budget_per_ts=opponent_budget_per_ts,
                       opponent_budget_class=opponent_budget_class,
                       kwargs_opponent=kwargs_opponent,
+                      _construction_cache=construction_cache
                       )
 
     # Update the thermal limit if any
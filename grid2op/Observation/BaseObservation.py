@@ -187,6 +187,9 @@ class BaseObservation(GridObjects):
         self._forecasted_grid_act = {}
         self._forecasted_inj = []
         self._obs_env = obs_env
+        # forecasts not computed yet (see :attr:`grid2op.Parameters.Parameters.REUSE_OBSERVATION`): a weak reference
+        # to the observation space that can compute them, and the number of the observation it built
+        self._lazy_forecast = None
 
         self.timestep_overflow = np.zeros(shape=(self.n_line,), dtype=dt_int)
 
@@ -458,6 +461,7 @@ class BaseObservation(GridObjects):
         # forecasts
         self._forecasted_inj = []
         self._forecasted_grid_act = {}
+        self._lazy_forecast = None
 
         # redispatching
         self.target_dispatch[:] = np.NaN
@@ -601,7 +605,7 @@ class BaseObservation(GridObjects):
         """
         pass
 
-    def connectivity_matrix(self):
+    def connectivity_matrix(self, as_csr_matrix=False, as_edge_list=False):
         """
         Computes and return the "connectivity matrix" `con_mat`.
         if "dim_topo = 2 * n_line + n_prod + n_conso"
@@ -618,6 +622,15 @@ class BaseObservation(GridObjects):
 
         By definition, the diagonal is made of 0.
 
+        Parameters
+        ----------
+        as_csr_matrix: ``bool``
+            Whether to return the matrix as a :class:`scipy.sparse.csr_matrix` (default ``False``)
+
+        as_edge_list: ``bool``
+            Whether to return the matrix as an "edge list", a matrix of shape (2, number of non zero elements) where
+            `res[0, k]` and `res[1, k]` are the row and the column of the k-th non zero element (default ``False``).
+
         Returns
         -------
         res: ``numpy.ndarray``, shape:dim_topo,dim_topo, dtype:float
@@ -625,7 +638,7 @@ class BaseObservation(GridObjects):
         """
         raise NotImplementedError("This method is not implemented")
 
-    def bus_connectivity_matrix(self):
+    def bus_connectivity_matrix(self, as_csr_matrix=False, as_edge_list=False):
         """
         If we denote by `nb_bus` the total number bus of the powergrid.
 
@@ -634,6 +647,14 @@ class BaseObservation(GridObjects):
         If `bus_connectivity_matrix[i,j] = 1` then at least a power line connects bus i and bus j.
         Otherwise, nothing connects it.
 
+        Parameters
+        ----------
+        as_csr_matrix: ``bool``
+            Whether to return the matrix as a :class:`scipy.sparse.csr_matrix` (default ``False``)
+
+        as_edge_list: ``bool``
+            Whether to return the matrix as an "edge list" (see :func:`BaseObservation.connectivity_matrix`)
+
         Returns
         -------
         res: ``numpy.ndarray``, shape:nb_bus,nb_bus dtype:float
@@ -641,6 +662,61 @@ class BaseObservation(GridObjects):
         """
         raise NotImplementedError("This method is not implemented. ")
 
+    def _update_forecasts(self, env):
+        """
+        Retrieve the forecasts (the current injections for time step 0, and the forecasts of the chronics for the next
+        ones) from the environment. Each of them is converted to an action only when it is used.
+
+        Parameters
+        ----------
+        env: :class:`grid2op.Environment.BaseEnv`
+            The environment from which the forecasts are retrieved.
+
+        """
+        inj_action = {}
+        dict_ = {}
+        dict_["load_p"] = dt_float(1.0 * self.load_p)
+        dict_["load_q"] = dt_float(1.0 * self.load_q)
+        dict_["prod_p"] = dt_float(1.0 * self.prod_p)
+        dict_["prod_v"] = dt_float(1.0 * self.prod_v)
+        inj_action["injection"] = dict_
+        timestamp = self.get_time_stamp()
+        self._forecasted_inj = [(timestamp, inj_action)]
+        self._forecasted_inj += env.chronics_handler.forecasts()
+        self._forecasted_grid = [None for _ in self._forecasted_inj]
+        self._forecasted_grid_act = {}
+
+    def _compute_lazy_forecasts(self):
+        """
+        Compute the forecasts of this observation if the observation space postponed it (see
+        :attr:`grid2op.Parameters.Parameters.REUSE_OBSERVATION`).
+
+        Raises
+        ------
+        :class:`grid2op.Exceptions.NoForecastAvailable`
+            If the environment has changed since this observation was built.
+
+        """
+        if self._lazy_forecast is None:
+            return
+        obs_space_ref, obs_id = self._lazy_forecast
+        self._lazy_forecast = None
+        obs_space = obs_space_ref()
+        if obs_space is None:
+            raise NoForecastAvailable("The forecasts of this observation are not available anymore: its observation "
+                                      "space has been deleted.")
+        obs_space._update_lazy_forecasts(self, obs_id)
+
+    def _get_forecasted_grid_act(self, time_step):
+        """the time stamp and the action setting the injections of the forecast `time_step` ahead"""
+        if time_step not in self._forecasted_grid_act:
+            timestamp, inj_forecasted = self._forecasted_inj[time_step]
+            self._forecasted_grid_act[time_step] = {
+                "timestamp": timestamp,
+                "inj_action": self.action_helper(inj_forecasted)
+            }
+        return self._forecasted_grid_act[time_step]
+
     def get_forecasted_inj(self, time_step=1):
         """
         This function allows you to retrieve directly the "planned" injections for the timestep `time_step`
@@ -661,9 +737,10 @@ class BaseObservation(GridObjects):
         load_q_f: ``numpy.ndarray``
             The forecasted load reactive consumption
         """
+        self._compute_lazy_forecasts()
         if time_step >= len(self._forecasted_inj):
             raise NoForecastAvailable("Forecast for {} timestep ahead is not possible with your chronics.".format(time_step))
-        a = self._forecasted_grid_act[time_step]["inj_action"]
+        a = self._get_forecasted_grid_act(time_step)["inj_action"]
         prod_p_f = np.full(self.n_gen, fill_value=np.NaN, dtype=dt_float)
         prod_v_f = np.full(self.n_gen, fill_value=np.NaN, dtype=dt_float)
         load_p_f = np.full(self.n_load, fill_value=np.NaN, dtype=dt_float)
@@ -693,7 +770,7 @@ class BaseObservation(GridObjects):
                           hour=self.hour_of_day, minute=self.minute_of_hour)
         return res
 
-    def simulate(self, action, time_step=1):
+    def simulate(self, action, time_step=1, fields=None):
         """
         This method is used to simulate the effect of an action on a forecasted powergrid state. It has the same return
         value as the :func:`grid2op.Environment.Environment.step` function.
@@ -708,6 +785,12 @@ class BaseObservation(GridObjects):
             The time step of the forecasted grid to perform the action on. If no forecast are available for this
             time step, a :class:`grid2op.Exceptions.NoForecastAvailable` is thrown.
 
+        fields: ``list``, optional
+            If provided, only the attributes of the observation listed here (for example ``("rho", "line_status")``,
+            they must be in :attr:`BaseObservation.attr_list_vect`) are returned, as a dictionary, instead of the
+            whole observation. This is faster when only a few of them are needed. An empty list returns an empty
+            dictionary.
+
         Raises
         ------
         :class:`grid2op.Exceptions.NoForecastAvailable`
@@ -716,7 +799,9 @@ class BaseObservation(GridObjects):
         Returns
         -------
             observation: :class:`grid2op.Observation.Observation`
-                agent's observation of the current environment
+                agent's observation of the current environment (or a dictionary with the attributes `fields` of this
+                observation if `fields` is provided). This observation is not linked to any environment: it cannot be
+                used to call `simulate` again.
             reward: ``float``
                 amount of reward returned after previous action
             done: ``bool``
@@ -732,27 +817,47 @@ class BaseObservation(GridObjects):
         if time_step < 0:
             raise NoForecastAvailable("Impossible to forecast in the past.")
 
+        if fields is not None:
+            unknown_fields = set(fields) - set(self.attr_list_vect)
+            if unknown_fields:
+                raise Grid2OpException("Impossible to simulate: the observation has no attribute(s) \"{}\""
+                                       "".format(sorted(unknown_fields)))
+
+        self._compute_lazy_forecasts()
         if time_step >= len(self._forecasted_inj):
             raise NoForecastAvailable("Forecast for {} timestep(s) ahead is not possible with your chronics."
                                       "".format(time_step))
 
-        if time_step not in self._forecasted_grid_act:
-            timestamp, inj_forecasted = self._forecasted_inj[time_step]
-            self._forecasted_grid_act[time_step] = {
-                "timestamp": timestamp,
-                "inj_action": self.action_helper(inj_forecasted)
-            }
-
-        timestamp = self._forecasted_grid_act[time_step]["timestamp"]
-        inj_action = self._forecasted_grid_act[time_step]["inj_action"]
+        forecasted_grid_act = self._get_forecasted_grid_act(time_step)
+        timestamp = forecasted_grid_act["timestamp"]
+        inj_action = forecasted_grid_act["inj_action"]
         self._obs_env.init(inj_action,
                            time_stamp=timestamp,
                            timestep_overflow=self.timestep_overflow,
                            topo_vect=self.topo_vect)
 
-        sim_obs, *rest = self._obs_env.simulate(action)
-        sim_obs = copy.deepcopy(sim_obs)
-        return (sim_obs, *rest)
+        return self._obs_env.simulate(action, fields=fields)
+
+    def _detached_copy(self):
+        """
+        Copy of this observation that is not linked to any environment, action space nor forecasts. Only the numpy
+        arrays are copied, the other attributes (immutable or never modified) are shared with this observation.
+
+        Returns
+        -------
+        res: :class:`BaseObservation`
+            The copy of this observation
+        """
+        res = copy.copy(self)
+        for attr_nm, attr in self.__dict__.items():
+            if isinstance(attr, np.ndarray):
+                res.__dict__[attr_nm] = attr.copy()
+        res.action_helper = None
+        res._obs_env = None
+        res._forecasted_grid_act = {}
+        res._forecasted_inj = []
+        res._lazy_forecast = None
+        return res
 
     def copy(self):
         """
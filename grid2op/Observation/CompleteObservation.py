@@ -8,8 +8,10 @@
 
 import numpy as np
 import copy
+from scipy.sparse import csr_matrix
 
-from grid2op.dtypes import dt_int, dt_float
+from grid2op.dtypes import dt_int, dt_float, dt_bool
+from grid2op.Exceptions import Grid2OpException
 from grid2op.Observation.BaseObservation import BaseObservation
 
 
@@ -87,6 +89,12 @@ class CompleteObservation(BaseObservation):
         The representation of the action in a form of a dictionnary. See the definition of
         :func:`CompleteObservation.to_dict` for a description of this dictionnary.
 
+    _connectivity_cache: ``dict``
+        Data used to speed up the computation of :func:`CompleteObservation.connectivity_matrix`: the pairs of
+        elements of each substation and the last topology for which it has been computed. It is shared by all the
+        observations built by the same :class:`grid2op.Observation.ObservationSpace` so that, from one observation
+        to the next, only the substations whose topology changed are recomputed.
+
     """
     def __init__(self,
                  obs_env=None,
@@ -98,6 +106,9 @@ class CompleteObservation(BaseObservation):
                                  action_helper=action_helper,
                                  seed=seed)
         self.dictionnarized = None
+        self._connectivity_edges = None
+        self._bus_connectivity_edges = None
+        self._connectivity_cache = {}
         self.attr_list_vect = [
             "year", "month", "day", "hour_of_day",
             "minute_of_hour", "day_of_week",
@@ -116,9 +127,17 @@ class CompleteObservation(BaseObservation):
     def _reset_matrices(self):
         self.connectivity_matrix_ = None
         self.bus_connectivity_matrix_ = None
-        self.vectorized = None
+        self._connectivity_edges = None
+        self._bus_connectivity_edges = None
+        self._vectorized = None
         self.dictionnarized = None
 
+    def _detached_copy(self):
+        res = super()._detached_copy()
+        # the connectivity cache is kept shared, the matrices refer to the arrays of this observation
+        res._reset_matrices()
+        return res
+
     def update(self, env, with_forecast=True):
         """
         This use the environement to update properly the BaseObservation.
@@ -142,9 +161,9 @@ class CompleteObservation(BaseObservation):
         self.day_of_week = dt_int(env.time_stamp.weekday())
 
         # get the values related to topology
-        self.timestep_overflow = copy.copy(env.timestep_overflow)
-        self.line_status = copy.copy(env.backend.get_line_status())
-        self.topo_vect = copy.copy(env.backend.get_topo_vect())
+        self.timestep_overflow[:] = env.timestep_overflow
+        self.line_status[:] = env.backend.get_line_status()
+        self.topo_vect[:] = env.backend.get_topo_vect()
 
         # get the values related to continuous values
         self.prod_p[:], self.prod_q[:], self.prod_v[:] = env.backend.generators_info()
@@ -154,20 +173,9 @@ class CompleteObservation(BaseObservation):
 
         # handles forecasts here
         if with_forecast:
-            inj_action = {}
-            dict_ = {}
-            dict_["load_p"] = dt_float(1.0 * self.load_p)
-            dict_["load_q"] = dt_float(1.0 * self.load_q)
-            dict_["prod_p"] = dt_float(1.0 * self.prod_p)
-            dict_["prod_v"] = dt_float(1.0 * self.prod_v)
-            inj_action["injection"] = dict_
-            # inj_action = self.action_helper(inj_action)
-            timestamp = self.get_time_stamp()
-            self._forecasted_inj = [(timestamp, inj_action)]
-            self._forecasted_inj += env.chronics_handler.forecasts()
-            self._forecasted_grid = [None for _ in self._forecasted_inj]
-
-        self.rho = env.backend.get_relative_flow().astype(dt_float)
+            self._update_forecasts(env)
+
+        self.rho[:] = env.backend.get_relative_flow()
 
         # cool down and reconnection time after hard overflow, soft overflow or cascading failure
         self.time_before_cooldown_line[:] = env.times_before_line_status_actionable
@@ -245,7 +253,86 @@ class CompleteObservation(BaseObservation):
 
         return self.dictionnarized
 
-    def connectivity_matrix(self):
+    def _get_conn_pairs(self):
+        """
+        Retrieve (and computes if needed) all the pairs of elements `(i, j)` with `i < j` that are in the same
+        substation. These pairs are sorted by substation, and the pairs of substation `sub_id` are
+        `pairs_i[pairs_start[sub_id]:pairs_start[sub_id+1]]` (and the same for `pairs_j`).
+
+        This only depends on the powergrid, so it is stored in the :attr:`CompleteObservation._connectivity_cache`
+        (shared among all the observations of the same observation space).
+        """
+        cache = self._connectivity_cache
+        if "pairs" not in cache:
+            pairs_i = []
+            pairs_j = []
+            pairs_start = np.zeros(self.n_sub + 1, dtype=dt_int)
+            beg_ = 0
+            for sub_id, nb_obj in enumerate(self.sub_info):
+                nb_obj = int(nb_obj)
+                tmp_i, tmp_j = np.triu_indices(nb_obj, k=1)
+                pairs_i.append(tmp_i + beg_)
+                pairs_j.append(tmp_j + beg_)
+                pairs_start[sub_id + 1] = pairs_start[sub_id] + tmp_i.shape[0]
+                beg_ += nb_obj
+            pairs_i = np.concatenate(pairs_i).astype(dt_int)
+            pairs_j = np.concatenate(pairs_j).astype(dt_int)
+            cache["pairs"] = (pairs_i, pairs_j, pairs_start)
+        return cache["pairs"]
+
+    def _get_topo_vect_to_sub(self):
+        if self._topo_vect_to_sub is not None:
+            return self._topo_vect_to_sub
+        return np.repeat(np.arange(self.n_sub), repeats=self.sub_info)
+
+    def _get_conn_edges(self):
+        """
+        Computes the non zero elements of the connectivity matrix (see :func:`CompleteObservation.connectivity_matrix`)
+        as two vectors `rows` and `cols`.
+
+        If the topology of only some substations changed since the last time it was computed (for an observation of
+        the same observation space) only the pairs of elements of these substations are updated.
+        """
+        if self._connectivity_edges is None:
+            pairs_i, pairs_j, pairs_start = self._get_conn_pairs()
+            cache = self._connectivity_cache
+            topo_vect = self.topo_vect
+            if "topo_vect" in cache and cache["topo_vect"].shape == topo_vect.shape:
+                prev_topo, same_bus = cache["topo_vect"], cache["same_bus"]
+                changed = prev_topo != topo_vect
+                if changed.any():
+                    same_bus = copy.copy(same_bus)
+                    for sub_id in np.unique(self._get_topo_vect_to_sub()[changed]):
+                        beg_, end_ = pairs_start[sub_id], pairs_start[sub_id + 1]
+                        same_bus[beg_:end_] = topo_vect[pairs_i[beg_:end_]] == topo_vect[pairs_j[beg_:end_]]
+            else:
+                same_bus = topo_vect[pairs_i] == topo_vect[pairs_j]
+            cache["topo_vect"] = copy.copy(topo_vect)
+            cache["same_bus"] = same_bus
+
+            # objects on the same bus are connected, as well as both ends of a powerline
+            rows = np.concatenate((pairs_i[same_bus], pairs_j[same_bus],
+                                   self.line_or_pos_topo_vect, self.line_ex_pos_topo_vect)).astype(dt_int)
+            cols = np.concatenate((pairs_j[same_bus], pairs_i[same_bus],
+                                   self.line_ex_pos_topo_vect, self.line_or_pos_topo_vect)).astype(dt_int)
+            self._connectivity_edges = (rows, cols)
+        return self._connectivity_edges
+
+    @staticmethod
+    def _check_matrix_format(as_csr_matrix, as_edge_list):
+        if as_csr_matrix and as_edge_list:
+            raise Grid2OpException("Impossible to retrieve the matrix both as a csr matrix and as an edge list.")
+
+    @staticmethod
+    def _to_csr_matrix(rows, cols, size):
+        """build the (size, size) csr matrix with 1. at (rows, cols), duplicates are removed"""
+        lin_idx = np.unique(rows.astype(np.int64) * size + cols)  # sorted by rows then by cols
+        indices = lin_idx % size
+        indptr = np.zeros(size + 1, dtype=np.int64)
+        np.cumsum(np.bincount(lin_idx // size, minlength=size), out=indptr[1:])
+        return csr_matrix((np.ones(lin_idx.shape[0], dtype=dt_float), indices, indptr), shape=(size, size))
+
+    def connectivity_matrix(self, as_csr_matrix=False, as_edge_list=False):
         """
         Computes and return the "connectivity matrix" `con_mat`.
         if "dim_topo = 2 * n_line + n_prod + n_conso"
@@ -262,40 +349,60 @@ class CompleteObservation(BaseObservation):
 
         By definition, the diagonal is made of 0.
 
+        Parameters
+        ----------
+        as_csr_matrix: ``bool``
+            Whether to return the matrix as a :class:`scipy.sparse.csr_matrix` (default ``False``)
+
+        as_edge_list: ``bool``
+            Whether to return the matrix as an "edge list", a matrix of shape (2, number of non zero elements) where
+            `res[0, k]` and `res[1, k]` are the row and the column of the k-th non zero element (default ``False``).
+            Both directions of each connection are given, as the matrix is symmetric.
+
         Returns
         -------
         res: ``numpy.ndarray``, shape:dim_topo,dim_topo, dtype:float
             The connectivity matrix, as defined above
 
         """
+        self._check_matrix_format(as_csr_matrix, as_edge_list)
+        rows, cols = self._get_conn_edges()
+        if as_edge_list:
+            return np.vstack((rows, cols))
+        if as_csr_matrix:
+            return self._to_csr_matrix(rows, cols, self.dim_topo)
         if self.connectivity_matrix_ is None:
             self.connectivity_matrix_ = np.zeros(shape=(self.dim_topo, self.dim_topo), dtype=dt_float)
-            # fill it by block for the objects
-            beg_ = 0
-            end_ = 0
-            for sub_id, nb_obj in enumerate(self.sub_info):
-                # it must be a vanilla python integer, otherwise it's not handled by some backend
-                # especially if written in c++
-                nb_obj = int(nb_obj)
-                end_ += nb_obj
-                tmp = np.zeros(shape=(nb_obj, nb_obj), dtype=dt_float)
-                for obj1 in range(nb_obj):
-                    for obj2 in range(obj1+1, nb_obj):
-                        if self.topo_vect[beg_+obj1] == self.topo_vect[beg_+obj2]:
-                            # objects are on the same bus
-                            tmp[obj1, obj2] = 1
-                            tmp[obj2, obj1] = 1
-
-                self.connectivity_matrix_[beg_:end_, beg_:end_] = tmp
-                beg_ += nb_obj
-            # connect the objects together with the lines (both ends of a lines are connected together)
-            for q_id in range(self.n_line):
-                self.connectivity_matrix_[self.line_or_pos_topo_vect[q_id], self.line_ex_pos_topo_vect[q_id]] = 1
-                self.connectivity_matrix_[self.line_ex_pos_topo_vect[q_id], self.line_or_pos_topo_vect[q_id]] = 1
-
+            self.connectivity_matrix_[rows, cols] = 1.
         return self.connectivity_matrix_
 
-    def bus_connectivity_matrix(self):
+    def _get_bus_conn_edges(self):
+        """
+        Computes the number of buses, and the non zero elements of the bus connectivity matrix
+        (see :func:`CompleteObservation.bus_connectivity_matrix`) as two vectors `rows` and `cols`.
+        """
+        if self._bus_connectivity_edges is None:
+            # computes the number of buses in each substation (disconnected elements are not on any bus)
+            topo_vect = self.topo_vect
+            is_present = np.zeros((self.n_sub, 3), dtype=dt_bool)
+            is_present[self._get_topo_vect_to_sub(), np.maximum(topo_vect, 0)] = True
+            # buses are numbered substation by substation: global id of bus `b` of substation `s` is bus_id[s, b-1]
+            bus_id = np.cumsum(is_present[:, 1:].ravel()).reshape(self.n_sub, 2) - 1
+            nb_bus = int(bus_id[-1, -1] + 1)
+
+            # connect the buses linked by (connected) powerlines
+            bus_or = topo_vect[self.line_or_pos_topo_vect]
+            bus_ex = topo_vect[self.line_ex_pos_topo_vect]
+            connected = (bus_or > 0) & (bus_ex > 0)
+            bus_id_or = bus_id[self.line_or_to_subid[connected], bus_or[connected] - 1]
+            bus_id_ex = bus_id[self.line_ex_to_subid[connected], bus_ex[connected] - 1]
+            diag = np.arange(nb_bus)
+            rows = np.concatenate((diag, bus_id_or, bus_id_ex)).astype(dt_int)
+            cols = np.concatenate((diag, bus_id_ex, bus_id_or)).astype(dt_int)
+            self._bus_connectivity_edges = (nb_bus, rows, cols)
+        return self._bus_connectivity_edges
+
+    def bus_connectivity_matrix(self, as_csr_matrix=False, as_edge_list=False):
         """
         If we denote by `nb_bus` the total number bus of the powergrid.
 
@@ -304,44 +411,29 @@ class CompleteObservation(BaseObservation):
         If `bus_connectivity_matrix[i,j] = 1` then at least a power line connects bus i and bus j.
         Otherwise, nothing connects it.
 
+        Parameters
+        ----------
+        as_csr_matrix: ``bool``
+            Whether to return the matrix as a :class:`scipy.sparse.csr_matrix` (default ``False``)
+
+        as_edge_list: ``bool``
+            Whether to return the matrix as an "edge list" (see :func:`CompleteObservation.connectivity_matrix`).
+            Some connections can be present more than once in this case (*eg* if two powerlines connect the same
+            buses).
+
         Returns
         -------
         res: ``numpy.ndarray``, shape:nb_bus,nb_bus dtype:float
             The bus connectivity matrix
         """
         # TODO voir avec Antoine pour les r,x,h ici !! (surtout les x)
+        self._check_matrix_format(as_csr_matrix, as_edge_list)
+        nb_bus, rows, cols = self._get_bus_conn_edges()
+        if as_edge_list:
+            return np.vstack((rows, cols))
+        if as_csr_matrix:
+            return self._to_csr_matrix(rows, cols, nb_bus)
         if self.bus_connectivity_matrix_ is None:
-            # computes the number of buses in the powergrid.
-            nb_bus = 0
-            nb_bus_per_sub = np.zeros(self.sub_info.shape[0], dtype=dt_int)
-            beg_ = 0
-            end_ = 0
-            for sub_id, nb_obj in enumerate(self.sub_info):
-                nb_obj = int(nb_obj)
-                end_ += nb_obj
-
-                tmp = len(np.unique(self.topo_vect[beg_:end_]))
-                nb_bus_per_sub[sub_id] = tmp
-                nb_bus += tmp
-
-                beg_ += nb_obj
-
-            # define the bus_connectivity_matrix
             self.bus_connectivity_matrix_ = np.zeros(shape=(nb_bus, nb_bus), dtype=dt_float)
-            np.fill_diagonal(self.bus_connectivity_matrix_, 1)
-
-            for q_id in range(self.n_line):
-                bus_or = int(self.topo_vect[self.line_or_pos_topo_vect[q_id]])
-                sub_id_or = int(self.line_or_to_subid[q_id])
-
-                bus_ex = int(self.topo_vect[self.line_ex_pos_topo_vect[q_id]])
-                sub_id_ex = int(self.line_ex_to_subid[q_id])
-
-                # try:
-                bus_id_or = int(np.sum(nb_bus_per_sub[:sub_id_or])+(bus_or-1))
-                bus_id_ex = int(np.sum(nb_bus_per_sub[:sub_id_ex])+(bus_ex-1))
-
-                self.bus_connectivity_matrix_[bus_id_or, bus_id_ex] = 1
-                self.bus_connectivity_matrix_[bus_id_ex, bus_id_or] = 1
+            self.bus_connectivity_matrix_[rows, cols] = 1.
         return self.bus_connectivity_matrix_
-
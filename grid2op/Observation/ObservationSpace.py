@@ -7,7 +7,9 @@
 # This file is part of Grid2Op, Grid2Op a testbed platform to model sequential decision making in power systems.
 
 import copy
+import weakref
 
+from grid2op.Exceptions import NoForecastAvailable
 from grid2op.Observation.SerializableObservationSpace import SerializableObservationSpace
 from grid2op.Reward import RewardHelper
 from grid2op.Observation.CompleteObservation import CompleteObservation
@@ -52,6 +54,10 @@ class ObservationSpace(SerializableObservationSpace):
     _empty_obs: :class:`BaseObservation`
         An instance of the observation with appropriate dimensions. It is updated and will be sent to he BaseAgent.
 
+    _obs_buffer: :class:`BaseObservation`
+        The observation updated at each call when :attr:`grid2op.Parameters.Parameters.REUSE_OBSERVATION` is set
+        (``None`` before its first use).
+
     """
     def __init__(self,
                  gridobj,
@@ -83,11 +89,9 @@ class ObservationSpace(SerializableObservationSpace):
 
         other_rewards = {k: v.rewardClass for k, v in env.other_rewards.items()}
 
-        # TODO here: have another backend maybe
-        self._backend_obs = env.backend.copy()
-
-        _ObsEnv_class = _ObsEnv.init_grid(self._backend_obs)
-        self.obs_env = _ObsEnv_class(backend_instanciated=self._backend_obs,
+        # the backend of the environment is not modified by the _ObsEnv, it copies it only when simulate is used
+        _ObsEnv_class = _ObsEnv.init_grid(env.backend)
+        self.obs_env = _ObsEnv_class(backend_instanciated=env.backend,
                                      obsClass=self.observationClass,
                                      parameters=env.parameters,
                                      reward_helper=self.reward_helper,
@@ -106,6 +110,13 @@ class ObservationSpace(SerializableObservationSpace):
         self._empty_obs = self.observationClass(obs_env=self.obs_env,
                                                 action_helper=self.action_helper_env)
         self._update_env_time = 0.
+        # shared among all the observations, to speed up the computation of the connectivity matrices
+        self._connectivity_cache = {}
+
+        # used when the parameters "REUSE_OBSERVATION" is set
+        self._obs_buffer = None
+        self._nb_obs = 0  # number of observations built, to know if the forecasts of one can still be computed
+        self._lazy_env = None
 
     def reset_space(self):
         if self.with_forecast:
@@ -113,17 +124,60 @@ class ObservationSpace(SerializableObservationSpace):
         self.action_helper_env.actionClass.reset_space()
 
     def __call__(self, env):
+        self._nb_obs += 1
+        if env.parameters.REUSE_OBSERVATION:
+            return self._update_obs_buffer(env)
+
         if self.with_forecast:
             self.obs_env.update_grid(env)
 
         res = self.observationClass(obs_env=self.obs_env,
                                     action_helper=self.action_helper_env)
+        res._connectivity_cache = self._connectivity_cache
 
         # TODO how to make sure that whatever the number of time i call "simulate" i still get the same observations
         # TODO use self.obs_prng when updating actions
         res.update(env=env, with_forecast=self.with_forecast)
         return res
 
+    def _update_obs_buffer(self, env):
+        """
+        Update the observation of this space with the current state of `env` (instead of building a new one). The
+        forecasts (and the state of the environment used by `simulate`) are computed only when they are used, by
+        :func:`ObservationSpace._update_lazy_forecasts`.
+        """
+        if self._obs_buffer is None:
+            self._obs_buffer = self.observationClass(obs_env=self.obs_env,
+                                                     action_helper=self.action_helper_env)
+            self._obs_buffer._connectivity_cache = self._connectivity_cache
+        res = self._obs_buffer
+        res.update(env=env, with_forecast=False)
+        if self.with_forecast:
+            self._lazy_env = weakref.ref(env)
+            res._lazy_forecast = (weakref.ref(self), self._nb_obs)
+        return res
+
+    def _update_lazy_forecasts(self, obs, obs_id):
+        """
+        Compute the forecasts of the observation `obs` (the `obs_id` th built by this space), and update the
+        environment it uses for `simulate`.
+
+        Raises
+        ------
+        :class:`grid2op.Exceptions.NoForecastAvailable`
+            If the environment has changed since `obs` was built (the forecasts can only be computed for the last
+            observation).
+
+        """
+        env = self._lazy_env() if self._lazy_env is not None else None
+        if obs_id != self._nb_obs or env is None:
+            raise NoForecastAvailable("The forecasts of this observation are not available anymore: the environment "
+                                      "changed since it was built. When \"REUSE_OBSERVATION\" is set, the forecasts "
+                                      "are computed only when they are first used, and only for the last observation.")
+        if obs._obs_env is not None:
+            obs._obs_env.update_grid(env)
+        obs._update_forecasts(env)
+
     def size_obs(self):
         """
         Size if the observation vector would be flatten
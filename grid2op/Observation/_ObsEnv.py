@@ -33,7 +33,13 @@ class _ObsEnv(BaseEnv):
     details.
 
     This class is reserved for internal use. Do not attempt to do anything with it.
+
+    The backend given at initialization (typically the one of the real environment) is never modified by this class.
+    The backend used to perform the simulations is a copy of it, made the first time it is needed.
     """
+    _backend = None
+    _backend_template = None
+
     def __init__(self,
                  backend_instanciated,
                  completeActionClass,
@@ -107,7 +113,8 @@ class _ObsEnv(BaseEnv):
         """
         self.env_dc = self.parameters.FORECAST_DC
         self.chronics_handler = chronics_handler
-        self.backend = backend
+        # the backend given is only read here, it is copied the first time a simulation is performed
+        self._backend = backend
         self._has_been_initialized()
         self.obsClass = observationClass
 
@@ -119,8 +126,9 @@ class _ObsEnv(BaseEnv):
         self.game_rules = RulesChecker(legalActClass=legalActClass)
         self.legalActClass = legalActClass
         self.helper_action_player = self._do_nothing
-        self.backend.set_thermal_limit(self._thermal_limit_a)
         self._create_opponent()
+        self._backend_template = backend
+        self._backend = None
 
         self.gen_activeprod_t_init = np.zeros(self.n_gen, dtype=dt_float)
         self.gen_activeprod_t_redisp_init = np.zeros(self.n_gen, dtype=dt_float)
@@ -137,6 +145,19 @@ class _ObsEnv(BaseEnv):
                                               obs_env=None,
                                               action_helper=None)
         self.current_obs = self.current_obs_init
+        # whether get_obs returns a copy of the observation (it does not when only some of its attributes are used)
+        self._copy_obs = True
+
+    @property
+    def backend(self):
+        if self._backend is None and self._backend_template is not None:
+            self._backend = self._backend_template.copy()
+            self._backend.set_thermal_limit(self._thermal_limit_a)
+        return self._backend
+
+    @backend.setter
+    def backend(self, value):
+        self._backend = value
 
     def _do_nothing(self, x):
         return self._do_nothing_act
@@ -166,11 +187,12 @@ class _ObsEnv(BaseEnv):
         res: :class:`ObsEnv`
             A deep copy of this instance.
         """
-        backend = self.backend
-        self.backend = None
-        res = copy.deepcopy(self)
-        res.backend = backend.copy()
-        self.backend = backend
+        backend = self._backend
+        self._backend = None
+        res = copy.deepcopy(self, {id(self._backend_template): self._backend_template})
+        if backend is not None:
+            res._backend = backend.copy()
+        self._backend = backend
         return res
 
     def init(self, new_state_action, time_stamp, timestep_overflow, topo_vect):
@@ -240,7 +262,7 @@ class _ObsEnv(BaseEnv):
         self._backend_action = copy.deepcopy(self._backend_action_set)
         self.oppSpace._set_state(self.opp_space_state, self.opp_state)
 
-    def simulate(self, action):
+    def simulate(self, action, fields=None):
         """
         This function is the core method of the :class:`ObsEnv`. It allows to perform a simulation of what would
         give and action if it were to be implemented on the "forecasted" powergrid.
@@ -257,10 +279,14 @@ class _ObsEnv(BaseEnv):
         action: :class:`grid2op.Action.Action`
             The action to test
 
+        fields: ``list``, optional
+            The attributes of the observation to return (all of them if ``None``)
+
         Returns
         -------
         observation: :class:`grid2op.Observation.Observation`
-            agent's observation of the current environment
+            agent's observation of the current environment (not linked to this environment), or a dictionary
+            with its attributes `fields` (copied) if `fields` is not ``None``
 
         reward: ``float``
             amount of reward returned after previous action
@@ -280,7 +306,18 @@ class _ObsEnv(BaseEnv):
         """
         self._reset_to_orig_state()
         # TODO set back the "change" to True
-        obs, reward, done, info = self.step(action)
+        self._copy_obs = fields is None
+        try:
+            obs, reward, done, info = self.step(action)
+        finally:
+            self._copy_obs = True
+            # the observation returned must not be modified by the next simulation
+            self.current_obs = self.current_obs_init
+        if fields is not None:
+            obs = {attr_nm: copy.copy(getattr(obs, attr_nm)) for attr_nm in fields}
+        elif obs is self.current_obs_init:
+            # the observation has not been computed (eg the powerflow diverged), this one is used internally
+            obs = obs._detached_copy()
         return obs, reward, done, info
 
     def get_obs(self):
@@ -293,7 +330,9 @@ class _ObsEnv(BaseEnv):
             The observation available.
         """
         self.current_obs.update(self, with_forecast=False)
-        res = copy.deepcopy(self.current_obs)
+        if not self._copy_obs:
+            return self.current_obs
+        res = self.current_obs._detached_copy()
         return res
 
     def update_grid(self, env):
@@ -77,6 +77,13 @@ class Parameters:
     IGNORE_MIN_UP_DOWN_TIME: ``bool``
         Whether or not to ignore the attributes `gen_min_uptime` and `gen_min_downtime`. Basically setting this
         parameter to ``True``
+
+    REUSE_OBSERVATION: ``bool``
+        If ``True`` the observation space updates the same observation at each step instead of building a new one
+        (so an observation returned by the environment is modified by the next call to `step` or `reset`: use
+        `obs.copy()` to keep it) and the forecasts are computed only when `obs.simulate` or `obs.get_forecasted_inj`
+        are called, and only for the last observation. This speeds up the environment for the agents that do not use
+        the forecasts. Default is ``False``.
     """
     def __init__(self, parameters_path=None):
         """
@@ -126,6 +133,9 @@ class Parameters:
         # allow dispatch on turned off generator (if ``True`` you can actually dispatch a turned on geenrator)
         self.ALLOW_DISPATCH_GEN_SWITCH_OFF = True
 
+        # reuse the same observation at each step, and compute the forecasts only when they are used
+        self.REUSE_OBSERVATION = False
+
         if parameters_path is not None:
             if os.path.isfile(parameters_path):
                 self.init_from_json(parameters_path)
@@ -173,6 +183,9 @@ class Parameters:
         if "ALLOW_DISPATCH_GEN_SWITCH_OFF" in dict_:
             self.ALLOW_DISPATCH_GEN_SWITCH_OFF = Parameters._isok_txt(dict_["ALLOW_DISPATCH_GEN_SWITCH_OFF"])
 
+        if "REUSE_OBSERVATION" in dict_:
+            self.REUSE_OBSERVATION = Parameters._isok_txt(dict_["REUSE_OBSERVATION"])
+
         if "NB_TIMESTEP_POWERFLOW_ALLOWED" in dict_:
             self.NB_TIMESTEP_OVERFLOW_ALLOWED = dt_int(dict_["NB_TIMESTEP_POWERFLOW_ALLOWED"])
         if "NB_TIMESTEP_OVERFLOW_ALLOWED" in dict_:
@@ -240,6 +253,7 @@ class Parameters:
         res["MAX_LINE_STATUS_CHANGED"] = int(self.MAX_LINE_STATUS_CHANGED)
         res["NB_TIMESTEP_COOLDOWN_LINE"] = int(self.NB_TIMESTEP_COOLDOWN_LINE)
         res["NB_TIMESTEP_COOLDOWN_SUB"] = int(self.NB_TIMESTEP_COOLDOWN_SUB)
+        res["REUSE_OBSERVATION"] = bool(self.REUSE_OBSERVATION)
         return res
 
     def init_from_json(self, json_path):
@@ -5,6 +5,8 @@
 # you can obtain one at http://mozilla.org/MPL/2.0/.
 # SPDX-License-Identifier: MPL-2.0
 # This file is part of Grid2Op, Grid2Op a testbed platform to model sequential decision making in power systems.
+import os
+import json
 import time
 import warnings
 
@@ -13,6 +15,7 @@ import numpy as np
 import copy
 
 from multiprocessing import Pool
+from multiprocessing.util import Finalize
 
 from grid2op.dtypes import dt_int, dt_float, dt_bool
 from grid2op.Action import BaseAction, TopologyAction, DontAct
@@ -36,6 +39,10 @@ from grid2op.Opponent import BaseOpponent, NeverAttackBudget
 # so i force the usage of the "starmap" stuff even if there is one process on windows
 _IS_WINDOWS = sys.platform.startswith('win')
 
+# state of a process of the parallel runner: the runner it plays the episodes of, and its environment and agent once
+# they are built (see :func:`Runner._init_worker`)
+_WORKER_CONTEXT = {}
+
 # TODO have a vectorized implementation of everything in case the agent is able to act on multiple environment
 # at the same time. This might require a lot of work, but would be totally worth it! (especially for Neural Net based agents)
 
@@ -255,7 +262,8 @@ class Runner(object):
                  opponent_attack_cooldown=99999,
                  opponent_kwargs={},
                  grid_layout=None,
-                 with_forecast=True):
+                 with_forecast=True,
+                 step_profiler_class=None):
         """
         Initialize the Runner.
 
@@ -312,10 +320,17 @@ class Runner(object):
         voltagecontrolerClass: :class:`grid2op.VoltageControler.ControlVoltageFromFile`, optional
             The controler that will change the voltage setpoints of the generators.
 
+        step_profiler_class: ``type``, optional
+            If not ``None``, each environment used by the runner has a step profiler of this class (for example
+            :class:`grid2op.Environment.StepProfiler`). The data it recorded during each episode are saved with the
+            other data of the episode (see :class:`grid2op.Episode.EpisodeData`). Default to ``None``: the steps are
+            not profiled.
+
         # TODO documentation on the opponent
         """
         self.with_forecast = with_forecast
         self.name_env = name_env
+        self.step_profiler_class = step_profiler_class
         if not isinstance(envClass, type):
             raise Grid2OpException(
                 "Parameter \"envClass\" used to build the Runner should be a type (a class) and not an object "
@@ -528,6 +543,9 @@ class Runner(object):
         if self.grid_layout is not None:
             res.attach_layout(self.grid_layout)
 
+        if self.step_profiler_class is not None:
+            res.set_step_profiler(self.step_profiler_class())
+
         if self._useclass:
             agent = self.agentClass(res.helper_action_player)
         else:
@@ -804,60 +822,181 @@ class Runner(object):
 
         next_pbar = [False]
         with self._make_progress_bar(pbar, nb_episode, next_pbar) as pbar_:
-            for i in range(nb_episode):
-                env_seed = None
-                if env_seeds is not None:
-                    env_seed = env_seeds[i]
-                agt_seed = None
-                if agent_seeds is not None:
-                    agt_seed = agent_seeds[i]
-                name_chron, cum_reward, nb_time_step = self.run_one_episode(path_save=path_save,
-                                                                            indx=i,
-                                                                            pbar=next_pbar[0],
-                                                                            env_seed=env_seed,
-                                                                            agent_seed=agt_seed,
-                                                                            max_iter=max_iter)
-                id_chron = self.chronics_handler.get_id()
-                max_ts = self.chronics_handler.max_timestep()
-                res[i] = (id_chron, name_chron, float(cum_reward), nb_time_step, max_ts)
+            for i, res_episode in self._iter_sequential(range(nb_episode), path_save=path_save, pbar=next_pbar[0],
+                                                        env_seeds=env_seeds, agent_seeds=agent_seeds,
+                                                        max_iter=max_iter):
+                res[i] = res_episode
                 pbar_.update(1)
         return res
 
-    @staticmethod
-    def _one_process_parrallel(runner, episode_this_process, process_id, path_save=None,
-                               env_seeds=None, max_iter=None, agent_seeds=None):
-        chronics_handler = ChronicsHandler(chronicsClass=runner.gridStateclass,
-                                           path=runner.path_chron,
-                                           **runner.gridStateclass_kwargs)
-        parameters = copy.deepcopy(runner.parameters)
-        backend = runner.backendClass()
-        nb_episode_this_process = len(episode_this_process)
-        res = [(None, None, None) for _ in range(nb_episode_this_process)]
-        for i, p_id in enumerate(episode_this_process):
-            env, agent = runner._new_env(chronics_handler=chronics_handler,
-                                         backend=backend,
-                                         parameters=parameters)
+    def _iter_sequential(self, episodes, path_save=None, pbar=False, env_seeds=None, agent_seeds=None, max_iter=None):
+        """
+        Play the episodes whose ids are in `episodes`, one after the other, in the runner process. It yields the id of
+        each episode and its result (see :func:`Runner.run_sequential`) as soon as the episode is over.
+
+        `pbar` is the progress bar used for the steps of each episode.
+        """
+        for i in episodes:
             env_seed = None
             if env_seeds is not None:
                 env_seed = env_seeds[i]
             agt_seed = None
             if agent_seeds is not None:
                 agt_seed = agent_seeds[i]
-            name_chron, cum_reward, nb_time_step = Runner._run_one_episode(
-                env, agent, runner.logger, p_id, path_save, env_seed=env_seed, max_iter=max_iter, agent_seed=agt_seed)
-            id_chron = chronics_handler.get_id()
-            max_ts = chronics_handler.max_timestep()
-            res[i] = (id_chron, name_chron, float(cum_reward), nb_time_step, max_ts)
+            name_chron, cum_reward, nb_time_step = self.run_one_episode(path_save=path_save,
+                                                                        indx=i,
+                                                                        pbar=pbar,
+                                                                        env_seed=env_seed,
+                                                                        agent_seed=agt_seed,
+                                                                        max_iter=max_iter)
+            id_chron = self.chronics_handler.get_id()
+            max_ts = self.chronics_handler.max_timestep()
+            yield i, (id_chron, name_chron, float(cum_reward), nb_time_step, max_ts)
+
+    @staticmethod
+    def _init_worker(runner):
+        """initializer of the processes used by :func:`Runner._run_parrallel`"""
+        _WORKER_CONTEXT.clear()
+        _WORKER_CONTEXT["runner"] = runner
+        # the environment of the process is closed when the process exits
+        Finalize(None, Runner._close_worker, exitpriority=10)
+
+    @staticmethod
+    def _close_worker():
+        """close the environment of a process of the parallel runner (if it has been built)"""
+        env = _WORKER_CONTEXT.pop("env", None)
+        _WORKER_CONTEXT.clear()
+        if env is not None:
+            env.close()
+
+    @staticmethod
+    def _run_one_episode_worker(args):
+        """
+        Play one episode in a process of the parallel runner. The environment (and the agent) of the process is built
+        when it plays its first episode, and is reset for the next ones.
+
+        Returns the id of the episode, and its result (as returned by :func:`Runner.run_sequential`)
+        """
+        p_id, path_save, env_seed, max_iter, agent_seed = args
+        runner = _WORKER_CONTEXT["runner"]
+        if "env" not in _WORKER_CONTEXT:
+            chronics_handler = ChronicsHandler(chronicsClass=runner.gridStateclass,
+                                               path=runner.path_chron,
+                                               **runner.gridStateclass_kwargs)
+            _WORKER_CONTEXT["env"], _WORKER_CONTEXT["agent"] = runner._new_env(
+                chronics_handler=chronics_handler,
+                backend=runner.backendClass(),
+                parameters=copy.deepcopy(runner.parameters))
+        env = _WORKER_CONTEXT["env"]
+        agent = _WORKER_CONTEXT["agent"]
+        name_chron, cum_reward, nb_time_step = Runner._run_one_episode(
+            env, agent, runner.logger, p_id, path_save, env_seed=env_seed, max_iter=max_iter, agent_seed=agent_seed)
+        id_chron = env.chronics_handler.get_id()
+        max_ts = env.chronics_handler.max_timestep()
+        return p_id, (id_chron, name_chron, float(cum_reward), nb_time_step, max_ts)
+
+    def _iter_chronics(self, nb_episode, max_iter=None, load=True):
+        """
+        Yields the id of each of the `nb_episode` first episodes, and a chronics handler set to the chronics of this
+        episode (in the same way as in :func:`Runner._run_one_episode`). If `load` is ``False``, the data of
+        the chronics are not loaded, only its id is known.
+        """
+        if self.env is None:
+            self.init_env()
+        backend = self.env.backend
+        chronics_handler = ChronicsHandler(chronicsClass=self.gridStateclass,
+                                           path=self.path_chron,
+                                           **self.gridStateclass_kwargs)
+        chronics_args = (backend.name_load, backend.name_gen, backend.name_line, backend.name_sub)
+        chronics_handler.initialize(*chronics_args, names_chronics_to_backend=self.names_chronics_to_backend)
+        for i in range(nb_episode):
+            # same as in `Runner._run_one_episode`
+            chronics_handler.tell_id(i - 1)
+            if max_iter is not None:
+                chronics_handler.set_max_iter(max_iter)
+            chronics_handler.next_chronics()
+            if load:
+                chronics_handler.initialize(*chronics_args, names_chronics_to_backend=self.names_chronics_to_backend)
+            yield i, chronics_handler
+
+    def _get_max_timesteps(self, nb_episode, max_iter=None):
+        """
+        Maximum duration of each of the `nb_episode` first episodes (as given by :func:`GridValue.max_timestep`,
+        ``-1`` if it is possibly infinite). The chronics of all these episodes are loaded.
+        """
+        res = np.zeros(nb_episode, dtype=dt_int)
+        for i, chronics_handler in self._iter_chronics(nb_episode, max_iter=max_iter):
+            res[i] = chronics_handler.max_timestep()
         return res
 
-    def _run_parrallel(self, nb_episode, nb_process=1, path_save=None, env_seeds=None, agent_seeds=None, max_iter=None):
+    def _get_episode_names(self, nb_episode):
+        """name of the chronics of each of the `nb_episode` first episodes (see :func:`ChronicsHandler.get_name`)"""
+        return [chronics_handler.get_name() for _, chronics_handler in self._iter_chronics(nb_episode, load=False)]
+
+    @staticmethod
+    def _read_episode_result(path_save, name_chron):
+        """
+        Result of an episode (see :func:`Runner.run_sequential`) read from the data saved by :class:`EpisodeData`
+        in `path_save`, or ``None`` if this episode has not been (completely) saved there.
+        """
+        meta_path = os.path.join(os.path.abspath(path_save), name_chron, EpisodeData.META)
+        if not os.path.exists(meta_path):
+            return None
+        with open(meta_path, "r") as f:
+            meta = json.load(fp=f)
+        return (meta["chronics_path"], name_chron, float(meta["cumulative_reward"]),
+                int(meta["nb_timestep_played"]), int(meta["chronics_max_timestep"]))
+
+    def _get_episode_order(self, nb_episode, longest_first=False, max_iter=None):
+        """order in which the episodes are played by the parallel runner"""
+        if not longest_first:
+            return list(range(nb_episode))
+        max_ts = self._get_max_timesteps(nb_episode, max_iter=max_iter).astype(dt_float)
+        max_ts[max_ts < 0] = np.inf
+        return [int(el) for el in np.argsort(-max_ts, kind="stable")]
+
+    def _iter_parrallel(self, nb_episode, nb_process, path_save=None, env_seeds=None, agent_seeds=None,
+                        max_iter=None, longest_first=False, episodes=None):
+        """
+        Play the episodes in `nb_process` processes, each process plays the next episode as soon as it is free. It
+        yields the id of each episode and its result as soon as the episode is over.
+
+        If `episodes` is not ``None``, only the episodes whose ids are in it are played.
+        """
+        order = self._get_episode_order(nb_episode, longest_first=longest_first, max_iter=max_iter)
+        if episodes is not None:
+            episodes = set(episodes)
+            order = [p_id for p_id in order if p_id in episodes]
+        self._clean_up()
+        self.backend = self.backendClass()
+
+        tasks = [(p_id,
+                  path_save,
+                  env_seeds[p_id] if env_seeds is not None else None,
+                  max_iter,
+                  agent_seeds[p_id] if agent_seeds is not None else None)
+                 for p_id in order]
+        with Pool(int(nb_process), initializer=Runner._init_worker, initargs=(self,)) as p:
+            for p_id, res in p.imap_unordered(Runner._run_one_episode_worker, tasks, chunksize=1):
+                yield p_id, res
+            # the processes exit normally (and not terminated), so that they close their environment
+            p.close()
+            p.join()
+
+    def _run_parrallel(self, nb_episode, nb_process=1, path_save=None, env_seeds=None, agent_seeds=None,
+                       max_iter=None, pbar=False, longest_first=False):
         """
         This method will run in parrallel, independantly the nb_episode over nb_process.
 
         In case the agent cannot be cloned using `copy.copy`: nb_process is set to 1
 
         Note that it restarts completely the :attr:`Runner.backend` and :attr:`Runner.env` if the computation
-        is actually performed with more than 1 cores (nb_process > 1)
+        is actually performed with more than 1 cores (nb_process > 1). Each process builds its own environment (and
+        agent) once, and resets it at the beginning of each of its episodes, as :func:`Runner.run_sequential` does.
+
+        The episodes are not split in advance between the processes: each process plays the next episode (not yet
+        played) as soon as it has finished the previous one. This way, the processes are kept busy even if the
+        episodes have very different durations.
 
         It uses the python multiprocess, and especially the :class:`multiprocess.Pool` to perform the computations.
         This implies that all runs are completely independant (they happen in different process) and that the
@@ -886,13 +1025,24 @@ class Runner(object):
             If provided, its size should match the ``nb_episode``. The agent will be seeded at the beginning of each
             scenario BEFORE calling `agent.reset()`.
 
+        pbar: ``bool`` or ``type`` or ``object``
+            How to display the progress bar (see :func:`Runner.run_sequential`). It is updated each time an episode is
+            over.
+
+        longest_first: ``bool``
+            Whether to play the longest episodes (according to the maximum duration of their chronics, see
+            :func:`grid2op.Chronics.GridValue.max_timestep`) first. This avoids that a long episode is started last,
+            when the other processes have nothing left to do. The chronics of all the episodes are loaded (once)
+            to know their durations. Default to ``False``: the episodes are started in their order.
+
         Returns
         -------
         res: ``list``
-            List of tuple. Each tuple having 3 elements:
+            List of tuple, one per episode, in the same order as for :func:`Runner.run_sequential`. Each tuple having
+            5 elements:
 
-              - "i" unique identifier of the episode (compared to :func:`Runner.run_sequential`, the elements of the
-                returned list are not necessarily sorted by this value)
+              - "id_chron" unique identifier of the episode
+              - "name_chron" name of chronics
               - "cum_reward" the cumulative reward obtained by the :attr:`Runner.BaseAgent` on this episode i
               - "nb_time_step": the number of time steps played in this episode.
               - "max_ts" : the maximum number of time steps of the chronics
@@ -906,38 +1056,17 @@ class Runner(object):
             # if i start using parallel i need to continue using parallel
             # so i force the usage of the sequential mode
             self.logger.warn("Runner.run_parrallel: number of process set to 1. Failing back into sequential mod.")
-            return self._run_sequential(nb_episode, path_save=path_save, env_seeds=env_seeds, agent_seeds=agent_seeds)
-        else:
-            self._clean_up()
-            self.backend = self.backendClass()
-
-            nb_process = int(nb_process)
-            process_ids = [[] for i in range(nb_process)]
-            for i in range(nb_episode):
-                process_ids[i % nb_process].append(i)
-
-            if env_seeds is None:
-                seeds_res = [None for _ in range(nb_process)]
-            else:
-                # split the seeds according to the process
-                seeds_res = [[] for i in range(nb_process)]
-                for i in range(nb_episode):
-                    seeds_res[i % nb_process].append(env_seeds[i])
+            return self._run_sequential(nb_episode, path_save=path_save, env_seeds=env_seeds, agent_seeds=agent_seeds,
+                                        max_iter=max_iter, pbar=pbar)
 
-            if agent_seeds is None:
-                seeds_agt_res = [None for _ in range(nb_process)]
-            else:
-                # split the seeds according to the process
-                seeds_agt_res = [[] for i in range(nb_process)]
-                for i in range(nb_episode):
-                    seeds_agt_res[i % nb_process].append(agent_seeds[i])
-
-            res = []
-            with Pool(nb_process) as p:
-                tmp = p.starmap(Runner._one_process_parrallel,
-                                [(self, pn, i, path_save, seeds_res[i], max_iter) for i, pn in enumerate(process_ids)])
-            for el in tmp:
-                res += el
+        res = [(None, None, None, None, None) for _ in range(nb_episode)]
+        next_pbar = [False]
+        with self._make_progress_bar(pbar, nb_episode, next_pbar) as pbar_:
+            for p_id, res_episode in self._iter_parrallel(nb_episode, nb_process, path_save=path_save,
+                                                          env_seeds=env_seeds, agent_seeds=agent_seeds,
+                                                          max_iter=max_iter, longest_first=longest_first):
+                res[p_id] = res_episode
+                pbar_.update(1)
         return res
 
     def _clean_up(self):
@@ -946,7 +1075,28 @@ class Runner(object):
             self.env.close()
         self.env = None
 
-    def run(self, nb_episode, nb_process=1, path_save=None, max_iter=None, pbar=False, env_seeds=None, agent_seeds=None):
+    def _check_run_args(self, nb_episode, env_seeds, agent_seeds, max_iter):
+        """check the arguments of :func:`Runner.run` and :func:`Runner.run_iter`, returns `max_iter` as an int"""
+        if nb_episode < 0:
+            raise RuntimeError("Impossible to run a negative number of scenarios.")
+
+        if env_seeds is not None:
+            if len(env_seeds) != nb_episode:
+                raise RuntimeError("You want to compute \"{}\" run(s) but provide only \"{}\" different seeds "
+                                   "(environment)."
+                                   "".format(nb_episode, len(env_seeds)))
+
+        if agent_seeds is not None:
+            if len(agent_seeds) != nb_episode:
+                raise RuntimeError("You want to compute \"{}\" run(s) but provide only \"{}\" different seeds (agent)."
+                                   "".format(nb_episode, len(agent_seeds)))
+
+        if max_iter is not None:
+            max_iter = int(max_iter)
+        return max_iter
+
+    def run(self, nb_episode, nb_process=1, path_save=None, max_iter=None, pbar=False, env_seeds=None, agent_seeds=None,
+            longest_first=False):
         """
         Main method of the :class:`Runner` class. It will either call :func:`Runner.run_sequential` if "nb_process" is
         1 or :func:`Runner.run_parrallel` if nb_process >= 2.
@@ -988,15 +1138,21 @@ class Runner(object):
             If provided, its size should match the ``nb_episode``. The agent will be seeded at the beginning of each
             scenario BEFORE calling `agent.reset()`.
 
+        longest_first: ``bool``
+            Only used if `nb_process` > 1. Whether to start with the episodes that can last the longest (see
+            :func:`Runner.run_parrallel`). Default to ``False``.
+
         Returns
         -------
         res: ``list``
-            List of tuple. Each tuple having 3 elements:
+            List of tuple, one per episode (in the same order whatever the number of processes). Each tuple having
+            5 elements:
 
-              - "i" unique identifier of the episode (compared to :func:`Runner.run_sequential`, the elements of the
-                returned list are not necessarily sorted by this value)
+              - "id_chron" unique identifier of the episode
+              - "name_chron" name of chronics
               - "cum_reward" the cumulative reward obtained by the :attr:`Runner.BaseAgent` on this episode i
               - "nb_time_step": the number of time steps played in this episode.
+              - "max_ts" : the maximum number of time steps of the chronics
 
         Examples
         --------
@@ -1043,22 +1199,7 @@ class Runner(object):
             res = runner.run(nb_episode=1, agent_seeds=[42], env_seeds=[0])
 
         """
-        if nb_episode < 0:
-            raise RuntimeError("Impossible to run a negative number of scenarios.")
-
-        if env_seeds is not None:
-            if len(env_seeds) != nb_episode:
-                raise RuntimeError("You want to compute \"{}\" run(s) but provide only \"{}\" different seeds "
-                                   "(environment)."
-                                   "".format(nb_episode, len(env_seeds)))
-
-        if agent_seeds is not None:
-            if len(agent_seeds) != nb_episode:
-                raise RuntimeError("You want to compute \"{}\" run(s) but provide only \"{}\" different seeds (agent)."
-                                   "".format(nb_episode, len(agent_seeds)))
-
-        if max_iter is not None:
-            max_iter = int(max_iter)
+        max_iter = self._check_run_args(nb_episode, env_seeds, agent_seeds, max_iter)
 
         if nb_episode == 0:
             res = []
@@ -1077,7 +1218,155 @@ class Runner(object):
                 else:
                     self.logger.info("Parallel runner used.")
                     res = self._run_parrallel(nb_episode, nb_process=nb_process, path_save=path_save,
-                                              env_seeds=env_seeds, max_iter=max_iter, agent_seeds=agent_seeds)
+                                              env_seeds=env_seeds, max_iter=max_iter, agent_seeds=agent_seeds,
+                                              pbar=pbar, longest_first=longest_first)
             finally:
                 self._clean_up()
         return res
+
+    def run_iter(self, nb_episode, nb_process=1, path_save=None, max_iter=None, pbar=False, env_seeds=None,
+                 agent_seeds=None, longest_first=False, resume=False, add_episode_path=False):
+        """
+        Same as :func:`Runner.run` but, instead of returning all the results once all the episodes are over, it yields
+        the result of each episode as soon as it is over. The results can then be processed (aggregated, saved etc.)
+        while the other episodes are being played.
+
+        When the episodes are played in parallel (`nb_process` > 1), the results are yielded in the order in which
+        the episodes end, which is not necessarily the order of the episodes.
+
+        Parameters
+        ----------
+        nb_episode: ``int``
+            Number of episode to simulate
+
+        nb_process: ``int``, optional
+            Number of process used to play the nb_episode. Default to 1. See :func:`Runner.run`
+
+        path_save: ``str``, optional
+            If not None, it specifies where to store the data. See the description of this module :mod:`Runner` for
+            more information
+
+        max_iter: ``int``
+            Maximum number of iteration you want the runner to perform.
+
+        pbar: ``bool`` or ``type`` or ``object``
+            How to display the progress bar, see :func:`Runner.run`
+
+        env_seeds: ``list``
+            An iterable of the seed used for the environment. By default ``None``, no seeds are set. If provided,
+            its size should match ``nb_episode``.
+
+        agent_seeds: ``list``
+            An iterable that contains the seed used for the environment. By default ``None`` means no seeds are set.
+            If provided, its size should match the ``nb_episode``.
+
+        longest_first: ``bool``
+            Only used if `nb_process` > 1. Whether to start with the episodes that can last the longest (see
+            :func:`Runner.run_parrallel`). Default to ``False``.
+
+        resume: ``bool``
+            If ``True``, the episodes already saved in `path_save` (for example by a previous call to this function
+            that has been interrupted) are not played again: their results are read from the disk, and yielded first.
+            An episode is considered saved if the "episode_meta.json" file (see :class:`grid2op.Episode.EpisodeData`)
+            of its chronics exists. It requires `path_save` to be set. Default to ``False``.
+
+        add_episode_path: ``bool``
+            Whether to also yield the path where the data of the episode are stored (``None`` if `path_save` is
+            ``None``). Default to ``False``.
+
+        Yields
+        ------
+        episode_id: ``int``
+            The id of the episode (between 0 and `nb_episode` - 1): the result would be the element `episode_id` of the
+            list returned by :func:`Runner.run`
+
+        res: ``tuple``
+            The result of this episode, with the 5 elements:
+
+              - "id_chron" unique identifier of the episode
+              - "name_chron" name of chronics
+              - "cum_reward" the cumulative reward obtained by the :attr:`Runner.BaseAgent` on this episode i
+              - "nb_time_step": the number of time steps played in this episode.
+              - "max_ts" : the maximum number of time steps of the chronics
+
+        episode_path: ``str``
+            Only if `add_episode_path` is ``True``: the path where the :class:`grid2op.Episode.EpisodeData` of this
+            episode is stored.
+
+        Examples
+        --------
+
+        .. code-block: python
+
+            import grid2op
+            from gri2op.Runner import Runner
+            from grid2op.Agent import RandomAgent
+
+            env = grid2op.make()
+            runner = Runner(**env.get_params_for_runner(), agentClass=RandomAgent)
+            for episode_id, (id_chron, name_chron, cum_reward, nb_time_step, max_ts) in runner.run_iter(nb_episode=10,
+                                                                                                        nb_process=2):
+                print("Episode {} is over: cumulative reward {:.2f}".format(episode_id, cum_reward))
+
+        If the computation is interrupted, it can be resumed by calling it again with the same `path_save`:
+
+        .. code-block: python
+
+            for episode_id, res in runner.run_iter(nb_episode=10, nb_process=2, path_save="saved_agent", resume=True):
+                # the results of the episodes that were already over are given first
+                ...
+
+        """
+        max_iter = self._check_run_args(nb_episode, env_seeds, agent_seeds, max_iter)
+        if nb_process <= 0:
+            raise RuntimeError("Impossible to run using less than 1 process.")
+        if resume and path_save is None:
+            raise RuntimeError("Impossible to resume the computation if the episodes are not saved "
+                               "(\"path_save\" is None).")
+        if nb_episode == 0:
+            return
+
+        try:
+            episodes = list(range(nb_episode))
+            names = None
+            if resume or (add_episode_path and path_save is not None):
+                names = self._get_episode_names(nb_episode)
+
+            def _make_res(p_id, res_episode):
+                if not add_episode_path:
+                    return p_id, res_episode
+                episode_path = None
+                if path_save is not None:
+                    episode_path = os.path.join(os.path.abspath(path_save), names[p_id])
+                return p_id, res_episode, episode_path
+
+            next_pbar = [False]
+            with self._make_progress_bar(pbar, nb_episode, next_pbar) as pbar_:
+                if resume:
+                    to_play = []
+                    for p_id in episodes:
+                        res_episode = self._read_episode_result(path_save, names[p_id])
+                        if res_episode is None:
+                            to_play.append(p_id)
+                        else:
+                            pbar_.update(1)
+                            yield _make_res(p_id, res_episode)
+                    episodes = to_play
+
+                if not episodes:
+                    iter_ = []
+                elif _IS_WINDOWS or nb_process == 1 or self.__can_copy_agent is False:
+                    if nb_process > 1:
+                        self.logger.warn("Runner.run_iter: number of process set to 1. Failing back into "
+                                         "sequential mod.")
+                    iter_ = self._iter_sequential(episodes, path_save=path_save, pbar=next_pbar[0],
+                                                  env_seeds=env_seeds, agent_seeds=agent_seeds, max_iter=max_iter)
+                else:
+                    iter_ = self._iter_parrallel(nb_episode, nb_process, path_save=path_save, env_seeds=env_seeds,
+                                                 agent_seeds=agent_seeds, max_iter=max_iter,
+                                                 longest_first=longest_first, episodes=episodes)
+                for p_id, res_episode in iter_:
+                    pbar_.update(1)
+                    yield _make_res(p_id, res_episode)
+        finally:
+            self._clean_up()
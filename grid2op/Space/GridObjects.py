@@ -345,6 +345,11 @@ class GridObjects:
     shunt_to_subid: :class:`numpy.ndarray`, dtype:int
         for each shunt (if supported), gives the id the substation to which it is connected
 
+    _topo_vect_to_sub: :class:`numpy.ndarray`, dtype:int
+        For each element of the topology vector, gives the id of the substation to which it is connected. It is
+        computed once in :func:`GridObjects.init_grid` (it is ``None`` for classes that have not been initialized this
+        way).
+
     """
     attr_list_vect = None
     attr_list_set = {}
@@ -385,6 +390,9 @@ class GridObjects:
     line_or_pos_topo_vect = None
     line_ex_pos_topo_vect = None
 
+    # to which substation is connected each element of the topology vector
+    _topo_vect_to_sub = None
+
     # list of attribute to convert it from/to a vector
     _vectorized = None
 
@@ -1145,6 +1153,7 @@ class GridObjects:
         res.gen_pos_topo_vect = gridobj.gen_pos_topo_vect
         res.line_or_pos_topo_vect = gridobj.line_or_pos_topo_vect
         res.line_ex_pos_topo_vect = gridobj.line_ex_pos_topo_vect
+        res._topo_vect_to_sub = np.repeat(np.arange(res.n_sub), repeats=res.sub_info)
 
         # for redispatching / unit commitment (not available for all environment)
         res.gen_type = gridobj.gen_type
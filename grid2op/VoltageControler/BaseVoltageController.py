@@ -36,6 +36,13 @@ class BaseVoltageController(RandomObject, ABC):
     chronics.
 
     If the voltages are not on the chronics (missing files), it will not change the voltage setpoints at all.
+
+    Attributes
+    ----------
+    backend: :class:`grid2op.Backend.Backend`
+        A backend that can be used to perform some computation before setting the voltages. It is a copy of the
+        backend given at initialization, made only the first time this attribute is accessed (the backend given at
+        initialization is never modified by this class).
     """
     def __init__(self, gridobj, controler_backend):
         """
@@ -54,7 +61,18 @@ class BaseVoltageController(RandomObject, ABC):
         self.action_space = ActionSpace(gridobj=gridobj,
                                         actionClass=VoltageOnlyAction,
                                         legal_action=legal_act)
-        self.backend = controler_backend.copy()
+        self._backend_template = controler_backend
+        self._backend = None
+
+    @property
+    def backend(self):
+        if self._backend is None and self._backend_template is not None:
+            self._backend = self._backend_template.copy()
+        return self._backend
+
+    @backend.setter
+    def backend(self, value):
+        self._backend = value
 
     def attach_layout(self, grid_layout):
         self.action_space.attach_layout(grid_layout)
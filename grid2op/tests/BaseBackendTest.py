@@ -343,6 +343,28 @@ class BaseTestLoadingBackendFunc(MakeBackend):
             assert not flows[i]
             assert np.sum(~flows) == 1
 
+    def test_disconnect_lines(self):
+        self.skip_if_needed()
+        conv = self.backend.runpf()
+        assert conv
+        # both "true" powerlines and transformers
+        ids = np.array([0, 5, self.backend.n_line - 1])
+        backend_cpy = self.backend.copy()
+        backend_cpy._disconnect_lines(ids)
+        conv = backend_cpy.runpf()
+        assert conv, "Power flow computation does not converge if lines {} are removed".format(ids)
+        flows = backend_cpy.get_line_status()
+        assert np.all(~flows[ids])
+        assert np.sum(~flows) == ids.shape[0]
+
+        # same results as disconnecting the powerlines one by one
+        backend_cpy2 = self.backend.copy()
+        for id_ in ids:
+            backend_cpy2._disconnect_line(id_)
+        conv = backend_cpy2.runpf()
+        assert conv
+        assert self.compare_vect(backend_cpy.get_line_flow(), backend_cpy2.get_line_flow())
+
     def test_donothing_action(self):
         self.skip_if_needed()
         conv = self.backend.runpf()
@@ -1057,9 +1079,9 @@ class BaseTestEnvPerformsCorrectCascadingFailures(MakeBackend):
         assert disco[self.id_2nd_line_disco]
         assert np.sum(disco) == 2
         for i, grid_tmp in enumerate(infos):
-            assert (not grid_tmp.get_line_status()[self.id_first_line_disco])
+            assert (not grid_tmp["line_status"][self.id_first_line_disco])
             if i == 1:
-                assert (not grid_tmp.get_line_status()[self.id_2nd_line_disco])
+                assert (not grid_tmp["line_status"][self.id_2nd_line_disco])
 
 
 class BaseTestChangeBusAffectRightBus(MakeBackend):
@@ -20,6 +20,7 @@ from grid2op.tests.helper_path_test import *
 from grid2op.dtypes import dt_int, dt_float, dt_bool
 from grid2op.Exceptions import *
 from grid2op.Action import *
+from grid2op.Action._BackendAction import ValueStore
 from grid2op.Rules import RulesChecker, DefaultRules
 from grid2op.Space import GridObjects
 from grid2op.Space.space_utils import save_to_dict
@@ -393,6 +394,53 @@ class TestActionBase(ABC):
         except InvalidLineStatus as e:
             pass
 
+    def test_ambiguity_cached(self):
+        self._skipMissingKey('set_bus')
+        self._skipMissingKey('change_bus')
+
+        action = self.helper_action({"change_bus": {"lines_or_id": [1]}})
+        ambiguous, _ = action.is_ambiguous()
+        assert not ambiguous
+        assert action._ambiguity_checked is not None
+        # a second check does not need the full validation
+        ambiguous, _ = action.is_ambiguous()
+        assert not ambiguous
+
+        # modifying the action invalidates the previous check
+        action.update({"set_bus": {"lines_or_id": [(1, 1)]}})
+        assert action._ambiguity_checked is None
+        ambiguous, except_ = action.is_ambiguous()
+        assert ambiguous
+        assert isinstance(except_, InvalidBusStatus)
+
+        # and so does the addition of another action
+        action.reset()
+        ambiguous, _ = action.is_ambiguous()
+        assert not ambiguous
+        action += self.helper_action({"set_bus": {"lines_or_id": [(1, 3)]}})
+        ambiguous, except_ = action.is_ambiguous()
+        assert ambiguous
+        assert isinstance(except_, InvalidBusStatus)
+
+    def test_set_redispatch_invalidates_cache(self):
+        action = self.helper_action({})
+        action.to_vect()
+        ambiguous, _ = action.is_ambiguous()
+        assert not ambiguous
+        assert action._vectorized is not None
+        assert action._ambiguity_checked is not None
+
+        # the same values: what is cached is still valid
+        action._set_redispatch(0.)
+        assert action._vectorized is not None
+        assert action._ambiguity_checked is not None
+
+        new_redisp = np.arange(action.n_gen, dtype=dt_float)
+        action._set_redispatch(new_redisp)
+        assert np.all(action._redispatch == new_redisp)
+        assert action._vectorized is None
+        assert action._ambiguity_checked is None
+
     def test_ambiguity_line_reconnected_without_bus(self):
         self.skipTest("deprecated with backend action")
         self._skipMissingKey('set_line_status')
@@ -1303,6 +1351,32 @@ class TestTopologicalImpact(unittest.TestCase):
         assert subs_impacted[self.res["line_or_to_subid"][l_id]]
         assert subs_impacted[self.res["line_ex_to_subid"][l_id]]
 
+    def test_get_topo_imp_cached(self):
+        l_id = 15
+        powerline_status = np.full(self.n_line, fill_value=True, dtype=dt_bool)
+        changelor = self.helper_action({"set_line_status": [(l_id, 1)],
+                                        "set_bus": {"lines_or_id": [(l_id, 1)],
+                                                    "lines_ex_id": [(l_id, 1)]}
+                                        })
+        # the result depends on the status of the powerlines, it should not be reused if the status changes
+        lines_impacted, subs_impacted = changelor.get_topological_impact(powerline_status)
+        assert np.sum(subs_impacted) == 2
+        lines_impacted, subs_impacted = changelor.get_topological_impact()
+        assert np.sum(subs_impacted) == 0
+        powerline_status[l_id] = False
+        lines_impacted, subs_impacted = changelor.get_topological_impact(powerline_status)
+        assert np.sum(subs_impacted) == 0
+        powerline_status[l_id] = True
+        lines_impacted, subs_impacted = changelor.get_topological_impact(powerline_status)
+        assert np.sum(subs_impacted) == 2
+
+        # and it is recomputed when the action is modified
+        changelor.update({"set_bus": {"generators_id": [(0, 2)]}})
+        lines_impacted, subs_impacted = changelor.get_topological_impact()
+        assert np.sum(lines_impacted) == 1
+        assert np.sum(subs_impacted) == 1
+        assert subs_impacted[0]
+
     def test_get_topo_imp_setstatus_up_alreadyup2(self):
         # change a line that is already reconnected (2 subs) + 1 line
         # and i change the object on same substation, should count as 0
@@ -1361,5 +1435,41 @@ class TestTopologicalImpact(unittest.TestCase):
         assert lines_impacted[l_id]
 
 
+class TestValueStore(unittest.TestCase):
+    def test_changed_indices(self):
+        store = ValueStore(6, dtype=dt_float)
+        assert store.changed_indices().shape == (0, )
+        assert list(store) == []
+
+        newvals = np.full(6, fill_value=np.NaN, dtype=dt_float)
+        newvals[[1, 4]] = [2., 3.]
+        store.set_val(newvals)
+        assert np.all(store.changed_indices() == [1, 4])
+        assert np.all(store.changed_values() == [2., 3.])
+
+        # the indices are updated when the values are modified again
+        store.change_val(np.array([0., 0., 0., 0., 0., 1.], dtype=dt_float))
+        assert np.all(store.changed_indices() == [1, 4, 5])
+        assert np.all(store.changed_values() == [2., 3., 2.])
+        assert [(int(id_), float(val)) for id_, val in store] == [(1, 2.), (4, 3.), (5, 2.)]
+        # the iteration is over until the next reset
+        assert list(store) == []
+
+        store.reset()
+        assert store.changed_indices().shape == (0, )
+        store.all_changed()
+        assert np.all(store.changed_indices() == np.arange(6))
+
+    def test_changed_indices_status(self):
+        store = ValueStore(4, dtype=dt_int)
+        old_vect = np.array([1, 2, 1, 2], dtype=dt_int)
+        store.set_status(np.array([-1, 0], dtype=dt_int), np.array([0, 2]), np.array([1, 3]), old_vect)
+        assert np.all(store.changed_indices() == [0, 1])
+        assert np.all(store.changed_values() == [-1, -1])
+        store.change_status(np.array([False, True]), np.array([0, 2]), np.array([1, 3]), old_vect)
+        assert np.all(store.changed_indices() == [0, 1, 2, 3])
+        assert np.all(store.changed_values() == [-1, -1, -1, -1])
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -11,7 +11,7 @@ from grid2op.tests.helper_path_test import *
 
 from grid2op.MakeEnv import make
 from grid2op.Parameters import Parameters
-from grid2op.Converter import ConnectivityConverter, IdToAct
+from grid2op.Converter import ConnectivityConverter, IdToAct, AnalogStateConverter
 import tempfile
 import pdb
 
@@ -118,6 +118,52 @@ class TestIdToAct(HelperTests):
         assert act_ == act2_
 
 
+class TestAnalogStateConverter(HelperTests):
+    def setUp(self):
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore")
+            self.env = make("rte_case14_realistic", test=True)
+
+    def tearDown(self):
+        self.env.close()
+
+    def test_convert_obs(self):
+        converter = AnalogStateConverter(self.env.action_space)
+        obs = self.env.reset()
+        res = converter.convert_obs(obs)
+        assert res.dtype == np.float32
+        assert res.shape[0] == AnalogStateConverter.size_obs(obs)
+        assert np.abs(res[0] - obs.month / 12.) <= self.tol_one
+        assert np.all(np.isfinite(res))
+
+        # disconnected powerline: bus is 0, rho is 0
+        obs, reward, done, info = self.env.step(self.env.action_space({"set_line_status": [(3, -1)]}))
+        res = converter.convert_obs(obs)
+        out = np.zeros(res.shape, dtype=np.float32)
+        res2 = converter.convert_obs(obs, out=out)
+        assert res2 is out
+        assert np.all(res == res2)
+        # the powerlines are the last part of the vector: p, q, v, bus and rho for both sides
+        beg_or_bus = res.shape[0] - 10 * obs.n_line + 3 * obs.n_line
+        assert res[beg_or_bus + 3] == 0.
+        assert np.abs(res[beg_or_bus + 2] - 1. / 3.) <= self.tol_one
+
+    def test_convert_obs_batch(self):
+        converter = AnalogStateConverter(self.env.action_space)
+        obs = self.env.reset()
+        all_res = []
+        all_vect = []
+        for act in [self.env.action_space(),
+                    self.env.action_space({"set_line_status": [(3, -1)]}),
+                    self.env.action_space({"redispatch": [(0, 2.)]})]:
+            all_res.append(converter.convert_obs(obs))
+            all_vect.append(obs.to_vect())
+            obs, reward, done, info = self.env.step(act)
+        res = converter.convert_obs_batch(np.array(all_vect), self.env.observation_space)
+        assert res.dtype == np.float32
+        assert res.shape == (3, all_res[0].shape[0])
+        assert np.all(res == np.array(all_res))
+
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -7,14 +7,16 @@
 # This file is part of Grid2Op, Grid2Op a testbed platform to model sequential decision making in power systems.
 
 import copy
+import json
 import pdb
+import tempfile
 import time
 import warnings
 
 from grid2op.tests.helper_path_test import *
 
 from grid2op.Exceptions import *
-from grid2op.Environment import Environment
+from grid2op.Environment import Environment, StepProfiler
 from grid2op.Backend import PandaPowerBackend
 from grid2op.Parameters import Parameters
 from grid2op.Chronics import ChronicsHandler, GridStateFromFile, ChangeNothing
@@ -585,5 +587,127 @@ class TestDeactivateForecast(unittest.TestCase):
         sim_obs, *_ = obs.simulate(self.env1.action_space())
 
 
+class TestLazyBackends(unittest.TestCase):
+    def setUp(self) -> None:
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore")
+            self.env = make("rte_case14_test", test=True)
+
+    def tearDown(self) -> None:
+        self.env.close()
+
+    def test_created_when_used(self):
+        obs_env = self.env.helper_observation.obs_env
+        assert obs_env._backend is None
+        assert self.env.voltage_controler._backend is None
+        report = self.env.memory_report()
+        assert report["simulate_backend"] == 0
+        assert report["voltage_controler_backend"] == 0
+        assert report["backend"] > 0
+        assert report["total"] >= report["backend"] + report["chronics_handler"]
+
+        obs = self.env.reset()
+        sim_obs, *_ = obs.simulate(self.env.action_space())
+        assert obs_env._backend is not None
+        assert obs_env._backend is not self.env.backend
+        assert self.env.memory_report()["simulate_backend"] > 0
+
+    def test_copy(self):
+        env_cpy = self.env.copy()
+        try:
+            assert env_cpy.helper_observation.obs_env._backend_template is env_cpy.backend
+            assert env_cpy.voltage_controler._backend_template is env_cpy.backend
+            assert env_cpy.backend is not self.env.backend
+            obs = env_cpy.reset()
+            sim_obs, *_ = obs.simulate(env_cpy.action_space())
+            assert self.env.helper_observation.obs_env._backend is None
+        finally:
+            env_cpy.close()
+
+
+class TestStepProfiler(unittest.TestCase):
+    def setUp(self) -> None:
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore")
+            self.env = make("rte_case14_realistic", test=True)
+        self.profiler = StepProfiler()
+
+    def tearDown(self) -> None:
+        self.env.close()
+
+    def test_disabled(self):
+        assert self.env.get_step_profiler() is None
+        self.env.step(self.env.action_space())
+        self.env.set_step_profiler(self.profiler)
+        self.env.set_step_profiler(None)
+        self.env.step(self.env.action_space())
+        assert self.profiler.nb_step == 0
+        assert self.profiler.summary()["phases"]["step"]["nb"] == 0
+
+    def test_record(self):
+        self.env.set_step_profiler(self.profiler)
+        nb_step = 3
+        for _ in range(nb_step):
+            obs, reward, done, info = self.env.step(self.env.action_space())
+        assert not done
+        summary = self.profiler.summary()
+        assert summary["nb_step"] == nb_step
+        for phase in StepProfiler.PHASES:
+            stats = summary["phases"][phase]
+            assert stats["nb"] == nb_step
+            assert 0. <= stats["p50"] <= stats["p95"] <= stats["p99"] <= stats["max"]
+        # the phases are included in the step
+        total = np.sum([summary["phases"][phase]["total"] for phase in StepProfiler.PHASES if phase != "step"])
+        assert total <= summary["phases"]["step"]["total"]
+        assert np.all(self.profiler.get_counter("nb_powerflow") == 1)
+        assert np.all(self.profiler.get_counter("cascade_depth") == 0)
+        assert np.all(self.profiler.get_counter("nb_iterations") > 0)
+        assert self.profiler.get_times("each_powerflow").shape[0] == nb_step
+        histograms = self.profiler.histograms()
+        assert np.sum(histograms["step"]) == nb_step
+        assert len(histograms["step"]) == StepProfiler.HIST_BINS.shape[0] - 1
+
+        # the data are the ones of the current episode
+        self.env.reset()
+        assert self.profiler.nb_step == 0
+        self.env.step(self.env.action_space())
+        assert self.profiler.nb_step == 1
+
+        f = tempfile.mkdtemp()
+        path = os.path.join(f, "profile.json")
+        self.profiler.to_json(path)
+        with open(path, "r") as fp:
+            dict_ = json.load(fp)
+        assert dict_["summary"]["nb_step"] == 1
+
+    def test_cascading_failure(self):
+        self.env.set_step_profiler(self.profiler)
+        self.env.reset()
+        thermal_limit = 10. * self.env.get_thermal_limit()
+        thermal_limit[[0, 1]] = 1.
+        self.env.set_thermal_limit(thermal_limit)
+        obs, reward, done, info = self.env.step(self.env.action_space())
+        assert info["disc_lines"][[0, 1]].all()
+        depth = self.profiler.get_counter("cascade_depth")
+        assert depth[-1] >= 1
+        assert self.profiler.get_counter("nb_powerflow")[-1] == depth[-1] + 1
+
+    def test_runner(self):
+        from grid2op.Runner import Runner
+        from grid2op.Episode import EpisodeData
+        self.env.set_step_profiler(self.profiler)
+        runner = Runner(**self.env.get_params_for_runner())
+        assert runner.step_profiler_class is StepProfiler
+        f = tempfile.mkdtemp()
+        res = runner.run(nb_episode=1, max_iter=5, path_save=f)
+        episode_path = os.path.join(f, res[0][1])
+        with open(os.path.join(episode_path, EpisodeData.TIMES), "r") as fp:
+            episode_times = json.load(fp)
+        assert episode_times["Env"]["step_profiler"]["nb_step"] == 5
+        with open(os.path.join(episode_path, EpisodeData.STEP_PROFILE), "r") as fp:
+            step_profile = json.load(fp)
+        assert np.sum(step_profile["histograms"]["step"]) == 5
+
+
 if __name__ == "__main__":
     unittest.main()
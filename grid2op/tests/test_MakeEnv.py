@@ -11,6 +11,9 @@ import sys
 import unittest
 import warnings
 import time
+import tempfile
+import shutil
+import pickle
 import numpy as np
 import pdb
 
@@ -22,6 +25,7 @@ from grid2op.tests.helper_path_test import PATH_DATA_MULTIMIX
 from grid2op.Exceptions import *
 from grid2op.MakeEnv import make_from_dataset_path
 from grid2op.MakeEnv.get_default_aux import _get_default_aux
+from grid2op.MakeEnv.ConstructionCache import ConstructionCache
 from grid2op.MakeEnv import make
 from grid2op.Backend import PandaPowerBackend
 from grid2op.Parameters import Parameters
@@ -555,6 +559,127 @@ class TestMakeFromPathParameters(unittest.TestCase):
                 with make_from_dataset_path(dataset_path, difficulty="3") as env:
                     assert False, "this should have raised an exception"
 
+class TestMakeConstructionCache(unittest.TestCase):
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+
+    def test_same_env(self):
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore")
+            with make("rte_case14_realistic", test=True) as env_ref:
+                obs_ref = env_ref.reset()
+                obs_ref_step, *_ = env_ref.step(env_ref.action_space())
+            with make("rte_case14_realistic", test=True, cache_dir=self.cache_dir) as env:
+                assert len(os.listdir(self.cache_dir)) == 1
+            with make("rte_case14_realistic", test=True, cache_dir=self.cache_dir) as env:
+                assert len(os.listdir(self.cache_dir)) == 1
+                assert env._construction_cache.load(PandaPowerBackend(), env.init_grid_path)
+                obs = env.reset()
+                obs_step, *_ = env.step(env.action_space())
+                assert obs == obs_ref
+                assert obs_step == obs_ref_step
+                assert np.all(env.backend.gen_pmax == env_ref.backend.gen_pmax)
+                assert env.grid_layout == env_ref.grid_layout
+
+    def test_key_changed(self):
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore")
+            with make("rte_case14_realistic", test=True) as env:
+                dataset_path = os.path.split(env.init_grid_path)[0]
+        dataset_copy = os.path.join(self.cache_dir, "rte_case14_realistic")
+        shutil.copytree(dataset_path, dataset_copy)
+        cache = ConstructionCache(os.path.join(self.cache_dir, "cache"))
+        grid_path = os.path.join(dataset_copy, "grid.json")
+        key = cache.get_key(PandaPowerBackend(), grid_path)
+        with open(os.path.join(dataset_copy, "prods_charac.csv"), "a") as f:
+            f.write("\n")
+        assert cache.get_key(PandaPowerBackend(), grid_path) != key
+
+    def test_key_backend_version(self):
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore")
+            with make("rte_case14_realistic", test=True) as env:
+                grid_path = env.init_grid_path
+        cache = ConstructionCache(self.cache_dir)
+        key = cache.get_key(PandaPowerBackend(), grid_path)
+        version = PandaPowerBackend.CONSTRUCTION_STATE_VERSION
+        try:
+            PandaPowerBackend.CONSTRUCTION_STATE_VERSION = version + 1
+            assert cache.get_key(PandaPowerBackend(), grid_path) != key
+        finally:
+            PandaPowerBackend.CONSTRUCTION_STATE_VERSION = version
+
+    def _aux_write_invalid_entry(self, modif_entry):
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore")
+            with make("rte_case14_realistic", test=True, cache_dir=self.cache_dir) as env:
+                grid_path = env.init_grid_path
+                name_line = np.array(env.name_line)
+        path_ = ConstructionCache(self.cache_dir).get_path(PandaPowerBackend(), grid_path)
+        with open(path_, "rb") as f:
+            entry = pickle.load(f)
+        modif_entry(entry)
+        with open(path_, "wb") as f:
+            pickle.dump(entry, f)
+        return grid_path, name_line
+
+    def _aux_check_invalid_entry(self, modif_entry):
+        grid_path, name_line = self._aux_write_invalid_entry(modif_entry)
+        # the names of the lines may be set at the class level by the environments created before: they must not be
+        # used instead of the missing attribute
+        name_line_cls = PandaPowerBackend.__dict__.get("name_line", None)
+        PandaPowerBackend.name_line = name_line
+        try:
+            backend = PandaPowerBackend()
+            previous_state = dict(backend.__dict__)
+            with self.assertWarns(UserWarning):
+                assert not ConstructionCache(self.cache_dir).load(backend, grid_path)
+            assert sorted(backend.__dict__.keys()) == sorted(previous_state.keys())
+        finally:
+            if name_line_cls is None:
+                del PandaPowerBackend.name_line
+            else:
+                PandaPowerBackend.name_line = name_line_cls
+
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore")
+            with make("rte_case14_realistic", test=True) as env_ref:
+                obs_ref = env_ref.reset()
+            with make("rte_case14_realistic", test=True, cache_dir=self.cache_dir) as env:
+                assert env.reset() == obs_ref
+        # the entry has been replaced
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            assert ConstructionCache(self.cache_dir).load(PandaPowerBackend(), grid_path)
+
+    def test_invalid_entry_missing_attr(self):
+        # an entry stored by a previous version of the backend, without the names of the lines
+        def modif_entry(entry):
+            del entry["backend"]["name_line"]
+        self._aux_check_invalid_entry(modif_entry)
+
+    def test_invalid_entry_missing_init_attr(self):
+        # the attribute is not listed in the entry either, but is set by the constructor of the backend
+        def modif_entry(entry):
+            del entry["backend"]["prod_pu_to_kv"]
+            del entry["shapes"]["prod_pu_to_kv"]
+        self._aux_check_invalid_entry(modif_entry)
+
+    def test_invalid_entry_wrong_shape(self):
+        def modif_entry(entry):
+            entry["backend"]["name_line"] = entry["backend"]["name_line"][1:]
+        self._aux_check_invalid_entry(modif_entry)
+
+    def test_wrong_cache_dir(self):
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore")
+            with self.assertRaises(EnvError):
+                make("rte_case14_realistic", test=True, cache_dir=1)
+
+
 class TestMakeMultiMix(unittest.TestCase):
     def test_create_dev(self):
         with warnings.catch_warnings():
@@ -293,5 +293,95 @@ class TestMultiMixEnvironment(unittest.TestCase):
             assert isinstance(v, BaseEnv)
             assert v == mme[k]
 
+    def test_lazy_creation(self):
+        mme = MultiMixEnvironment(PATH_DATA_MULTIMIX)
+        assert mme.mix_envs[0] is not None
+        assert mme.mix_envs[1] is None
+        assert list(mme.keys()) == ["case14_001", "case14_002"]
+        assert mme.mix_envs[1] is None
+        mme.seed(2)
+        mme.set_chunk_size(10)
+        mme.deactivate_forecast()
+        # the settings are applied when the mix is created
+        obs = mme.reset()
+        assert mme.current_index == 1
+        assert mme.mix_envs[1] is not None
+        assert not mme.mix_envs[1].with_forecast
+        assert mme.mix_envs[1].chronics_handler.real_data.chunk_size == 10
+
+        # same as if the mix had been created before being seeded
+        mme2 = MultiMixEnvironment(PATH_DATA_MULTIMIX)
+        for _ in mme2:
+            pass
+        mme2.seed(2)
+        obs2 = mme2.reset()
+        assert np.allclose(obs.to_vect(), obs2.to_vect(), equal_nan=True)
+        mme2.close()
+        mme.close()
+
+    def test_seed_lazy_mix(self):
+        mme = MultiMixEnvironment(PATH_DATA_MULTIMIX)
+        seeds = mme.seed(2)
+        assert len(seeds) == 3
+        # the mix created returns its seeds, the mix not created the seed it will be given
+        assert isinstance(seeds[1], tuple)
+        assert isinstance(seeds[2], (int, np.integer))
+
+        # same seeds as if the mix had been created before being seeded
+        mme2 = MultiMixEnvironment(PATH_DATA_MULTIMIX)
+        for _ in mme2:
+            pass
+        seeds2 = mme2.seed(2)
+        assert isinstance(seeds2[2], tuple)
+        assert seeds2[1] == seeds[1]
+        assert mme2.mix_envs[1].seed(seeds[2]) == seeds2[2]
+        mme2.close()
+        mme.close()
+
+    def test_process_per_mix(self):
+        mme = MultiMixEnvironment(PATH_DATA_MULTIMIX, process_per_mix=True)
+        try:
+            assert mme.mix_envs[1] is None
+            assert isinstance(mme.current_obs, CompleteObservation)
+            dn = mme.action_space({})
+            obs, r, done, info = mme.step(dn)
+            assert isinstance(obs, CompleteObservation)
+            assert not done
+            assert isinstance(info, dict)
+            assert mme.parameters.MAX_SUB_CHANGED == Parameters().MAX_SUB_CHANGED
+
+            obs = mme.reset()
+            assert isinstance(obs, CompleteObservation)
+            assert mme.current_index == 1
+            assert mme["case14_002"].name == "case14_002"
+
+            obss = mme.reset_all()
+            assert len(obss) == 2
+            res = mme.step_all([dn, dn])
+            assert len(res) == 2
+            for obs, r, done, info in res:
+                assert isinstance(obs, CompleteObservation)
+                assert not done
+            with self.assertRaises(EnvError):
+                mme.step_all([dn])
+        finally:
+            mme.close()
+
+    def test_process_per_mix_same_results(self):
+        dn = None
+        res = []
+        for process_per_mix in [False, True]:
+            mme = MultiMixEnvironment(PATH_DATA_MULTIMIX, process_per_mix=process_per_mix)
+            try:
+                mme.seed(0)
+                mme.reset_all()
+                dn = mme.action_space({})
+                res.append([obs.to_vect() for obs, *_ in mme.step_all([dn, dn])])
+            finally:
+                mme.close()
+        for vect_local, vect_remote in zip(*res):
+            assert np.allclose(vect_local, vect_remote, equal_nan=True)
+
+
 if __name__ == "__main__":
     unittest.main()
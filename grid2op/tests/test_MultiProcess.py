@@ -6,12 +6,18 @@
 # SPDX-License-Identifier: MPL-2.0
 # This file is part of Grid2Op, Grid2Op a testbed platform to model sequential decision making in power systems.
 
+import os
 import pdb
+import signal
 import warnings
 from grid2op.tests.helper_path_test import *
 from grid2op.Environment import BaseMultiProcessEnvironment
 from grid2op.Environment import SingleEnvMultiProcess
 from grid2op.Environment import MultiEnvMultiProcess
+from grid2op.Environment import VectorEnv
+from grid2op.Environment.BaseMultiProcessEnv import _SafeReset
+from grid2op.Environment.InfoPacker import InfoPacker
+from grid2op.Exceptions import MultiEnvException, Grid2OpException, DivergingPowerFlow
 from grid2op.MakeEnv import make
 from grid2op.Observation import CompleteObservation
 import pdb
@@ -148,5 +154,341 @@ class TestMultiEnvMultiProcess(unittest.TestCase):
                 assert np.any(seeds_1 != seeds_2)
 
 
+class TestVectorEnv(unittest.TestCase):
+    def setUp(self):
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore")
+            self.env = make("rte_case5_example", test=True)
+
+    def tearDown(self):
+        self.env.close()
+
+    def _play(self, vect_env, nb_step=5):
+        res = [vect_env.reset().copy()]
+        for _ in range(nb_step):
+            obs, rews, dones, infos = vect_env.step([self.env.action_space() for _ in range(vect_env.nb_env)])
+            assert obs.shape == (vect_env.nb_env, self.env.observation_space.n)
+            assert rews.shape == (vect_env.nb_env,)
+            assert dones.shape == (vect_env.nb_env,)
+            assert len(infos) == vect_env.nb_env
+            res.append(obs.copy())
+        return np.stack(res)
+
+    def test_creation(self):
+        vect_env = VectorEnv(self.env, nb_env=3)
+        try:
+            obs = vect_env.reset()
+            assert obs.shape == (3, self.env.observation_space.n)
+            obss = vect_env.get_observations()
+            assert len(obss) == 3
+            for ob in obss:
+                assert isinstance(ob, CompleteObservation)
+            vect_env.set_ff(7*288)
+            vect_env.set_chunk_size(128)
+            obs = vect_env.reset()
+            assert np.all(np.isfinite(obs))
+            assert len(vect_env.get_seeds()) == 3
+            with self.assertRaises(MultiEnvException):
+                vect_env.step([self.env.action_space()])
+        finally:
+            vect_env.close()
+
+    def test_same_as_hybrid(self):
+        # same seeds: the same observations whatever the number of processes used
+        self.env.seed(0)
+        vect_env = VectorEnv(self.env, nb_env=3)
+        try:
+            res_single = self._play(vect_env)
+            seeds_single = vect_env.get_seeds()
+        finally:
+            vect_env.close()
+
+        self.env.seed(0)
+        vect_env = VectorEnv(self.env, nb_env=3, nb_process=2)
+        try:
+            res_hybrid = self._play(vect_env)
+            seeds_hybrid = vect_env.get_seeds()
+        finally:
+            vect_env.close()
+        assert seeds_single == seeds_hybrid
+        assert np.allclose(res_single, res_hybrid, equal_nan=True)
+        # the environments do not all play the same chronics
+        assert not np.allclose(res_single[:, 0, :], res_single[:, 1, :], equal_nan=True)
+
+    def test_auto_reset(self):
+        vect_env = VectorEnv(self.env, nb_env=2)
+        try:
+            vect_env.reset()
+            act = self.env.action_space({"set_bus": {"loads_id": [(0, 2)]}})
+            obs, rews, dones, infos = vect_env.step([act, self.env.action_space()])
+            assert dones[0]
+            assert not dones[1]
+            assert np.all(np.isfinite(obs[0]))
+        finally:
+            vect_env.close()
+
+    def test_bounded_reset(self):
+        vect_env = VectorEnv(self.env, nb_env=2, max_reset_retry=3)
+        try:
+            def reset():
+                raise Grid2OpException("bad chronics")
+            vect_env._group.envs[0].reset = reset
+            with self.assertRaises(MultiEnvException):
+                vect_env.reset()
+            assert vect_env._group.safe_resets[0].get_stats()["nb_retry"] == 3
+        finally:
+            vect_env.close()
+
+    def test_close_processes(self):
+        vect_env = VectorEnv(self.env, nb_env=3, nb_process=2)
+        vect_env.reset()
+        vect_env.close()
+        for p in vect_env._ps:
+            assert not p.is_alive()
+            assert p.exitcode == 0
+
+    def test_close_hung_process(self):
+        vect_env = VectorEnv(self.env, nb_env=3, nb_process=2)
+        vect_env.reset()
+        vect_env.CLOSE_TIMEOUT = 1.
+        os.kill(vect_env._ps[0].pid, signal.SIGSTOP)
+        vect_env.close()
+        for p in vect_env._ps:
+            assert not p.is_alive()
+        assert vect_env._ps[0].exitcode != 0
+        assert vect_env._ps[1].exitcode == 0
+
+
+class TestSupervision(unittest.TestCase):
+    def setUp(self):
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore")
+            self.env = make("rte_case5_example", test=True)
+
+    def tearDown(self):
+        self.env.close()
+
+    def test_skip_chronics(self):
+        safe_reset = _SafeReset(self.env, np.random.RandomState(0), max_reset_retry=3)
+        env_reset = self.env.reset
+        bad_chronics = []
+
+        def reset():
+            obs = env_reset()
+            if not bad_chronics:
+                bad_chronics.append(self.env.chronics_handler.get_id())
+            if self.env.chronics_handler.get_id() in bad_chronics:
+                raise Grid2OpException("bad chronics")
+            return obs
+        self.env.reset = reset
+
+        obs_v = safe_reset()
+        assert np.all(np.isfinite(obs_v))
+        stats = safe_reset.get_stats()
+        assert stats["nb_reset"] == 1
+        assert stats["nb_retry"] == 1
+        assert stats["skipped_chronics"] == bad_chronics
+        nb_chronics = len(self.env.chronics_handler.real_data.subpaths)
+        for _ in range(nb_chronics):
+            safe_reset()
+            assert self.env.chronics_handler.get_id() not in bad_chronics
+        assert safe_reset.get_stats()["nb_retry"] == 1
+
+    def test_bounded_retry(self):
+        safe_reset = _SafeReset(self.env, np.random.RandomState(0), max_reset_retry=3)
+
+        def reset():
+            raise Grid2OpException("bad chronics")
+        self.env.reset = reset
+        with self.assertRaises(MultiEnvException):
+            safe_reset()
+        assert safe_reset.get_stats()["nb_retry"] == 3
+
+    def test_respawn_crashed(self):
+        multi_envs = SingleEnvMultiProcess(env=self.env, nb_env=2)
+        try:
+            multi_envs.reset()
+            multi_envs._ps[0].kill()
+            multi_envs._ps[0].join()
+            with warnings.catch_warnings(record=True) as w:
+                warnings.simplefilter("always")
+                obss, rews, dones, infos = multi_envs.step([self.env.action_space() for _ in range(2)])
+            assert len(w) == 1
+            assert dones[0]
+            assert not dones[1]
+            assert isinstance(infos[0]["exception"][0], MultiEnvException)
+            assert isinstance(obss[0], CompleteObservation)
+            stats = multi_envs.get_stats()
+            assert stats[0]["nb_respawn"] == 1
+            assert stats[0]["nb_step"] == 0
+            assert stats[1]["nb_respawn"] == 0
+            assert stats[1]["nb_step"] == 1
+            assert stats[1]["nb_reset"] == 1
+        finally:
+            multi_envs.close()
+
+    def test_respawn_hung(self):
+        multi_envs = SingleEnvMultiProcess(env=self.env, nb_env=2, timeout=5)
+        try:
+            multi_envs.reset()
+            os.kill(multi_envs._ps[1].pid, signal.SIGSTOP)
+            with warnings.catch_warnings():
+                warnings.filterwarnings("ignore")
+                obss, rews, dones, infos = multi_envs.step([self.env.action_space() for _ in range(2)])
+            assert not dones[0]
+            assert dones[1]
+            stats = multi_envs.get_stats()
+            assert stats[1]["nb_respawn"] == 1
+        finally:
+            multi_envs.close()
+
+    def test_max_respawn(self):
+        multi_envs = SingleEnvMultiProcess(env=self.env, nb_env=2, max_respawn=0)
+        try:
+            multi_envs.reset()
+            multi_envs._ps[0].kill()
+            multi_envs._ps[0].join()
+            with self.assertRaises(MultiEnvException):
+                multi_envs.step([self.env.action_space() for _ in range(2)])
+        finally:
+            multi_envs.close()
+
+    def test_vector_env_respawn_crashed(self):
+        vect_env = VectorEnv(self.env, nb_env=3, nb_process=2)
+        try:
+            vect_env.reset()
+            seeds = vect_env.get_seeds()
+            vect_env._ps[0].kill()
+            vect_env._ps[0].join()
+            with warnings.catch_warnings(record=True) as w:
+                warnings.simplefilter("always")
+                obs, rews, dones, infos = vect_env.step([self.env.action_space() for _ in range(3)])
+            assert len(w) == 1
+            # the first process holds the environment 0, the second one the environments 1 and 2
+            assert dones[0]
+            assert not np.any(dones[1:])
+            assert rews[0] == self.env.reward_range[0]
+            assert isinstance(infos[0]["exception"][0], MultiEnvException)
+            assert np.all(np.isfinite(obs))
+            assert vect_env._nb_respawn[0] == 1
+            new_seeds = vect_env.get_seeds()
+            assert new_seeds[0] != seeds[0]
+            assert new_seeds[1:] == seeds[1:]
+            obs, rews, dones, infos = vect_env.step([self.env.action_space() for _ in range(3)])
+            assert not np.any(dones)
+        finally:
+            vect_env.close()
+
+    def test_vector_env_respawn_hung(self):
+        vect_env = VectorEnv(self.env, nb_env=3, nb_process=2, timeout=5)
+        try:
+            vect_env.reset()
+            os.kill(vect_env._ps[1].pid, signal.SIGSTOP)
+            with warnings.catch_warnings():
+                warnings.filterwarnings("ignore")
+                obs, rews, dones, infos = vect_env.step([self.env.action_space() for _ in range(3)])
+            assert not dones[0]
+            assert np.all(dones[1:])
+            assert vect_env._nb_respawn[1] == 1
+        finally:
+            vect_env.close()
+
+    def test_vector_env_max_respawn(self):
+        vect_env = VectorEnv(self.env, nb_env=3, nb_process=2, max_respawn=0)
+        try:
+            vect_env.reset()
+            vect_env._ps[1].kill()
+            vect_env._ps[1].join()
+            with self.assertRaises(MultiEnvException):
+                vect_env.reset()
+        finally:
+            vect_env.close()
+
+    def test_close_joins(self):
+        multi_envs = SingleEnvMultiProcess(env=self.env, nb_env=2)
+        multi_envs.reset()
+        multi_envs.CLOSE_TIMEOUT = 1.
+        os.kill(multi_envs._ps[1].pid, signal.SIGSTOP)
+        multi_envs.close()
+        for p in multi_envs._ps:
+            assert not p.is_alive()
+        assert multi_envs._ps[0].exitcode == 0
+
+
+class TestInfoPacker(unittest.TestCase):
+    def setUp(self):
+        self.n_line = 5
+        self.info = {"disc_lines": np.array([True, False, False, True, False]),
+                     "is_illegal": True,
+                     "is_ambiguous": False,
+                     "is_dispatching_illegal": False,
+                     "is_illegal_reco": True,
+                     "exception": [DivergingPowerFlow("diverged"), ValueError("other error")],
+                     "rewards": {"other": 1.}}
+
+    def _check_same(self, info, res):
+        assert set(res.keys()) == set(info.keys())
+        for key, val in info.items():
+            if key == "exception":
+                assert [type(el) for el in res[key]] == [type(el) for el in val]
+            elif key == "disc_lines":
+                assert np.array_equal(res[key], val)
+            else:
+                assert res[key] == val
+
+    def test_pack_unpack(self):
+        for shared in [True, False]:
+            packer = InfoPacker(self.n_line, shared=shared)
+            res = packer.unpack(packer.pack(self.info))
+            self._check_same(self.info, res)
+            # other exceptions are sent as is
+            assert str(res["exception"][1]) == "other error"
+
+            info = dict(self.info)
+            info["disc_lines"] = None
+            info["exception"] = []
+            self._check_same(info, packer.unpack(packer.pack(info)))
+
+    def test_filter(self):
+        packer = InfoPacker(self.n_line, info_filter=["is_illegal", "rewards"])
+        res = packer.unpack(packer.pack(self.info))
+        assert set(res.keys()) == {"is_illegal", "rewards"}
+        assert res["is_illegal"]
+
+        packer = InfoPacker(self.n_line, info_filter=lambda info: {"nb_exc": len(info["exception"])})
+        res = packer.unpack(packer.pack(self.info))
+        assert res == {"nb_exc": 2}
+
+        with self.assertRaises(MultiEnvException):
+            InfoPacker(self.n_line, info_filter=1)
+
+    def test_multi_env(self):
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore")
+            env = make("rte_case5_example", test=True)
+        info_filter = ["disc_lines", "is_illegal", "exception"]
+        multi_envs = SingleEnvMultiProcess(env=env, nb_env=2, info_filter=info_filter)
+        try:
+            multi_envs.reset()
+            obss, rews, dones, infos = multi_envs.step([env.action_space() for _ in range(2)])
+            for info in infos:
+                assert set(info.keys()) == set(info_filter)
+                assert info["disc_lines"].shape == (env.n_line,)
+                assert not info["is_illegal"]
+        finally:
+            multi_envs.close()
+
+        vect_env = VectorEnv(env, nb_env=3, nb_process=2, info_filter=info_filter)
+        try:
+            vect_env.reset()
+            obs, rews, dones, infos = vect_env.step([env.action_space() for _ in range(3)])
+            assert len(infos) == 3
+            for info in infos:
+                assert set(info.keys()) == set(info_filter)
+        finally:
+            vect_env.close()
+        env.close()
+
+
 if __name__ == "__main__":
     unittest.main()
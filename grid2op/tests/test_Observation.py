@@ -6,6 +6,7 @@
 # SPDX-License-Identifier: MPL-2.0
 # This file is part of Grid2Op, Grid2Op a testbed platform to model sequential decision making in power systems.
 
+import copy
 import json
 import warnings
 import pdb
@@ -186,6 +187,58 @@ class TestLoadingBackendFunc(unittest.TestCase):
                             ])
         assert np.all(mat[:10,:] == ref_mat)
 
+    def test_conn_mat_sparse(self):
+        obs = self.env.helper_observation(self.env)
+        mat = obs.connectivity_matrix()
+        mat_csr = obs.connectivity_matrix(as_csr_matrix=True)
+        assert mat_csr.shape == mat.shape
+        assert np.all(mat_csr.toarray() == mat)
+        edges = obs.connectivity_matrix(as_edge_list=True)
+        assert edges.shape == (2, int(mat.sum()))
+        assert np.all(mat[edges[0], edges[1]] == 1.)
+
+        bus_mat = obs.bus_connectivity_matrix()
+        assert np.all(obs.bus_connectivity_matrix(as_csr_matrix=True).toarray() == bus_mat)
+        edges = obs.bus_connectivity_matrix(as_edge_list=True)
+        assert np.all(bus_mat[edges[0], edges[1]] == 1.)
+
+        with self.assertRaises(Grid2OpException):
+            obs.connectivity_matrix(as_csr_matrix=True, as_edge_list=True)
+
+    def test_conn_mat_incremental(self):
+        obs = self.env.helper_observation(self.env)
+        mat_init = 1. * obs.connectivity_matrix()
+
+        # change the topology of substation 1, observations of the same space share the previous computation
+        act = self.env.action_space({"set_bus": {"substations_id": [(1, [1, 2, 2, 1, 1, 2])]}})
+        obs, reward, done, info = self.env.step(act)
+        assert not done
+        mat = obs.connectivity_matrix()
+        assert obs._connectivity_cache is self.env.helper_observation._connectivity_cache
+        beg_, end_ = 3, 9  # position of the elements of substation 1 in the topology vector
+        assert np.all(mat[beg_:end_, beg_:end_] == [[0., 0., 0., 1., 1., 0.],
+                                                     [0., 0., 1., 0., 0., 1.],
+                                                     [0., 1., 0., 0., 0., 1.],
+                                                     [1., 0., 0., 0., 1., 0.],
+                                                     [1., 0., 0., 1., 0., 0.],
+                                                     [0., 1., 1., 0., 0., 0.]])
+        mat_init[beg_:end_, beg_:end_] = mat[beg_:end_, beg_:end_]
+        assert np.all(mat == mat_init)
+
+        # result is the same as if it was computed from scratch
+        obs_scratch = obs.copy()
+        obs_scratch._connectivity_cache = {}
+        obs_scratch._reset_matrices()
+        assert np.all(obs_scratch.connectivity_matrix() == mat)
+
+    def test_bus_conn_mat_disc_line(self):
+        obs, reward, done, info = self.env.step(self.env.action_space({"set_line_status": [(0, -1)]}))
+        mat = obs.bus_connectivity_matrix()
+        # powerline 0 connects bus 0 and bus 1, and is now disconnected
+        assert mat[0, 1] == 0.
+        assert mat[1, 0] == 0.
+        assert mat[0, 4] == 1.
+
     def test_observation_space(self):
         obs = self.env.helper_observation(self.env)
         assert self.env.observation_space.n == obs.size()
@@ -1020,6 +1073,31 @@ class TestSimulateEqualsStep(unittest.TestCase):
         # test all prod p are equal, of course we remove the slack bus...
         assert np.sum(np.abs(prod_p_f[:-1] - sim_obs.prod_p[:-1])) < 1e-5
 
+    def test_simulated_obs_independant(self):
+        disc_act = self.env.action_space({"set_line_status": [(3, -1)]})
+        sim_obs1, *_ = self.obs.simulate(disc_act)
+        sim_vect1 = copy.deepcopy(sim_obs1.to_vect())
+        sim_obs2, *_ = self.obs.simulate(self.env.action_space())
+        # the second simulation does not modify the first observation
+        assert np.array_equal(sim_obs1.to_vect(), sim_vect1)
+        assert not sim_obs1.line_status[3]
+        assert sim_obs2.line_status[3]
+        assert sim_obs1._obs_env is None
+        assert sim_obs1.action_helper is None
+
+    def test_simulate_fields(self):
+        disc_act = self.env.action_space({"set_line_status": [(3, -1)]})
+        sim_obs, sim_reward, *_ = self.obs.simulate(disc_act)
+        sim_dict, sim_reward2, *_ = self.obs.simulate(disc_act, fields=("rho", "line_status"))
+        assert set(sim_dict.keys()) == {"rho", "line_status"}
+        assert np.all(np.abs(sim_dict["rho"] - sim_obs.rho) <= 1e-8)
+        assert np.array_equal(sim_dict["line_status"], sim_obs.line_status)
+        assert abs(sim_reward - sim_reward2) <= 1e-8
+        sim_dict, *_ = self.obs.simulate(disc_act, fields=())
+        assert sim_dict == {}
+        with self.assertRaises(Grid2OpException):
+            self.obs.simulate(disc_act, fields=("rho", "unknown_attr"))
+
     def _check_equal(self, obs1, obs2):
         tol = 1e-8
         assert np.all(np.abs(obs1.prod_p - obs2.prod_p) <= tol), "issue with prod_p"
@@ -1057,6 +1135,57 @@ class TestSimulateEqualsStep(unittest.TestCase):
 
 ## TODO test -- Add test to cover simulation vs step when there is a planned maintenance operation
 
+
+class TestReuseObservation(unittest.TestCase):
+    def setUp(self):
+        param = Parameters()
+        param.REUSE_OBSERVATION = True
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore")
+            self.env = make("rte_case14_realistic", test=True, param=param)
+            self.env_ref = make("rte_case14_realistic", test=True)
+        self.env.seed(0)
+        self.env_ref.seed(0)
+        self.obs = self.env.reset()
+        self.obs_ref = self.env_ref.reset()
+
+    def tearDown(self):
+        self.env.close()
+        self.env_ref.close()
+
+    def test_same_as_new_obs(self):
+        for i in range(4):
+            act = self.env.action_space({"set_line_status": [(3, -1)]}) if i == 1 else self.env.action_space()
+            obs, *_ = self.env.step(act)
+            obs_ref, *_ = self.env_ref.step(act)
+            assert obs is self.obs
+            # forecasts are not computed unless they are used
+            assert obs._forecasted_inj == []
+            assert np.allclose(obs.to_vect(), obs_ref.to_vect(), equal_nan=True)
+
+            if i % 2:
+                continue
+            sim_obs, sim_reward, *_ = obs.simulate(self.env.action_space())
+            sim_obs_ref, sim_reward_ref, *_ = obs_ref.simulate(self.env.action_space())
+            assert np.allclose(sim_obs.to_vect(), sim_obs_ref.to_vect(), equal_nan=True)
+            assert abs(sim_reward - sim_reward_ref) <= 1e-5
+            for inj, inj_ref in zip(obs.get_forecasted_inj(), obs_ref.get_forecasted_inj()):
+                assert np.allclose(inj, inj_ref)
+
+    def test_forecasts_outdated(self):
+        obs_cpy = self.obs.copy()
+        self.env.step(self.env.action_space())
+        with self.assertRaises(NoForecastAvailable):
+            obs_cpy.simulate(self.env.action_space())
+        with self.assertRaises(NoForecastAvailable):
+            obs_cpy.get_forecasted_inj()
+
+        # the forecasts, once computed, are kept in the copy
+        obs_cpy = self.obs.copy()
+        obs_cpy.get_forecasted_inj()
+        self.env.step(self.env.action_space())
+        obs_cpy.simulate(self.env.action_space())
+
         
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,113 @@
+# Copyright (c) 2019-2020, RTE (https://www.rte-france.com)
+# See AUTHORS.txt
+# This Source Code Form is subject to the terms of the Mozilla Public License, version 2.0.
+# If a copy of the Mozilla Public License, version 2.0 was not distributed with this file,
+# you can obtain one at http://mozilla.org/MPL/2.0/.
+# SPDX-License-Identifier: MPL-2.0
+# This file is part of Grid2Op, Grid2Op a testbed platform to model sequential decision making in power systems.
+
+import unittest
+import warnings
+import numpy as np
+
+from grid2op import make
+from grid2op.dtypes import dt_bool
+from grid2op.Backend import PTDFScreening
+from grid2op.Exceptions import Grid2OpException
+
+
+class TestPTDFScreening(unittest.TestCase):
+    def setUp(self):
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore")
+            self.env = make(test=True)
+        self.obs = self.env.reset()
+        self.screening = PTDFScreening(self.env.backend)
+        self.tol = 1e-3
+
+    def tearDown(self):
+        self.env.close()
+
+    def _aux_dc_state(self, lines_disc=()):
+        """flows computed with a DC powerflow after the disconnection of some powerlines"""
+        backend = self.env.backend.copy()
+        for l_id in lines_disc:
+            backend._disconnect_line(l_id)
+        conv = backend.runpf(is_dc=True)
+        return conv, backend.get_line_status(), backend.lines_or_info()[0]
+
+    def _aux_dc_obs(self):
+        """the current observation, with the flows of a DC powerflow (for which the LODF are exact)"""
+        conv, _, p_or = self._aux_dc_state()
+        assert conv
+        obs = self.env.get_obs()
+        obs.p_or[:] = p_or
+        return obs
+
+    def test_single_disconnection(self):
+        obs = self._aux_dc_obs()
+        self.screening.update(obs)
+        assert self.screening.ptdf.shape == (self.env.n_line, 2 * self.env.n_sub)
+        line_ids = np.arange(self.env.n_line)
+        p_or_screen = self.screening.p_or_after_disconnection(line_ids)
+        nb_checked = 0
+        for l_id in line_ids:
+            conv, status, p_or = self._aux_dc_state([l_id])
+            if not np.all(np.isfinite(p_or_screen[l_id])):
+                # the grid is split
+                continue
+            assert conv
+            assert np.max(np.abs(p_or - p_or_screen[l_id])) <= self.tol
+            nb_checked += 1
+        assert nb_checked >= self.env.n_line - 2
+
+    def test_multiple_disconnections(self):
+        obs = self._aux_dc_obs()
+        self.screening.update(obs)
+        lines_disc = [3, 12]
+        conv, status, p_or = self._aux_dc_state(lines_disc)
+        assert conv
+        p_or_screen = self.screening.p_or_after_line_status(status)
+        assert p_or_screen.shape == (1, self.env.n_line)
+        assert np.max(np.abs(p_or - p_or_screen[0])) <= self.tol
+
+        # reconnections are not supported
+        status = np.ones(self.env.n_line, dtype=dt_bool)
+        self.screening._line_status[0] = False
+        with self.assertRaises(Grid2OpException):
+            self.screening.p_or_after_line_status(status)
+
+    def test_screen(self):
+        actions = [self.env.action_space(),
+                   self.env.action_space({"set_line_status": [(3, -1)]}),
+                   self.env.action_space({"change_line_status": [5, 12]}),
+                   self.env.action_space({"redispatch": [(0, 1.)]})]
+        rho_max = self.screening.screen(self.obs, actions)
+        assert rho_max.shape == (len(actions), )
+        # the flows are not modified by the do nothing action
+        assert abs(rho_max[0] - np.max(self.obs.rho)) <= self.tol
+        assert np.all(np.isfinite(rho_max[1:3]))
+        # redispatching cannot be assessed
+        assert np.isnan(rho_max[3])
+
+        top_ids, simulations = self.screening.simulate_top_k(self.obs, actions, k=2)
+        assert top_ids.shape == (2, )
+        assert len(simulations) == 2
+        assert 3 not in top_ids
+        assert rho_max[top_ids[0]] <= rho_max[top_ids[1]]
+        sim_obs, sim_reward, sim_done, sim_info = simulations[0]
+        assert not sim_done
+
+    def test_screen_new_thermal_limit(self):
+        actions = [self.env.action_space(),
+                   self.env.action_space({"set_line_status": [(3, -1)]})]
+        rho_max = self.screening.screen(self.obs, actions)
+        # the thermal limits are changed after the creation of the screening: the new ones are used
+        self.env.set_thermal_limit(0.5 * self.env.get_thermal_limit())
+        rho_max_new = self.screening.screen(self.obs, actions)
+        assert np.all(np.abs(rho_max_new - 2. * rho_max) <= self.tol)
+        assert np.allclose(self.screening.thermal_limit, self.env.get_thermal_limit())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -9,11 +9,14 @@ import unittest
 import warnings
 
 import numpy as np
+import pandas as pd
 
 from grid2op import make
 
 from grid2op.tests.helper_path_test import PATH_DATA_TEST_PP, PATH_DATA_TEST
+from grid2op.dtypes import dt_int
 from grid2op.Backend import PandaPowerBackend
+from grid2op.Action import CompleteAction
 
 from grid2op.tests.helper_path_test import HelperTests
 from grid2op.tests.BaseBackendTest import BaseTestNames, BaseTestLoadingCase, BaseTestLoadingBackendFunc
@@ -180,5 +183,262 @@ class TestChangeBusAffectRightBus2(unittest.TestCase):
         assert np.sum(env.backend._grid["bus"]["in_service"]) == 14
         assert env.backend._grid["trafo"]["hv_bus"][2] == 4
 
+
+class TestResetRestoreGrid(unittest.TestCase):
+    def test_reset_restore_grid(self):
+        backend = PandaPowerBackend()
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore")
+            env = make(test=True, backend=backend)
+        env.backend.reset(env.init_grid_path)
+        init_bus = env.backend._grid.bus["in_service"].values.copy()
+        init_line = env.backend._grid.line[["from_bus", "to_bus", "in_service"]].values.copy()
+        init_trafo = env.backend._grid.trafo[["hv_bus", "lv_bus", "in_service"]].values.copy()
+        init_load = env.backend._grid.load[["p_mw", "q_mvar", "bus"]].values.copy()
+        init_gen = env.backend._grid.gen[["p_mw", "vm_pu", "bus"]].values.copy()
+        init_topo = env.backend.get_topo_vect().copy()
+
+        env.reset()
+        action = env.helper_action_player({"set_bus": {"lines_or_id": [(17, 2)]}})
+        obs, reward, done, info = env.step(action)
+        assert not done
+        assert np.any(env.backend._grid.bus["in_service"].values != init_bus)
+        assert np.any(env.backend._grid.trafo[["hv_bus", "lv_bus", "in_service"]].values != init_trafo)
+        assert np.any(env.backend.get_topo_vect() != init_topo)
+
+        env.backend.reset(env.init_grid_path)
+        assert np.all(env.backend._grid.bus["in_service"].values == init_bus)
+        assert np.all(env.backend._grid.line[["from_bus", "to_bus", "in_service"]].values == init_line)
+        assert np.all(env.backend._grid.trafo[["hv_bus", "lv_bus", "in_service"]].values == init_trafo)
+        assert np.all(env.backend._grid.load[["p_mw", "q_mvar", "bus"]].values == init_load)
+        assert np.all(env.backend._grid.gen[["p_mw", "vm_pu", "bus"]].values == init_gen)
+        assert np.all(env.backend.get_topo_vect() == init_topo)
+
+        # the backend can be used after the reset
+        obs = env.reset()
+        obs, reward, done, info = env.step(env.action_space())
+        assert not done
+        assert np.all(np.isfinite(obs.v_or))
+        env.close()
+
+
+class TestApplyAction(unittest.TestCase):
+    def setUp(self):
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore")
+            self.env = make(test=True, action_class=CompleteAction)
+        self.backend = self.env.backend
+
+    def tearDown(self):
+        self.env.close()
+
+    def _aux_pos_sub(self, sub_id):
+        return np.concatenate((self.env.load_pos_topo_vect[self.env.load_to_subid == sub_id],
+                               self.env.gen_pos_topo_vect[self.env.gen_to_subid == sub_id],
+                               self.env.line_or_pos_topo_vect[self.env.line_or_to_subid == sub_id],
+                               self.env.line_ex_pos_topo_vect[self.env.line_ex_to_subid == sub_id]))
+
+    def _aux_apply(self, dict_):
+        bk_action = self.env._backend_action_class()
+        bk_action += self.env.helper_action_env(dict_)
+        self.backend.apply_action(bk_action)
+
+    def test_full_topology(self):
+        np.random.seed(0)
+        new_topo = np.random.choice([1, 2], self.env.dim_topo).astype(dt_int)
+        self._aux_apply({"set_bus": new_topo})
+        assert np.all(self.backend._get_topo_vect() == new_topo)
+        bus_is = self.backend._grid.bus["in_service"].values
+        for sub_id in range(self.env.n_sub):
+            topo_sub = new_topo[self._aux_pos_sub(sub_id)]
+            assert bus_is[sub_id] == np.any(topo_sub == 1)
+            assert bus_is[sub_id + self.env.n_sub] == np.any(topo_sub == 2)
+
+        # disconnection of powerlines
+        self._aux_apply({"set_line_status": [(0, -1), (self.env.n_line - 1, -1)]})
+        line_status = self.backend._get_line_status()
+        assert not line_status[0]
+        assert not line_status[-1]
+        assert np.sum(line_status) == self.env.n_line - 2
+
+    def test_shunt_bus(self):
+        self._aux_apply({"shunt": {"set_bus": [(0, 2)]}})
+        assert self.backend._grid.shunt["bus"].iloc[0] == self.env.shunt_to_subid[0] + self.env.n_sub
+        assert self.backend._grid.shunt["in_service"].iloc[0]
+        self._aux_apply({"shunt": {"set_bus": [(0, -1)]}})
+        assert not self.backend._grid.shunt["in_service"].iloc[0]
+
+    def test_copy_on_write(self):
+        # the modifications must reach the grid even when pandas does not return views of the columns
+        try:
+            option_cow = pd.option_context("mode.copy_on_write", True)
+        except (KeyError, pd.errors.OptionError):
+            self.skipTest("pandas does not have a copy on write mode")
+        new_topo = np.ones(self.env.dim_topo, dtype=dt_int)
+        new_topo[self._aux_pos_sub(1)] = 2
+        load_p = self.backend._grid.load["p_mw"].values + 1.
+        with option_cow:
+            self._aux_apply({"set_bus": new_topo,
+                             "injection": {"load_p": load_p},
+                             "set_line_status": [(self.env.n_line - 1, -1)],
+                             "shunt": {"set_bus": [(0, -1)]}})
+        assert np.all(self.backend._get_topo_vect()[self._aux_pos_sub(1)] == 2)
+        assert self.backend._grid.bus["in_service"].values[1 + self.env.n_sub]
+        assert np.allclose(self.backend._grid.load["p_mw"].values, load_p)
+        assert not self.backend._get_line_status()[-1]
+        assert not self.backend._grid.shunt["in_service"].iloc[0]
+
+
+class TestWarmStartCache(unittest.TestCase):
+    def setUp(self):
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore")
+            self.env = make(test=True, backend=PandaPowerBackend(warm_start_cache_size=2))
+        self.backend = self.env.backend
+
+    def tearDown(self):
+        self.env.close()
+
+    def test_cache_hits(self):
+        self.env.reset()
+        stats_init = self.backend.get_warm_start_stats()
+        conv = self.backend.runpf()
+        assert conv
+        a_or_init = self.backend.get_line_flow().copy()
+        # same topology: the voltages of the previous powerflow are used
+        conv = self.backend.runpf()
+        assert conv
+        stats = self.backend.get_warm_start_stats()
+        assert stats["nb_powerflow"] == stats_init["nb_powerflow"] + 2
+        assert stats["hits"] >= stats_init["hits"] + 1
+        assert stats["nb_converged"] == stats_init["nb_converged"] + 2
+        assert 0. < stats["hit_rate"] <= 1.
+        assert np.max(np.abs(self.backend.get_line_flow() - a_or_init)) <= 1e-3
+
+        # a new topology is a miss, but it is then cached
+        self.backend._disconnect_line(3)
+        conv = self.backend.runpf()
+        assert conv
+        stats2 = self.backend.get_warm_start_stats()
+        assert stats2["misses"] == stats["misses"] + 1
+        conv = self.backend.runpf()
+        assert conv
+        assert self.backend.get_warm_start_stats()["hits"] == stats2["hits"] + 1
+
+    def test_cache_bounded(self):
+        self.env.reset()
+        for l_id in range(4):
+            self.backend._disconnect_line(l_id)
+            conv = self.backend.runpf()
+            assert conv
+            assert len(self.backend._warm_start_cache) <= 2
+            self.backend._reconnect_line(l_id)
+
+    def test_deactivated(self):
+        self.backend.warm_start_cache_size = 0
+        self.backend._warm_start_cache.clear()
+        self.env.reset()
+        stats_init = self.backend.get_warm_start_stats()
+        self.backend.runpf()
+        self.backend.runpf()
+        stats = self.backend.get_warm_start_stats()
+        assert stats["hits"] == stats_init["hits"]
+        assert not self.backend._warm_start_cache
+
+
+class TestNativeDC(unittest.TestCase):
+    def setUp(self):
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore")
+            self.env = make(test=True)
+        self.backend = self.env.backend.copy()
+        self.backend.use_native_dc = True
+        self.backend_pp = self.env.backend.copy()
+        self.backend_pp.use_native_dc = False
+        self.tol = 1e-3
+
+    def tearDown(self):
+        self.env.close()
+
+    def _aux_outputs(self, backend):
+        res = {}
+        for fun_nm in ["lines_or_info", "lines_ex_info", "loads_info", "generators_info", "shunt_info"]:
+            for i, vect in enumerate(getattr(backend, fun_nm)()):
+                res["{}_{}".format(fun_nm, i)] = np.array(vect, dtype=float)
+        res["topo_vect"] = backend.get_topo_vect().astype(float)
+        res["line_status"] = backend.get_line_status().astype(float)
+        for table_nm in ["res_bus", "res_line", "res_trafo", "res_gen", "res_load", "res_shunt", "res_ext_grid"]:
+            for col_nm in backend._grid[table_nm].columns:
+                res["{}.{}".format(table_nm, col_nm)] = backend._grid[table_nm][col_nm].values.astype(float)
+        return res
+
+    def _aux_compare(self, action=None, check_balance=True, skip=()):
+        for bk in [self.backend, self.backend_pp]:
+            bk.reset(None)
+            if action is not None:
+                bk_action = self.env._backend_action_class()
+                bk_action += action
+                bk.apply_action(bk_action)
+        conv = self.backend.runpf(is_dc=True)
+        conv_pp = self.backend_pp.runpf(is_dc=True)
+        assert conv == conv_pp
+        if conv:
+            res = self._aux_outputs(self.backend)
+            res_pp = self._aux_outputs(self.backend_pp)
+            assert sorted(res.keys()) == sorted(res_pp.keys())
+            for key, vect in res.items():
+                if key in skip:
+                    continue
+                vect_pp = res_pp[key]
+                assert np.all(np.isnan(vect) == np.isnan(vect_pp)), "NaN differ for {}".format(key)
+                ok_ = ~np.isnan(vect)
+                assert np.all(np.abs(vect[ok_] - vect_pp[ok_]) <= self.tol), "{} differs".format(key)
+            if not skip:
+                for vect, vect_pp in zip(self.backend.check_kirchoff(), self.backend_pp.check_kirchoff()):
+                    assert np.allclose(vect, vect_pp, atol=self.tol, equal_nan=True)
+            if check_balance:
+                # production balances consumption
+                prod_p, *_ = self.backend.generators_info()
+                load_p, *_ = self.backend.loads_info()
+                ext_p = self.backend._grid.res_ext_grid["p_mw"].values
+                assert abs(np.sum(prod_p) + np.sum(ext_p) - np.sum(load_p)) <= self.tol
+        return conv
+
+    def test_same_as_pandapower(self):
+        assert self.backend._dc_solver is not None
+        assert self._aux_compare()
+        assert self._aux_compare(self.env.action_space({"set_line_status": [(3, -1), (12, -1)]}))
+        action = self.env.action_space({"set_bus": {"substations_id": [(1, [1, 1, 2, 1, 2, 2])]}})
+        assert self._aux_compare(action)
+        # the factorization of the initial topology is used for all these topologies
+        assert self.backend._dc_solver.nb_factorization == 1
+        assert self.backend._dc_solver.nb_low_rank >= 2
+
+    def test_isolated_gen(self):
+        # generator 0 alone on its bus
+        new_topo = np.ones(self.env.sub_info[self.env.gen_to_subid[0]], dtype=dt_int)
+        new_topo[self.env.gen_to_sub_pos[0]] = 2
+        action = self.env.action_space({"set_bus": {"substations_id": [(self.env.gen_to_subid[0], new_topo)]}})
+        assert not self._aux_compare(action)
+
+    def test_isolated_load(self):
+        # load 0 alone on its bus: it is not part of the grid anymore (as in pandapower)
+        sub_id = self.env.load_to_subid[0]
+        new_topo = np.ones(self.env.sub_info[sub_id], dtype=dt_int)
+        new_topo[self.env.load_to_sub_pos[0]] = 2
+        action = self.env.action_space({"set_bus": {"substations_id": [(sub_id, new_topo)]}})
+        # pandapower still reports the consumption of the isolated load
+        assert self._aux_compare(action, skip=("loads_info_0", "res_load.p_mw", "res_bus.p_mw"))
+        load_p, *_ = self.backend.loads_info()
+        assert load_p[0] == 0.
+
+    def test_copy(self):
+        assert self.backend.runpf(is_dc=True)
+        p_or = self.backend.get_line_flow().copy()
+        backend = self.backend.copy()
+        assert backend.runpf(is_dc=True)
+        assert np.max(np.abs(backend.get_line_flow() - p_or)) <= self.tol
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -8,7 +8,10 @@
 
 import warnings
 import tempfile
+import contextlib
+import shutil
 import pdb
+import pandas as pd
 
 from grid2op.tests.helper_path_test import *
 PATH_ADN_CHRONICS_FOLDER = os.path.abspath(os.path.join(PATH_CHRONICS, "test_multi_chronics"))
@@ -18,10 +21,30 @@ from grid2op.Reward import L2RPNReward
 from grid2op.Backend import PandaPowerBackend
 from grid2op.MakeEnv import make
 from grid2op.Runner import Runner
+from grid2op.Runner.Runner import _WORKER_CONTEXT
 from grid2op.dtypes import dt_float
 from grid2op.Agent import RandomAgent
 
 
+class _BackendCountClose(PandaPowerBackend):
+    """backend that creates a file in `CLOSE_DIR` when it is closed, in the process that closes it"""
+    CLOSE_DIR = None
+
+    @classmethod
+    @contextlib.contextmanager
+    def tracking(cls, close_dir):
+        cls.CLOSE_DIR = close_dir
+        try:
+            yield
+        finally:
+            cls.CLOSE_DIR = None
+
+    def close(self):
+        if self.CLOSE_DIR is not None:
+            open(os.path.join(self.CLOSE_DIR, str(os.getpid())), "w").close()
+        super().close()
+
+
 class TestRunner(HelperTests):
     def setUp(self):
         self.init_grid_path = os.path.join(PATH_DATA_TEST_PP, "test_case14.json")
@@ -65,10 +88,24 @@ class TestRunner(HelperTests):
         assert int(timestep) == self.max_iter
         assert np.abs(cum_reward - self.real_reward) <= self.tol_one
 
+    def _aux_run_worker(self, episodes):
+        Runner._init_worker(self.runner)
+        try:
+            res = [Runner._run_one_episode_worker((p_id, None, None, self.max_iter, None))
+                   for p_id in episodes]
+            env = _WORKER_CONTEXT["env"]
+        finally:
+            Runner._close_worker()
+        assert not _WORKER_CONTEXT
+        # the environment of the process is closed
+        assert env.backend._grid is None
+        assert [p_id for p_id, _ in res] == list(episodes)
+        return [res_ep for _, res_ep in res]
+
     def test_one_process_par(self):
         with warnings.catch_warnings():
             warnings.filterwarnings("ignore")
-            res = Runner._one_process_parrallel(self.runner, [0], 0, None, None, self.max_iter)
+            res = self._aux_run_worker([0])
         assert len(res) == 1
         _, el1, el2, el3, el4 = res[0]
         assert el1 == "1"
@@ -76,6 +113,32 @@ class TestRunner(HelperTests):
         assert el3 == 10
         assert el4 == 10
 
+    def test_one_process_par_several_episodes(self):
+        # the same environment is used for all the episodes of the process, it must give the same results as the
+        # sequential runner
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore")
+            res = self._aux_run_worker([0, 1])
+        res_seq = self.runner._run_sequential(nb_episode=2, max_iter=self.max_iter)
+        assert len(res) == 2
+        for (_, name_chron, cum_reward, timestep, _), (_, name_chron_seq, cum_reward_seq, timestep_seq, _) in \
+                zip(res, res_seq):
+            assert name_chron == name_chron_seq
+            assert int(timestep) == int(timestep_seq)
+            assert np.abs(cum_reward - cum_reward_seq) <= self.tol_one
+
+    def test_worker_env_closed(self):
+        # each process of the parallel runner closes its environment when it exits
+        self.runner.backendClass = _BackendCountClose
+        with tempfile.TemporaryDirectory() as close_dir:
+            with warnings.catch_warnings():
+                warnings.filterwarnings("ignore")
+                with _BackendCountClose.tracking(close_dir):
+                    res = self.runner._run_parrallel(nb_episode=2, nb_process=2, max_iter=self.max_iter)
+            assert len(res) == 2
+            # the backend of the runner itself is not used by the processes
+            assert 1 <= len(os.listdir(close_dir)) <= 2
+
     def test_2episode(self):
         res = self.runner._run_sequential(nb_episode=2, max_iter=self.max_iter)
         assert len(res) == 2
@@ -92,6 +155,91 @@ class TestRunner(HelperTests):
             assert int(timestep) == self.max_iter
             assert np.abs(cum_reward - self.real_reward) <= self.tol_one
 
+    def test_3episode_2process_longest_first(self):
+        # the 3 chronics are shortened to 6, 8 and 12 rows: the last episode is the longest (the duration of the
+        # episodes is not limited by max_iter)
+        with tempfile.TemporaryDirectory() as path_chron:
+            for name_chron, nb_ts in zip(sorted(os.listdir(PATH_ADN_CHRONICS_FOLDER)), [6, 8, 12]):
+                shutil.copytree(os.path.join(PATH_ADN_CHRONICS_FOLDER, name_chron),
+                                os.path.join(path_chron, name_chron))
+                for file_nm in os.listdir(os.path.join(path_chron, name_chron)):
+                    file_path = os.path.join(path_chron, name_chron, file_nm)
+                    df = pd.read_csv(file_path, sep=";")
+                    df.iloc[:nb_ts].to_csv(file_path, sep=";", index=False)
+            runner = Runner(init_grid_path=self.init_grid_path,
+                            path_chron=path_chron,
+                            parameters_path=self.parameters_path,
+                            names_chronics_to_backend=self.names_chronics_to_backend,
+                            gridStateclass=self.gridStateclass,
+                            gridStateclass_kwargs={},
+                            backendClass=self.backendClass,
+                            rewardClass=L2RPNReward,
+                            name_env="test_runner_env")
+
+            max_ts = runner._get_max_timesteps(3, max_iter=None)
+            assert list(max_ts) == [5, 7, 11]
+            assert runner._get_episode_order(3, longest_first=True, max_iter=None) == [2, 1, 0]
+            assert runner._get_episode_order(3, longest_first=False, max_iter=None) == [0, 1, 2]
+            with warnings.catch_warnings():
+                warnings.filterwarnings("ignore")
+                res = runner.run(nb_episode=3, nb_process=2, max_iter=None, longest_first=True)
+            res_seq = runner.run(nb_episode=3, max_iter=None)
+        # results are given in the order of the episodes
+        assert [el[0] for el in res] == [el[0] for el in res_seq]
+        assert [int(el[3]) for el in res_seq] == [5, 7, 11]
+        for (_, _, cum_reward, timestep, _), (_, _, cum_reward_seq, timestep_seq, _) in zip(res, res_seq):
+            assert int(timestep) == int(timestep_seq)
+            assert np.abs(cum_reward - cum_reward_seq) <= self.tol_one
+
+    def test_run_iter(self):
+        res = self.runner.run(nb_episode=3, max_iter=self.max_iter)
+        res_seq = list(self.runner.run_iter(nb_episode=3, max_iter=self.max_iter))
+        assert [p_id for p_id, _ in res_seq] == [0, 1, 2]
+        assert [el for _, el in res_seq] == res
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore")
+            res_par = list(self.runner.run_iter(nb_episode=3, nb_process=2, max_iter=self.max_iter))
+        assert sorted(p_id for p_id, _ in res_par) == [0, 1, 2]
+        for p_id, (id_chron, name_chron, cum_reward, timestep, max_ts) in res_par:
+            assert id_chron == res[p_id][0]
+            assert name_chron == res[p_id][1]
+            assert int(timestep) == int(res[p_id][3])
+            assert np.abs(cum_reward - res[p_id][2]) <= self.tol_one
+
+    def test_run_iter_resume(self):
+        f = tempfile.mkdtemp()
+        res = self.runner.run(nb_episode=2, max_iter=self.max_iter)
+        with self.assertRaises(RuntimeError):
+            next(self.runner.run_iter(nb_episode=2, max_iter=self.max_iter, resume=True))
+
+        # the computation is stopped after the first episode
+        it_ = self.runner.run_iter(nb_episode=2, path_save=f, max_iter=self.max_iter, add_episode_path=True)
+        p_id, res_episode, episode_path = next(it_)
+        it_.close()
+        assert p_id == 0
+        assert res_episode == res[0]
+        assert episode_path == os.path.join(f, res[0][1])
+        meta_path = os.path.join(episode_path, "episode_meta.json")
+        assert os.path.exists(meta_path)
+        assert not os.path.exists(os.path.join(f, res[1][1], "episode_meta.json"))
+        mtime = os.path.getmtime(meta_path)
+
+        # and resumed: the first episode is not played again
+        res_resume = list(self.runner.run_iter(nb_episode=2, path_save=f, max_iter=self.max_iter, resume=True))
+        assert [p_id for p_id, _ in res_resume] == [0, 1]
+        assert os.path.getmtime(meta_path) == mtime
+        for (_, (id_chron, name_chron, cum_reward, timestep, max_ts)), res_episode in zip(res_resume, res):
+            assert id_chron == res_episode[0]
+            assert name_chron == res_episode[1]
+            assert int(timestep) == int(res_episode[3])
+            assert int(max_ts) == int(res_episode[4])
+            assert np.abs(cum_reward - res_episode[2]) <= self.tol_one
+
+        # nothing left to play
+        res_resume = list(self.runner.run_iter(nb_episode=2, path_save=f, max_iter=self.max_iter, resume=True,
+                                               nb_process=2))
+        assert [p_id for p_id, _ in res_resume] == [0, 1]
+
     def test_complex_agent(self):
         nb_episode = 4
         with warnings.catch_warnings():